@@ -15,16 +15,156 @@ Date: 2025-11-04
 import asyncio
 import json
 import logging
-from collections import defaultdict
-from typing import Dict, Set
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Optional, Set, Tuple
 
 import websockets
 from websockets.server import WebSocketServerProtocol
 
 logger = logging.getLogger(__name__)
 
-# Channel subscriptions: channel_name -> set of WebSocket connections
-SUBS: Dict[str, Set[WebSocketServerProtocol]] = defaultdict(set)
+# Per-subscriber send queue bound (frames waiting for the writer task)
+SEND_QUEUE_MAX = 256
+
+# What to do when a subscriber's queue is full:
+#   drop_oldest - discard the oldest queued frame (default)
+#   coalesce    - discard queued frames on the same channel (newest wins),
+#                 falling back to drop_oldest
+#   disconnect  - close the slow connection (1008) and unsubscribe it
+OVERFLOW_POLICIES = ("drop_oldest", "coalesce", "disconnect")
+OVERFLOW_POLICY = "drop_oldest"
+
+
+class Subscriber:
+    """
+    One /observe connection with a bounded send queue drained by its own writer task.
+
+    dispatch() only enqueues pre-encoded frames, so a slow reader fills its
+    own queue (and hits the overflow policy) instead of stalling delivery to
+    every other subscriber on the channel.
+    """
+
+    def __init__(
+        self,
+        ws: WebSocketServerProtocol,
+        max_queue: Optional[int] = None,
+        overflow: Optional[str] = None
+    ):
+        # Defaults read at connect time, so SEND_QUEUE_MAX / OVERFLOW_POLICY can be configured
+        overflow = overflow or OVERFLOW_POLICY
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.ws = ws
+        self.max_queue = max_queue or SEND_QUEUE_MAX
+        self.overflow = overflow
+        self.channels: Set[str] = set()
+        self.closed = False
+
+        self._queue: Deque[Tuple[Optional[str], str]] = deque()  # (channel, frame)
+        self._ready = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+
+        # Counters
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    def start(self) -> None:
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def offer(self, frame: str, channel: Optional[str] = None) -> bool:
+        """
+        Enqueue a frame without blocking.
+
+        Returns:
+            False if the subscriber is closed or was disconnected by overflow
+        """
+        if self.closed:
+            return False
+
+        if len(self._queue) >= self.max_queue:
+            if self.overflow == "disconnect":
+                logger.warning(f"[MembraneHub] Disconnecting slow subscriber ({len(self._queue)} frames queued)")
+                self.close(code=1008, reason="slow consumer")
+                return False
+            if self.overflow == "coalesce" and channel is not None:
+                kept = deque(item for item in self._queue if item[0] != channel)
+                self.coalesced += len(self._queue) - len(kept)
+                self._queue = kept
+            if len(self._queue) >= self.max_queue:
+                self._queue.popleft()
+                self.dropped += 1
+
+        self._queue.append((channel, frame))
+        self._ready.set()
+        return True
+
+    async def _write_loop(self) -> None:
+        try:
+            while not self.closed:
+                if not self._queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+                _, frame = self._queue.popleft()
+                await self.ws.send(frame)
+                self.sent += 1
+        except websockets.exceptions.ConnectionClosed:
+            logger.debug(f"[MembraneHub] Subscriber connection closed during send")
+        except Exception as e:
+            logger.error(f"[MembraneHub] Failed to send to subscriber: {e}")
+        finally:
+            self.closed = True
+            unsubscribe(self)
+
+    def close(self, code: int = 1000, reason: str = "") -> None:
+        """Stop the writer and close the connection (non-blocking)."""
+        if self.closed:
+            return
+        self.closed = True
+        self._queue.clear()
+        self._ready.set()
+        unsubscribe(self)
+        asyncio.ensure_future(self.ws.close(code=code, reason=reason))
+
+    async def wait_closed(self) -> None:
+        if self._writer:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": len(self._queue),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "channels": sorted(self.channels),
+        }
+
+
+# Channel subscriptions: channel_name -> set of subscribers
+SUBS: Dict[str, Set[Subscriber]] = defaultdict(set)
+
+
+def unsubscribe(sub: Subscriber) -> None:
+    """Remove a subscriber from all of its channels."""
+    for ch in sub.channels:
+        SUBS[ch].discard(sub)
+
+
+def hub_stats() -> Dict[str, Any]:
+    """Per-channel subscriber counts and aggregate queue/drop counters."""
+    subscribers = {sub for subs in SUBS.values() for sub in subs}
+    return {
+        "channels": {ch: len(subs) for ch, subs in SUBS.items() if subs},
+        "subscribers": len(subscribers),
+        "queued": sum(len(sub._queue) for sub in subscribers),
+        "dropped": sum(sub.dropped for sub in subscribers),
+        "coalesced": sum(sub.coalesced for sub in subscribers),
+    }
 
 
 async def handle_observe(ws: WebSocketServerProtocol):
@@ -34,9 +174,11 @@ async def handle_observe(ws: WebSocketServerProtocol):
     Clients send: {"type": "subscribe", "channels": ["docs.view.request", ...]}
     Server responds: {"type": "subscribe.ack", "channels": [...]}
 
-    Then server pushes matching membrane.inject envelopes to this connection.
+    Then server pushes matching membrane.inject envelopes to this connection
+    through its bounded send queue (see Subscriber / OVERFLOW_POLICY).
     """
-    client_channels = set()
+    sub = Subscriber(ws)
+    sub.start()
 
     try:
         async for raw in ws:
@@ -45,10 +187,10 @@ async def handle_observe(ws: WebSocketServerProtocol):
             if msg.get("type") == "subscribe":
                 channels = msg.get("channels", [])
                 for ch in channels:
-                    SUBS[ch].add(ws)
-                    client_channels.add(ch)
+                    SUBS[ch].add(sub)
+                    sub.channels.add(ch)
 
-                await ws.send(json.dumps({
+                sub.offer(json.dumps({
                     "type": "subscribe.ack",
                     "channels": channels
                 }))
@@ -60,16 +202,20 @@ async def handle_observe(ws: WebSocketServerProtocol):
 
     finally:
         # Cleanup: remove this connection from all subscriptions
-        for ch in client_channels:
-            SUBS[ch].discard(ws)
+        sub.closed = True
+        unsubscribe(sub)
+        await sub.wait_closed()
 
-        logger.debug(f"[MembraneHub] Observer unsubscribed from {len(client_channels)} channels")
+        logger.debug(f"[MembraneHub] Observer unsubscribed from {len(sub.channels)} channels")
 
 
 async def dispatch(envelope: dict):
     """
     Fan out envelope to all subscribers of the channel.
 
+    The envelope is encoded once; each subscriber gets the same frame in its
+    own send queue, so fan-out never waits on a subscriber's socket.
+
     Envelope format:
     {
         "type": "membrane.inject",
@@ -90,20 +236,10 @@ async def dispatch(envelope: dict):
         logger.debug(f"[MembraneHub] No subscribers for channel '{ch}'")
         return
 
-    dead = []
-
-    for conn in subscribers:
-        try:
-            await conn.send(json.dumps(envelope))
-        except Exception as e:
-            logger.error(f"[MembraneHub] Failed to send to subscriber: {e}")
-            dead.append(conn)
-
-    # Remove dead connections
-    for d in dead:
-        SUBS[ch].discard(d)
+    frame = json.dumps(envelope)
+    delivered = sum(1 for sub in subscribers if sub.offer(frame, ch))
 
-    logger.debug(f"[MembraneHub] Dispatched to {len(subscribers) - len(dead)} subscribers on '{ch}'")
+    logger.debug(f"[MembraneHub] Queued for {delivered} subscribers on '{ch}'")
 
 
 async def handle_inject(ws: WebSocketServerProtocol):
@@ -133,8 +269,10 @@ async def handle_inject(ws: WebSocketServerProtocol):
         logger.debug(f"[MembraneHub] Injector connection closed")
 
 
-async def router(ws: WebSocketServerProtocol, path: str):
-    """Route connections based on path."""
+async def router(ws: WebSocketServerProtocol, path: Optional[str] = None):
+    """Route connections based on path (legacy handlers get path, new ones read ws.request)."""
+    if path is None:
+        path = ws.request.path
 
     if path == "/observe":
         await handle_observe(ws)
@@ -13,6 +13,7 @@ Events emitted:
 
 Design:
   - Runs mp-lint scanners (hardcoded, quality, fallback, fail-loud) on changed files
+    via LintDriver: one parse per file, results cached by content hash
   - Converts violations to L4 event format
   - Emits findings as structured events
   - Fail-loud: All exceptions emit failure.emit and rethrow
@@ -42,11 +43,8 @@ from dataclasses import dataclass
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
-# mp-lint scanners
-from tools.mp_lint.scanner_hardcoded import scan_file_for_hardcoded, HardcodedViolation
-from tools.mp_lint.scanner_quality import scan_file_for_quality, QualityViolation
-from tools.mp_lint.scanner_fallback import scan_file_for_fallback, FallbackViolation
-from tools.mp_lint.scanner_fail_loud import scan_file_for_fail_loud, FailLoudViolation
+# mp-lint scanners (shared-parse, cached driver)
+from tools.mp_lint.driver import LintDriver
 from tools.mp_lint.rules import (
     convert_hardcoded_violation,
     convert_quality_violation,
@@ -104,7 +102,8 @@ class PythonLintAdapter:
     def __init__(
         self,
         citizen_id: str = "adapter.lint.python",
-        broadcaster: Optional[SafeBroadcaster] = None
+        broadcaster: Optional[SafeBroadcaster] = None,
+        cache_path: Optional[Path] = None
     ):
         """
         Initialize lint adapter.
@@ -112,9 +111,11 @@ class PythonLintAdapter:
         Args:
             citizen_id: Adapter identity for event provenance
             broadcaster: SafeBroadcaster for event emission
+            cache_path: Optional lint result cache file (reused across runs)
         """
         self.citizen_id = citizen_id
         self.broadcaster = broadcaster or SafeBroadcaster(citizen_id=citizen_id)
+        self.driver = LintDriver(cache_path=cache_path)
 
         logger.info(f"[{self.citizen_id}] Initialized Python lint adapter")
 
@@ -140,6 +141,7 @@ class PythonLintAdapter:
         files_scanned = 0
 
         try:
+            python_files = []
             for file_path_str in file_paths:
                 file_path = Path(file_path_str)
 
@@ -152,23 +154,30 @@ class PythonLintAdapter:
                     logger.warning(f"[{self.citizen_id}] File not found: {file_path}")
                     continue
 
-                try:
-                    # Run all scanners on file
-                    violations = await self._scan_file(file_path)
-                    all_violations.extend(violations)
-                    files_scanned += 1
-
-                except Exception as e:
-                    # Emit failure for this specific file
-                    await self._emit_failure(
-                        change_id=change_id,
-                        code_location=f"{file_path}:0",
-                        exception=str(e),
-                        severity="error",
-                        suggestion=f"Failed to scan {file_path}: {e}"
-                    )
-                    # Continue with other files
-                    logger.error(f"[{self.citizen_id}] Error scanning {file_path}: {e}")
+                python_files.append(file_path)
+
+            # Run all scanners on all files off the event loop (one parse per file)
+            run = await asyncio.to_thread(self.driver.lint_paths, python_files)
+
+            for file_path_str in run.unreadable:
+                # Emit failure for this specific file, continue with others
+                await self._emit_failure(
+                    change_id=change_id,
+                    code_location=f"{file_path_str}:0",
+                    exception="File unreadable",
+                    severity="error",
+                    suggestion=f"Failed to scan {file_path_str}: file could not be read"
+                )
+                logger.error(f"[{self.citizen_id}] Error scanning {file_path_str}: unreadable")
+
+            for per_file in run.results.values():
+                all_violations.extend(self._convert_results(per_file))
+                files_scanned += 1
+
+            logger.debug(
+                f"[{self.citizen_id}] Linted {files_scanned} files in {run.seconds:.3f}s "
+                f"({run.cache_hits} cache hits)"
+            )
 
             # Emit findings if any violations found
             if all_violations:
@@ -191,12 +200,12 @@ class PythonLintAdapter:
             )
             raise
 
-    async def _scan_file(self, file_path: Path) -> List[Violation]:
+    def _convert_results(self, per_file: Dict[str, List[Any]]) -> List[Violation]:
         """
-        Run all mp-lint scanners on a single file.
+        Convert one file's driver results to Violation objects.
 
         Args:
-            file_path: Path to Python file
+            per_file: {scanner_name: [scanner violations]} from LintDriver
 
         Returns:
             List of Violation objects
@@ -204,23 +213,19 @@ class PythonLintAdapter:
         violations = []
 
         # R-100 series: Hardcoded values
-        hardcoded_violations = scan_file_for_hardcoded(file_path)
-        for hv in hardcoded_violations:
+        for hv in per_file.get("hardcoded", []):
             violations.append(convert_hardcoded_violation(hv))
 
         # R-200 series: Quality degradation
-        quality_violations = scan_file_for_quality(file_path)
-        for qv in quality_violations:
+        for qv in per_file.get("quality", []):
             violations.append(convert_quality_violation(qv))
 
         # R-300 series: Fallback antipatterns
-        fallback_violations = scan_file_for_fallback(file_path)
-        for fv in fallback_violations:
+        for fv in per_file.get("fallback", []):
             violations.append(convert_fallback_violation(fv))
 
         # R-400 series: Fail-loud contract
-        fail_loud_violations = scan_file_for_fail_loud(file_path)
-        for flv in fail_loud_violations:
+        for flv in per_file.get("fail_loud", []):
             violations.append(convert_fail_loud_violation(flv))
 
         return violations
@@ -19,8 +19,13 @@ import logging
 from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
 
+from orchestration.adapters.search.model_registry import get_model_registry
+
 logger = logging.getLogger(__name__)
 
+# Shared through the process-wide model registry (retrieval, ask, trace capture)
+SENTENCE_TRANSFORMERS_MODEL = 'all-mpnet-base-v2'
+
 
 class EmbeddingService:
     """
@@ -46,6 +51,7 @@ class EmbeddingService:
         self.backend = backend
         self.embedding_dim = 768
         self.model = None
+        self.registry = get_model_registry()
 
         if backend == 'sentence-transformers':
             self._init_sentence_transformers()
@@ -55,13 +61,11 @@ class EmbeddingService:
             raise ValueError(f"Unknown backend: {backend}")
 
     def _init_sentence_transformers(self):
-        """Initialize SentenceTransformers backend (all-mpnet-base-v2)."""
+        """Initialize SentenceTransformers backend (all-mpnet-base-v2, shared via the model registry)."""
         try:
-            from sentence_transformers import SentenceTransformer
-
             # all-mpnet-base-v2: 768 dims, SOTA performance, CPU-friendly
-            self.model = SentenceTransformer('all-mpnet-base-v2')
-            logger.info("[EmbeddingService] Loaded SentenceTransformer: all-mpnet-base-v2 (768 dims)")
+            self.model = self.registry.get_model(SENTENCE_TRANSFORMERS_MODEL)
+            logger.info("[EmbeddingService] Using SentenceTransformer: all-mpnet-base-v2 (768 dims)")
 
         except ImportError:
             logger.error("[EmbeddingService] sentence-transformers not installed. Run: pip install sentence-transformers")
@@ -106,7 +110,7 @@ class EmbeddingService:
 
         try:
             if self.backend == 'sentence-transformers':
-                embedding = self.model.encode(text, convert_to_numpy=True)
+                embedding = self.registry.encode(SENTENCE_TRANSFORMERS_MODEL, text, convert_to_numpy=True)
 
                 # Fix #6: L2 normalization for stable cosine similarity
                 norm = np.linalg.norm(embedding)
@@ -135,6 +139,50 @@ class EmbeddingService:
             # Return zero vector as fallback
             return [0.0] * self.embedding_dim
 
+    def embed_batch(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+        """
+        Generate 768-dim embeddings for many texts in one model call.
+
+        Same output as calling embed() per text (L2-normalized, zero vector
+        for empty text), but sentence-transformers encodes the whole batch at
+        once instead of paying per-call overhead.
+
+        Args:
+            texts: Embeddable texts
+            batch_size: Model batch size (sentence-transformers)
+
+        Returns:
+            One embedding per text, in order
+        """
+        if self.backend != 'sentence-transformers':
+            return [self.embed(text) for text in texts]
+
+        results = [[0.0] * self.embedding_dim for _ in texts]
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not indices:
+            return results
+
+        try:
+            embeddings = self.registry.encode(
+                SENTENCE_TRANSFORMERS_MODEL,
+                [texts[i] for i in indices],
+                batch_size=batch_size,
+                convert_to_numpy=True
+            )
+
+            # Fix #6: L2 normalization for stable cosine similarity
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = np.divide(embeddings, norms, out=np.zeros_like(embeddings), where=norms > 0)
+
+            for i, embedding in zip(indices, embeddings.tolist()):
+                results[i] = embedding
+
+        except Exception as e:
+            logger.error(f"[EmbeddingService] Batch embedding generation failed: {e}")
+            # Zero vectors remain as fallback
+
+        return results
+
     def create_node_embeddable_text(self, node_type: str, fields: Dict[str, Any]) -> str:
         """
         Generate embeddable text from node fields based on type.
@@ -503,6 +551,15 @@ class EmbeddingService:
             # Return empty text and zero vector as fallback
             return ("", [0.0] * self.embedding_dim)
 
+    async def create_formation_embedding_async(
+        self,
+        formation_type: str,
+        type_name: str,
+        fields: Dict[str, Any]
+    ) -> Tuple[str, List[float]]:
+        """create_formation_embedding() on the model registry's thread pool (for async callers)."""
+        return await self.registry.run(self.create_formation_embedding, formation_type, type_name, fields)
+
 
 # Global singleton instance
 _embedding_service = None
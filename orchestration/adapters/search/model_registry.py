@@ -0,0 +1,224 @@
+"""
+Embedding Model Registry - One SentenceTransformer per model per process
+
+Loading a SentenceTransformer costs hundreds of milliseconds (weights + torch
+init), and the first encode pays a further warmup. Every embedding consumer
+(retrieval, insertion, EmbeddingService / trace capture, doc ingestion ask)
+shares models through this registry instead of constructing its own:
+
+- get_model(name): load once (per-model lock, concurrent callers wait), warm up
+- warmup(names): preload at service startup, off the critical path
+- encode(name, texts, **kwargs): blocking encode with latency metrics
+- encode_async(...): same, on a dedicated thread pool (never on the event loop)
+- metrics(): load seconds, cache hits, encode count / p50 / p95 / max per model
+
+Usage:
+    registry = get_model_registry()
+    registry.warmup(["all-mpnet-base-v2"])
+    vector = registry.encode("all-mpnet-base-v2", "some text")
+    vector = await registry.encode_async("all-mpnet-base-v2", "some text")
+
+Author: Atlas (Infrastructure Engineer)
+Date: 2026-10-18
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Encode latencies kept per model for p50/p95
+LATENCY_WINDOW = 1024
+
+# Encode threads (torch releases the GIL during inference)
+ENCODE_WORKERS = 2
+
+WARMUP_TEXT = "warmup"
+
+
+class _ModelStats:
+    """Load time and a rolling window of encode latencies for one model."""
+
+    def __init__(self):
+        self.load_seconds: Optional[float] = None
+        self.warmup_seconds: Optional[float] = None
+        self.cache_hits = 0  # get_model calls served by the already-loaded model
+        self.encodes = 0
+        self.texts = 0
+        self.latencies_ms: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def snapshot(self) -> Dict[str, Any]:
+        latencies = np.fromiter(self.latencies_ms, dtype=float)
+        return {
+            "load_seconds": self.load_seconds,
+            "warmup_seconds": self.warmup_seconds,
+            "cache_hits": self.cache_hits,
+            "encodes": self.encodes,
+            "texts": self.texts,
+            "encode_p50_ms": round(float(np.percentile(latencies, 50)), 3) if latencies.size else None,
+            "encode_p95_ms": round(float(np.percentile(latencies, 95)), 3) if latencies.size else None,
+            "encode_max_ms": round(float(latencies.max()), 3) if latencies.size else None,
+        }
+
+
+class EmbeddingModelRegistry:
+    """
+    Process-wide SentenceTransformer cache with warmup and metrics.
+
+    loader(name) builds a model; defaults to sentence_transformers.SentenceTransformer
+    (imported lazily so importing the registry stays cheap).
+    """
+
+    def __init__(self, loader=None, encode_workers: int = ENCODE_WORKERS):
+        self._loader = loader
+        self._encode_workers = encode_workers
+        self._models: Dict[str, Any] = {}
+        self._stats: Dict[str, _ModelStats] = {}
+        self._lock = threading.Lock()
+        self._model_locks: Dict[str, threading.Lock] = {}
+        self._stats_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _load(self, name: str) -> Any:
+        if self._loader is not None:
+            return self._loader(name)
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(name)
+
+    def get_model(self, name: str, warmup: bool = True) -> Any:
+        """
+        Return the shared model, loading (and warming up) on first use.
+
+        Concurrent first callers for the same model wait for a single load.
+        """
+        model = self._models.get(name)
+        if model is not None:
+            self._count_hit(name)
+            return model
+
+        with self._lock:
+            model_lock = self._model_locks.setdefault(name, threading.Lock())
+
+        with model_lock:
+            model = self._models.get(name)
+            if model is not None:
+                self._count_hit(name)
+                return model
+
+            started = time.perf_counter()
+            model = self._load(name)
+            load_seconds = time.perf_counter() - started
+
+            warmup_seconds = None
+            if warmup:
+                started = time.perf_counter()
+                model.encode([WARMUP_TEXT])
+                warmup_seconds = time.perf_counter() - started
+
+            stats = self._stats_for(name)
+            stats.load_seconds = load_seconds
+            stats.warmup_seconds = warmup_seconds
+            self._models[name] = model
+
+        logger.info(
+            f"[ModelRegistry] Loaded {name} in {load_seconds:.2f}s"
+            + (f" (warmup {warmup_seconds * 1000:.0f}ms)" if warmup_seconds is not None else "")
+        )
+        return model
+
+    def warmup(self, names: Iterable[str]) -> Dict[str, float]:
+        """
+        Preload and warm up models (call at service startup).
+
+        Returns:
+            {name: load_seconds} for every requested model
+        """
+        names = list(names)
+        for name in names:
+            self.get_model(name)
+        return {name: self._stats[name].load_seconds for name in names}
+
+    def _count_hit(self, name: str) -> None:
+        stats = self._stats_for(name)
+        with self._stats_lock:
+            stats.cache_hits += 1
+
+    def _stats_for(self, name: str) -> _ModelStats:
+        with self._stats_lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = _ModelStats()
+            return stats
+
+    def encode(self, name: str, texts: Any, **kwargs) -> Any:
+        """
+        Blocking encode through the shared model (same signature/result as model.encode).
+
+        Args:
+            name: Model name
+            texts: A string or list of strings
+            **kwargs: Passed to model.encode (batch_size, normalize_embeddings, ...)
+        """
+        model = self.get_model(name)
+        started = time.perf_counter()
+        result = model.encode(texts, **kwargs)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        stats = self._stats_for(name)
+        with self._stats_lock:
+            stats.encodes += 1
+            stats.texts += 1 if isinstance(texts, str) else len(texts)
+            stats.latencies_ms.append(elapsed_ms)
+        return result
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._encode_workers,
+                    thread_name_prefix="embed"
+                )
+            return self._executor
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking embedding call (e.g. text building + encode) on the registry's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(fn, *args, **kwargs))
+
+    async def encode_async(self, name: str, texts: Any, **kwargs) -> Any:
+        """encode() on the registry's thread pool, so the event loop never blocks."""
+        return await self.run(self.encode, name, texts, **kwargs)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-model load time, cache hits and encode latency (p50/p95/max over the last LATENCY_WINDOW encodes)."""
+        with self._stats_lock:
+            return {name: stats.snapshot() for name, stats in self._stats.items()}
+
+
+# Global singleton instance
+_model_registry = None
+_model_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> EmbeddingModelRegistry:
+    """
+    Get or create the process-wide embedding model registry.
+
+    Returns:
+        EmbeddingModelRegistry singleton
+    """
+    global _model_registry
+
+    with _model_registry_lock:
+        if _model_registry is None:
+            _model_registry = EmbeddingModelRegistry()
+
+    return _model_registry
@@ -20,10 +20,42 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from orchestration.adapters.search.embedding_service import get_embedding_service
+from orchestration.libs.utils.falkordb_adapter import cypher_params_header, vector_param
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Constant query bodies: embeddings, labels and limits travel as parameters so
+# FalkorDB parses/plans each query once and reuses the cached plan afterwards.
+NODE_VECTOR_SEARCH_QUERY = """
+CALL db.idx.vector.queryNodes($label, 'content_embedding', $k, vecf32($query_vector))
+YIELD node, score
+WHERE score >= $threshold
+RETURN
+  node.name as name,
+  node.description as description,
+  node.embeddable_text as embeddable_text,
+  labels(node) as labels,
+  score as distance
+ORDER BY score DESC
+LIMIT $k
+"""
+
+LINK_VECTOR_SEARCH_QUERY = """
+CALL db.idx.vector.queryRelationships($rel_type, 'relationship_embedding', $k, vecf32($query_vector))
+YIELD relationship, score
+WHERE score <= $max_distance
+RETURN
+  type(relationship) as link_type,
+  relationship.goal as goal,
+  relationship.mindstate as mindstate,
+  relationship.felt_as as felt_as,
+  relationship.embeddable_text as embeddable_text,
+  score as distance
+ORDER BY score ASC
+LIMIT $limit
+"""
+
 
 class SemanticSearch:
     """
@@ -90,24 +122,17 @@ class SemanticSearch:
         # Build vector query using FalkorDB's vector search procedure
         # FalkorDB expects: queryNodes(label, attribute, k, vecf32([array]))
         # FalkorDB returns cosine similarity scores (higher = more similar, range 0-1)
-        vector_str = str(query_embedding)  # Converts list to "[0.1, 0.2, ...]"
+        # Embedding is a query parameter, not inlined text (constant plan-cacheable body)
 
         # Fix #6: Query more results to account for potential near-duplicates
         query_limit = limit * 3
 
-        query = f"""
-        CALL db.idx.vector.queryNodes('{node_type}', 'content_embedding', {query_limit}, vecf32({vector_str}))
-        YIELD node, score
-        WHERE score >= {threshold}
-        RETURN
-          node.name as name,
-          node.description as description,
-          node.embeddable_text as embeddable_text,
-          labels(node) as labels,
-          score as distance
-        ORDER BY score DESC
-        LIMIT {query_limit}
-        """
+        query = cypher_params_header({
+            'label': node_type,
+            'k': query_limit,
+            'threshold': threshold,
+            'query_vector': vector_param(query_embedding),
+        }) + NODE_VECTOR_SEARCH_QUERY
 
         try:
             result = self.r.execute_command('GRAPH.QUERY', self.graph_name, query)
@@ -187,21 +212,13 @@ class SemanticSearch:
             return []
 
         # Build vector query using FalkorDB's vector search procedure
-        vector_str = str(query_embedding)
-        query = f"""
-        CALL db.idx.vector.queryRelationships('{link_type}', 'relationship_embedding', {limit * 2}, vecf32({vector_str}))
-        YIELD relationship, score
-        WHERE score <= {1.0 - threshold}
-        RETURN
-          type(relationship) as link_type,
-          relationship.goal as goal,
-          relationship.mindstate as mindstate,
-          relationship.felt_as as felt_as,
-          relationship.embeddable_text as embeddable_text,
-          score as distance
-        ORDER BY score ASC
-        LIMIT {limit}
-        """
+        query = cypher_params_header({
+            'rel_type': link_type,
+            'k': limit * 2,
+            'max_distance': 1.0 - threshold,
+            'limit': limit,
+            'query_vector': vector_param(query_embedding),
+        }) + LINK_VECTOR_SEARCH_QUERY
 
         try:
             result = self.r.execute_command('GRAPH.QUERY', self.graph_name, query)
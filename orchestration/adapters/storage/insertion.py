@@ -37,8 +37,10 @@ from orchestration.libs.write_gate import namespace_for_graph, write_gate
 # Import Ada's schema registry
 from substrate.schemas.consciousness_schema import NODE_TYPES, RELATION_TYPES
 
-# Import local embedding model for semantic layer
-from sentence_transformers import SentenceTransformer
+# Local embedding model for semantic layer (shared per process via the model registry)
+from orchestration.adapters.search.model_registry import get_model_registry
+
+EMBEDDING_MODEL_NAME = 'sentence-transformers/all-MiniLM-L6-v2'
 
 # Import serialization layer to handle FalkorDB primitive-type constraint
 from substrate.schemas.serialization import serialize_dict_fields, verify_no_nested_dicts
@@ -126,7 +128,7 @@ class ConsciousnessIngestionEngine:
 
         # Initialize local embedding model for semantic layer
         print(f"[ConsciousnessIngestionEngine] Loading embedding model...")
-        self.embedding_model = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
+        self.embedding_model = get_model_registry().get_model(EMBEDDING_MODEL_NAME)
         embedding_dim = self.embedding_model.get_sentence_embedding_dimension()
 
         print(f"[ConsciousnessIngestionEngine] Initialized")
@@ -236,7 +238,7 @@ class ConsciousnessIngestionEngine:
                     # Combine name + description for richer semantic representation
                     text_to_embed = f"{node_dict.get('name', '')}: {node_dict.get('description', '')}" \
                                    if node_dict.get('description') else node_dict.get('name', '')
-                    embedding = self.embedding_model.encode(text_to_embed).tolist()
+                    embedding = get_model_registry().encode(EMBEDDING_MODEL_NAME, text_to_embed).tolist()
                     node_dict['embedding'] = embedding
 
                     # CRITICAL: Serialize complex dict fields to JSON strings for FalkorDB
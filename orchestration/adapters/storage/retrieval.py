@@ -6,7 +6,9 @@ relevant consciousness context from multi-level memory (N1/N2/N3) via parallel h
 
 Flow:
 1. Couche 3 generates RetrievalIntention (via S6 autonomous energy or explicit request)
-2. Orchestrator executes 6 parallel queries (N1/N2/N3 � vector/graph)
+2. Orchestrator embeds the query and extracts entities once (shared by all
+   levels), then executes 6 parallel queries (N1/N2/N3 � vector/graph) on a
+   pooled off-loop executor with per-level deadlines
 3. Temporal filtering applied via Phase 2 bitemporal logic
 4. Results assembled into ConsciousnessStream with full consciousness metadata
 5. Stream returned to Couche 3 for response formulation
@@ -20,10 +22,16 @@ Date: 2025-10-17
 
 import sys
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Literal, Tuple
+from typing import List, Dict, Any, Optional, Literal, Tuple, Callable
 from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
+import functools
+import hashlib
 import json
+import threading
+import time
 
 # Add substrate to path for schema imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "substrate"))
@@ -39,6 +47,10 @@ from orchestration.config.graph_names import resolver
 
 # Import FalkorDB for graph queries
 from llama_index.graph_stores.falkordb import FalkorDBGraphStore
+from orchestration.libs.utils.falkordb_adapter import vector_param
+
+# Shared embedding models (one load per process)
+from orchestration.adapters.search.model_registry import get_model_registry
 
 # Import our custom LLM wrapper for subentity extraction
 from orchestration.libs.custom_claude_llm import create_claude_llm
@@ -198,6 +210,8 @@ class ConsciousnessStream(BaseModel):
     # Query performance metadata
     retrieval_latency_ms: Optional[int] = None
     query_count: int = 6  # Always 6 parallel queries
+    level_latency_ms: Dict[str, int] = {}  # Per query ("N1_vector", ...) + shared work ("embedding", "entities")
+    cache_hits: int = 0  # Levels served from the short-term result cache
 
 
 # ============================================================================
@@ -252,96 +266,230 @@ def generate_temporal_filter(
         raise ValueError(f"Unknown temporal_mode: {temporal_mode}")
 
 
+# ============================================================================
+# Component 2: Shared Query Execution (pooled, off-loop, short-term cache)
+# ============================================================================
+
+# Worker threads for blocking FalkorDB / LLM / embedding calls (6 level queries + shared work)
+RETRIEVAL_POOL_WORKERS = 8
+
+# Per-level query deadline: a slow level is dropped (empty results) instead of
+# holding back the whole stream. The worker thread finishes in the background.
+LEVEL_DEADLINE_S = 5.0
+
+# Short-term cache for level results, query embeddings and extracted entities.
+# Keyed by (query hash, intention filters, graph); "current" mode results may be
+# up to RESULT_CACHE_TTL_S stale, which is fine for conversational retrieval.
+RESULT_CACHE_TTL_S = 5.0
+RESULT_CACHE_MAX_ENTRIES = 256
+
+EMBEDDING_MODEL_NAME = 'sentence-transformers/all-MiniLM-L6-v2'
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_graph_stores: Dict[Tuple[str, str], Any] = {}
+_graph_stores_lock = threading.Lock()
+
+_result_cache: "OrderedDict[Tuple[str, ...], Tuple[float, Any]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Shared retrieval thread pool (created on first use)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=RETRIEVAL_POOL_WORKERS,
+                thread_name_prefix="retrieval"
+            )
+        return _executor
+
+
+async def _run_blocking(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking call on the retrieval pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(fn, *args, **kwargs))
+
+
+def get_graph_store(
+    graph_name: str,
+    falkordb_host: str = "localhost",
+    falkordb_port: int = 6379
+) -> FalkorDBGraphStore:
+    """
+    Pooled FalkorDBGraphStore per (url, graph).
+
+    Stores (and their redis connection pools) are reused across retrievals
+    instead of opening a fresh connection for every level query.
+    """
+    falkordb_url = f"redis://{falkordb_host}:{falkordb_port}"
+    key = (falkordb_url, graph_name)
+    with _graph_stores_lock:
+        store = _graph_stores.get(key)
+        if store is None:
+            store = FalkorDBGraphStore(graph_name=graph_name, url=falkordb_url)
+            _graph_stores[key] = store
+        return store
+
+
+def _query_hash(query_text: str) -> str:
+    return hashlib.sha256(query_text.encode("utf-8")).hexdigest()
+
+
+def _intention_key(intention: RetrievalIntention) -> str:
+    """Intention filters that change results (identity/provenance fields excluded)."""
+    return json.dumps(
+        intention.model_dump(
+            mode="json",
+            exclude={"query_text", "citizen_id", "intention_id", "generated_at", "generated_by"}
+        ),
+        sort_keys=True
+    )
+
+
+def _cache_get(key: Tuple[str, ...]) -> Any:
+    now = time.monotonic()
+    with _result_cache_lock:
+        entry = _result_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= now:
+            del _result_cache[key]
+            return None
+        _result_cache.move_to_end(key)
+        return value
+
+
+def _cache_put(key: Tuple[str, ...], value: Any) -> None:
+    with _result_cache_lock:
+        _result_cache[key] = (time.monotonic() + RESULT_CACHE_TTL_S, value)
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > RESULT_CACHE_MAX_ENTRIES:
+            _result_cache.popitem(last=False)
+
+
+def clear_retrieval_cache() -> None:
+    """Drop all cached level results, embeddings and entity extractions."""
+    with _result_cache_lock:
+        _result_cache.clear()
+
+
 # ============================================================================
 # Component 2: Vector Search Implementation
 # ============================================================================
 
+VECTOR_FIELD_NAMES = [
+    "node_id", "name", "description", "node_type",
+    "valid_at", "invalid_at", "created_at", "expired_at",
+    "energy", "weight", "confidence", "emotion_vector",
+    "felt_quality", "body_sensation", "score"
+]
+
+GRAPH_NODE_FIELD_NAMES = [
+    "node_id", "name", "description", "node_type",
+    "valid_at", "invalid_at", "created_at", "expired_at",
+    "energy", "weight", "confidence", "emotion_vector",
+    "felt_quality", "body_sensation",
+    "node_activity", "node_weight", "path_confidence", "depth"
+]
+
+# Energy-only model: no energy on relations
+RELATIONSHIP_FIELD_NAMES = [
+    "source_id", "target_id", "relation_type", "goal", "mindstate",
+    "confidence", "formation_trigger",
+    "emotion_vector", "valid_at", "invalid_at", "created_at", "expired_at"
+]
+
+def _vector_search_sync(
+    graph_store: Any,
+    query_embedding: List[float],
+    level_name: str,
+    intention: RetrievalIntention
+) -> List[Dict[str, Any]]:
+    """Blocking vector search (runs on the retrieval pool). Raises on query errors."""
+
+    # Generate temporal filter clause
+    temporal_cypher = generate_temporal_filter(
+        intention.temporal_mode,
+        intention.as_of_time
+    )
+
+    # FalkorDB Native Vector Search
+    # Signature: db.idx.vector.queryNodes(label, attribute, k, vecf32(query))
+    # All nodes carry the :Node label for vector search (44 node types, one index).
+    # The embedding travels as a parameter (vecf32($query_vector)), not as query text.
+    cypher_query = f"""
+    CALL db.idx.vector.queryNodes(
+        'Node',          // All nodes have :Node label for vector search
+        'embedding',     // Attribute name
+        $k,              // Get extra results before filtering
+        vecf32($query_vector)
+    ) YIELD node, score
+    WHERE {temporal_cypher}
+    RETURN
+        id(node) AS node_id,
+        node.name AS name,
+        node.description AS description,
+        labels(node)[0] AS node_type,
+        node.valid_at AS valid_at,
+        node.invalid_at AS invalid_at,
+        node.created_at AS created_at,
+        node.expired_at AS expired_at,
+        node.energy AS energy,
+        node.weight AS weight,
+        node.confidence AS confidence,
+        node.emotion_vector AS emotion_vector,
+        node.felt_quality AS felt_quality,
+        node.body_sensation AS body_sensation,
+        score
+    ORDER BY score DESC
+    LIMIT $max_results
+    """
+
+    raw_results = graph_store.query(
+        cypher_query,
+        params={
+            "k": intention.max_results_per_level * 3,
+            "max_results": intention.max_results_per_level,
+            "query_vector": vector_param(query_embedding)
+        }
+    )
+
+    # FalkorDB returns results as lists matching RETURN order
+    results = []
+    for raw_result in raw_results:
+        result_dict = dict(zip(VECTOR_FIELD_NAMES, raw_result))
+        result_dict["_source"] = f"{level_name}_vector"
+        results.append(result_dict)
+
+    return results
+
+
 async def vector_search(
     query_embedding: List[float],
     graph_name: str,  # "citizen_Luca" (N1) or "ecosystem" or "ecosystem_n3"
     level_name: str,  # "N1", "N2", or "N3"
     intention: RetrievalIntention,
     falkordb_host: str = "localhost",
-    falkordb_port: int = 6379
+    falkordb_port: int = 6379,
+    graph_store: Optional[Any] = None
 ) -> List[Dict[str, Any]]:
     """
     Semantic similarity search using FalkorDB native vectors.
 
     Returns top-K nodes ranked by cosine similarity to query embedding.
+    The query runs on the retrieval pool (off the event loop) against a
+    pooled graph store unless graph_store is given.
     """
 
     print(f"[VectorSearch/{level_name}] Starting for graph: {graph_name}")
 
     try:
-        # Connect to FalkorDB graph
-        falkordb_url = f"redis://{falkordb_host}:{falkordb_port}"
-        graph_store = FalkorDBGraphStore(
-            graph_name=graph_name,
-            url=falkordb_url
-        )
-
-        # Generate temporal filter clause
-        temporal_cypher = generate_temporal_filter(
-            intention.temporal_mode,
-            intention.as_of_time
-        )
-
-        # FalkorDB Native Vector Search
-        # Signature: db.idx.vector.queryNodes(label, attribute, k, vecf32(query))
-        # NOTE: FalkorDB requires querying specific labels, so we union across all node types
-        # This is architectural - we have 44 different node types, not a single "Node" label
-
-        # Convert embedding list to vecf32 format for FalkorDB
-        # FalkorDB expects: vecf32([float, float, ...])
-        embedding_str = str(query_embedding)
-
-        # Build union query across all possible node labels
-        # We query top K from each label, then sort and limit to overall top K
-        cypher_query = f"""
-        CALL db.idx.vector.queryNodes(
-            'Node',          // All nodes have :Node label for vector search
-            'embedding',     // Attribute name
-            {intention.max_results_per_level * 3},  // Get extra results before filtering
-            vecf32({embedding_str})
-        ) YIELD node, score
-        WHERE {temporal_cypher}
-        RETURN
-            id(node) AS node_id,
-            node.name AS name,
-            node.description AS description,
-            labels(node)[0] AS node_type,
-            node.valid_at AS valid_at,
-            node.invalid_at AS invalid_at,
-            node.created_at AS created_at,
-            node.expired_at AS expired_at,
-            node.energy AS energy,
-            node.weight AS weight,
-            node.confidence AS confidence,
-            node.emotion_vector AS emotion_vector,
-            node.felt_quality AS felt_quality,
-            node.body_sensation AS body_sensation,
-            score
-        ORDER BY score DESC
-        LIMIT {intention.max_results_per_level}
-        """
-
-        # Execute native vector search query
-        raw_results = graph_store.query(cypher_query)
-
-        # Convert list results to dictionaries
-        # FalkorDB returns results as lists matching RETURN order
-        field_names = [
-            "node_id", "name", "description", "node_type",
-            "valid_at", "invalid_at", "created_at", "expired_at",
-            "energy", "weight", "confidence", "emotion_vector",
-            "felt_quality", "body_sensation", "score"
-        ]
-
-        results = []
-        for raw_result in raw_results:
-            result_dict = {field_names[i]: raw_result[i] for i in range(len(field_names))}
-            result_dict["_source"] = f"{level_name}_vector"
-            results.append(result_dict)
+        graph_store = graph_store or get_graph_store(graph_name, falkordb_host, falkordb_port)
+        results = await _run_blocking(_vector_search_sync, graph_store, query_embedding, level_name, intention)
 
         print(f"[VectorSearch/{level_name}] Retrieved {len(results)} results")
         return results
@@ -362,7 +510,8 @@ async def extract_entities_from_query(
     """
     Extract subentity names from query text using LLM.
 
-    Uses few-shot prompting with schema awareness.
+    Uses few-shot prompting with schema awareness. The blocking LLM call
+    runs on the retrieval pool.
     """
 
     print(f"[EntityExtraction] Extracting subentities from query...")
@@ -381,8 +530,9 @@ async def extract_entities_from_query(
     Return ONLY the JSON array, nothing else.
     """
 
+    response_text = ""
     try:
-        response = llm.complete(prompt)
+        response = await _run_blocking(llm.complete, prompt)
         response_text = response.text.strip()
 
         # Debug: Show what LLM returned
@@ -411,6 +561,121 @@ async def extract_entities_from_query(
         return []
 
 
+def _graph_traversal_sync(
+    graph_store: Any,
+    subentities: List[str],
+    level_name: str,
+    intention: RetrievalIntention
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Blocking traversal + relationship fetch (runs on the retrieval pool). Raises on query errors."""
+
+    if not subentities:
+        return [], []
+
+    # Generate temporal filter
+    temporal_cypher = generate_temporal_filter(
+        intention.temporal_mode,
+        intention.as_of_time
+    )
+
+    # Multi-subentity traversal Cypher (ARCHITECTURAL DECISION #3)
+    cypher_query = f"""
+    MATCH (start)
+    WHERE start.name IN $entity_names
+      AND ({temporal_cypher.replace('node.', 'start.')})
+
+    // Traverse relationships to depth 2
+    MATCH path = (start)-[r*1..2]-(connected)
+    WHERE ({temporal_cypher.replace('node.', 'connected.')})
+
+    // Rank by relationship strength and consciousness metadata (energy-only model)
+    WITH connected, path,
+         // Energy contribution: node activity + weight
+         COALESCE(connected.energy, 0.0) AS node_activity,
+         COALESCE(connected.weight, 0.5) AS node_weight,
+         // Confidence contribution from relationships
+         reduce(conf = 0.0, rel IN relationships(path) | conf + COALESCE(rel.confidence, 0.5)) AS path_confidence,
+         // Path length penalty
+         length(path) AS depth
+
+    RETURN DISTINCT
+        id(connected) AS node_id,
+        connected.name AS name,
+        connected.description AS description,
+        labels(connected)[0] AS node_type,
+        connected.valid_at AS valid_at,
+        connected.invalid_at AS invalid_at,
+        connected.created_at AS created_at,
+        connected.expired_at AS expired_at,
+        connected.energy AS energy,
+        connected.weight AS weight,
+        connected.confidence AS confidence,
+        connected.emotion_vector AS emotion_vector,
+        connected.felt_quality AS felt_quality,
+        connected.body_sensation AS body_sensation,
+        node_activity,
+        node_weight,
+        path_confidence,
+        depth
+    ORDER BY node_weight DESC, node_activity DESC, path_confidence DESC, depth ASC
+    LIMIT $max_results
+    """
+
+    # Execute node query
+    raw_node_results = graph_store.query(
+        cypher_query,
+        params={
+            "entity_names": subentities,
+            "max_results": intention.max_results_per_level
+        }
+    )
+
+    node_results = []
+    for raw_result in raw_node_results:
+        result_dict = dict(zip(GRAPH_NODE_FIELD_NAMES, raw_result))
+        result_dict["_source"] = f"{level_name}_graph"
+        # Energy-only model: score = weight (static importance) + activity (dynamic energy)
+        weight_val = result_dict.get("node_weight", 0.5)
+        activity_val = result_dict.get("node_activity", 0.0)
+        result_dict["score"] = (weight_val * 0.6) + (activity_val * 0.4)  # Weight matters more
+        node_results.append(result_dict)
+
+    if not node_results:
+        return node_results, []
+
+    # Fetch relationships for returned nodes
+    relationship_query = """
+    MATCH (source)-[r]->(target)
+    WHERE id(source) IN $node_ids
+      AND id(target) IN $node_ids
+    RETURN
+        id(source) AS source_id,
+        id(target) AS target_id,
+        type(r) AS relation_type,
+        r.goal AS goal,
+        r.mindstate AS mindstate,
+        r.confidence AS confidence,
+        r.formation_trigger AS formation_trigger,
+        r.emotion_vector AS emotion_vector,
+        r.valid_at AS valid_at,
+        r.invalid_at AS invalid_at,
+        r.created_at AS created_at,
+        r.expired_at AS expired_at
+    """
+
+    raw_relationship_results = graph_store.query(
+        relationship_query,
+        params={"node_ids": [r["node_id"] for r in node_results]}
+    )
+
+    relationship_results = [
+        dict(zip(RELATIONSHIP_FIELD_NAMES, raw_result))
+        for raw_result in raw_relationship_results
+    ]
+
+    return node_results, relationship_results
+
+
 async def graph_traversal(
     query_text: str,
     graph_name: str,
@@ -418,13 +683,17 @@ async def graph_traversal(
     intention: RetrievalIntention,
     llm: Any,
     falkordb_host: str = "localhost",
-    falkordb_port: int = 6379
+    falkordb_port: int = 6379,
+    subentities: Optional[List[str]] = None,
+    graph_store: Optional[Any] = None
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """
     Relationship-based traversal from subentities identified in query.
 
     Steps:
-    1. Extract subentities from query_text via LLM
+    1. Extract subentities from query_text via LLM (skipped when the caller
+       already extracted them - retrieve_consciousness_context shares one
+       extraction across N1/N2/N3)
     2. Start traversal from those subentities (parallel)
     3. Follow relationships to depth=2
     4. Apply temporal filters
@@ -437,138 +706,18 @@ async def graph_traversal(
 
     try:
         # Step 1: Extract subentities via LLM
-        subentities = await extract_entities_from_query(query_text, llm)
+        if subentities is None:
+            subentities = await extract_entities_from_query(query_text, llm)
 
         if not subentities:
             print(f"[GraphTraversal/{level_name}] No subentities extracted, skipping")
             return [], []
 
-        # Connect to FalkorDB graph
-        falkordb_url = f"redis://{falkordb_host}:{falkordb_port}"
-        graph_store = FalkorDBGraphStore(
-            graph_name=graph_name,
-            url=falkordb_url
-        )
-
-        # Generate temporal filter
-        temporal_cypher = generate_temporal_filter(
-            intention.temporal_mode,
-            intention.as_of_time
+        graph_store = graph_store or get_graph_store(graph_name, falkordb_host, falkordb_port)
+        node_results, relationship_results = await _run_blocking(
+            _graph_traversal_sync, graph_store, subentities, level_name, intention
         )
 
-        # Multi-subentity traversal Cypher (ARCHITECTURAL DECISION #3)
-        cypher_query = f"""
-        MATCH (start)
-        WHERE start.name IN $entity_names
-          AND ({temporal_cypher.replace('node.', 'start.')})
-
-        // Traverse relationships to depth 2
-        MATCH path = (start)-[r*1..2]-(connected)
-        WHERE ({temporal_cypher.replace('node.', 'connected.')})
-
-        // Rank by relationship strength and consciousness metadata (energy-only model)
-        WITH connected, path,
-             // Energy contribution: node activity + weight
-             COALESCE(connected.energy, 0.0) AS node_activity,
-             COALESCE(connected.weight, 0.5) AS node_weight,
-             // Confidence contribution from relationships
-             reduce(conf = 0.0, rel IN relationships(path) | conf + COALESCE(rel.confidence, 0.5)) AS path_confidence,
-             // Path length penalty
-             length(path) AS depth
-
-        RETURN DISTINCT
-            id(connected) AS node_id,
-            connected.name AS name,
-            connected.description AS description,
-            labels(connected)[0] AS node_type,
-            connected.valid_at AS valid_at,
-            connected.invalid_at AS invalid_at,
-            connected.created_at AS created_at,
-            connected.expired_at AS expired_at,
-            connected.energy AS energy,
-            connected.weight AS weight,
-            connected.confidence AS confidence,
-            connected.emotion_vector AS emotion_vector,
-            connected.felt_quality AS felt_quality,
-            connected.body_sensation AS body_sensation,
-            node_activity,
-            node_weight,
-            path_confidence,
-            depth
-        ORDER BY node_weight DESC, node_activity DESC, path_confidence DESC, depth ASC
-        LIMIT $max_results
-        """
-
-        # Execute node query
-        raw_node_results = graph_store.query(
-            cypher_query,
-            params={
-                "entity_names": subentities,
-                "max_results": intention.max_results_per_level
-            }
-        )
-
-        # Convert list results to dictionaries
-        node_field_names = [
-            "node_id", "name", "description", "node_type",
-            "valid_at", "invalid_at", "created_at", "expired_at",
-            "energy", "weight", "confidence", "emotion_vector",
-            "felt_quality", "body_sensation",
-            "node_activity", "node_weight", "path_confidence", "depth"
-        ]
-
-        node_results = []
-        for raw_result in raw_node_results:
-            result_dict = {node_field_names[i]: raw_result[i] for i in range(len(node_field_names))}
-            result_dict["_source"] = f"{level_name}_graph"
-            # Energy-only model: score = weight (static importance) + activity (dynamic energy)
-            weight_val = result_dict.get("node_weight", 0.5)
-            activity_val = result_dict.get("node_activity", 0.0)
-            result_dict["score"] = (weight_val * 0.6) + (activity_val * 0.4)  # Weight matters more
-            node_results.append(result_dict)
-
-        # Fetch relationships for returned nodes
-        if node_results:
-            node_ids = [r["node_id"] for r in node_results]
-
-            relationship_query = """
-            MATCH (source)-[r]->(target)
-            WHERE id(source) IN $node_ids
-              AND id(target) IN $node_ids
-            RETURN
-                id(source) AS source_id,
-                id(target) AS target_id,
-                type(r) AS relation_type,
-                r.goal AS goal,
-                r.mindstate AS mindstate,
-                r.confidence AS confidence,
-                r.formation_trigger AS formation_trigger,
-                r.emotion_vector AS emotion_vector,
-                r.valid_at AS valid_at,
-                r.invalid_at AS invalid_at,
-                r.created_at AS created_at,
-                r.expired_at AS expired_at
-            """
-
-            raw_relationship_results = graph_store.query(
-                relationship_query,
-                params={"node_ids": node_ids}
-            )
-
-            # Convert list results to dictionaries (energy-only model: no energy on relations)
-            rel_field_names = [
-                "source_id", "target_id", "relation_type", "goal", "mindstate",
-                "confidence", "formation_trigger",
-                "emotion_vector", "valid_at", "invalid_at", "created_at", "expired_at"
-            ]
-
-            relationship_results = []
-            for raw_result in raw_relationship_results:
-                result_dict = {rel_field_names[i]: raw_result[i] for i in range(len(rel_field_names))}
-                relationship_results.append(result_dict)
-        else:
-            relationship_results = []
-
         print(f"[GraphTraversal/{level_name}] Retrieved {len(node_results)} nodes, {len(relationship_results)} relationships")
         return node_results, relationship_results
 
@@ -846,31 +995,47 @@ def assemble_consciousness_stream(
 # Component 2: Main Retrieval Orchestrator (6-Way Parallel Queries)
 # ============================================================================
 
+def _encode_query(query_text: str) -> List[float]:
+    return get_model_registry().encode(EMBEDDING_MODEL_NAME, query_text).tolist()
+
+
+def warmup_retrieval() -> Dict[str, float]:
+    """
+    Preload the query embedding model (call at service startup).
+
+    Keeps the model load and first-encode warmup off the first retrieval.
+
+    Returns:
+        {model_name: load_seconds}
+    """
+    return get_model_registry().warmup([EMBEDDING_MODEL_NAME])
+
+
 async def generate_embedding(query_text: str) -> List[float]:
     """
     Generate embedding for query text using sentence-transformers.
 
     Uses: sentence-transformers/all-MiniLM-L6-v2 (384 dimensions)
     - Same model used for backfilling embeddings
-    - Local model (no API dependency)
-    - Fast inference
+    - Local model (no API dependency), loaded once per process by the
+      shared model registry
+    - Encoded off the event loop
     """
-    from sentence_transformers import SentenceTransformer
-
-    # Load model (cached after first call)
-    model = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
-
     print(f"[Embedding] Generating embedding for query: {query_text[:50]}...")
-    embedding = model.encode(query_text).tolist()
-
-    return embedding
+    embedding = await get_model_registry().encode_async(EMBEDDING_MODEL_NAME, query_text)
+    return embedding.tolist()
 
 
 async def retrieve_consciousness_context(
     intention: RetrievalIntention,
     falkordb_host: str = "localhost",
     falkordb_port: int = 6379,
-    claude_working_dir: Optional[str] = None
+    claude_working_dir: Optional[str] = None,
+    level_deadline_s: float = LEVEL_DEADLINE_S,
+    use_cache: bool = True,
+    llm: Optional[Any] = None,
+    graph_store_factory: Optional[Callable[[str], Any]] = None,
+    embed_fn: Optional[Callable[[str], List[float]]] = None
 ) -> ConsciousnessStream:
     """
     Main retrieval function - orchestrates 6 parallel queries.
@@ -878,11 +1043,28 @@ async def retrieve_consciousness_context(
     This is the entry point called by Couche 3 (Mind/Ecology).
 
     Flow:
-    1. Generate query embedding
-    2. Execute 6 parallel queries (N1/N2/N3 � vector/graph)
+    1. Start shared work once: query embedding + LLM entity extraction
+    2. Execute 6 parallel queries (N1/N2/N3 � vector/graph) on the retrieval
+       pool; each vector level waits for the embedding, each graph level for
+       the entities, and each query has its own deadline
     3. Assemble results into ConsciousnessStream
     4. Return to Couche 3
 
+    Level results, the embedding and the entities are cached for
+    RESULT_CACHE_TTL_S keyed by (query hash, intention filters, graph), so
+    N2/N3 results are shared across citizens asking the same question.
+
+    Args:
+        intention: Retrieval request
+        falkordb_host: FalkorDB server host
+        falkordb_port: FalkorDB server port
+        claude_working_dir: Working directory for the entity extraction LLM
+        level_deadline_s: Deadline per level query; late levels return empty
+        use_cache: Use the short-term result cache
+        llm: LLM for entity extraction (default: created on demand)
+        graph_store_factory: graph_name -> store (default: pooled FalkorDBGraphStore)
+        embed_fn: Blocking text -> embedding (default: sentence-transformers)
+
     ARCHITECTURAL DECISION #1: Query all levels by default (parallel = no latency penalty)
     """
 
@@ -893,16 +1075,97 @@ async def retrieve_consciousness_context(
     print(f"[Retrieval] Temporal mode: {intention.temporal_mode}")
     print(f"{'=' * 60}\n")
 
-    start_time = datetime.utcnow()
+    start_time = time.perf_counter()
 
-    # Initialize LLM for subentity extraction
-    llm = create_claude_llm(
-        working_dir=claude_working_dir,
-        timeout=60
+    store_for = graph_store_factory or (
+        lambda graph_name: get_graph_store(graph_name, falkordb_host, falkordb_port)
     )
+    embed_fn = embed_fn or _encode_query
+    query_hash = _query_hash(intention.query_text)
+    intention_key = _intention_key(intention)
+    server = f"{falkordb_host}:{falkordb_port}"
+
+    timings: Dict[str, int] = {}
+    cache_hits = 0
+
+    def elapsed_ms(started: float) -> int:
+        return int((time.perf_counter() - started) * 1000)
+
+    async def shared_embedding() -> List[float]:
+        key = ("embedding", query_hash)
+        cached = _cache_get(key) if use_cache else None
+        if cached is not None:
+            return cached
+        started = time.perf_counter()
+        print(f"[Embedding] Generating embedding for query: {intention.query_text[:50]}...")
+        embedding = await _run_blocking(embed_fn, intention.query_text)
+        timings["embedding"] = elapsed_ms(started)
+        if use_cache:
+            _cache_put(key, embedding)
+        return embedding
+
+    async def shared_entities() -> List[str]:
+        nonlocal llm
+        key = ("entities", query_hash)
+        cached = _cache_get(key) if use_cache else None
+        if cached is not None:
+            return cached
+        started = time.perf_counter()
+        if llm is None:
+            # Initialize LLM for subentity extraction
+            llm = create_claude_llm(working_dir=claude_working_dir, timeout=60)
+        entities = await extract_entities_from_query(intention.query_text, llm)
+        timings["entities"] = elapsed_ms(started)
+        if use_cache and entities:
+            _cache_put(key, entities)  # Empty may be an LLM failure: retry next time
+        return entities
+
+    # Shared work starts once, on first need (not at all if every level is cached)
+    shared_tasks: Dict[str, "asyncio.Future[Any]"] = {}
+
+    def shared(name: str, factory: Callable[[], Any]) -> "asyncio.Future[Any]":
+        if name not in shared_tasks:
+            shared_tasks[name] = asyncio.ensure_future(factory())
+        return shared_tasks[name]
+
+    async def run_level(level_name: str, kind: str, graph_name: str) -> Any:
+        nonlocal cache_hits
+        label = f"{level_name}_{kind}"
+        empty: Any = [] if kind == "vector" else ([], [])
+        key = (query_hash, intention_key, f"{server}/{graph_name}", kind)
+
+        cached = _cache_get(key) if use_cache else None
+        if cached is not None:
+            cache_hits += 1
+            timings[label] = 0
+            return cached
+
+        try:
+            if kind == "vector":
+                shared_input = await shared("embedding", shared_embedding)
+                query_fn = _vector_search_sync
+            else:
+                shared_input = await shared("entities", shared_entities)
+                query_fn = _graph_traversal_sync
+
+            started = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(
+                    _run_blocking(query_fn, store_for(graph_name), shared_input, level_name, intention),
+                    timeout=level_deadline_s
+                )
+            finally:
+                timings[label] = elapsed_ms(started)
+        except asyncio.TimeoutError:
+            print(f"[ERROR] {label} missed {level_deadline_s}s deadline, returning no results")
+            return empty
+        except Exception as e:
+            print(f"[ERROR] {label} failed: {str(e)}")
+            return empty
 
-    # Generate query embedding
-    query_embedding = await generate_embedding(intention.query_text)
+        if use_cache:
+            _cache_put(key, result)
+        return result
 
     # Prepare graph names (using hierarchical naming)
     n1_graph = intention.citizen_id  # Should be full hierarchical name
@@ -911,32 +1174,19 @@ async def retrieve_consciousness_context(
 
     # Execute 6 parallel queries (ARCHITECTURAL DECISION #1)
     print(f"[Retrieval] Executing 6 parallel queries...")
-    results = await asyncio.gather(
-        # N1 queries
-        vector_search(query_embedding, n1_graph, "N1", intention, falkordb_host, falkordb_port),
-        graph_traversal(intention.query_text, n1_graph, "N1", intention, llm, falkordb_host, falkordb_port),
-
-        # N2 queries
-        vector_search(query_embedding, n2_graph, "N2", intention, falkordb_host, falkordb_port),
-        graph_traversal(intention.query_text, n2_graph, "N2", intention, llm, falkordb_host, falkordb_port),
-
-        # N3 queries
-        vector_search(query_embedding, n3_graph, "N3", intention, falkordb_host, falkordb_port),
-        graph_traversal(intention.query_text, n3_graph, "N3", intention, llm, falkordb_host, falkordb_port),
-
-        return_exceptions=True  # Don't fail entire retrieval if one query fails
+    (
+        n1_vec, (n1_graph_nodes, n1_graph_rels),
+        n2_vec, (n2_graph_nodes, n2_graph_rels),
+        n3_vec, (n3_graph_nodes, n3_graph_rels),
+    ) = await asyncio.gather(
+        run_level("N1", "vector", n1_graph),
+        run_level("N1", "graph", n1_graph),
+        run_level("N2", "vector", n2_graph),
+        run_level("N2", "graph", n2_graph),
+        run_level("N3", "vector", n3_graph),
+        run_level("N3", "graph", n3_graph),
     )
 
-    # Unpack results (graph_traversal returns tuples, vector_search returns lists)
-    n1_vec = results[0] if not isinstance(results[0], Exception) else []
-    n1_graph_nodes, n1_graph_rels = results[1] if not isinstance(results[1], Exception) else ([], [])
-
-    n2_vec = results[2] if not isinstance(results[2], Exception) else []
-    n2_graph_nodes, n2_graph_rels = results[3] if not isinstance(results[3], Exception) else ([], [])
-
-    n3_vec = results[4] if not isinstance(results[4], Exception) else []
-    n3_graph_nodes, n3_graph_rels = results[5] if not isinstance(results[5], Exception) else ([], [])
-
     # Assemble consciousness stream (ARCHITECTURAL DECISION #4: Pure concatenation)
     stream = assemble_consciousness_stream(
         n1_vec, n1_graph_nodes, n1_graph_rels,
@@ -946,12 +1196,13 @@ async def retrieve_consciousness_context(
     )
 
     # Add performance metadata
-    end_time = datetime.utcnow()
-    stream.retrieval_latency_ms = int((end_time - start_time).total_seconds() * 1000)
+    stream.retrieval_latency_ms = elapsed_ms(start_time)
+    stream.level_latency_ms = timings
+    stream.cache_hits = cache_hits
 
     print(f"\n{'=' * 60}")
     print(f"[Retrieval] Complete for intention: {intention.intention_id}")
-    print(f"[Retrieval] Latency: {stream.retrieval_latency_ms}ms")
+    print(f"[Retrieval] Latency: {stream.retrieval_latency_ms}ms ({cache_hits} cached levels)")
     print(f"[Retrieval] Total results: {stream.consciousness_summary.total_results}")
     print(f"{'=' * 60}\n")
 
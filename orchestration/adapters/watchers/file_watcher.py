@@ -14,6 +14,8 @@ Design:
   - Ignores vendor/build/node_modules
   - Emits failure.emit on errors (fail-loud)
   - Backpressure: exponential backoff on bus errors
+  - Optional in-process lint: only the changed .py files go to the lint
+    adapter (cached driver, so unchanged content is never re-scanned)
 
 Author: Atlas "Infrastructure Engineer"
 Created: 2025-10-31
@@ -181,12 +183,14 @@ class FileWatcher:
         org_id: str,
         ecosystem_id: str = "prod",
         debounce_ms: int = 300,
-        batch_ms: int = 2000
+        batch_ms: int = 2000,
+        lint_adapter=None
     ):
         self.root_path = root_path
         self.broadcaster = broadcaster
         self.org_id = org_id
         self.ecosystem_id = ecosystem_id
+        self.lint_adapter = lint_adapter  # e.g. PythonLintAdapter; None = lint via review.request only
 
         self.buffer = ChangeBuffer(debounce_ms=debounce_ms, batch_ms=batch_ms)
         self.observer = None
@@ -331,6 +335,9 @@ class FileWatcher:
             )
             return
 
+        if self.lint_adapter is not None:
+            await self._lint_changed(changes, change_id)
+
         # Emit review.request
         try:
             await self.broadcaster.broadcast_event("review.request", {
@@ -351,6 +358,26 @@ class FileWatcher:
                 change_id=change_id
             )
 
+    async def _lint_changed(self, changes: List[FileChange], change_id: str):
+        """Lint only the created/modified Python files of this batch."""
+        paths = [
+            str(self.root_path / change.path)
+            for change in changes
+            if change.event_type != "deleted" and change.path.endswith(".py")
+        ]
+        if not paths:
+            return
+
+        try:
+            result = await self.lint_adapter.lint_files(paths, change_id)
+            logger.info(
+                f"[FileWatcher] Linted {result['files_scanned']} changed files: "
+                f"{result['violations_found']} violations, change_id={change_id}"
+            )
+        except Exception as exc:
+            # Lint adapter already emitted its own failure.emit
+            logger.error(f"[FileWatcher] Lint of changed files failed: {exc}")
+
     async def _handle_emit_failure(self):
         """Handle emission failure with exponential backoff."""
         self.emit_failures += 1
@@ -11,8 +11,13 @@ Triggers:
 
 Architecture:
 - Event-driven: Monitors activation changes after energy propagation
-- Per-subentity state: Each subentity has own activation threshold and state
-- Continuous updates: File written whenever significant activation changes
+- Incremental: Consumes an n.E change feed (update_node_energies) or energy
+  deltas (apply_energy_deltas); only changed nodes are re-evaluated unless a
+  threshold moved. Without a feed, falls back to a full graph scan per check.
+- Per-subentity state: (subentity, node) arrays; all subentities are
+  evaluated in one vectorized pass
+- Debounced updates: File written at most every min_write_interval seconds,
+  and only when the content (ignoring the timestamp) changed
 - Output: Current activation state per subentity
 
 Designer: Felix "Ironhand" (Engineer)
@@ -21,12 +26,17 @@ Date: 2025-10-17
 """
 
 import logging
-from typing import Dict, List, Set, Optional, Tuple
+import os
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from datetime import datetime, timezone
 from dataclasses import dataclass
 from pathlib import Path
 
-from llama_index.graph_stores.falkordb import FalkorDBGraphStore
+import numpy as np
+
+if TYPE_CHECKING:
+    from llama_index.graph_stores.falkordb import FalkorDBGraphStore
 
 # Configure logging
 logging.basicConfig(
@@ -94,14 +104,21 @@ class DynamicPromptGenerator:
     Monitors node activation state changes and updates the file to reflect
     current consciousness state. Each subentity section shows which nodes are
     currently activated for that subentity.
+
+    Node energies, sub_entity_weights and activation flags live in dense
+    arrays (energy per node, weight/active per (subentity, node)). Feeds mark
+    the rows they touch dirty; a check re-evaluates only dirty rows unless a
+    subentity threshold changed, in which case every row is re-evaluated.
     """
 
     def __init__(
         self,
         citizen_id: str,
-        graph_store: FalkorDBGraphStore,
+        graph_store: "FalkorDBGraphStore",
         network_id: str = "N1",
-        file_path: Optional[str] = None
+        file_path: Optional[str] = None,
+        min_write_interval: float = 2.0,
+        node_capacity: int = 1024
     ):
         """
         Initialize prompt generator.
@@ -111,10 +128,14 @@ class DynamicPromptGenerator:
             graph_store: FalkorDB graph connection
             network_id: Network level (N1/N2/N3) - determines file path
             file_path: Path to CLAUDE.md (auto-determined if None)
+            min_write_interval: Minimum seconds between file writes; changes
+                inside the window are written by a later check or flush()
+            node_capacity: Initial node rows (grows by doubling)
         """
         self.citizen_id = citizen_id
         self.graph = graph_store
         self.network_id = network_id
+        self.min_write_interval = min_write_interval
 
         # Determine file path based on network level
         if file_path:
@@ -132,9 +153,26 @@ class DynamicPromptGenerator:
                 logger.warning(f"Unknown network_id '{network_id}', defaulting to N1 path")
                 self.file_path = Path(f"consciousness/citizens/{citizen_id}/CLAUDE.md")
 
-        # Track activation state per subentity per node
-        # Structure: {entity_id: {node_id: is_active}}
-        self.activation_states: Dict[str, Dict[str, bool]] = {}
+        # Node rows: node_id -> row, row -> (node_id, name), energy per row
+        self.node_index: Dict[str, int] = {}
+        self._node_ids: List[str] = []
+        self._node_names: List[str] = []
+        self._energy = np.zeros(max(node_capacity, 1), dtype=np.float64)
+        # Sparse sub_entity_weights per row, kept to fill columns of subentities seen later
+        self._row_weights: Dict[int, Dict[str, float]] = {}
+
+        # Subentity columns: entity_id -> index; weight/active are (subentity, node)
+        self.entity_index: Dict[str, int] = {}
+        self._weights = np.ones((0, self._energy.size), dtype=np.float64)
+        self._active = np.zeros((0, self._energy.size), dtype=bool)
+        self._thresholds = np.zeros(0, dtype=np.float64)
+
+        # Rows whose energy/weights changed since the last check
+        self._dirty_rows: set = set()
+        # True once a caller feeds energies; checks then stop scanning the graph
+        self._feed_attached = False
+        self._feed_ids: List[str] = []
+        self._feed_rows = np.zeros(0, dtype=np.int64)
 
         # Track recent activation changes for each subentity
         # Structure: {entity_id: [ActivationChange]}
@@ -144,9 +182,148 @@ class DynamicPromptGenerator:
         # Structure: {entity_id: criticality (0.0-1.0)}
         self.entity_criticalities: Dict[str, float] = {}
 
+        # Write debounce/diff state
+        self._last_write_at = float("-inf")
+        self._last_written_body: Optional[str] = None
+        self._write_pending = False
+        self._last_global_criticality = 0.5
+        self.bytes_written = 0
+        self.writes = 0
+
         logger.info(f"[DynamicPromptGenerator] Initialized for {citizen_id}")
         logger.info(f"  File path: {self.file_path}")
 
+    @property
+    def activation_states(self) -> Dict[str, Dict[str, bool]]:
+        """Active nodes per subentity: {entity_id: {node_id: True}}."""
+        return {
+            entity_id: {self._node_ids[row]: True for row in np.flatnonzero(self._active[col, :len(self._node_ids)])}
+            for entity_id, col in self.entity_index.items()
+        }
+
+    # --- Change feed ---
+
+    def update_node_energies(
+        self,
+        node_ids: Iterable[str],
+        energies: Iterable[float],
+        names: Optional[Union[Iterable[str], Callable[[str], str]]] = None,
+        sub_entity_weights: Optional[Iterable[Optional[Dict[str, float]]]] = None
+    ):
+        """
+        Feed current n.E values (an n.E change feed or a full snapshot).
+
+        Only rows whose energy actually changed are marked for re-evaluation,
+        so feeding a full snapshot every tick is cheap when few nodes move.
+
+        Args:
+            node_ids: Node identifiers
+            energies: Current energy per node (same order)
+            names: Display names (same order), or a node_id -> name callable;
+                only read for nodes not seen before (defaults to node_id)
+            sub_entity_weights: Optional per-node {entity_id: weight} dicts
+        """
+        self._feed_attached = True
+        self._ingest(node_ids, energies, names, sub_entity_weights)
+
+    def apply_energy_deltas(self, deltas: Mapping[str, float]):
+        """
+        Feed energy deltas (e.g. staged diffusion deltas) for changed nodes.
+
+        Args:
+            deltas: {node_id: delta_E}; unknown nodes start from 0.0
+        """
+        self._feed_attached = True
+        if not deltas:
+            return
+        rows = self._rows(deltas.keys())
+        energy = self._energy
+        np.add.at(energy, rows, np.fromiter(deltas.values(), dtype=np.float64, count=len(deltas)))
+        energy[rows] = np.maximum(energy[rows], 0.0)
+        self._dirty_rows.update(rows.tolist())
+
+    def _ingest(self, node_ids, energies, names=None, sub_entity_weights=None):
+        node_ids = list(node_ids)
+        if not node_ids:
+            return
+        new_before = len(self._node_ids)
+        if node_ids == self._feed_ids:
+            rows = self._feed_rows  # same snapshot order as last feed: no new nodes, skip the id lookups
+        else:
+            rows = self._rows(node_ids, names)
+            self._feed_ids, self._feed_rows = node_ids, rows
+        values = np.asarray(energies if isinstance(energies, np.ndarray) else list(energies), dtype=np.float64)
+        changed = rows[(self._energy[rows] != values) | (rows >= new_before)]
+        self._energy[rows] = values
+        self._dirty_rows.update(changed.tolist())
+
+        if sub_entity_weights is not None:
+            for row, weights in zip(rows.tolist(), sub_entity_weights):
+                weights = dict(weights or {})
+                if weights == self._row_weights.get(row, {}):
+                    continue
+                if weights:
+                    self._row_weights[row] = weights
+                else:
+                    self._row_weights.pop(row, None)
+                self._weights[:, row] = 1.0
+                for entity_id, weight in weights.items():
+                    col = self.entity_index.get(entity_id)
+                    if col is not None:
+                        self._weights[col, row] = weight
+                self._dirty_rows.add(row)
+
+    def _rows(self, node_ids: Iterable[str], names=None) -> np.ndarray:
+        """Dense rows for node_ids, in order (assigned on first use)."""
+        node_ids = list(node_ids)
+        index = self.node_index
+        if names is None:
+            name_of = lambda i, node_id: node_id
+        elif callable(names):
+            name_of = lambda i, node_id: names(node_id)
+        else:
+            listed = list(names)
+            name_of = lambda i, node_id: listed[i]
+        for i, node_id in enumerate(node_ids):
+            if node_id not in index:
+                index[node_id] = len(self._node_ids)
+                self._node_ids.append(node_id)
+                self._node_names.append(name_of(i, node_id))
+        capacity = self._energy.size
+        if len(self._node_ids) > capacity:
+            while capacity < len(self._node_ids):
+                capacity *= 2
+            self._resize_nodes(capacity)
+        return np.fromiter((index[node_id] for node_id in node_ids), dtype=np.int64, count=len(node_ids))
+
+    def _resize_nodes(self, capacity: int):
+        grown = np.zeros(capacity, dtype=np.float64)
+        grown[:self._energy.size] = self._energy
+        self._energy = grown
+        weights = np.ones((self._weights.shape[0], capacity), dtype=np.float64)
+        weights[:, :self._weights.shape[1]] = self._weights
+        self._weights = weights
+        active = np.zeros((self._active.shape[0], capacity), dtype=bool)
+        active[:, :self._active.shape[1]] = self._active
+        self._active = active
+
+    def _entity_columns(self, entity_ids: List[str]) -> np.ndarray:
+        """Column per subentity (new subentities start all-inactive)."""
+        for entity_id in entity_ids:
+            if entity_id in self.entity_index:
+                continue
+            col = self.entity_index[entity_id] = len(self.entity_index)
+            capacity = self._energy.size
+            self._weights = np.vstack([self._weights, np.ones((1, capacity))])
+            self._active = np.vstack([self._active, np.zeros((1, capacity), dtype=bool)])
+            self._thresholds = np.append(self._thresholds, np.nan)  # forces a full pass
+            for row, weights in self._row_weights.items():
+                if entity_id in weights:
+                    self._weights[col, row] = weights[entity_id]
+        return np.fromiter((self.entity_index[e] for e in entity_ids), dtype=np.int64, count=len(entity_ids))
+
+    # --- Checks ---
+
     async def check_and_update(
         self,
         global_criticality: float,
@@ -161,48 +338,56 @@ class DynamicPromptGenerator:
             global_criticality: Current global criticality (from ConsciousnessState)
             entity_ids: List of subentity IDs to check
         """
-        # Get current node activation levels from graph
-        node_states = await self._get_current_node_states()
-
-        if not node_states:
+        if not self._feed_attached:
+            # No change feed: fall back to one graph scan per check
+            node_states = await self._get_current_node_states()
+            if node_states:
+                names, energies, weights = zip(*node_states.values())
+                self._ingest(list(node_states.keys()), energies, names, weights)
+
+        n = len(self._node_ids)
+        if not n:
             return  # No nodes in graph yet
 
-        # Check for activation changes per subentity
-        all_changes: List[ActivationChange] = []
-
-        for entity_id in entity_ids:
-            # Get subentity criticality (default 0.5 if not set)
-            entity_criticality = self.entity_criticalities.get(entity_id, 0.5)
-
-            # Calculate threshold for this subentity
-            threshold = calculate_activation_threshold(global_criticality, entity_criticality)
-
-            # Check each node for activation changes
-            entity_changes = await self._detect_activation_changes(
-                entity_id=entity_id,
-                threshold=threshold,
-                node_states=node_states
-            )
-
-            if entity_changes:
-                all_changes.extend(entity_changes)
+        cols = self._entity_columns(list(dict.fromkeys(entity_ids)))
+        thresholds = np.array([
+            calculate_activation_threshold(global_criticality, self.entity_criticalities.get(entity_id, 0.5))
+            for entity_id in dict.fromkeys(entity_ids)
+        ])
 
-                # Store recent changes
-                if entity_id not in self.recent_changes:
-                    self.recent_changes[entity_id] = []
+        # Threshold moved (or new subentity): every row; otherwise only rows the feed touched
+        moved = thresholds != self._thresholds[cols]
+        if moved.any():
+            rows = np.arange(n)
+        else:
+            rows = np.fromiter(self._dirty_rows, dtype=np.int64, count=len(self._dirty_rows))
+        self._dirty_rows.clear()
+        self._thresholds[cols] = thresholds
 
-                self.recent_changes[entity_id].extend(entity_changes)
+        all_changes = await self._detect_activation_changes(cols, thresholds, rows)
 
-                # Keep only recent changes (last 20 per subentity)
-                self.recent_changes[entity_id] = self.recent_changes[entity_id][-20:]
+        for change in all_changes:
+            self.recent_changes.setdefault(change.entity_id, []).append(change)
+        for entity_id in {change.entity_id for change in all_changes}:
+            # Keep only recent changes (last 20 per subentity)
+            self.recent_changes[entity_id] = self.recent_changes[entity_id][-20:]
 
-        # If any activation changes detected, update prompt
+        # If any activation changes detected (or a debounced write is due), update prompt
         if all_changes:
             logger.info(
                 f"[DynamicPromptGenerator] {len(all_changes)} activation changes detected, "
                 f"updating {self.file_path.name}"
             )
-            await self.update_prompt(global_criticality)
+            self._write_pending = True
+        if self._write_pending:
+            self._last_global_criticality = global_criticality
+            if time.monotonic() - self._last_write_at >= self.min_write_interval:
+                await self.update_prompt(global_criticality)
+
+    async def flush(self):
+        """Write a debounced prompt update now (e.g. on shutdown)."""
+        if self._write_pending:
+            await self.update_prompt(self._last_global_criticality)
 
     async def _get_current_node_states(self) -> Dict[str, Tuple[str, float, Dict[str, float]]]:
         """
@@ -252,75 +437,78 @@ class DynamicPromptGenerator:
 
     async def _detect_activation_changes(
         self,
-        entity_id: str,
-        threshold: float,
-        node_states: Dict[str, Tuple[str, float, Dict[str, float]]]
+        cols: np.ndarray,
+        thresholds: np.ndarray,
+        rows: np.ndarray
     ) -> List[ActivationChange]:
         """
-        Detect which nodes changed activation state for this subentity.
+        Detect which (subentity, node) pairs changed activation state.
+
+        One vectorized pass over all subentities: activity = E * weight
+        (weight 1.0 where sub_entity_weights has no entry), active where
+        activity >= the subentity's threshold.
 
         Args:
-            entity_id: Subentity to check
-            threshold: Activation threshold for this subentity
-            node_states: Current node states from graph
+            cols: Subentity columns to check
+            thresholds: Activation threshold per column
+            rows: Node rows to re-evaluate
 
         Returns:
             List of activation changes
         """
-        changes = []
+        if not rows.size or not cols.size:
+            return []
 
-        # Initialize activation state tracking for this subentity if needed
-        if entity_id not in self.activation_states:
-            self.activation_states[entity_id] = {}
-
-        previous_states = self.activation_states[entity_id]
-
-        for node_id, (node_name, energy, sub_entity_weights) in node_states.items():
-            # Per-subentity activity level (use sub_entity_weights if available)
-            entity_activity = energy
-            if entity_id in sub_entity_weights:
-                # Subentity-specific weight modulates activity
-                entity_weight = sub_entity_weights[entity_id]
-                entity_activity = energy * entity_weight
-
-            # Check if crosses threshold
-            is_active = entity_activity >= threshold
-            was_active = previous_states.get(node_id, False)
-
-            # Detect change
-            if is_active != was_active:
-                change = ActivationChange(
-                    node_id=node_id,
-                    node_name=node_name,
-                    entity_id=entity_id,
-                    became_active=is_active,
-                    energy=entity_activity,
-                    threshold=threshold,
-                    timestamp=datetime.now(timezone.utc)
-                )
-                changes.append(change)
-
-                # Broadcast threshold crossing event for dashboard
-                if WEBSOCKET_AVAILABLE and websocket_manager:
-                    await websocket_manager.broadcast({
-                        "type": "threshold_crossing",
-                        "entity_id": entity_id,
-                        "node_id": node_id,
-                        "node_name": node_name,
-                        "direction": "on" if is_active else "off",
-                        "entity_activity": entity_activity,
-                        "threshold": threshold,
-                        "timestamp": change.timestamp.isoformat()
-                    })
-
-                # Update state
-                previous_states[node_id] = is_active
-
-                logger.debug(
-                    f"[{entity_id}] Node {node_name} "
-                    f"{'ACTIVATED' if is_active else 'DEACTIVATED'} "
-                    f"(activity={entity_activity:.2f}, threshold={threshold:.2f})"
-                )
+        if rows.size == len(self._node_ids):
+            # Full pass: contiguous slices instead of gathers
+            span = slice(0, rows.size)
+            activity = self._weights[cols, span] * self._energy[span]
+            was_active = self._active[cols, span]
+        else:
+            activity = self._weights[np.ix_(cols, rows)] * self._energy[rows]
+            was_active = self._active[np.ix_(cols, rows)]
+        is_active = activity >= thresholds[:, None]
+        flipped_col, flipped_row = np.nonzero(is_active != was_active)
+        if not flipped_col.size:
+            return []
+
+        # Update state
+        self._active[cols[flipped_col], rows[flipped_row]] = is_active[flipped_col, flipped_row]
+
+        entity_ids = list(self.entity_index)
+        timestamp = datetime.now(timezone.utc)
+        changes = []
+        for c, r in zip(flipped_col.tolist(), flipped_row.tolist()):
+            row = int(rows[r])
+            change = ActivationChange(
+                node_id=self._node_ids[row],
+                node_name=self._node_names[row],
+                entity_id=entity_ids[cols[c]],
+                became_active=bool(is_active[c, r]),
+                energy=float(activity[c, r]),
+                threshold=float(thresholds[c]),
+                timestamp=timestamp
+            )
+            changes.append(change)
+
+            # Broadcast threshold crossing event for dashboard
+            if WEBSOCKET_AVAILABLE and websocket_manager:
+                await websocket_manager.broadcast({
+                    "type": "threshold_crossing",
+                    "entity_id": change.entity_id,
+                    "node_id": change.node_id,
+                    "node_name": change.node_name,
+                    "direction": "on" if change.became_active else "off",
+                    "entity_activity": change.energy,
+                    "threshold": change.threshold,
+                    "timestamp": timestamp.isoformat()
+                })
+
+            logger.debug(
+                f"[{change.entity_id}] Node {change.node_name} "
+                f"{'ACTIVATED' if change.became_active else 'DEACTIVATED'} "
+                f"(activity={change.energy:.2f}, threshold={change.threshold:.2f})"
+            )
 
         return changes
 
@@ -328,21 +516,32 @@ class DynamicPromptGenerator:
         """
         Update CLAUDE.md with current activation states.
 
-        Writes complete file with all subentity sections.
+        Writes complete file with all subentity sections, atomically, and
+        only if the content changed since the last write (the Last Updated
+        timestamp alone does not count).
 
         Args:
             global_criticality: Current global criticality for display
         """
         try:
             # Build content
-            content = await self._build_prompt_content(global_criticality)
+            header, body = await self._build_prompt_parts(global_criticality)
+            self._write_pending = False
+            self._last_write_at = time.monotonic()
+            if body == self._last_written_body:
+                return
 
             # Ensure directory exists
             self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write file (synchronous - simpler, no need for async file I/O here)
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Write temp file + rename so readers never see a half-written prompt
+            data = (header + body).encode("utf-8")
+            tmp_path = self.file_path.with_name(self.file_path.name + ".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.file_path)
+            self._last_written_body = body
+            self.bytes_written += len(data)
+            self.writes += 1
 
             logger.info(f"[DynamicPromptGenerator] Updated {self.file_path}")
 
@@ -356,28 +555,34 @@ class DynamicPromptGenerator:
         Returns:
             Markdown content with all subentity sections
         """
+        header, body = await self._build_prompt_parts(global_criticality)
+        return header + body
+
+    async def _build_prompt_parts(self, global_criticality: float) -> Tuple[str, str]:
+        """Build CLAUDE.md as (timestamp header, body)."""
         # Header
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
 
-        content = f"""# Dynamic Context for {self.citizen_id}
+        header = f"""# Dynamic Context for {self.citizen_id}
 
 **Last Updated:** {timestamp}
-**Global Criticality:** {global_criticality:.2f}
-**Active Subentities:** {len(self.activation_states)}
+"""
+        body = f"""**Global Criticality:** {global_criticality:.2f}
+**Active Subentities:** {len(self.entity_index)}
 
 ---
 
 """
 
         # Subentity sections
-        for entity_id in sorted(self.activation_states.keys()):
-            content += await self._build_entity_section(entity_id, global_criticality)
-            content += "\n---\n\n"
+        for entity_id in sorted(self.entity_index):
+            body += await self._build_entity_section(entity_id, global_criticality)
+            body += "\n---\n\n"
 
         # System state footer
-        content += await self._build_system_state_section(global_criticality)
+        body += await self._build_system_state_section(global_criticality)
 
-        return content
+        return header, body
 
     async def _build_entity_section(self, entity_id: str, global_criticality: float) -> str:
         """Build section for one subentity."""
@@ -385,10 +590,9 @@ class DynamicPromptGenerator:
         threshold = calculate_activation_threshold(global_criticality, entity_criticality)
 
         # Get currently active nodes
-        active_nodes = [
-            node_id for node_id, is_active in self.activation_states.get(entity_id, {}).items()
-            if is_active
-        ]
+        col = self.entity_index[entity_id]
+        n = len(self._node_ids)
+        active_rows = np.flatnonzero(self._active[col, :n])
 
         # Get recent changes
         recent_changes = self.recent_changes.get(entity_id, [])[-10:]  # Last 10
@@ -397,7 +601,7 @@ class DynamicPromptGenerator:
 
 **Criticality:** {entity_criticality:.2f}
 **Activation Threshold:** {threshold:.2f}
-**Currently Active Nodes:** {len(active_nodes)}
+**Currently Active Nodes:** {len(active_rows)}
 
 **Recent Activation Changes:**
 """
@@ -411,35 +615,23 @@ class DynamicPromptGenerator:
 
         section += f"\n**Active Node Focus:**\n"
 
-        if active_nodes:
-            # Get node details for active nodes
-            node_details = await self._get_node_details(active_nodes[:10])  # Top 10
-            for node_id, node_name, energy in node_details:
+        if active_rows.size:
+            # Top 10 active nodes by subentity activity
+            for node_name, energy in self._get_node_details(col, active_rows, 10):
                 section += f"- {node_name} (activity={energy:.2f})\n"
         else:
             section += "- No active nodes currently\n"
 
         return section
 
-    async def _get_node_details(self, node_ids: List[str]) -> List[Tuple[str, str, float]]:
-        """Get details for specific nodes."""
-        try:
-            cypher = """
-            MATCH (n)
-            WHERE id(n) IN $node_ids
-            RETURN id(n) AS node_id, n.name AS node_name, n.energy AS energy
-            """
-
-            result = self.graph.query(cypher, params={"node_ids": [int(nid) for nid in node_ids]})
-
-            if not result:
-                return []
-
-            return [(str(row[0]), row[1] or "unknown", row[2] or 0.0) for row in result]
-
-        except Exception as e:
-            logger.error(f"[DynamicPromptGenerator] Failed to get node details: {e}")
-            return []
+    def _get_node_details(self, col: int, rows: np.ndarray, limit: int) -> List[Tuple[str, float]]:
+        """Names and activities of the `limit` most active rows for one subentity."""
+        activity = self._weights[col, rows] * self._energy[rows]
+        if rows.size > limit:
+            top = np.argpartition(-activity, limit)[:limit]
+            rows, activity = rows[top], activity[top]
+        order = np.lexsort((rows, -activity))
+        return [(self._node_names[rows[i]], float(activity[i])) for i in order]
 
     async def _build_system_state_section(self, global_criticality: float) -> str:
         """Build system state footer section."""
@@ -497,7 +689,7 @@ class DynamicPromptGenerator:
 # Helper function
 def create_dynamic_prompt_generator(
     citizen_id: str,
-    graph_store: FalkorDBGraphStore,
+    graph_store: "FalkorDBGraphStore",
     network_id: str = "N1"
 ) -> DynamicPromptGenerator:
     """
@@ -40,7 +40,7 @@ from substrate.schemas.consciousness_schema import (
     BaseRelation
 )
 from llama_index.graph_stores.falkordb import FalkorDBGraphStore
-from orchestration.libs.utils.falkordb_adapter import FalkorDBAdapter
+from orchestration.libs.utils.falkordb_adapter import FalkorDBAdapter, vector_param
 import time
 
 logger = logging.getLogger(__name__)
@@ -130,6 +130,7 @@ class TraceCapture:
         self.adapter = FalkorDBAdapter(self.graph_store)
 
         # Embedding service for automatic embedding generation during formation
+        # (model shared via the process-wide registry, loaded + warmed up once)
         self.embedding_service = get_embedding_service(backend='sentence-transformers')
         logger.info(f"[TraceCapture] Embedding service initialized for automatic formation embeddings")
 
@@ -561,7 +562,7 @@ class TraceCapture:
 
                 # Generate embeddings automatically for this node
                 try:
-                    embeddable_text, embedding = self.embedding_service.create_formation_embedding(
+                    embeddable_text, embedding = await self.embedding_service.create_formation_embedding_async(
                         'node', node_type, fields
                     )
                     fields['embeddable_text'] = embeddable_text
@@ -664,7 +665,7 @@ class TraceCapture:
 
                 # Generate embeddings automatically for this link
                 try:
-                    embeddable_text, embedding = self.embedding_service.create_formation_embedding(
+                    embeddable_text, embedding = await self.embedding_service.create_formation_embedding_async(
                         'link', link_type, fields
                     )
                     fields['embeddable_text'] = embeddable_text
@@ -712,7 +713,7 @@ class TraceCapture:
             logger.debug(f"[TraceCapture] Inserting {node_type} node '{node_name}' into {self._current_graph_name}")
 
             # Convert datetime to string and handle embeddings
-            embedding_fields = {}  # Track embeddings to add as vecf32()
+            embedding_fields = set()  # Embeddings are wrapped as vecf32($param)
 
             for key, value in props.items():
                 if isinstance(value, datetime):
@@ -720,27 +721,16 @@ class TraceCapture:
                 elif isinstance(value, dict):
                     props[key] = str(value)  # Serialize dicts as strings
                 elif isinstance(value, list) and key in ['content_embedding', 'relationship_embedding']:
-                    # Embeddings need vecf32() wrapper, not parameter
-                    embedding_fields[key] = value
-
-            # Remove embedding fields from params (will be added inline with vecf32())
-            for key in embedding_fields.keys():
-                props.pop(key, None)
+                    # Embeddings stay query parameters (constant query text, cached plan)
+                    props[key] = vector_param(value)
+                    embedding_fields.add(key)
 
             # Build Cypher query with node type as label
             # CRITICAL: Node type must be in the MERGE statement to set the label
-            prop_assignments = ', '.join([f'n.{k} = ${k}' for k in props.keys()])
-
-            # Add embedding fields with vecf32() wrapper
-            if embedding_fields:
-                embedding_assignments = ', '.join([
-                    f'n.{k} = vecf32({str(v)})'  # Convert list to string for vecf32()
-                    for k, v in embedding_fields.items()
-                ])
-                if prop_assignments:
-                    prop_assignments += ', ' + embedding_assignments
-                else:
-                    prop_assignments = embedding_assignments
+            prop_assignments = ', '.join([
+                f'n.{k} = vecf32(${k})' if k in embedding_fields else f'n.{k} = ${k}'
+                for k in props.keys()
+            ])
 
             query = f"""
             MERGE (n:{node_type} {{name: $name}})
@@ -835,7 +825,7 @@ class TraceCapture:
             props = relation.model_dump(exclude_none=True)
 
             # Convert datetime to string and handle embeddings
-            embedding_fields = {}  # Track embeddings to add as vecf32()
+            embedding_fields = set()  # Embeddings are wrapped as vecf32($param)
 
             for key, value in props.items():
                 if isinstance(value, datetime):
@@ -843,26 +833,15 @@ class TraceCapture:
                 elif isinstance(value, dict):
                     props[key] = str(value)
                 elif isinstance(value, list) and key in ['content_embedding', 'relationship_embedding']:
-                    # Embeddings need vecf32() wrapper, not parameter
-                    embedding_fields[key] = value
-
-            # Remove embedding fields from params (will be added inline with vecf32())
-            for key in embedding_fields.keys():
-                props.pop(key, None)
+                    # Embeddings stay query parameters (constant query text, cached plan)
+                    props[key] = vector_param(value)
+                    embedding_fields.add(key)
 
             # Build Cypher query
-            prop_assignments = ', '.join([f'r.{k} = ${k}' for k in props.keys()])
-
-            # Add embedding fields with vecf32() wrapper
-            if embedding_fields:
-                embedding_assignments = ', '.join([
-                    f'r.{k} = vecf32({v})'
-                    for k, v in embedding_fields.items()
-                ])
-                if prop_assignments:
-                    prop_assignments += ', ' + embedding_assignments
-                else:
-                    prop_assignments = embedding_assignments
+            prop_assignments = ', '.join([
+                f'r.{k} = vecf32(${k})' if k in embedding_fields else f'r.{k} = ${k}'
+                for k in props.keys()
+            ])
 
             query = f"""
             MATCH (s {{name: $source}})
@@ -22,9 +22,11 @@ import json
 import logging
 import re
 import redis
+from array import array
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
 from falkordb import FalkorDB
+from falkordb.helpers import stringify_param_value
 
 from orchestration.core.node import Node
 from orchestration.core.link import Link
@@ -794,6 +796,73 @@ def build_batch_node_creation_query(nodes: List[Node]) -> tuple[str, Dict[str, A
     return (query.strip(), {'nodes': serialized_nodes})
 
 
+# --- Vector Parameters ---
+
+# Significant digits that round-trip an IEEE float32 exactly (vecf32 stores float32)
+VECTOR_PARAM_DIGITS = 9
+
+
+class VectorParam:
+    """
+    Embedding pre-rendered for the CYPHER parameter header.
+
+    FalkorDB only accepts parameters as text (there is no packed-bytes
+    parameter type), and the falkordb client stringifies unknown values with
+    str(). Rendering the float32 values once with a single C-level format call
+    avoids per-element stringify in the client, and 9 significant digits
+    replace the 17-digit float64 repr without losing anything after vecf32().
+    """
+
+    __slots__ = ("values", "_text")
+
+    def __init__(self, embedding: Sequence[float]):
+        self.values = array('f', embedding)
+        n = len(self.values)
+        self._text = "[" + (("%.9g," * n) % tuple(self.values))[:-1] + "]" if n else "[]"
+
+    def __str__(self) -> str:
+        return self._text
+
+    __repr__ = __str__
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+
+def vector_param(embedding: Sequence[float]) -> VectorParam:
+    """
+    Convert an embedding to a query parameter for vecf32($param).
+
+    Use instead of inlining vecf32({str(vec)}) into Cypher text: the query body
+    stays constant, so FalkorDB can reuse the cached plan across writes/searches.
+    Works with both graph.query(query, params) and cypher_params_header().
+
+    Example:
+        >>> str(vector_param([0.1, 0.2]))
+        '[0.100000001,0.200000003]'
+    """
+    return VectorParam(embedding)
+
+
+def cypher_params_header(params: Dict[str, Any]) -> str:
+    """
+    Build the 'CYPHER k=v ...' prefix for raw GRAPH.QUERY calls.
+
+    Same encoding as the falkordb client's graph.query(query, params), for call
+    sites that talk to redis directly.
+
+    Example:
+        >>> cypher_params_header({'k': 3, 'label': 'Concept'})
+        'CYPHER k=3 label="Concept" '
+    """
+    if not params:
+        return ""
+    return "CYPHER " + "".join(f"{k}={stringify_param_value(v)} " for k, v in params.items())
+
+
 # --- Graph Utilities ---
 
 def extract_node_from_result(result: Any) -> Node:
@@ -39,8 +39,9 @@ Updated: 2025-10-22 - Added version chain semantics per v2 spec
 Spec: foundations/bitemporal_tracking.md
 """
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import Optional, Union, List, TYPE_CHECKING
+from typing import Dict, Iterable, Optional, Union, List, TYPE_CHECKING
 import uuid
 
 if TYPE_CHECKING:
@@ -90,13 +91,18 @@ def is_currently_valid(obj: BitemporalObject, at_time: Optional[datetime] = None
     return True
 
 
-def invalidate(obj: BitemporalObject, invalidated_at: Optional[datetime] = None) -> None:
+def invalidate(
+    obj: BitemporalObject,
+    invalidated_at: Optional[datetime] = None,
+    index: Optional['VersionIndex'] = None
+) -> None:
     """
     Mark object as no longer valid in reality.
 
     Args:
         obj: Node or Link to invalidate
         invalidated_at: When it became invalid (defaults to now)
+        index: Version index to keep in sync (adds obj if missing)
 
     Example:
         >>> node = Node(id="n1", valid_at=datetime(2025, 1, 1), ...)
@@ -109,6 +115,9 @@ def invalidate(obj: BitemporalObject, invalidated_at: Optional[datetime] = None)
 
     obj.invalidated_at = invalidated_at
 
+    if index is not None:
+        index.add(obj)
+
 
 # --- Knowledge Timeline Queries ---
 
@@ -149,7 +158,11 @@ def is_currently_known(obj: BitemporalObject, at_time: Optional[datetime] = None
     return True
 
 
-def expire(obj: BitemporalObject, expired_at: Optional[datetime] = None) -> None:
+def expire(
+    obj: BitemporalObject,
+    expired_at: Optional[datetime] = None,
+    index: Optional['VersionIndex'] = None
+) -> None:
     """
     Mark object as no longer part of our knowledge.
 
@@ -159,6 +172,7 @@ def expire(obj: BitemporalObject, expired_at: Optional[datetime] = None) -> None
     Args:
         obj: Node or Link to expire
         expired_at: When it expired from knowledge (defaults to now)
+        index: Version index to keep in sync (adds obj if missing)
 
     Example:
         >>> node = Node(id="n1", created_at=datetime(2025, 1, 1), ...)
@@ -171,10 +185,17 @@ def expire(obj: BitemporalObject, expired_at: Optional[datetime] = None) -> None
 
     obj.expired_at = expired_at
 
+    if index is not None:
+        index.add(obj)
+
 
 # --- Supersession (V2 with Version Chains) ---
 
-def supersede(old_obj: BitemporalObject, new_obj: BitemporalObject) -> None:
+def supersede(
+    old_obj: BitemporalObject,
+    new_obj: BitemporalObject,
+    index: Optional['VersionIndex'] = None
+) -> None:
     """
     Mark old object as superseded by new object (V2 with version chains).
 
@@ -190,6 +211,7 @@ def supersede(old_obj: BitemporalObject, new_obj: BitemporalObject) -> None:
     Args:
         old_obj: Object being superseded
         new_obj: Object superseding it
+        index: Version index to keep in sync (adds either version if missing)
 
     Example:
         >>> old_node = Node(id="context_reconstruction", vid="v_abc123",
@@ -216,6 +238,10 @@ def supersede(old_obj: BitemporalObject, new_obj: BitemporalObject) -> None:
     old_obj.superseded_by = new_obj.vid
     new_obj.supersedes = old_obj.vid
 
+    if index is not None:
+        index.add(old_obj)
+        index.add(new_obj)
+
 
 # --- Temporal Range Queries ---
 
@@ -367,7 +393,12 @@ def verify_bitemporal_consistency(obj: BitemporalObject) -> bool:
 
 # --- Version Chain Helpers (V2) ---
 
-def create_new_version(obj: BitemporalObject, **changes) -> BitemporalObject:
+def create_new_version(
+    obj: BitemporalObject,
+    *,
+    index: Optional['VersionIndex'] = None,
+    **changes
+) -> BitemporalObject:
     """
     Create a new version of an object with changes applied.
 
@@ -381,6 +412,7 @@ def create_new_version(obj: BitemporalObject, **changes) -> BitemporalObject:
 
     Args:
         obj: Object to create new version from
+        index: Version index to add the new version to
         **changes: Fields to change in new version
 
     Returns:
@@ -423,18 +455,21 @@ def create_new_version(obj: BitemporalObject, **changes) -> BitemporalObject:
         if hasattr(new_obj, key):
             setattr(new_obj, key, value)
 
+    if index is not None:
+        index.add(new_obj)
+
     return new_obj
 
 
 def get_version_history(
-    objects: List[BitemporalObject],
+    objects: Union[Iterable[BitemporalObject], 'VersionIndex'],
     logical_id: str
 ) -> List[BitemporalObject]:
     """
     Get version history for a logical entity, ordered from oldest to newest.
 
     Args:
-        objects: List of all objects (e.g., graph.nodes.values())
+        objects: List of all objects (e.g., graph.nodes.values()) or a VersionIndex
         logical_id: Logical entity id
 
     Returns:
@@ -449,6 +484,9 @@ def get_version_history(
         >>> versions[-1].superseded_by
         None  # Latest version
     """
+    if isinstance(objects, VersionIndex):
+        return objects.history(logical_id)
+
     # Filter to logical id
     versions = [obj for obj in objects if obj.id == logical_id]
 
@@ -459,7 +497,7 @@ def get_version_history(
 
 
 def get_current_version(
-    objects: List[BitemporalObject],
+    objects: Union[Iterable[BitemporalObject], 'VersionIndex'],
     logical_id: str,
     as_of_knowledge: Optional[datetime] = None,
     as_of_reality: Optional[datetime] = None
@@ -468,7 +506,7 @@ def get_current_version(
     Get current version of a logical entity with optional as-of queries.
 
     Args:
-        objects: List of all objects (e.g., graph.nodes.values())
+        objects: List of all objects (e.g., graph.nodes.values()) or a VersionIndex
         logical_id: Logical entity id
         as_of_knowledge: Time for knowledge timeline query (default: now)
         as_of_reality: Time for reality timeline query (default: now)
@@ -489,6 +527,9 @@ def get_current_version(
         ...     as_of_knowledge=datetime(2025, 1, 1)
         ... )
     """
+    if isinstance(objects, VersionIndex):
+        return objects.current(logical_id, as_of_knowledge, as_of_reality)
+
     # Get all versions
     versions = get_version_history(objects, logical_id)
 
@@ -531,12 +572,12 @@ def is_latest_version(obj: BitemporalObject) -> bool:
     return obj.superseded_by is None
 
 
-def count_versions(objects: List[BitemporalObject], logical_id: str) -> int:
+def count_versions(objects: Union[Iterable[BitemporalObject], 'VersionIndex'], logical_id: str) -> int:
     """
     Count versions for a logical entity (belief churn metric).
 
     Args:
-        objects: List of all objects
+        objects: List of all objects or a VersionIndex
         logical_id: Logical entity id
 
     Returns:
@@ -546,4 +587,180 @@ def count_versions(objects: List[BitemporalObject], logical_id: str) -> int:
         >>> churn = count_versions(graph.nodes.values(), "context_reconstruction")
         >>> print(f"Belief churn: {churn} versions")
     """
+    if isinstance(objects, VersionIndex):
+        return objects.count(logical_id)
+
     return len([obj for obj in objects if obj.id == logical_id])
+
+
+# --- Version Index ---
+
+class _VersionTimeline:
+    """Versions of one logical id, kept sorted on both timelines."""
+
+    __slots__ = ("created", "by_created", "valid", "by_valid")
+
+    def __init__(self):
+        self.created: List[datetime] = []             # Sorted created_at
+        self.by_created: List[BitemporalObject] = []  # Versions in created_at order
+        self.valid: List[datetime] = []               # Sorted valid_at
+        self.by_valid: List[BitemporalObject] = []    # Versions in valid_at order
+
+    def add(self, obj: BitemporalObject) -> None:
+        # insort-right keeps insertion order among equal timestamps (stable sort order)
+        k = bisect_right(self.created, obj.created_at)
+        self.created.insert(k, obj.created_at)
+        self.by_created.insert(k, obj)
+        k = bisect_right(self.valid, obj.valid_at)
+        self.valid.insert(k, obj.valid_at)
+        self.by_valid.insert(k, obj)
+
+    def remove(self, obj: BitemporalObject) -> bool:
+        for keys, versions in ((self.created, self.by_created), (self.valid, self.by_valid)):
+            k = next((i for i, v in enumerate(versions) if v is obj), None)
+            if k is None:
+                return False
+            del keys[k]
+            del versions[k]
+        return True
+
+
+class VersionIndex:
+    """
+    Version index keyed by logical id, for as-of queries without scanning every object.
+
+    Each logical id holds its versions sorted by created_at (knowledge
+    timeline) and by valid_at (reality timeline). Point-in-time and range
+    queries bisect those arrays instead of filtering and sorting the whole
+    object list. Answers match the list-based functions
+    (get_version_history, get_current_version, count_versions,
+    was_known_during, was_valid_during) for the same objects added in the
+    same order.
+
+    Maintenance is incremental: pass the index to create_new_version,
+    supersede, invalidate and expire. Interval ends (expired_at,
+    invalidated_at) are read from the objects at query time, so closing a
+    timeline needs no re-sort; changing created_at or valid_at of an indexed
+    object directly requires update().
+
+    The list-based functions also accept an index in place of the object
+    list, e.g. get_current_version(index, "n1", as_of_knowledge=t).
+
+    Example:
+        >>> index = VersionIndex(graph.nodes.values())
+        >>> new_node = create_new_version(node, index=index, description="Updated")
+        >>> supersede(node, new_node, index=index)
+        >>> index.current("n1", as_of_knowledge=datetime(2025, 6, 1))
+    """
+
+    def __init__(self, objects: Iterable[BitemporalObject] = ()):
+        self._timelines: Dict[str, _VersionTimeline] = {}
+        self._count = 0
+        for obj in objects:
+            self.add(obj)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, obj: BitemporalObject) -> bool:
+        timeline = self._timelines.get(obj.id)
+        return timeline is not None and any(v is obj for v in timeline.by_created)
+
+    def logical_ids(self) -> List[str]:
+        """All indexed logical ids."""
+        return list(self._timelines)
+
+    # --- Maintenance ---
+
+    def add(self, obj: BitemporalObject) -> None:
+        """Index a version (no-op if this exact object is already indexed)."""
+        if obj in self:
+            return
+        self._timelines.setdefault(obj.id, _VersionTimeline()).add(obj)
+        self._count += 1
+
+    def remove(self, obj: BitemporalObject) -> None:
+        """Drop a version from the index."""
+        timeline = self._timelines.get(obj.id)
+        if timeline is None or not timeline.remove(obj):
+            return
+        self._count -= 1
+        if not timeline.created:
+            del self._timelines[obj.id]
+
+    def update(self, obj: BitemporalObject) -> None:
+        """Re-sort a version after its created_at, valid_at (or id) changed."""
+        own = self._timelines.get(obj.id)
+        for logical_id, timeline in ([(obj.id, own)] if own else []) + list(self._timelines.items()):
+            if timeline.remove(obj):
+                self._count -= 1
+                if not timeline.created:
+                    del self._timelines[logical_id]
+                break
+        self.add(obj)
+
+    # --- Queries ---
+
+    def history(self, logical_id: str) -> List[BitemporalObject]:
+        """Versions of logical_id ordered by created_at (oldest first)."""
+        timeline = self._timelines.get(logical_id)
+        return list(timeline.by_created) if timeline else []
+
+    def count(self, logical_id: str) -> int:
+        """Number of versions of logical_id."""
+        timeline = self._timelines.get(logical_id)
+        return len(timeline.created) if timeline else 0
+
+    def current(
+        self,
+        logical_id: str,
+        as_of_knowledge: Optional[datetime] = None,
+        as_of_reality: Optional[datetime] = None
+    ) -> Optional[BitemporalObject]:
+        """
+        Latest version (by created_at) known at as_of_knowledge and valid at as_of_reality.
+
+        Same answer as get_current_version; None as-of times apply no filter.
+        """
+        timeline = self._timelines.get(logical_id)
+        if timeline is None:
+            return None
+
+        # Versions created by as_of_knowledge form a prefix of the created_at order
+        end = len(timeline.created) if as_of_knowledge is None else bisect_right(timeline.created, as_of_knowledge)
+
+        def matches(v: BitemporalObject) -> bool:
+            if as_of_knowledge is not None and v.expired_at is not None and v.expired_at <= as_of_knowledge:
+                return False
+            return as_of_reality is None or is_currently_valid(v, as_of_reality)
+
+        # Newest first; among equal created_at, max() keeps the earliest in order
+        for k in range(end - 1, -1, -1):
+            if matches(timeline.by_created[k]):
+                first = bisect_left(timeline.created, timeline.created[k])
+                return next(v for v in timeline.by_created[first:k + 1] if matches(v))
+        return None
+
+    def known_during(self, logical_id: str, start: datetime, end: datetime) -> List[BitemporalObject]:
+        """Versions known at any point in [start, end), in created_at order (was_known_during)."""
+        timeline = self._timelines.get(logical_id)
+        if timeline is None:
+            return []
+        candidates = timeline.by_created[:bisect_left(timeline.created, end)]
+        return [v for v in candidates if start < (v.expired_at if v.expired_at else datetime.max)]
+
+    def valid_during(self, logical_id: str, start: datetime, end: datetime) -> List[BitemporalObject]:
+        """Versions valid at any point in [start, end), in valid_at order, ties as added (was_valid_during)."""
+        timeline = self._timelines.get(logical_id)
+        if timeline is None:
+            return []
+        candidates = timeline.by_valid[:bisect_left(timeline.valid, end)]
+        return [v for v in candidates if start < (v.invalidated_at if v.invalidated_at else datetime.max)]
+
+    def valid_at(self, logical_id: str, at_time: datetime) -> List[BitemporalObject]:
+        """Versions valid at at_time, in valid_at order, ties as added (is_currently_valid)."""
+        timeline = self._timelines.get(logical_id)
+        if timeline is None:
+            return []
+        candidates = timeline.by_valid[:bisect_right(timeline.valid, at_time)]
+        return [v for v in candidates if v.invalidated_at is None or v.invalidated_at > at_time]
@@ -44,7 +44,7 @@ from orchestration.core import Node, Link, Graph
 from orchestration.mechanisms import decay, strengthening, threshold, criticality
 from orchestration.mechanisms.diffusion_runtime import DiffusionRuntime
 from orchestration.mechanisms.strengthening import StrengtheningContext
-from orchestration.mechanisms.threshold import ThresholdContext, NoiseTracker
+from orchestration.mechanisms.threshold import ThresholdContext, ArrayNoiseTracker
 from orchestration.mechanisms.criticality import CriticalityController, ControllerConfig
 
 # Learning Mechanisms (Phase 3+4)
@@ -184,7 +184,7 @@ class ConsciousnessEngineV2:
         # NOTE: DecayContext is now created per-tick with criticality-adjusted parameters
         self.strengthening_ctx = StrengtheningContext()
         self.threshold_ctx = ThresholdContext()
-        self.noise_tracker = NoiseTracker()
+        self.noise_tracker = ArrayNoiseTracker()
 
         # Criticality controller (M03)
         self.criticality_controller = CriticalityController(ControllerConfig(
@@ -2517,6 +2517,14 @@ class ConsciousnessEngineV2:
             try:
                 entity_ids = list(self.graph.subentities.keys())
                 global_crit = criticality_metrics.rho_global if criticality_metrics else 0.5
+                # n.E change feed from the in-memory graph (replaces a full FalkorDB scan per tick);
+                # the generator re-evaluates only nodes whose E moved
+                nodes = self.graph.nodes
+                self.dynamic_prompt.update_node_energies(
+                    list(nodes),
+                    np.fromiter((node.E for node in nodes.values()), dtype=np.float64, count=len(nodes)),
+                    names=lambda node_id: nodes[node_id].name
+                )
                 await self.dynamic_prompt.check_and_update(
                     global_criticality=global_crit,
                     entity_ids=entity_ids
@@ -11,7 +11,7 @@ ARCHITECTURAL PRINCIPLES:
 - Auditable: Full merge history and before/after metrics
 
 Algorithm:
-1. Detect candidates (type match + similarity)
+1. Detect candidates (LSH blocking, then type match + similarity)
 2. Select canonical (age → connectivity → weight)
 3. Consolidate: E, memberships, links, names
 4. Record bitemporally with supersession chain
@@ -23,10 +23,13 @@ Spec: docs/specs/v2/learning_and_trace/duplicate_node_merging.md
 
 import math
 import logging
-from typing import Dict, List, Set, Optional, Tuple, TYPE_CHECKING
+import weakref
+from typing import Any, Dict, Iterable, List, Set, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 from datetime import datetime
 
+import numpy as np
+
 if TYPE_CHECKING:
     from orchestration.core.graph import Graph
     from orchestration.core.node import Node
@@ -205,33 +208,457 @@ def compute_similarity(node_a: 'Node', node_b: 'Node') -> SimilarityScore:
     )
 
 
-def find_duplicate_candidates(
-    graph: 'Graph',
-    node: 'Node',
-    threshold: float = 0.85
-) -> List[Tuple['Node', SimilarityScore]]:
-    """
-    Find duplicate candidates for a given node.
+# === Candidate Blocking (LSH) ===
 
-    Returns nodes with similarity above threshold, sorted by similarity.
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15           # Band key mixing constant
+_SHINGLE_BASE = np.uint64(0x100000001B3)  # Polynomial base for k-gram hashes
+_EMPTY_MINHASH = np.iinfo(np.uint64).max
+_ENCODE_BATCH = 50_000                  # Nodes hashed per vectorized batch
 
-    Args:
-        graph: Consciousness graph
-        node: Node to find duplicates for
-        threshold: Minimum similarity threshold [0, 1]
+NAME_SHINGLE_SIZE = 3         # Character 3-grams of the normalized name
+DESCRIPTION_SHINGLE_SIZE = 4  # Character 4-grams of the normalized description
+
+
+def _node_embedding(node: 'Node') -> Optional[np.ndarray]:
+    """Embedding from node.embedding or properties['embedding'] (None if absent)."""
+    embedding = getattr(node, 'embedding', None)
+    if embedding is None:
+        embedding = node.properties.get('embedding')
+    if embedding is None:
+        return None
+    vector = np.asarray(embedding, dtype=np.float32).ravel()
+    return vector if vector.size else None
+
+
+def _shingle_hashes(texts: List[str], k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hash every character k-gram of every text in one vectorized pass.
+
+    Texts shorter than k contribute one shingle (the whole text); empty texts
+    contribute none.
 
     Returns:
-        List of (candidate_node, score) sorted by similarity (descending)
+        (hashes, owner): uint64 shingle hashes and the (non-decreasing) index
+        of the text each one belongs to
+    """
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    padding = "\x00" * k
+    codes = np.frombuffer((padding.join(texts) + padding).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+
+    # Window hash at every position; windows read zero padding past a text's end
+    hashes = np.zeros(codes.size, dtype=np.uint64)
+    for offset in range(k):
+        shifted = np.zeros(codes.size, dtype=np.uint64)
+        shifted[:codes.size - offset] = codes[offset:]
+        hashes = hashes * _SHINGLE_BASE + shifted
+
+    spans = lengths + k
+    owner = np.repeat(np.arange(len(texts)), spans)
+    local = np.arange(codes.size) - (np.cumsum(spans) - spans)[owner]
+    windows = np.where(lengths > 0, np.maximum(lengths - k + 1, 1), 0)
+    valid = local < windows[owner]
+    return hashes[valid], owner[valid]
+
+
+def _minhash(hashes: np.ndarray, owner: np.ndarray, count: int,
+             a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """MinHash signatures (count x len(a)) via multiply-shift permutations."""
+    signature = np.full((count, len(a)), _EMPTY_MINHASH, dtype=np.uint64)
+    if hashes.size == 0:
+        return signature
+    segments = np.flatnonzero(np.r_[True, owner[1:] != owner[:-1]])
+    owners = owner[segments]
+    for p in range(len(a)):
+        permuted = (hashes * a[p] + b[p]) >> np.uint64(32)
+        signature[owners, p] = np.minimum.reduceat(permuted, segments)
+    return signature
+
+
+def _band_keys(columns: np.ndarray, bands: int, rows: int, salt: np.ndarray) -> np.ndarray:
+    """Fold each band of `rows` consecutive columns into one uint64 key per node."""
+    keys = np.empty((columns.shape[0], bands), dtype=np.uint64)
+    mix = np.uint64(_GOLDEN)
+    for band in range(bands):
+        key = salt.copy()
+        for column in columns[:, band * rows:(band + 1) * rows].T:
+            key = (key ^ column) * mix
+        keys[:, band] = key
+    return keys
+
+
+class DuplicateBlockingIndex:
+    """
+    Incremental LSH blocking index for duplicate candidate detection.
+
+    Each node gets band keys from four families, salted by node type so only
+    same-type nodes collide:
+    - name: MinHash over character 3-grams of the normalized name
+    - name_chars: MinHash over the name's character set, the set
+      compute_name_similarity compares (catches reordered names)
+    - description: MinHash over character 4-grams of the description
+    - embedding: SimHash (random hyperplanes) over the node embedding
+
+    Nodes sharing any band key are candidates. Duplicate detection scores
+    only candidates instead of every pair. Recall against the exhaustive
+    scan is a tuning trade-off: more bands catch more pairs and cost more
+    comparisons (see orchestration/scripts/bench_merge_blocking.py).
+
+    Storage is columnar: one uint64 key per (node, band). Per-band keys are
+    kept sorted for lookups. Rows added since the last sort are scanned
+    linearly until the next rebuild. Removals are tombstoned and compacted
+    once they outnumber live rows. Buckets larger than max_bucket_size
+    (e.g. a templated description shared by thousands of nodes) are
+    skipped instead of producing quadratic candidate lists.
 
     Example:
-        >>> candidates = find_duplicate_candidates(graph, my_node, threshold=0.85)
-        >>> if candidates:
-        ...     best_match, score = candidates[0]
-        ...     print(f"Best match: {best_match.name} (score={score.overall:.2f})")
+        >>> index = DuplicateBlockingIndex()
+        >>> index.sync(graph)                  # Hashes only nodes not yet indexed
+        >>> ids = index.candidates(my_node)    # Node ids sharing a bucket
+    """
+
+    FAMILIES = ("name", "name_chars", "description", "embedding")
+
+    def __init__(
+        self,
+        name_bands: int = 8,
+        name_rows: int = 4,
+        name_chars_bands: int = 4,
+        name_chars_rows: int = 20,
+        description_bands: int = 4,
+        description_rows: int = 4,
+        simhash_bands: int = 6,
+        simhash_bits: int = 24,
+        max_bucket_size: int = 512,
+        seed: int = 17
+    ):
+        self.name_bands = name_bands
+        self.name_rows = name_rows
+        self.name_chars_bands = name_chars_bands
+        self.name_chars_rows = name_chars_rows
+        self.description_bands = description_bands
+        self.description_rows = description_rows
+        self.simhash_bands = simhash_bands
+        self.simhash_bits = simhash_bits
+        self.max_bucket_size = max_bucket_size
+
+        self._rng = np.random.default_rng(seed)
+        self._name_perms = self._permutations(name_bands * name_rows)
+        self._name_chars_perms = self._permutations(name_chars_bands * name_chars_rows)
+        self._description_perms = self._permutations(description_bands * description_rows)
+        self._hyperplanes: Optional[np.ndarray] = None  # (bands * bits) x dim, set by first embedding
+
+        # Band columns: one run of bands per family, in FAMILIES order
+        self._band_family = np.repeat(
+            np.arange(len(self.FAMILIES)), [name_bands, name_chars_bands, description_bands, simhash_bands]
+        )
+        self._total_bands = len(self._band_family)
+        self._type_salts: Dict[Any, int] = {}
+
+        # Row storage (grown by doubling)
+        self._ids: List[str] = []
+        self._row_of: Dict[str, int] = {}
+        self._fingerprints: Dict[str, int] = {}  # node_id -> content hash when indexed
+        self._keys = np.empty((0, self._total_bands), dtype=np.uint64)
+        self._present = np.empty((0, len(self.FAMILIES)), dtype=bool)
+        self._alive = np.empty(0, dtype=bool)
+        self._dead = 0
+
+        # Sorted per-band (keys, rows) covering rows [0, _sorted_upto)
+        self._sorted: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._sorted_upto = 0
+
+        self.oversized_buckets_skipped = 0
+
+    def _permutations(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        a = self._rng.integers(1, 2**63, size=count, dtype=np.uint64) | np.uint64(1)
+        b = self._rng.integers(0, 2**63, size=count, dtype=np.uint64)
+        return a, b
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._row_of
+
+    # --- Hashing ---
+
+    def _fingerprint(self, node: 'Node') -> int:
+        """Hash of the fields the band keys are built from (detects in-place edits)."""
+        embedding = _node_embedding(node) if self.simhash_bands else None
+        return hash((
+            node.node_type,
+            node.name,
+            node.description,
+            embedding.tobytes() if embedding is not None else None,
+        ))
+
+    def _type_salt(self, node_type: Any) -> int:
+        salt = self._type_salts.get(node_type)
+        if salt is None:
+            salt = self._type_salts[node_type] = ((len(self._type_salts) + 1) * _GOLDEN) & _MASK64
+        return salt
+
+    def _encode(self, nodes: List['Node']) -> Tuple[np.ndarray, np.ndarray]:
+        """Band keys (n x bands) and family presence (n x families) for nodes."""
+        count = len(nodes)
+        keys = np.zeros((count, self._total_bands), dtype=np.uint64)
+        present = np.zeros((count, len(self.FAMILIES)), dtype=bool)
+        salt = np.fromiter((self._type_salt(n.node_type) for n in nodes), dtype=np.uint64, count=count)
+
+        names = [(n.name or "").lower().strip() for n in nodes]
+        descriptions = [" ".join((n.description or "").lower().split()) for n in nodes]
+        column = 0
+        for family, texts, k, (a, b), bands, rows in (
+            (0, names, NAME_SHINGLE_SIZE, self._name_perms, self.name_bands, self.name_rows),
+            (1, names, 1, self._name_chars_perms, self.name_chars_bands, self.name_chars_rows),
+            (2, descriptions, DESCRIPTION_SHINGLE_SIZE, self._description_perms,
+             self.description_bands, self.description_rows),
+        ):
+            hashes, owner = _shingle_hashes(texts, k)
+            signature = _minhash(hashes, owner, count, a, b)
+            keys[:, column:column + bands] = _band_keys(signature, bands, rows, salt)
+            present[:, family] = np.bincount(owner, minlength=count) > 0
+            column += bands
+
+        if self.simhash_bands:
+            embeddings = [_node_embedding(n) for n in nodes]
+            first = next((e for e in embeddings if e is not None), None)
+            if first is not None and self._hyperplanes is None:
+                self._hyperplanes = self._rng.standard_normal(
+                    (self.simhash_bands * self.simhash_bits, first.size)
+                ).astype(np.float32)
+            if self._hyperplanes is not None:
+                dim = self._hyperplanes.shape[1]
+                with_embedding = [i for i, e in enumerate(embeddings) if e is not None and e.size == dim]
+                if with_embedding:
+                    matrix = np.stack([embeddings[i] for i in with_embedding])
+                    bits = (matrix @ self._hyperplanes.T > 0).astype(np.uint64)
+                    keys[with_embedding, column:] = _band_keys(
+                        bits, self.simhash_bands, self.simhash_bits, salt[with_embedding]
+                    )
+                    present[with_embedding, 3] = True
+
+        return keys, present
+
+    # --- Maintenance ---
+
+    def _reserve(self, extra: int) -> None:
+        needed = len(self._ids) + extra
+        if needed <= self._alive.size:
+            return
+        capacity = max(needed, 2 * self._alive.size, 1024)
+        for name in ("_keys", "_present", "_alive"):
+            old = getattr(self, name)
+            grown = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            grown[:old.shape[0]] = old
+            setattr(self, name, grown)
+
+    def add(self, node: 'Node') -> None:
+        """Index one node (re-indexes it if already present)."""
+        self.add_many([node])
+
+    def add_many(self, nodes: Iterable['Node']) -> None:
+        """Index nodes in vectorized batches (re-indexes ids already present)."""
+        nodes = list(nodes)
+        for node in nodes:
+            if node.id in self._row_of:
+                self.remove(node.id)
+        for start in range(0, len(nodes), _ENCODE_BATCH):
+            batch = nodes[start:start + _ENCODE_BATCH]
+            keys, present = self._encode(batch)
+            self._reserve(len(batch))
+            first_row = len(self._ids)
+            rows = slice(first_row, first_row + len(batch))
+            self._keys[rows] = keys
+            self._present[rows] = present
+            self._alive[rows] = True
+            for offset, node in enumerate(batch):
+                self._row_of[node.id] = first_row + offset
+                self._fingerprints[node.id] = self._fingerprint(node)
+                self._ids.append(node.id)
+
+    def update(self, node: 'Node') -> None:
+        """Re-index a node after its name, description, type or embedding changed."""
+        self.add(node)
+
+    def remove(self, node_id: str) -> None:
+        """Drop a node from the index (tombstoned until compaction)."""
+        row = self._row_of.pop(node_id, None)
+        if row is None:
+            return
+        self._fingerprints.pop(node_id, None)
+        self._alive[row] = False
+        self._dead += 1
+        if self._dead > max(1024, len(self._row_of)):
+            self._compact()
+
+    def sync(self, graph: 'Graph') -> Tuple[int, int]:
+        """
+        Bring the index in line with graph.nodes.
+
+        Hashes nodes not indexed yet, re-hashes nodes whose name,
+        description, type or embedding changed since they were indexed
+        (compared by content fingerprint), and drops nodes no longer in the
+        graph.
+
+        Returns:
+            (indexed, removed) counts; indexed covers new and changed nodes
+        """
+        gone = [node_id for node_id in self._row_of if node_id not in graph.nodes]
+        for node_id in gone:
+            self.remove(node_id)
+        fingerprints = self._fingerprints
+        stale = [node for node_id, node in graph.nodes.items()
+                 if fingerprints.get(node_id) != self._fingerprint(node)]
+        self.add_many(stale)
+        return len(stale), len(gone)
+
+    def _compact(self) -> None:
+        live = np.flatnonzero(self._alive[:len(self._ids)])
+        self._keys = self._keys[live]
+        self._present = self._present[live]
+        self._alive = np.ones(live.size, dtype=bool)
+        self._ids = [self._ids[row] for row in live]
+        self._row_of = {node_id: row for row, node_id in enumerate(self._ids)}
+        self._dead = 0
+        self._sorted = []
+        self._sorted_upto = 0
+
+    def _rebuild(self) -> None:
+        """Sort every band's keys over all live rows."""
+        size = len(self._ids)
+        usable = self._alive[:size, None] & self._present[:size][:, self._band_family]
+        self._sorted = []
+        for band in range(self._total_bands):
+            rows = np.flatnonzero(usable[:, band])
+            keys = self._keys[rows, band]
+            order = np.argsort(keys, kind="stable")
+            self._sorted.append((keys[order], rows[order]))
+        self._sorted_upto = size
+
+    # --- Queries ---
+
+    def candidates(self, node: 'Node') -> List[str]:
+        """
+        Ids of indexed nodes sharing at least one bucket with node.
+
+        Works for nodes not in the index too (their keys are computed on the
+        fly). Ids come back in indexing order.
+        """
+        row = self._row_of.get(node.id)
+        if row is None:
+            keys, present = self._encode([node])
+            keys, present = keys[0], present[0]
+        else:
+            keys, present = self._keys[row], self._present[row]
+
+        size = len(self._ids)
+        if size - self._sorted_upto > max(1024, self._sorted_upto // 8) or len(self._sorted) != self._total_bands:
+            self._rebuild()
+        upto = self._sorted_upto
+
+        found: Set[int] = set()
+        for band in range(self._total_bands):
+            family = self._band_family[band]
+            if not present[family]:
+                continue
+            sorted_keys, sorted_rows = self._sorted[band]
+            lo = np.searchsorted(sorted_keys, keys[band], side="left")
+            hi = np.searchsorted(sorted_keys, keys[band], side="right")
+            if hi - lo > self.max_bucket_size:
+                self.oversized_buckets_skipped += 1
+                continue
+            found.update(sorted_rows[lo:hi].tolist())
+            if upto < size:
+                recent = (self._keys[upto:size, band] == keys[band]) & self._present[upto:size, family]
+                found.update((np.flatnonzero(recent) + upto).tolist())
+
+        found.discard(row)
+        return [self._ids[r] for r in sorted(found) if self._alive[r]]
+
+    def candidate_map(self) -> Dict[str, List[str]]:
+        """
+        Candidates for every indexed node at once (symmetric).
+
+        Groups equal keys per band from the sorted columns, so a full scan
+        costs one sort per band plus the candidate pairs themselves.
+
+        Returns:
+            Dict of node_id -> candidate ids (indexing order); nodes without
+            candidates are omitted
+        """
+        if self._sorted_upto != len(self._ids) or len(self._sorted) != self._total_bands:
+            self._rebuild()
+
+        lows, highs = [], []
+        for sorted_keys, sorted_rows in self._sorted:
+            if sorted_keys.size < 2:
+                continue
+            starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+            sizes = np.diff(np.r_[starts, sorted_keys.size])
+            pairs = starts[sizes == 2]
+            lows.append(sorted_rows[pairs])
+            highs.append(sorted_rows[pairs + 1])
+            for start, run in zip(starts[sizes > 2], sizes[sizes > 2]):
+                if run > self.max_bucket_size:
+                    self.oversized_buckets_skipped += 1
+                    continue
+                members = sorted_rows[start:start + run]
+                i, j = np.triu_indices(run, k=1)
+                lows.append(members[i])
+                highs.append(members[j])
+
+        neighbors: Dict[str, List[str]] = {}
+        if not lows:
+            return neighbors
+        low = np.concatenate(lows).astype(np.int64)
+        high = np.concatenate(highs).astype(np.int64)
+        low, high = np.minimum(low, high), np.maximum(low, high)
+        live = self._alive[low] & self._alive[high] & (low != high)
+        codes = np.unique(low[live] * len(self._ids) + high[live])
+        ids = self._ids
+        for a, b in zip((codes // len(ids)).tolist(), (codes % len(ids)).tolist()):
+            neighbors.setdefault(ids[a], []).append(ids[b])
+            neighbors.setdefault(ids[b], []).append(ids[a])
+        return neighbors
+
+    def stats(self) -> Dict[str, Any]:
+        """Index size and bucket statistics."""
+        return {
+            "nodes": len(self._row_of),
+            "tombstones": self._dead,
+            "bands": {family: int((self._band_family == i).sum()) for i, family in enumerate(self.FAMILIES)},
+            "unsorted_rows": len(self._ids) - self._sorted_upto,
+            "oversized_buckets_skipped": self.oversized_buckets_skipped,
+        }
+
+
+_graph_indexes: 'weakref.WeakKeyDictionary[Graph, DuplicateBlockingIndex]' = weakref.WeakKeyDictionary()
+
+
+def get_blocking_index(graph: 'Graph') -> DuplicateBlockingIndex:
     """
+    Blocking index kept alongside a graph across scans.
+
+    The index lives as long as the graph. Callers sync it before use
+    (find_and_merge_duplicates does).
+    """
+    index = _graph_indexes.get(graph)
+    if index is None:
+        index = _graph_indexes[graph] = DuplicateBlockingIndex()
+    return index
+
+
+def _score_candidates(
+    node: 'Node',
+    others: Iterable['Node'],
+    threshold: float
+) -> List[Tuple['Node', SimilarityScore]]:
+    """Score node against others; keep scores >= threshold, best first."""
     candidates = []
 
-    for other_node in graph.nodes.values():
+    for other_node in others:
         # Skip self
         if other_node.id == node.id:
             continue
@@ -249,6 +676,41 @@ def find_duplicate_candidates(
     return candidates
 
 
+def find_duplicate_candidates(
+    graph: 'Graph',
+    node: 'Node',
+    threshold: float = 0.85,
+    index: Optional[DuplicateBlockingIndex] = None
+) -> List[Tuple['Node', SimilarityScore]]:
+    """
+    Find duplicate candidates for a given node.
+
+    Returns nodes with similarity above threshold, sorted by similarity.
+    With a blocking index, only nodes sharing an LSH bucket with node are
+    scored; without one, every node in the graph is.
+
+    Args:
+        graph: Consciousness graph
+        node: Node to find duplicates for
+        threshold: Minimum similarity threshold [0, 1]
+        index: Optional blocking index (kept in sync with graph by the caller)
+
+    Returns:
+        List of (candidate_node, score) sorted by similarity (descending)
+
+    Example:
+        >>> candidates = find_duplicate_candidates(graph, my_node, threshold=0.85)
+        >>> if candidates:
+        ...     best_match, score = candidates[0]
+        ...     print(f"Best match: {best_match.name} (score={score.overall:.2f})")
+    """
+    if index is None:
+        return _score_candidates(node, graph.nodes.values(), threshold)
+
+    others = (graph.nodes[node_id] for node_id in index.candidates(node) if node_id in graph.nodes)
+    return _score_candidates(node, others, threshold)
+
+
 # === Canonical Selection ===
 
 def select_canonical(nodes: List['Node']) -> 'Node':
@@ -664,7 +1126,8 @@ def merge_nodes(
 def find_and_merge_duplicates(
     graph: 'Graph',
     threshold: float = 0.85,
-    max_merges_per_run: int = 10
+    max_merges_per_run: int = 10,
+    use_blocking: bool = False
 ) -> List[MergeMetrics]:
     """
     Find and merge duplicate nodes in graph.
@@ -672,7 +1135,7 @@ def find_and_merge_duplicates(
     High-level API for periodic duplicate detection and merging.
 
     Process:
-    1. Scan all nodes for duplicates
+    1. Scan all nodes for duplicates (LSH bucket-mates only when blocking)
     2. Group duplicates by canonical
     3. Merge groups (up to max_merges_per_run)
     4. Return metrics
@@ -681,6 +1144,12 @@ def find_and_merge_duplicates(
         graph: Consciousness graph
         threshold: Similarity threshold [0, 1]
         max_merges_per_run: Maximum merges per run (rate limiting)
+        use_blocking: Score only candidates sharing a bucket in the graph's
+            blocking index (get_blocking_index) instead of all pairs. Much
+            faster on large graphs but approximate: LSH recall against the
+            exhaustive scan is below 1 (about 0.93 at 10k nodes and 0.68 at
+            100k with the default bands, per bench_merge_blocking.py), so
+            some duplicates are not merged. Off by default.
 
     Returns:
         List of MergeMetrics for all merges performed
@@ -697,6 +1166,14 @@ def find_and_merge_duplicates(
     # Track processed nodes to avoid duplicate work
     processed = set()
 
+    # Candidate lists for the whole graph in one pass over the sorted buckets
+    index = None
+    neighbors: Dict[str, List[str]] = {}
+    if use_blocking:
+        index = get_blocking_index(graph)
+        index.sync(graph)
+        neighbors = index.candidate_map()
+
     for node in list(graph.nodes.values()):
         if merges_performed >= max_merges_per_run:
             logger.info(f"Reached max merges per run: {max_merges_per_run}")
@@ -706,7 +1183,11 @@ def find_and_merge_duplicates(
             continue
 
         # Find duplicates
-        candidates = find_duplicate_candidates(graph, node, threshold=threshold)
+        if index is None:
+            candidates = find_duplicate_candidates(graph, node, threshold=threshold)
+        else:
+            others = (graph.nodes[i] for i in neighbors.get(node.id, ()) if i in graph.nodes)
+            candidates = _score_candidates(node, others, threshold)
 
         if not candidates:
             continue
@@ -740,6 +1221,9 @@ def find_and_merge_duplicates(
 
         # Mark all as processed
         processed.update(n.id for n in duplicate_group)
+        if index is not None:
+            for n in absorbed:
+                index.remove(n.id)
 
         logger.info(f"Merged {len(absorbed)} nodes into {canonical.id}")
 
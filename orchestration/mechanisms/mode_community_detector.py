@@ -16,14 +16,82 @@ Spec: docs/specs/v2/subentity/emergent_ifs_modes.md §Steps 2-4
 import numpy as np
 import logging
 import json
+import os
+import random
 import uuid
-from typing import List, Dict, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Optional, Union
 from dataclasses import dataclass
+from scipy import sparse
 from scipy.spatial.distance import jensenshannon
 from scipy.stats import rankdata
 
 logger = logging.getLogger(__name__)
 
+# Role graph weights: dense (n×n) array or any scipy.sparse matrix
+RoleGraphMatrix = Union[np.ndarray, sparse.spmatrix, sparse.sparray]
+
+# Sweeps over graphs with fewer edges run in-process (pool startup costs more than Leiden)
+PARALLEL_MIN_EDGES = 20_000
+
+
+def sparse_edge_list(W: RoleGraphMatrix) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Upper-triangle edges (i < j, weight > 0) of a role graph matrix.
+
+    Vectorized over the nonzeros: sparse input is never densified and dense
+    input is only scanned for nonzeros.
+
+    Returns:
+        (edges, weights): (m×2) int64 endpoints in row-major order and (m,) weights
+    """
+    coo = sparse.coo_matrix(W)
+    keep = (coo.row < coo.col) & (coo.data > 0)
+    rows, cols, weights = coo.row[keep], coo.col[keep], coo.data[keep]
+
+    # Row-major order (the order the dense double loop produced); sums duplicate COO entries
+    order = np.lexsort((cols, rows))
+    rows, cols, weights = rows[order].astype(np.int64), cols[order].astype(np.int64), weights[order].astype(np.float64)
+    if rows.size > 1:
+        first = np.r_[True, (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])]
+        weights = np.add.reduceat(weights, np.flatnonzero(first))
+        rows, cols = rows[first], cols[first]
+    return np.column_stack([rows, cols]), weights
+
+
+# === Resolution sweep (runs in worker processes) ===
+
+_sweep_graph = None
+
+
+def _init_sweep_worker(n: int, edges: np.ndarray, weights: np.ndarray) -> None:
+    """Build the igraph once per worker; tasks then only carry a resolution."""
+    global _sweep_graph
+    import igraph as ig
+
+    _sweep_graph = ig.Graph(n=n, edges=edges)
+    _sweep_graph.es['weight'] = weights
+
+
+def _leiden_at(task: Tuple[float, int]) -> Tuple[Optional[List[int]], float]:
+    """Run Leiden at one resolution with a per-resolution seed (same result in any process)."""
+    import igraph as ig
+
+    gamma, seed = task
+    ig.set_random_number_generator(random.Random(seed))
+    try:
+        partition = _sweep_graph.community_leiden(
+            weights='weight',
+            resolution_parameter=gamma,
+            n_iterations=10
+        )
+        return partition.membership, partition.modularity
+    except Exception as e:
+        logger.warning(f"[ModeCommunity] Leiden failed at γ={gamma:.3f}: {e}")
+        return None, 0.0
+    finally:
+        ig.set_random_number_generator(random)
+
 
 @dataclass
 class CommunityCandidate:
@@ -74,9 +142,12 @@ class ModeCommunityDetector:
 
     def detect_communities(
         self,
-        W: np.ndarray,
+        W: RoleGraphMatrix,
         entity_ids: List[str],
-        min_community_size: int = 3
+        min_community_size: int = 3,
+        max_workers: Optional[int] = None,
+        plateau_patience: Optional[int] = None,
+        seed: Optional[int] = None
     ) -> List[List[int]]:
         """
         Detect communities using multi-resolution Leiden algorithm.
@@ -84,10 +155,23 @@ class ModeCommunityDetector:
         Sweeps resolution parameter from 0.01 to 10, finds knee in modularity curve,
         and verifies partition persistence against historical data.
 
+        The edge list comes straight from the nonzeros of W (dense or
+        scipy.sparse). Resolutions above the largest edge weight are not
+        run: under CPM no community can beat singletons there, so their
+        partition is known. Other resolutions run across a process pool
+        when the graph is large enough (PARALLEL_MIN_EDGES); each worker
+        builds the graph once and every resolution gets its own seed, so
+        serial and parallel sweeps agree.
+
         Args:
-            W: (n×n) weighted adjacency matrix from role graph
+            W: (n×n) weighted adjacency matrix from role graph (dense or sparse)
             entity_ids: List of SubEntity IDs matching matrix indices
             min_community_size: Minimum members per community (default 3)
+            max_workers: Sweep processes (default: CPU count; 1 = in-process)
+            plateau_patience: Stop the sweep once this many consecutive
+                resolutions return the same partition and reuse it for the
+                rest (default None = exact sweep)
+            seed: Base seed for the per-resolution Leiden runs (default random)
 
         Returns:
             List of communities (each is list of SubEntity indices)
@@ -112,16 +196,8 @@ class ModeCommunityDetector:
         logger.info(f"[ModeCommunity] Detecting communities for {self.graph_name}")
         logger.info(f"  Graph size: {n} SubEntities")
 
-        # Build igraph from adjacency matrix
-        # Create edge list from non-zero entries
-        edges = []
-        weights = []
-
-        for i in range(n):
-            for j in range(i + 1, n):
-                if W[i, j] > 0:
-                    edges.append((i, j))
-                    weights.append(W[i, j])
+        # Build igraph from the nonzero upper-triangle entries
+        edges, weights = sparse_edge_list(W)
 
         logger.info(f"  Edges: {len(edges)}")
 
@@ -134,25 +210,10 @@ class ModeCommunityDetector:
 
         # Multi-resolution sweep
         resolutions = np.logspace(-2, 1, 20)  # 0.01 to 10
-        modularity_scores = []
-        partitions = []
-
-        logger.info(f"[ModeCommunity] Running multi-resolution sweep (20 resolutions)")
-
-        for gamma in resolutions:
-            try:
-                partition = g.community_leiden(
-                    weights='weight',
-                    resolution_parameter=gamma,
-                    n_iterations=10
-                )
-                Q = partition.modularity
-                modularity_scores.append(Q)
-                partitions.append(partition)
-            except Exception as e:
-                logger.warning(f"[ModeCommunity] Leiden failed at γ={gamma:.3f}: {e}")
-                modularity_scores.append(0.0)
-                partitions.append(None)
+        modularity_scores, partitions = self._sweep_resolutions(
+            g, edges, weights, resolutions, max_workers, plateau_patience,
+            random.randrange(2**31) if seed is None else seed
+        )
 
         # Find knee in modularity curve
         knee_idx = self._find_knee(modularity_scores)
@@ -168,7 +229,7 @@ class ModeCommunityDetector:
         historical_partition = self._load_historical_partition()
 
         if historical_partition is not None:
-            nmi = self._normalized_mutual_info(best_partition.membership, historical_partition)
+            nmi = self._normalized_mutual_info(best_partition, historical_partition)
             persistence_threshold = self._get_persistence_threshold()
 
             logger.info(f"  Partition persistence: NMI={nmi:.3f}, threshold={persistence_threshold:.3f}")
@@ -182,10 +243,13 @@ class ModeCommunityDetector:
 
         # Convert partition to community list
         communities = []
-        num_clusters = max(best_partition.membership) + 1
+        membership = np.asarray(best_partition)
+        num_clusters = membership.max() + 1
+        order = np.argsort(membership, kind='stable')
+        bounds = np.searchsorted(membership[order], np.arange(num_clusters + 1))
 
         for cluster_id in range(num_clusters):
-            community = [i for i, c in enumerate(best_partition.membership) if c == cluster_id]
+            community = order[bounds[cluster_id]:bounds[cluster_id + 1]].tolist()
 
             if len(community) >= min_community_size:
                 communities.append(community)
@@ -197,7 +261,7 @@ class ModeCommunityDetector:
             logger.info(f"  Community {i}: {len(comm)} members")
 
         # Save partition for future persistence checks
-        self._save_historical_partition(best_partition.membership)
+        self._save_historical_partition(best_partition)
 
         return communities
 
@@ -347,6 +411,90 @@ class ModeCommunityDetector:
 
     # === Helper Methods: Community Detection ===
 
+    def _sweep_resolutions(
+        self,
+        g,
+        edges: np.ndarray,
+        weights: np.ndarray,
+        resolutions: np.ndarray,
+        max_workers: Optional[int],
+        plateau_patience: Optional[int],
+        seed: int
+    ) -> Tuple[List[float], List[Optional[List[int]]]]:
+        """
+        Leiden partition and modularity at every resolution.
+
+        Returns:
+            (modularity_scores, partitions) aligned with resolutions; a
+            partition is a membership list (None where Leiden failed)
+        """
+        n = g.vcount()
+        tasks = [(float(gamma), seed + i) for i, gamma in enumerate(resolutions)]
+
+        # CPM: above the heaviest edge every merge loses quality, singletons are optimal
+        runnable = [task for task in tasks if task[0] <= weights.max()]
+
+        workers = max_workers or os.cpu_count() or 1
+        if len(edges) < PARALLEL_MIN_EDGES:
+            workers = 1
+
+        # Wave size bounds the work wasted past a plateau
+        wave = workers if plateau_patience else len(runnable)
+
+        results: List[Tuple[Optional[List[int]], float]] = []
+        logger.info(
+            f"[ModeCommunity] Running multi-resolution sweep ({len(tasks)} resolutions, "
+            f"{len(runnable)} Leiden runs, {workers} worker(s))"
+        )
+
+        global _sweep_graph
+        pool = None
+        if workers > 1:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_sweep_worker,
+                initargs=(n, edges, weights)
+            )
+        else:
+            _sweep_graph = g
+
+        try:
+            while len(results) < len(runnable):
+                batch = runnable[len(results):len(results) + wave]
+                results.extend(pool.map(_leiden_at, batch) if pool else map(_leiden_at, batch))
+
+                if plateau_patience and self._has_plateaued([m for m, _ in results], plateau_patience):
+                    logger.info(f"  Partition unchanged for {plateau_patience} resolutions, stopping sweep "
+                                f"at γ={runnable[len(results) - 1][0]:.3f}")
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            _sweep_graph = None
+
+        # Resolutions not run keep the last partition (singletons past the heaviest edge)
+        modularity_scores = [q for _, q in results]
+        partitions = [m for m, _ in results]
+        fill = partitions[-1] if partitions and plateau_patience and len(results) < len(runnable) else None
+        for gamma, _ in tasks[len(results):]:
+            membership = fill if fill is not None else list(range(n))
+            modularity_scores.append(g.modularity(membership, weights='weight', resolution=gamma))
+            partitions.append(membership)
+
+        return modularity_scores, partitions
+
+    @staticmethod
+    def _has_plateaued(partitions: List[Optional[List[int]]], patience: int) -> bool:
+        """Did the last `patience` resolutions return the same partition?"""
+        recent = partitions[-patience:]
+        if len(recent) < patience or any(p is None for p in recent):
+            return False
+        # Compare up to relabeling: number communities by first appearance
+        canonical = [np.unique(p, return_inverse=True)[1] for p in recent]
+        firsts = [np.unique(c, return_index=True)[1] for c in canonical]
+        relabeled = [np.argsort(np.argsort(f))[c] for f, c in zip(firsts, canonical)]
+        return all(np.array_equal(r, relabeled[-1]) for r in relabeled[:-1])
+
     def _find_knee(self, scores: List[float]) -> int:
         """Find knee/elbow in modularity curve using kneedle algorithm."""
         try:
@@ -477,16 +625,16 @@ class ModeCommunityDetector:
             logger.warning(f"[ModeCommunity] Cohesion computation failed: {e}")
             return 0.0
 
-    def _compute_boundary_clarity(self, community: List[int], W: np.ndarray) -> float:
+    def _compute_boundary_clarity(self, community: List[int], W: RoleGraphMatrix) -> float:
         """Compute modularity contribution (boundary clarity)."""
-        n = W.shape[0]
+        members = np.sort(np.asarray(community, dtype=np.int64))
 
-        # Internal weight
-        internal_weight = 0.0
-        for i in community:
-            for j in community:
-                if i < j:
-                    internal_weight += W[i, j]
+        # Internal weight (upper triangle of the community block)
+        if sparse.issparse(W):
+            W = sparse.csr_matrix(W)
+            internal_weight = float(sparse.triu(W[members][:, members], k=1).sum())
+        else:
+            internal_weight = float(np.triu(W[np.ix_(members, members)], k=1).sum())
 
         # Total weight
         total_weight = W.sum() / 2  # Divide by 2 (symmetric)
@@ -495,7 +643,7 @@ class ModeCommunityDetector:
             return 0.0
 
         # Expected internal weight
-        degree_sum = sum(W[i, :].sum() for i in community)
+        degree_sum = W[members].sum()
         expected_internal = (degree_sum / (2 * total_weight)) ** 2
 
         # Modularity contribution
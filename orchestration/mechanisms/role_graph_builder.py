@@ -16,8 +16,9 @@ Spec: docs/specs/v2/subentity/emergent_ifs_modes.md §Step 1
 
 import numpy as np
 import logging
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Sequence, Tuple, Optional, Union
 from dataclasses import dataclass
+from scipy import sparse
 from scipy.spatial.distance import jensenshannon
 from scipy.stats import rankdata
 
@@ -66,8 +67,9 @@ class RoleGraphBuilder:
     def build_role_graph(
         self,
         min_u_threshold: float = 0.01,
-        percentile_normalize: bool = True
-    ) -> Tuple[np.ndarray, List[str]]:
+        percentile_normalize: bool = True,
+        as_sparse: bool = False
+    ) -> Tuple[Union[np.ndarray, sparse.csr_matrix], List[str]]:
         """
         Build weighted adjacency matrix for SubEntities.
 
@@ -76,9 +78,15 @@ class RoleGraphBuilder:
 
         All components are percentile-normalized (citizen-local) if percentile_normalize=True.
 
+        Three queries in total: SubEntity features, then every COACTIVATES_WITH
+        and every RELATES_TO edge between SubEntities in bulk (sparse
+        matrices). Pair components are computed as array operations over
+        the pairs with U >= min_u_threshold.
+
         Args:
             min_u_threshold: Minimum U (co-activation) to include edge (default 0.01)
             percentile_normalize: Apply percentile normalization to components (default True)
+            as_sparse: Return W as scipy.sparse CSR instead of a dense array
 
         Returns:
             Tuple of (W, entity_ids)
@@ -90,64 +98,49 @@ class RoleGraphBuilder:
             >>> # W[i,j] = functional similarity between entities[i] and entities[j]
             >>> # W is symmetric: W[i,j] == W[j,i]
         """
+        from orchestration.libs.utils.falkordb_adapter import get_falkordb_graph
+
+        graph = get_falkordb_graph(self.graph_name)
+
         # Step 1: Load SubEntity features
         logger.info(f"[RoleGraph] Building role graph for {self.graph_name}")
-        entities = self._load_subentity_features()
+        entities = self._load_subentity_features(graph)
         n = len(entities)
         logger.info(f"[RoleGraph] Loaded {n} SubEntities")
 
         if n == 0:
             logger.warning(f"[RoleGraph] No SubEntities found in {self.graph_name}")
-            return np.zeros((0, 0)), []
+            return (sparse.csr_matrix((0, 0)) if as_sparse else np.zeros((0, 0))), []
 
         # Build index mapping
         entity_ids = [e.id for e in entities]
         entity_map = {e.id: i for i, e in enumerate(entities)}
 
-        # Step 2: Initialize adjacency matrix
-        W = np.zeros((n, n))
-
-        # Step 3: Compute raw component values for all pairs
-        u_values = []
-        ease_values = []
-        affect_sim_values = []
-        tool_overlap_values = []
-
-        # Pre-compute all pairwise similarities (for percentile normalization)
-        logger.info(f"[RoleGraph] Computing pairwise similarities for {n*(n-1)//2} pairs")
-
-        for i in range(n):
-            for j in range(i + 1, n):
-                A = entities[i]
-                B = entities[j]
-
-                # U: WM co-activation
-                u = self._get_u_metric(A.id, B.id)
-
-                # Skip pairs with very low co-activation (noise reduction)
-                if u < min_u_threshold:
-                    continue
-
-                # Ease: Highway strength
-                ease = self._get_highway_ease(A.id, B.id)
-
-                # Affect similarity
-                affect_sim = self._compute_affect_similarity(A, B)
-
-                # Tool/outcome overlap
-                tool_overlap = self._compute_tool_overlap(A, B)
-
-                # Store for percentile normalization
-                u_values.append(u)
-                ease_values.append(ease)
-                affect_sim_values.append(affect_sim)
-                tool_overlap_values.append(tool_overlap)
+        # Step 2: Bulk-load edge signals (upper triangle, i < j)
+        U, ease = self._load_edge_matrices(graph, entity_map)
+
+        # Step 3: Compute raw component values for all pairs with enough co-activation
+        if min_u_threshold > 0:
+            rows, cols = U.nonzero()
+            u_values = np.asarray(U[rows, cols]).ravel()
+            keep = u_values >= min_u_threshold
+            rows, cols, u_values = rows[keep], cols[keep], u_values[keep]
+            order = np.lexsort((cols, rows))
+            rows, cols, u_values = rows[order], cols[order], u_values[order]
+        else:
+            # Every pair qualifies, including pairs without a COACTIVATES_WITH edge
+            rows, cols = np.triu_indices(n, k=1)
+            u_values = np.asarray(U[rows, cols]).ravel() if len(rows) else np.zeros(0)
 
         logger.info(f"[RoleGraph] Found {len(u_values)} non-zero similarity pairs")
 
         if len(u_values) == 0:
             logger.warning(f"[RoleGraph] No SubEntity pairs with U > {min_u_threshold}")
-            return np.zeros((n, n)), entity_ids
+            return (sparse.csr_matrix((n, n)) if as_sparse else np.zeros((n, n))), entity_ids
+
+        ease_values = np.asarray(ease[rows, cols]).ravel()
+        affect_sim_values = self._affect_similarities(entities, rows, cols)
+        tool_overlap_values = self._tool_overlaps(entities, rows, cols)
 
         # Step 4: Percentile normalize components (citizen-local)
         if percentile_normalize:
@@ -164,40 +157,26 @@ class RoleGraphBuilder:
             tool_ranks = tool_overlap_values
 
         # Step 5: Build weighted adjacency matrix
+        # W_AB = U_AB × (1 + ease_AB) × (1 + affect_sim_AB) × (1 + tool_overlap_AB)
         logger.info(f"[RoleGraph] Building weighted adjacency matrix")
-        pair_idx = 0
-
-        for i in range(n):
-            for j in range(i + 1, n):
-                A = entities[i]
-                B = entities[j]
-
-                # U: WM co-activation
-                u = self._get_u_metric(A.id, B.id)
-
-                if u < min_u_threshold:
-                    continue
-
-                # Get normalized component values
-                u_norm = u_ranks[pair_idx]
-                ease_norm = ease_ranks[pair_idx]
-                affect_norm = affect_ranks[pair_idx]
-                tool_norm = tool_ranks[pair_idx]
-
-                # Combine using spec formula
-                # W_AB = U_AB × (1 + ease_AB) × (1 + affect_sim_AB) × (1 + tool_overlap_AB)
-                weight = u_norm * (1 + ease_norm) * (1 + affect_norm) * (1 + tool_norm)
-
-                # Symmetric assignment
-                W[i, j] = weight
-                W[j, i] = weight
-
-                pair_idx += 1
+        weights = u_ranks * (1 + ease_ranks) * (1 + affect_ranks) * (1 + tool_ranks)
+
+        if as_sparse:
+            W = sparse.coo_matrix(
+                (np.r_[weights, weights], (np.r_[rows, cols], np.r_[cols, rows])), shape=(n, n)
+            ).tocsr()
+            W.eliminate_zeros()
+            non_zero = W.nnz
+            mean_weight = W.data.mean() if non_zero > 0 else 0.0
+        else:
+            W = np.zeros((n, n))
+            W[rows, cols] = weights
+            W[cols, rows] = weights
+            non_zero = np.count_nonzero(W)
+            mean_weight = np.mean(W[W > 0]) if non_zero > 0 else 0.0
 
         # Step 6: Compute statistics
-        non_zero = np.count_nonzero(W)
-        density = non_zero / (n * (n - 1))  # Exclude diagonal
-        mean_weight = np.mean(W[W > 0]) if non_zero > 0 else 0.0
+        density = non_zero / (n * (n - 1)) if n > 1 else 0.0  # Exclude diagonal
 
         logger.info(f"[RoleGraph] Graph built:")
         logger.info(f"  Nodes: {n}")
@@ -207,20 +186,19 @@ class RoleGraphBuilder:
 
         return W, entity_ids
 
-    def _load_subentity_features(self) -> List[SubEntityFeatures]:
+    def _load_subentity_features(self, graph) -> List[SubEntityFeatures]:
         """
         Load SubEntity features from FalkorDB.
 
+        Args:
+            graph: FalkorDB graph handle (from get_falkordb_graph)
+
         Returns:
             List of SubEntityFeatures with affect EMAs and context distributions
 
         Raises:
             Exception if FalkorDB connection fails
         """
-        from orchestration.libs.utils.falkordb_adapter import get_falkordb_graph
-
-        graph = get_falkordb_graph(self.graph_name)
-
         # Query SubEntities with all required features
         query = """
         MATCH (e:SubEntity)
@@ -264,66 +242,130 @@ class RoleGraphBuilder:
 
         return entities
 
-    def _get_u_metric(self, entity_a: str, entity_b: str) -> float:
+    def _load_edge_matrices(
+        self,
+        graph,
+        entity_map: Dict[str, int]
+    ) -> Tuple[sparse.csr_matrix, sparse.csr_matrix]:
         """
-        Get U metric (WM co-activation) from COACTIVATES_WITH edge.
+        Load U (COACTIVATES_WITH.u_jaccard) and ease (RELATES_TO.ease) for all SubEntity pairs.
+
+        One query per edge type. Semantics match the former per-pair lookups:
+        - U comes from the edge directed from the lexicographically smaller
+          id to the larger one (undirected edge convention)
+        - ease comes from a RELATES_TO edge in either direction
+        - the first edge returned wins when a pair has several; NULL reads as 0.0
 
         Args:
-            entity_a: First SubEntity ID
-            entity_b: Second SubEntity ID
+            graph: FalkorDB graph handle
+            entity_map: SubEntity ID -> matrix index
 
         Returns:
-            u_jaccard ∈ [0, 1], or 0.0 if no edge exists
+            (U, ease): (n×n) CSR matrices holding each pair at [min(i, j), max(i, j)]
         """
-        from orchestration.libs.utils.falkordb_adapter import get_falkordb_graph
+        n = len(entity_map)
 
-        graph = get_falkordb_graph(self.graph_name)
+        u_query = """
+        MATCH (a:SubEntity)-[r:COACTIVATES_WITH]->(b:SubEntity)
+        WHERE a.id < b.id
+        RETURN a.id AS a, b.id AS b, r.u_jaccard AS u
+        """
+        ease_query = """
+        MATCH (a:SubEntity)-[r:RELATES_TO]->(b:SubEntity)
+        RETURN a.id AS a, b.id AS b, r.ease AS ease
+        """
 
-        # Ensure A < B lexicographically (undirected edge semantics)
-        A, B = (entity_a, entity_b) if entity_a < entity_b else (entity_b, entity_a)
+        matrices = []
+        for query in (u_query, ease_query):
+            result = graph.query(query)
+            rows_out = result.result_set if result and result.result_set else []
 
-        query = """
-        MATCH (a:SubEntity {id: $A})-[r:COACTIVATES_WITH]->(b:SubEntity {id: $B})
-        RETURN r.u_jaccard AS u
-        """
+            first: Dict[Tuple[int, int], float] = {}
+            for a, b, value in rows_out:
+                i, j = entity_map.get(a), entity_map.get(b)
+                if i is None or j is None or i == j:
+                    continue
+                key = (i, j) if i < j else (j, i)
+                if key not in first:
+                    first[key] = float(value) if value is not None else 0.0
 
-        result = graph.query(query, {"A": A, "B": B})
+            if first:
+                (rows, cols), values = zip(*first.keys()), list(first.values())
+            else:
+                rows, cols, values = (), (), ()
+            matrices.append(sparse.csr_matrix((values, (rows, cols)), shape=(n, n)))
 
-        if result and result.result_set and len(result.result_set) > 0:
-            u = result.result_set[0][0]
-            return float(u) if u is not None else 0.0
+        return matrices[0], matrices[1]
 
-        return 0.0
+    def _affect_similarities(
+        self,
+        entities: List[SubEntityFeatures],
+        rows: np.ndarray,
+        cols: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized _compute_affect_similarity for pairs (rows[k], cols[k])."""
+        arousal = np.array([e.arousal_ema for e in entities], dtype=np.float64)
+        valence = np.array([e.valence_ema for e in entities], dtype=np.float64)
 
-    def _get_highway_ease(self, entity_a: str, entity_b: str) -> float:
-        """
-        Get highway ease from RELATES_TO edge.
+        similarity = 1.0 - np.abs(arousal[rows] - arousal[cols]) - np.abs(valence[rows] - valence[cols])
 
-        Args:
-            entity_a: First SubEntity ID
-            entity_b: Second SubEntity ID
+        return np.clip(similarity, 0.0, 1.0)
 
-        Returns:
-            ease ∈ [0, 1], or 0.0 if no highway exists
+    def _tool_overlaps(
+        self,
+        entities: List[SubEntityFeatures],
+        rows: np.ndarray,
+        cols: np.ndarray,
+        chunk_pairs: int = 65536
+    ) -> np.ndarray:
         """
-        from orchestration.libs.utils.falkordb_adapter import get_falkordb_graph
+        Vectorized _compute_tool_overlap for pairs (rows[k], cols[k]).
 
-        graph = get_falkordb_graph(self.graph_name)
-
-        # Try both directions (RELATES_TO can be directional)
-        query = """
-        MATCH (a:SubEntity {id: $A})-[r:RELATES_TO]-(b:SubEntity {id: $B})
-        RETURN r.ease AS ease
-        LIMIT 1
+        Each pair is compared over the union of its two entities' tool keys
+        (smoothed, renormalized), exactly as the scalar version; pairs with
+        no tool data at all get 0.5. Pairs are processed in chunks to bound
+        memory at chunk_pairs × vocabulary.
         """
+        vocabulary = sorted({tool for e in entities for tool in e.tool_distribution})
+        overlap = np.full(len(rows), 0.5)
 
-        result = graph.query(query, {"A": entity_a, "B": entity_b})
+        if not vocabulary:
+            return overlap
 
-        if result and result.result_set and len(result.result_set) > 0:
-            ease = result.result_set[0][0]
-            return float(ease) if ease is not None else 0.0
+        column = {tool: k for k, tool in enumerate(vocabulary)}
+        probabilities = np.zeros((len(entities), len(vocabulary)))
+        has_key = np.zeros((len(entities), len(vocabulary)), dtype=bool)
+        for i, e in enumerate(entities):
+            for tool, p in e.tool_distribution.items():
+                probabilities[i, column[tool]] = p
+                has_key[i, column[tool]] = True
 
-        return 0.0
+        # Build probability vectors (with smoothing for missing tools)
+        smooth = 1e-10
+        for start in range(0, len(rows), chunk_pairs):
+            r, c = rows[start:start + chunk_pairs], cols[start:start + chunk_pairs]
+            union = has_key[r] | has_key[c]
+            width = union.sum(axis=1)
+
+            # Group pairs by union size and pack each union into `width` columns
+            # (sorted tool order): row sums then add the same terms in the same
+            # order as the scalar version, so equal overlaps stay exactly equal
+            # (percentile ranks depend on ties)
+            for size in np.unique(width[width > 0]):
+                group = np.flatnonzero(width == size)
+                mask = union[group]
+                dist_a = (probabilities[r[group]][mask] + smooth).reshape(len(group), size)
+                dist_b = (probabilities[c[group]][mask] + smooth).reshape(len(group), size)
+
+                # Normalize
+                dist_a = dist_a / dist_a.sum(axis=1, keepdims=True)
+                dist_b = dist_b / dist_b.sum(axis=1, keepdims=True)
+
+                # Jensen-Shannon divergence
+                jsd = jensenshannon(dist_a, dist_b, axis=1)
+                overlap[start + group] = np.clip(1.0 - jsd, 0.0, 1.0)
+
+        return overlap
 
     def _compute_affect_similarity(
         self,
@@ -394,23 +436,23 @@ class RoleGraphBuilder:
 
         return max(0.0, min(1.0, overlap))
 
-    def _percentile_normalize(self, values: List[float]) -> List[float]:
+    def _percentile_normalize(self, values: Sequence[float]) -> np.ndarray:
         """
         Percentile-normalize values to [0, 1] range (citizen-local).
 
         Args:
-            values: List of raw values
+            values: Raw values (list or array)
 
         Returns:
-            List of percentile ranks ∈ [0, 1]
+            Array of percentile ranks ∈ [0, 1]
 
         Example:
             >>> values = [0.1, 0.5, 0.3, 0.9]
             >>> normalized = self._percentile_normalize(values)
-            >>> # normalized ≈ [0.0, 0.5, 0.25, 1.0]
+            >>> # normalized ≈ [0.0, 0.667, 0.333, 1.0]
         """
-        if not values:
-            return []
+        if len(values) == 0:
+            return np.zeros(0)
 
         # Use scipy.stats.rankdata with 'average' method
         # Returns ranks starting from 1
@@ -422,8 +464,6 @@ class RoleGraphBuilder:
 
         if max_rank == min_rank:
             # All values the same
-            return [0.5] * len(values)
-
-        normalized = [(r - min_rank) / (max_rank - min_rank) for r in ranks]
+            return np.full(len(values), 0.5)
 
-        return normalized
+        return (ranks - min_rank) / (max_rank - min_rank)
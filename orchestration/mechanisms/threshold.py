@@ -45,7 +45,7 @@ Spec: Based on Nicolas's architectural corrections 2025-10-20
 """
 
 import numpy as np
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Dict, Iterable, Optional, TYPE_CHECKING, Union
 from dataclasses import dataclass
 from collections import deque
 
@@ -223,6 +223,69 @@ def compute_adaptive_threshold(
     return theta_adjusted
 
 
+def compute_adaptive_thresholds(
+    ctx: ThresholdContext,
+    num_nodes: int,
+    node_emotions: Optional[np.ndarray] = None,
+    active_affect: Optional[np.ndarray] = None,
+    node_ids: Optional[Iterable[str]] = None,
+    citizen_id: str = "",
+    frame_id: Optional[str] = None
+) -> np.ndarray:
+    """
+    Compute adaptive thresholds for many nodes in one call.
+
+    Array form of compute_adaptive_threshold: the criticality-driven base is
+    shared, and the affective reduction h is computed for every row of
+    node_emotions at once.
+
+    Args:
+        ctx: Threshold configuration with criticality state
+        num_nodes: Number of thresholds to return
+        node_emotions: (num_nodes, d) emotion vectors, zero rows for nodes
+            without one (optional, for PR-B)
+        active_affect: Current affective state vector (optional, for PR-B)
+        node_ids: Node IDs aligned with node_emotions, for telemetry
+        citizen_id: Citizen ID for telemetry
+        frame_id: Frame ID for telemetry
+
+    Returns:
+        Array of num_nodes thresholds (unbounded - no min/max)
+
+    Example:
+        >>> ctx = ThresholdContext(num_active=10, num_total=100)
+        >>> thetas = compute_adaptive_thresholds(ctx, len(nodes), emotions, affect)
+        >>> # thetas[i] == compute_adaptive_threshold(nodes[i], ..., affect)
+    """
+    theta_base = compute_adaptive_threshold(None, "", ctx)
+    thresholds = np.full(num_nodes, theta_base, dtype=np.float64)
+
+    if not settings.AFFECTIVE_THRESHOLD_ENABLED or node_emotions is None or active_affect is None:
+        return thresholds
+
+    h = compute_affective_threshold_reductions(active_affect, node_emotions)
+    thresholds -= h
+
+    if settings.AFFECTIVE_TELEMETRY_ENABLED and node_ids is not None:
+        node_ids = list(node_ids)
+        A_magnitude = float(np.linalg.norm(active_affect))
+        E_magnitudes = np.linalg.norm(node_emotions, axis=1)
+        dots = node_emotions @ active_affect
+        for i in np.flatnonzero(h > 0.0):
+            emit_affective_threshold(
+                citizen_id=citizen_id,
+                frame_id=frame_id or "",
+                node_id=node_ids[i],
+                theta_base=theta_base,
+                theta_adjusted=float(thresholds[i]),
+                h=float(h[i]),
+                affective_alignment=float(dots[i] / (A_magnitude * E_magnitudes[i])),
+                emotion_magnitude=float(E_magnitudes[i])
+            )
+
+    return thresholds
+
+
 def soft_activation(
     energy: float,
     threshold: float,
@@ -371,6 +434,49 @@ def compute_affective_threshold_reduction(
     return float(h)
 
 
+def compute_affective_threshold_reductions(
+    active_affect: Optional[np.ndarray],
+    node_emotions: np.ndarray
+) -> np.ndarray:
+    """
+    Compute affective threshold reduction for many nodes at once.
+
+    Array form of compute_affective_threshold_reduction (same formula and
+    guards) over the rows of node_emotions. Rows with (near-)zero magnitude
+    get h = 0, so nodes without an emotion vector can be zero-filled.
+
+    Args:
+        active_affect: Current affective state vector (A)
+        node_emotions: (num_nodes, d) emotion vectors (E_emo per row)
+
+    Returns:
+        Array of threshold reductions h, each in [0, λ_aff]
+    """
+    node_emotions = np.asarray(node_emotions, dtype=np.float64)
+    h = np.zeros(len(node_emotions), dtype=np.float64)
+
+    if not settings.AFFECTIVE_THRESHOLD_ENABLED or active_affect is None or len(active_affect) == 0:
+        return h
+    if node_emotions.size == 0:
+        return h
+
+    A_magnitude = float(np.linalg.norm(active_affect))
+    if A_magnitude < 1e-6:
+        return h
+
+    E_magnitudes = np.linalg.norm(node_emotions, axis=1)
+    valid = E_magnitudes >= 1e-6
+    if not valid.any():
+        return h
+
+    # Same per-row arithmetic as the scalar version: A · cos(A, E_emo)
+    alignment = (node_emotions[valid] @ np.asarray(active_affect, dtype=np.float64)) / (A_magnitude * E_magnitudes[valid])
+    lambda_aff = settings.AFFECTIVE_THRESHOLD_LAMBDA_FACTOR
+    h[valid] = lambda_aff * np.tanh(A_magnitude * alignment) * np.minimum(E_magnitudes[valid], 1.0)
+
+    return np.clip(h, 0.0, lambda_aff)
+
+
 # --- Noise Statistics Tracking ---
 
 class NoiseTracker:
@@ -439,22 +545,201 @@ class NoiseTracker:
         stats.sample_count += 1
 
 
+class ArrayNoiseTracker:
+    """
+    Array-backed noise statistics for node-subentity pairs.
+
+    Same EMA as NoiseTracker, but mu/sigma/sample_count live in
+    (subentity, node) NumPy arrays indexed by dense integer ids, so a whole
+    tick's quiet samples update in one vectorized call. Subentity-major
+    layout keeps each subentity's nodes contiguous. String ids are
+    mapped to dense ids once (node_index / subentity_index); unseen pairs
+    read as NoiseStatistics defaults.
+    """
+
+    def __init__(self, ema_alpha: float = 0.1, node_capacity: int = 1024, subentity_capacity: int = 8):
+        """
+        Initialize array noise tracker.
+
+        Args:
+            ema_alpha: EMA smoothing factor (0 < alpha < 1). Default 0.1.
+            node_capacity: Initial node rows (grows by doubling)
+            subentity_capacity: Initial subentity columns (grows by doubling)
+        """
+        self.ema_alpha = ema_alpha
+        self.node_ids: Dict[str, int] = {}
+        self.subentity_ids: Dict[str, int] = {}
+        self.mu = np.empty((0, 0), dtype=np.float64)
+        self.sigma = np.empty((0, 0), dtype=np.float64)
+        self.sample_count = np.empty((0, 0), dtype=np.int64)
+        self._resize(max(subentity_capacity, 1), max(node_capacity, 1))
+
+    def _resize(self, rows: int, cols: int):
+        """Grow arrays to (rows, cols), filling new cells with defaults."""
+        defaults = NoiseStatistics()
+        old_rows, old_cols = self.mu.shape
+        for name, fill, dtype in (("mu", defaults.mu, np.float64),
+                                  ("sigma", defaults.sigma, np.float64),
+                                  ("sample_count", defaults.sample_count, np.int64)):
+            grown = np.full((rows, cols), fill, dtype=dtype)
+            grown[:old_rows, :old_cols] = getattr(self, name)
+            setattr(self, name, grown)
+
+    def node_index(self, node_id: str) -> int:
+        """Dense id for node_id (assigned on first use)."""
+        index = self.node_ids.get(node_id)
+        if index is None:
+            index = self.node_ids[node_id] = len(self.node_ids)
+            if index >= self.mu.shape[1]:
+                self._resize(self.mu.shape[0], 2 * self.mu.shape[1])
+        return index
+
+    def node_indices(self, node_ids: Iterable[str]) -> np.ndarray:
+        """Dense ids for node_ids, in order (assigned on first use)."""
+        node_ids = list(node_ids)
+        known = self.node_ids
+        missing = [node_id for node_id in dict.fromkeys(node_ids) if node_id not in known]
+        if missing:
+            start = len(known)
+            known.update(zip(missing, range(start, start + len(missing))))
+            cols = self.mu.shape[1]
+            while cols < len(known):
+                cols *= 2
+            if cols > self.mu.shape[1]:
+                self._resize(self.mu.shape[0], cols)
+        return np.fromiter((known[node_id] for node_id in node_ids), dtype=np.int64, count=len(node_ids))
+
+    def subentity_index(self, subentity: str) -> int:
+        """Dense id for subentity (assigned on first use)."""
+        index = self.subentity_ids.get(subentity)
+        if index is None:
+            index = self.subentity_ids[subentity] = len(self.subentity_ids)
+            if index >= self.mu.shape[0]:
+                self._resize(2 * self.mu.shape[0], self.mu.shape[1])
+        return index
+
+    def get_stats(self, node_id: str, subentity: str) -> NoiseStatistics:
+        """
+        Get noise statistics for node-subentity pair.
+
+        Returns:
+            NoiseStatistics snapshot (defaults if never sampled)
+        """
+        k, i = self.subentity_index(subentity), self.node_index(node_id)
+        return NoiseStatistics(float(self.mu[k, i]), float(self.sigma[k, i]), int(self.sample_count[k, i]))
+
+    def update(self, node_id: str, subentity: str, energy: float, is_quiet: bool):
+        """
+        Update noise statistics with one energy sample (NoiseTracker API).
+
+        Args:
+            node_id: Node identifier
+            subentity: Subentity identifier
+            energy: Current energy value
+            is_quiet: True if node is quiet (suitable for noise sampling)
+        """
+        if not is_quiet:
+            return
+        self.update_many(np.array([self.node_index(node_id)]), self.subentity_index(subentity),
+                         np.array([energy], dtype=np.float64))
+
+    def update_many(
+        self,
+        nodes: np.ndarray,
+        subentity: Union[int, np.ndarray],
+        energies: np.ndarray,
+        is_quiet: Optional[np.ndarray] = None
+    ):
+        """
+        Apply one tick of samples in a single vectorized EMA step.
+
+        Only quiet samples update. Each (node, subentity) pair should appear
+        at most once per call - one tick is one sample per pair.
+
+        Args:
+            nodes: Dense node ids (from node_index / node_indices)
+            subentity: Dense subentity id, or an array aligned with nodes
+            energies: Energy per sample, aligned with nodes
+            is_quiet: Boolean mask aligned with nodes (None = all quiet)
+        """
+        nodes = np.asarray(nodes, dtype=np.int64)
+        energies = np.asarray(energies, dtype=np.float64)
+        if is_quiet is not None:
+            quiet = np.asarray(is_quiet, dtype=bool)
+            nodes, energies = nodes[quiet], energies[quiet]
+            if np.ndim(subentity):
+                subentity = np.asarray(subentity)[quiet]
+        if len(nodes) == 0:
+            return
+
+        if np.ndim(subentity):
+            # Mixed subentities: flat indices into the (subentity, node) arrays
+            cells = np.asarray(subentity, dtype=np.int64) * self.mu.shape[1] + nodes
+            mu_row, sigma_row, count_row = self.mu.reshape(-1), self.sigma.reshape(-1), self.sample_count.reshape(-1)
+        else:
+            cells = nodes
+            mu_row, sigma_row, count_row = self.mu[subentity], self.sigma[subentity], self.sample_count[subentity]
+
+        alpha = self.ema_alpha
+        counts = count_row[cells]
+        first = counts == 0
+        mu = alpha * energies + (1 - alpha) * mu_row[cells]
+        mu[first] = energies[first]
+        # Deviation from the updated mean, as in NoiseTracker.update
+        sigma = alpha * np.abs(energies - mu) + (1 - alpha) * sigma_row[cells]
+        sigma[first] = 0.01  # Initial guess
+
+        mu_row[cells] = mu
+        sigma_row[cells] = sigma
+        count_row[cells] = counts + 1
+
+    def base_thresholds(
+        self,
+        subentity: Union[str, int],
+        z_alpha: float,
+        nodes: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Statistical base threshold (mu + z_alpha * sigma) for many nodes.
+
+        Args:
+            subentity: Subentity identifier or dense id
+            z_alpha: Z-score (e.g., 1.28 for alpha=10%)
+            nodes: Dense node ids (None = every registered node, by dense id)
+
+        Returns:
+            Array of base thresholds aligned with nodes
+        """
+        k = self.subentity_index(subentity) if isinstance(subentity, str) else subentity
+        if nodes is None:
+            nodes = slice(0, len(self.node_ids))
+        return compute_base_threshold(self.mu[k, nodes], self.sigma[k, nodes], z_alpha)
+
+
 # --- Activation Computation ---
 
+def _entity_energies(nodes, subentity: 'EntityID') -> np.ndarray:
+    """Gather each node's energy for subentity into one array."""
+    return np.fromiter((node.get_entity_energy(subentity) for node in nodes), dtype=np.float64, count=len(nodes))
+
+
 def compute_activation_mask(
     graph: 'Graph',
     subentity: 'EntityID',
-    ctx: ThresholdContext
+    ctx: ThresholdContext,
+    thresholds: Optional[np.ndarray] = None
 ) -> Dict[str, bool]:
     """
     Compute hard activation mask for all nodes.
 
-    Threshold is same for all nodes (criticality-driven), so this is simple.
+    Threshold is same for all nodes (criticality-driven) unless per-node
+    thresholds are passed, e.g. from compute_adaptive_thresholds.
 
     Args:
         graph: Graph with nodes
         subentity: Subentity to compute activations for
         ctx: Threshold configuration (with num_active, num_total set)
+        thresholds: Per-node thresholds in graph.nodes order (optional)
 
     Returns:
         Dict mapping node_id to activation bool
@@ -469,22 +754,22 @@ def compute_activation_mask(
         >>> active_count = sum(mask.values())
         >>> print(f"Active nodes: {active_count}/{len(graph.nodes)}")
     """
-    mask = {}
-
-    # Compute threshold once (same for all nodes)
-    threshold = compute_adaptive_threshold(None, subentity, ctx)
+    nodes = list(graph.nodes.values())
+    energies = _entity_energies(nodes, subentity)
 
-    for node in graph.nodes.values():
-        energy = node.get_entity_energy(subentity)
-        mask[node.id] = hard_activation(energy, threshold)
+    # Criticality-driven threshold is the same for all nodes
+    if thresholds is None:
+        thresholds = compute_adaptive_threshold(None, subentity, ctx)
 
-    return mask
+    mask = hard_activation(energies, thresholds)
+    return dict(zip([node.id for node in nodes], mask.tolist()))
 
 
 def compute_activation_values(
     graph: 'Graph',
     subentity: 'EntityID',
-    ctx: ThresholdContext
+    ctx: ThresholdContext,
+    thresholds: Optional[np.ndarray] = None
 ) -> Dict[str, float]:
     """
     Compute soft activation values for all nodes.
@@ -493,6 +778,7 @@ def compute_activation_values(
         graph: Graph with nodes
         subentity: Subentity to compute activations for
         ctx: Threshold configuration (with num_active, num_total set)
+        thresholds: Per-node thresholds in graph.nodes order (optional)
 
     Returns:
         Dict mapping node_id to soft activation [0, 1]
@@ -506,13 +792,12 @@ def compute_activation_values(
         >>> activations = compute_activation_values(graph, "translator", ctx)
         >>> print(f"Average activation: {np.mean(list(activations.values())):.3f}")
     """
-    activations = {}
-
-    # Compute threshold once (same for all nodes)
-    threshold = compute_adaptive_threshold(None, subentity, ctx)
+    nodes = list(graph.nodes.values())
+    energies = _entity_energies(nodes, subentity)
 
-    for node in graph.nodes.values():
-        energy = node.get_entity_energy(subentity)
-        activations[node.id] = soft_activation(energy, threshold, ctx.kappa)
+    # Criticality-driven threshold is the same for all nodes
+    if thresholds is None:
+        thresholds = compute_adaptive_threshold(None, subentity, ctx)
 
-    return activations
+    activations = soft_activation(energies, thresholds, ctx.kappa)
+    return dict(zip([node.id for node in nodes], activations.tolist()))
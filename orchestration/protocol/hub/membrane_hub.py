@@ -34,8 +34,15 @@ from typing import Dict, Set, Optional
 from datetime import datetime, timezone
 
 import websockets
+from pydantic import ValidationError
 from websockets.server import WebSocketServerProtocol
 
+from orchestration.schemas.membrane_envelopes import (
+    BusEnvelope,
+    EnvelopeValidator,
+    UnknownEnvelopeTypeError,
+)
+
 logger = logging.getLogger(__name__)
 
 # Channel subscriptions: channel_name -> set of WebSocket connections
@@ -51,38 +58,48 @@ RATE_LIMIT_MAX = 100  # Max requests per window per (org, channel)
 # CPS-1 Quote Registry (stub - will integrate with economy runtime)
 VALID_QUOTES: Dict[str, Dict] = {}  # quote_id -> {price, expires_at, org}
 
+# Compiled /inject schema; raw frames are validated without decoding to a dict
+# first, and replayed/duplicated frames are answered from the digest cache
+BUS_VALIDATOR = EnvelopeValidator({"membrane.inject": BusEnvelope})
+
 
 # ============================================================================
 # L4 Protocol Enforcement
 # ============================================================================
 
-def validate_envelope(envelope: dict) -> tuple[bool, Optional[str]]:
+def describe_schema_error(error: ValueError) -> str:
+    """One-line reason for a BUS_VALIDATOR rejection."""
+    if isinstance(error, UnknownEnvelopeTypeError):
+        if error.envelope_type is None:
+            return "Missing required field: 'type'"
+        return f"Invalid envelope type: {error.envelope_type}"
+    if not isinstance(error, ValidationError):
+        return str(error)
+
+    first = error.errors()[0]
+    field = ".".join(str(part) for part in first["loc"])
+    if first["type"] == "missing":
+        return f"Missing required field: '{field}'"
+    if first["type"] == "json_invalid":
+        return first["msg"]
+    if field == "channel":
+        return "Invalid channel format"
+    return f"Invalid field '{field}': {first['msg']}"
+
+
+def validate_envelope(envelope) -> tuple[bool, Optional[str]]:
     """
     Validate envelope schema (L4 protocol requirement).
 
+    Accepts a decoded dict or the raw frame (bytes/str); both go through the
+    compiled BusEnvelope validator.
+
     Returns: (is_valid, error_message)
     """
-    # Required fields
-    if "type" not in envelope:
-        return False, "Missing required field: 'type'"
-
-    if envelope["type"] != "membrane.inject":
-        return False, f"Invalid envelope type: {envelope['type']}"
-
-    if "channel" not in envelope:
-        return False, "Missing required field: 'channel'"
-
-    if "payload" not in envelope:
-        return False, "Missing required field: 'payload'"
-
-    if "origin" not in envelope:
-        return False, "Missing required field: 'origin'"
-
-    # Channel format validation
-    channel = envelope["channel"]
-    if not isinstance(channel, str) or len(channel) == 0:
-        return False, "Invalid channel format"
-
+    try:
+        BUS_VALIDATOR.validate(envelope)
+    except ValueError as e:
+        return False, describe_schema_error(e)
     return True, None
 
 
@@ -121,7 +138,7 @@ def enforce_cps1_quote(envelope: dict) -> tuple[bool, Optional[str]]:
         return True, None  # Free channels pass
 
     # Check for quote_id
-    quote_id = payload.get("quote_id")
+    quote_id = payload.get("quote_id") if isinstance(payload, dict) else None
     if not quote_id:
         return False, "CPS-1 violation: Missing quote_id for paid channel"
 
@@ -188,12 +205,12 @@ def extract_org_from_channel(channel: str) -> Optional[str]:
     return None
 
 
-async def enforce_protocol(envelope: dict) -> tuple[bool, Optional[str]]:
+async def enforce_protocol(envelope: dict, schema_checked: bool = False) -> tuple[bool, Optional[str]]:
     """
     L4 Protocol Enforcement - Gate before dispatch.
 
     Checks:
-    1. Envelope schema validation
+    1. Envelope schema validation (skipped if schema_checked)
     2. SEA-1.0 signature verification
     3. CPS-1 quote enforcement
     4. Rate limiting
@@ -201,9 +218,10 @@ async def enforce_protocol(envelope: dict) -> tuple[bool, Optional[str]]:
     Returns: (is_valid, error_message)
     """
     # 1. Schema validation
-    valid, error = validate_envelope(envelope)
-    if not valid:
-        return False, f"Schema validation failed: {error}"
+    if not schema_checked:
+        valid, error = validate_envelope(envelope)
+        if not valid:
+            return False, f"Schema validation failed: {error}"
 
     # 2. SEA-1.0 signature verification
     valid, error = verify_sea_signature(envelope)
@@ -315,6 +333,11 @@ async def dispatch(envelope: dict):
         logger.warning(f"[L4 Protocol] Envelope missing 'channel': {envelope}")
         return
 
+    await dispatch_frame(ch, json.dumps(envelope))
+
+
+async def dispatch_frame(ch: str, frame: str):
+    """Fan out an already-encoded envelope frame to all subscribers of ch."""
     subscribers = list(SUBS.get(ch, []))
 
     if not subscribers:
@@ -325,7 +348,7 @@ async def dispatch(envelope: dict):
 
     for conn in subscribers:
         try:
-            await conn.send(json.dumps(envelope))
+            await conn.send(frame)
         except Exception as e:
             logger.error(f"[L4 Protocol] Failed to send to subscriber: {e}")
             dead.append(conn)
@@ -337,6 +360,18 @@ async def dispatch(envelope: dict):
     logger.debug(f"[L4 Protocol] Dispatched to {len(subscribers) - len(dead)} subscribers on '{ch}'")
 
 
+def rejected_frame(raw) -> dict:
+    """Best-effort decode of a rejected frame for the failure report."""
+    try:
+        decoded = json.loads(raw)
+    except ValueError:
+        decoded = None
+    if isinstance(decoded, dict):
+        return decoded
+    text = raw if isinstance(raw, str) else raw.decode("utf-8", "replace")
+    return {"raw": text[:1024]}
+
+
 async def handle_inject(ws: WebSocketServerProtocol):
     """
     Handle /inject connections (publishers).
@@ -349,21 +384,33 @@ async def handle_inject(ws: WebSocketServerProtocol):
     }
 
     L4 Protocol enforces envelope validation, signatures, quotes, rate limits.
+    Frames are schema-checked straight from the raw text (digest-cached for
+    replays) and forwarded to subscribers as received, without re-encoding.
     """
     try:
         async for raw in ws:
-            env = json.loads(raw)
+            try:
+                envelope = BUS_VALIDATOR.validate_json(raw)
+            except ValueError as e:
+                await emit_protocol_failure(
+                    rejected_frame(raw), f"Schema validation failed: {describe_schema_error(e)}", ws
+                )
+                continue
+
+            # Every field the client sent, extras (signature, ...) included
+            env = envelope.model_dump(exclude_unset=True)
 
-            # L4 Protocol Enforcement
-            valid, error = await enforce_protocol(env)
+            # L4 Protocol Enforcement (schema already checked above)
+            valid, error = await enforce_protocol(env, schema_checked=True)
 
             if not valid:
-                # Reject and emit failure
-                await emit_protocol_failure(env, error, ws)
+                # Reject and emit failure (report the frame as the client sent it)
+                await emit_protocol_failure(rejected_frame(raw), error, ws)
                 continue
 
             # Envelope passed all checks - dispatch to subscribers
-            await dispatch(env)
+            frame = raw if isinstance(raw, str) else raw.decode("utf-8")
+            await dispatch_frame(envelope.channel, frame)
 
     except websockets.exceptions.ConnectionClosed:
         logger.debug(f"[L4 Protocol] Injector connection closed")
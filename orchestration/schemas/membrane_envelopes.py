@@ -13,12 +13,19 @@ This is the shared contract between all components:
 - All components share OutcomeSignal for learning
 
 No component should create ad-hoc message formats. Use these schemas.
+
+Incoming frames are validated with EnvelopeValidator: per-type validators
+compiled once from a registry, raw JSON bytes parsed straight into the
+model, and results cached by frame digest for replayed/duplicated frames.
 """
 
+import hashlib
+import re
+from collections import OrderedDict
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any, Literal
-from pydantic import BaseModel, Field, validator
+from typing import Dict, List, Optional, Any, Literal, Mapping, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, validator
 
 
 # ============================================================================
@@ -552,20 +559,66 @@ class StimulusProcessed(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
+# ============================================================================
+# Bus Wire Formats
+# ============================================================================
+
+class BusEnvelope(BaseModel):
+    """
+    membrane.inject frame on the protocol hub's /inject path.
+
+    The hub routes on channel and hands payload to the L4 checks (SEA-1.0,
+    CPS-1 quotes); everything else in the frame is forwarded untouched.
+    Same contract as the hub's original hand-written checks: type and a
+    non-empty string channel are checked, payload and origin only need to
+    be present (any JSON value), timestamp is optional and untyped. Other
+    top-level fields (signature, quote_id, ...) are kept as extras so the
+    L4 checks see them.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    type: Literal["membrane.inject"]
+    channel: str = Field(..., min_length=1, description="Channel to fan out on")
+    payload: Any = Field(..., description="Channel-specific body")
+    origin: Any = Field(..., description="Publisher (e.g., 'l3.docs')")
+    timestamp: Any = None
+
+
+class SignalEnvelope(BaseModel):
+    """
+    membrane.inject envelope accepted by the signals collector (/ingest).
+
+    Producers (L2 logger, collectors) vary in the stimulus fields they
+    send; the collector only reads metadata (dedupe_key, stack_fingerprint,
+    stimulus_id) and queues the frame as received.
+    """
+
+    type: Literal["membrane.inject"]
+    channel: Optional[str] = None
+    content: Optional[str] = None
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
 # ============================================================================
 # Utility: Envelope Validation
 # ============================================================================
 
-def validate_envelope(envelope: BaseModel) -> bool:
+def validate_envelope(envelope: Union[BaseModel, Dict[str, Any], bytes, str]) -> bool:
     """
     Validate any envelope schema.
 
-    Returns True if valid, raises ValidationError otherwise.
+    Model instances were validated when they were built and pass as-is;
+    dicts and raw JSON frames go through the compiled validators.
+
+    Returns True if valid, raises ValueError otherwise.
     """
+    if isinstance(envelope, BaseModel):
+        return True
     try:
-        envelope.dict()  # Pydantic validation happens here
+        get_envelope_validator().validate(envelope)
         return True
-    except Exception as e:
+    except ValueError as e:
         raise ValueError(f"Envelope validation failed: {e}")
 
 
@@ -612,19 +665,161 @@ ENVELOPE_REGISTRY: Dict[str, type[BaseModel]] = {
 }
 
 
-def deserialize_envelope(data: Dict[str, Any]) -> BaseModel:
+# Fast path: "type" as the first key (how model_dump_json and our publishers write it)
+_LEADING_TYPE = re.compile(rb'\s*\{\s*"type"\s*:\s*"([^"\\]+)"')
+
+
+class UnknownEnvelopeTypeError(ValueError):
+    """Envelope type missing or not in the validator's registry."""
+
+    def __init__(self, envelope_type: Any):
+        super().__init__(f"Unknown envelope type: {envelope_type}")
+        self.envelope_type = envelope_type
+
+
+class _EnvelopeHead(BaseModel):
+    """Reads only the top-level type; other fields are skipped, not materialized."""
+    type: str
+
+
+class EnvelopeValidator:
+    """
+    Compiled, cached envelope validation.
+
+    One pydantic-core validator (TypeAdapter) is compiled per registry type
+    up front. validate_json() reads the envelope type from the raw frame
+    and parses the frame straight into that model, with no intermediate
+    dict. Results, rejections included, are cached by BLAKE2 digest of the
+    frame (LRU, cache_size entries), so a replayed or duplicated frame costs
+    one hash. Cached envelopes are shared between callers: treat them as
+    read-only.
+    """
+
+    def __init__(self, registry: Optional[Mapping[str, type]] = None, cache_size: int = 4096):
+        self.registry = dict(ENVELOPE_REGISTRY if registry is None else registry)
+        self._adapters = {
+            envelope_type: TypeAdapter(schema_class)
+            for envelope_type, schema_class in self.registry.items()
+        }
+        self._head = TypeAdapter(_EnvelopeHead)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, Union[BaseModel, ValueError]]" = OrderedDict()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+
+    def _adapter(self, envelope_type: Any) -> TypeAdapter:
+        adapter = self._adapters.get(envelope_type)
+        if adapter is None:
+            raise UnknownEnvelopeTypeError(envelope_type)
+        return adapter
+
+    def _head_type(self, raw: bytes) -> Optional[str]:
+        try:
+            return self._head.validate_json(raw).type
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                raise
+            return None  # Not an object, or no string type
+
+    def _parse(self, raw: bytes) -> BaseModel:
+        match = _LEADING_TYPE.match(raw)
+        leading_type = match.group(1).decode("utf-8") if match else None
+        adapter = self._adapters.get(leading_type)
+        if adapter is not None:
+            # A later duplicate "type" key wins in the parse; re-dispatch on it
+            try:
+                envelope = adapter.validate_json(raw)
+            except ValidationError:
+                if self._head_type(raw) == leading_type:
+                    raise
+            else:
+                if getattr(envelope.type, "value", envelope.type) == leading_type:
+                    return envelope
+        return self._adapter(self._head_type(raw)).validate_json(raw)
+
+    def validate_json(self, raw: Union[bytes, bytearray, str]) -> BaseModel:
+        """
+        Validate a raw JSON frame into its registered envelope model.
+
+        Raises:
+            UnknownEnvelopeTypeError: unknown or missing type
+            ValidationError: invalid JSON or fields
+            (both ValueError subclasses)
+        """
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8")
+        elif isinstance(raw, bytearray):
+            raw = bytes(raw)
+        if not self.cache_size:
+            return self._parse(raw)
+
+        key = hashlib.blake2b(raw, digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            if isinstance(cached, ValueError):
+                raise cached.with_traceback(None)
+            return cached
+
+        self.misses += 1
+        try:
+            result = self._parse(raw)
+        except ValueError as e:
+            result = e
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        if isinstance(result, ValueError):
+            raise result
+        return result
+
+    def validate_python(self, data: Mapping[str, Any]) -> BaseModel:
+        """Validate an already-decoded envelope dict (not cached)."""
+        return self._adapter(data.get("type")).validate_python(data)
+
+    def validate(self, envelope: Union[Mapping[str, Any], bytes, bytearray, str]) -> BaseModel:
+        """validate_json() for raw frames, validate_python() for dicts."""
+        if isinstance(envelope, (bytes, bytearray, str)):
+            return self.validate_json(envelope)
+        return self.validate_python(envelope)
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "types": len(self._adapters),
+            "cached": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_envelope_validator: Optional[EnvelopeValidator] = None
+
+
+def get_envelope_validator() -> EnvelopeValidator:
+    """Process-wide validator for ENVELOPE_REGISTRY (compiled on first use)."""
+    global _envelope_validator
+    if _envelope_validator is None:
+        _envelope_validator = EnvelopeValidator()
+    return _envelope_validator
+
+
+def deserialize_envelope(data: Union[Dict[str, Any], bytes, str]) -> BaseModel:
     """
     Deserialize JSON data into appropriate envelope type.
 
+    Accepts the raw frame (validated without an intermediate dict, cached by
+    digest) or an already-decoded dict.
+
     Usage:
-        envelope = deserialize_envelope(json.loads(message))
+        envelope = deserialize_envelope(message)
     """
-    envelope_type = data.get("type")
-    if envelope_type not in ENVELOPE_REGISTRY:
-        raise ValueError(f"Unknown envelope type: {envelope_type}")
-
-    schema_class = ENVELOPE_REGISTRY[envelope_type]
-    return schema_class(**data)
+    return get_envelope_validator().validate(data)
 
 
 # ============================================================================
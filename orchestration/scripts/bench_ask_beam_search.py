@@ -0,0 +1,245 @@
+"""
+Benchmark: doc Q&A beam search (tools/doc_ingestion/ask.py) queries and latency.
+
+Runs ask() over a synthetic fixture corpus held in an in-memory graph that
+answers the Cypher shapes ask.py issues, with a simulated round-trip time per
+query. Compares the legacy per-state expansion (one MATCH per beam state per
+step, one MATCH per hydrated edge) with batched UNWIND frontier expansion plus
+the per-question and cross-question adjacency caches.
+
+Reports graph queries per question and p50/p95 ask() latency.
+
+Usage:
+    python orchestration/scripts/bench_ask_beam_search.py
+    python orchestration/scripts/bench_ask_beam_search.py --nodes 5000 --questions 50 --rtt-ms 1.0
+    python orchestration/scripts/bench_ask_beam_search.py --full-depth --beam-width 8 --max-steps 12
+
+Date: 2026-10-18
+Purpose: Measure batched frontier expansion in ask.py beam_search
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import numpy as np
+
+from tools.doc_ingestion import ask as ask_module
+
+LABELS = ["U4_Knowledge_Object", "U4_Code_Artifact", "U4_Decision", "U4_Goal"]
+REL_TYPES = ["U4_DOCUMENTS", "U4_IMPLEMENTS", "U4_DEPENDS_ON", "U4_RELATES_TO"]
+DIMS = 64
+
+
+class Result:
+    def __init__(self, rows):
+        self.result_set = rows
+
+
+class FixtureGraph:
+    """In-memory docs graph answering the query shapes used by ask.py (legacy and batched)."""
+
+    def __init__(self, n_nodes: int, avg_degree: int, rtt_ms: float, rng: random.Random):
+        self.rtt_s = rtt_ms / 1000
+        self.queries = 0
+        self.nodes = {}
+        self.labels = {}
+        self.adjacency = {}
+        for i in range(n_nodes):
+            node_id = f"n{i}"
+            vector = np.array([rng.gauss(0, 1) for _ in range(DIMS)])
+            vector /= np.linalg.norm(vector)
+            self.nodes[node_id] = {
+                "id": node_id,
+                "name": f"node {i}",
+                "confidence": round(rng.uniform(0.3, 1.0), 3),
+                "base_weight": round(rng.uniform(0.3, 1.0), 3),
+                "embedding": vector.tolist(),
+            }
+            self.labels[node_id] = rng.choice(LABELS)
+            self.adjacency[node_id] = []
+        ids = list(self.nodes)
+        for source in ids:
+            for _ in range(rng.randint(1, 2 * avg_degree)):
+                target = rng.choice(ids)
+                if target == source:
+                    continue
+                edge = (rng.choice(REL_TYPES), source, target,
+                        {"confidence": round(rng.uniform(0.3, 1.0), 3), "energy": round(rng.uniform(0.2, 1.0), 3)})
+                self.adjacency[source].append(edge)
+                self.adjacency[target].append(edge)
+
+    def _edge_rows(self, node_id, limit=20):
+        rows = []
+        for rel_type, source, target, props in self.adjacency.get(node_id, [])[:limit]:
+            other = target if source == node_id else source
+            rows.append([rel_type, source, target, props, self.nodes[other], other])
+        return rows
+
+    def query(self, cypher, params=None):
+        self.queries += 1
+        time.sleep(self.rtt_s)
+        params = params or {}
+        if "db.labels()" in cypher:
+            return Result([[LABELS]])
+        if "db.idx.vector.queryNodes" in cypher:
+            label = cypher.split("queryNodes('")[1].split("'")[0]
+            query = np.asarray(params["query_vec"])
+            scored = sorted(
+                ((float(np.dot(query, node["embedding"])), node_id)
+                 for node_id, node in self.nodes.items() if self.labels[node_id] == label),
+                reverse=True,
+            )[:5]
+            return Result([[node_id, [label], dict(self.nodes[node_id]), score] for score, node_id in scored])
+        if "UNWIND $ids AS nid" in cypher and "-[r]-" in cypher:
+            return Result([[nid, self._edge_rows(nid, params["limit"])] for nid in params["ids"] if nid in self.nodes])
+        if "UNWIND $ids AS nid" in cypher:
+            return Result([[nid, self.nodes[nid]] for nid in params["ids"] if nid in self.nodes])
+        if "UNWIND $edges" in cypher:
+            rows = []
+            for source, rel_type, target in params["edges"]:
+                for r, s, t, props in self.adjacency.get(source, []):
+                    if (r, s, t) == (rel_type, source, target):
+                        rows.append([source, rel_type, target, props])
+            return Result(rows)
+        if "-[r]-(m)" in cypher:  # Legacy per-node expansion
+            return Result(self._edge_rows(params["node_id"]))
+        if "WHERE n.id IN $ids" in cypher:
+            return Result([[nid, [self.labels[nid]], dict(self.nodes[nid])] for nid in params["ids"] if nid in self.nodes])
+        if "$source_id" in cypher:  # Legacy per-edge hydration
+            rel_type = cypher.split("[r:`")[1].split("`")[0]
+            for r, s, t, props in self.adjacency.get(params["source_id"], []):
+                if (r, s, t) == (rel_type, params["source_id"], params["target_id"]):
+                    return Result([[r, props]])
+            return Result([])
+        if "MATCH (n {id: $node_id})" in cypher:  # Legacy node fetch
+            node = self.nodes.get(params["node_id"])
+            return Result([[node, node["embedding"]]] if node else [])
+        raise ValueError(f"Unhandled query: {cypher}")
+
+
+class FixtureEmbeddings:
+    """Deterministic question embeddings (no model download)."""
+
+    def __init__(self, graph: FixtureGraph, rng: random.Random):
+        self.graph = graph
+        self.rng = rng
+
+    def embed(self, text):
+        # Near a random corpus node, so candidate discovery and expansion have signal
+        anchor = np.asarray(self.graph.nodes[self.rng.choice(list(self.graph.nodes))]["embedding"])
+        noise = np.array([self.rng.gauss(0, 0.3) for _ in range(DIMS)])
+        vector = anchor + noise
+        return vector / np.linalg.norm(vector)
+
+
+def legacy_beam_search(graph, initial_nodes, query_vector, beam_width, max_steps):
+    """Pre-batching beam search: one query per beam state per step."""
+    beam = [ask_module.PathState([n["id"]], [], ask_module.node_score(n["props"], n["score_cos"]), "node", 1)
+            for n in initial_nodes[:ask_module.N_INITIAL]]
+    beam.sort(key=lambda s: s.score, reverse=True)
+    beam = beam[:beam_width]
+    best_score = beam[0].score if beam else 0.0
+    for _ in range(max_steps):
+        new_beam = []
+        for state in beam:
+            if state.last_step_type == "node":
+                result = graph.query("MATCH (n {id: $node_id})-[r]-(m) RETURN ...", params={"node_id": state.nodes[-1]})
+                for rel_type, source_id, target_id, edge_props, _, _ in result.result_set:
+                    if target_id in state.nodes:
+                        continue
+                    new_edges = state.edges + [(source_id, rel_type, target_id)]
+                    score = state.score * (ask_module.edge_score(edge_props) ** (1.0 / (len(state.nodes) + len(new_edges))))
+                    new_beam.append(ask_module.PathState(state.nodes.copy(), new_edges, score, "links", state.depth + 1))
+            elif state.edges:
+                target_id = state.edges[-1][2]
+                result = graph.query("MATCH (n {id: $node_id}) RETURN properties(n), n.embedding", params={"node_id": target_id})
+                if not result.result_set:
+                    continue
+                props, embedding = result.result_set[0]
+                cos_sim = np.dot(query_vector, np.array(embedding)) if embedding else 0.5
+                new_nodes = state.nodes + [target_id]
+                score = state.score * (ask_module.node_score(props, cos_sim) ** (1.0 / len(new_nodes)))
+                new_beam.append(ask_module.PathState(new_nodes, state.edges.copy(), score, "node", state.depth + 1))
+        if not new_beam:
+            break
+        new_beam.sort(key=lambda s: s.score, reverse=True)
+        beam = new_beam[:beam_width]
+        if (beam[0].score - best_score) / (best_score + 1e-10) < ask_module.MARGINAL_GAIN_THRESHOLD:
+            break
+        best_score = beam[0].score
+    return beam[0] if beam else ask_module.PathState([], [], 0.0, "node", 0)
+
+
+def legacy_ask(question, graph, embeddings, beam_width, max_steps):
+    query_vector, _ = ask_module.build_contextual_query(question, embeddings)
+    candidates = ask_module.discover_candidates(graph, query_vector)
+    flat = sorted((c for cands in candidates.values() for c in cands), key=lambda c: c["score_cos"], reverse=True)
+    path = legacy_beam_search(graph, flat, query_vector, beam_width, max_steps)
+    graph.query("MATCH (n) WHERE n.id IN $ids RETURN ...", params={"ids": path.nodes})
+    for source_id, rel_type, target_id in path.edges:
+        graph.query(f"MATCH (s {{id: $source_id}})-[r:`{rel_type}`]->(t) RETURN ...",
+                    params={"source_id": source_id, "target_id": target_id})
+    return path
+
+
+def run_mode(args, mode):
+    rng = random.Random(args.seed)
+    graph = FixtureGraph(args.nodes, args.degree, args.rtt_ms, rng)
+    embeddings = FixtureEmbeddings(graph, random.Random(args.seed + 1))
+    adjacency = ask_module.AdjacencyLRU() if mode == "batched+lru" else ask_module.AdjacencyLRU(max_entries=0)
+
+    latencies, queries, scores = [], [], []
+    for q in range(args.questions):
+        before = graph.queries
+        started = time.perf_counter()
+        if mode == "legacy":
+            path = legacy_ask(f"question {q}", graph, embeddings, args.beam_width, args.max_steps)
+            scores.append(path.score)
+        else:
+            result = ask_module.ask(f"question {q}", graph=graph, embedding_service=embeddings, adjacency=adjacency)
+            scores.append(float(result["notes"].split("score: ")[1].split(",")[0]))
+        latencies.append((time.perf_counter() - started) * 1000)
+        queries.append(graph.queries - before)
+
+    latencies.sort()
+    p95 = latencies[min(len(latencies) - 1, int(round(0.95 * (len(latencies) - 1))))]
+    print(f"{mode:>12}: {statistics.mean(queries):6.1f} queries/question   "
+          f"p50 {statistics.median(latencies):7.1f}ms   p95 {p95:7.1f}ms   mean path score {statistics.mean(scores):.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ask.py beam search benchmark")
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--degree", type=int, default=6, help="Average outgoing edges per node")
+    parser.add_argument("--questions", type=int, default=30)
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="Simulated graph round trip per query")
+    parser.add_argument("--beam-width", type=int, default=ask_module.BEAM_WIDTH)
+    parser.add_argument("--max-steps", type=int, default=ask_module.MAX_STEPS)
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--full-depth", action="store_true",
+                        help="Disable the marginal-gain stop (path scores only shrink, so it usually stops after one step)")
+    args = parser.parse_args()
+
+    if args.full_depth:
+        ask_module.MARGINAL_GAIN_THRESHOLD = float("-inf")
+
+    ask_module.BEAM_WIDTH = args.beam_width
+    ask_module.MAX_STEPS = args.max_steps
+    ask_module.beam_search.__defaults__ = (args.beam_width, args.max_steps, None)
+
+    print("=" * 78)
+    print(f"ask() beam search: {args.nodes} nodes, {args.questions} questions, "
+          f"B={args.beam_width} T={args.max_steps}, {args.rtt_ms}ms simulated RTT")
+    print("=" * 78)
+    for mode in ["legacy", "batched", "batched+lru"]:
+        run_mode(args, mode)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark: as-of version queries (orchestration/mechanisms/bitemporal.py).
+
+Builds version chains for synthetic logical ids (create_new_version +
+supersede, with some invalidations) and compares as-of query throughput of
+the list-based get_current_version (filter every object, sort) with the
+VersionIndex (per-id arrays, bisection). Also reports index build time and
+incremental maintenance cost per new version.
+
+Usage:
+    python orchestration/scripts/bench_bitemporal_index.py
+    python orchestration/scripts/bench_bitemporal_index.py --ids 1000 10000 100000 --max-versions 12
+
+Date: 2026-10-18
+Purpose: Measure as-of query throughput of the bitemporal VersionIndex
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from orchestration.mechanisms.bitemporal import (
+    VersionIndex,
+    get_current_version,
+    get_version_history,
+    supersede,
+)
+
+BASE = datetime(2025, 1, 1)
+
+
+class Version:
+    __slots__ = ("id", "vid", "created_at", "valid_at", "expired_at", "invalidated_at", "supersedes", "superseded_by")
+
+    def __init__(self, logical_id, vid, created_at, valid_at):
+        self.id = logical_id
+        self.vid = vid
+        self.created_at = created_at
+        self.valid_at = valid_at
+        self.expired_at = None
+        self.invalidated_at = None
+        self.supersedes = None
+        self.superseded_by = None
+
+
+def build_versions(n_ids, max_versions, rng, index=None):
+    """Version chains per logical id; returns all versions (and fills index incrementally if given)."""
+    objects = []
+    for i in range(n_ids):
+        logical_id = f"node_{i}"
+        t = BASE + timedelta(hours=rng.randint(0, 24 * 90))
+        previous = None
+        for k in range(rng.randint(1, max_versions)):
+            version = Version(logical_id, f"v_{i}_{k}", t, t - timedelta(hours=rng.randint(0, 48)))
+            if index is not None:
+                index.add(version)
+            if previous is not None:
+                supersede(previous, version, index=index)
+            objects.append(version)
+            previous = version
+            t += timedelta(hours=rng.randint(1, 24 * 14))
+    return objects
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bitemporal as-of query benchmark")
+    parser.add_argument("--ids", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--max-versions", type=int, default=8)
+    parser.add_argument("--queries", type=int, default=100_000, help="Indexed as-of queries")
+    parser.add_argument("--linear-seconds", type=float, default=3.0, help="Time budget for list-based queries")
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("As-of version queries: list scan vs VersionIndex")
+    print("=" * 78)
+    for n_ids in args.ids:
+        rng = random.Random(args.seed)
+        objects = build_versions(n_ids, args.max_versions, rng)
+        started = time.perf_counter()
+        index = VersionIndex(objects)
+        build_s = time.perf_counter() - started
+
+        queries = [(f"node_{rng.randrange(n_ids)}",
+                    BASE + timedelta(hours=rng.randint(0, 24 * 200)),
+                    rng.choice([None, BASE + timedelta(hours=rng.randint(0, 24 * 200))]))
+                   for _ in range(args.queries)]
+
+        linear_done, started = 0, time.perf_counter()
+        while linear_done < len(queries) and time.perf_counter() - started < args.linear_seconds:
+            logical_id, knowledge, reality = queries[linear_done]
+            expected = get_current_version(objects, logical_id, knowledge, reality)
+            assert index.current(logical_id, knowledge, reality) is expected
+            linear_done += 1
+        linear_qps = linear_done / (time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for logical_id, knowledge, reality in queries:
+            index.current(logical_id, knowledge, reality)
+        indexed_qps = len(queries) / (time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for logical_id, _, _ in queries[:10_000]:
+            index.history(logical_id)
+        history_qps = min(10_000, len(queries)) / (time.perf_counter() - started)
+        started = time.perf_counter()
+        get_version_history(objects, queries[0][0])
+        linear_history_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        incremental = VersionIndex()
+        build_versions(max(1, n_ids // 10), args.max_versions, random.Random(args.seed + 1), index=incremental)
+        maintain_us = (time.perf_counter() - started) / max(len(incremental), 1) * 1e6
+
+        print(f"\n{n_ids:,} logical ids, {len(objects):,} versions")
+        print(f"  get_current_version: list {linear_qps:12,.0f} q/s   index {indexed_qps:12,.0f} q/s   "
+              f"({indexed_qps / linear_qps:,.0f}x, {linear_done:,} answers cross-checked)")
+        print(f"  get_version_history: list {1 / linear_history_s:12,.0f} q/s   index {history_qps:12,.0f} q/s")
+        print(f"  index build {build_s * 1000:.0f}ms   incremental add+supersede {maintain_us:.1f}us/version")
+
+
+if __name__ == "__main__":
+    main()
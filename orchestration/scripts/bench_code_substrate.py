@@ -0,0 +1,221 @@
+"""
+Benchmark: code substrate watcher settle time (orchestration/services/watchers/code_substrate_watcher.py).
+
+Creates N watched files in a temp tree, starts a real watchdog Observer,
+then touches every file (a branch checkout / bulk refactor) and measures
+the time from the first touch until every upsert has been applied, plus
+graph round trips.
+
+- batched: CodeSubstrateHandler (per-path coalescing, one UNWIND ... MERGE
+  per node type per batch, worker thread)
+- legacy: per-event task on the asyncio loop: sleep 300 ms, then a
+  find query and a create/update query on the synchronous client (the
+  pre-coalescer handler; events are handed to the loop thread-safely,
+  which the original create_task from the observer thread did not do)
+
+Without --redis-url the graph is a stand-in that costs --rtt-ms per round
+trip plus --row-us per upserted row (no server needed).
+
+Usage:
+    python orchestration/scripts/bench_code_substrate.py
+    python orchestration/scripts/bench_code_substrate.py --files 5000 --rtt-ms 0.5
+    python orchestration/scripts/bench_code_substrate.py --redis-url redis://localhost:6379 --graph bench_code
+
+Date: 2026-10-19
+Purpose: Measure time to settle after touching 5,000 files, batched vs per-event ingestion
+"""
+
+import argparse
+import asyncio
+import logging
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+from orchestration.services.watchers import code_substrate_watcher as csw
+from orchestration.services.watchers.code_substrate_watcher import CodeSubstrateHandler
+
+
+class LatencyGraph:
+    """GRAPH.QUERY stand-in: sleeps one round trip plus a per-row cost."""
+
+    def __init__(self, rtt_s, row_s):
+        self.rtt_s = rtt_s
+        self.row_s = row_s
+        self.round_trips = 0
+        self.last_reply = None
+
+    def execute_command(self, *args):
+        self.round_trips += 1
+        rows = args[2].count("`file_path`:")
+        time.sleep(self.rtt_s + rows * self.row_s)
+        self.last_reply = time.perf_counter()
+        return []
+
+
+class CountingClient:
+    """Wraps a real redis client to count round trips."""
+
+    def __init__(self, client):
+        self.client = client
+        self.round_trips = 0
+        self.last_reply = None
+
+    def execute_command(self, *args):
+        self.round_trips += 1
+        reply = self.client.execute_command(*args)
+        self.last_reply = time.perf_counter()
+        return reply
+
+
+def make_tree(root, n):
+    files = []
+    for i in range(n):
+        directory = root / f"pkg_{i % 50}"
+        directory.mkdir(exist_ok=True)
+        path = directory / (f"mod_{i}.py" if i % 5 else f"doc_{i}.md")
+        path.write_text(f"# file {i}\n")
+        files.append(path)
+    return files
+
+
+def touch_all(files):
+    for path in files:
+        with path.open("a") as fh:
+            fh.write("# touched\n")
+
+
+def observe(handler, root):
+    observer = Observer()
+    observer.schedule(handler, str(root), recursive=True)
+    observer.start()
+    time.sleep(0.5)  # let the backend settle before touching
+    return observer
+
+
+def run_batched(args, root, files, db):
+    handler = CodeSubstrateHandler(db=db, graph_name=args.graph)
+    handler.start()
+    observer = observe(handler, root)
+    trips_before = db.round_trips
+    started = time.perf_counter()
+    touch_all(files)
+    touched_s = time.perf_counter() - started
+    handler.wait_settled()
+    time.sleep(1.0)  # late events from the observer
+    handler.wait_settled()
+    settle_s = db.last_reply - started
+    observer.stop()
+    observer.join()
+    handler.stop()
+    return settle_s, touched_s, db.round_trips - trips_before, handler.batches, handler.upserts
+
+
+# --- Legacy path (pre-coalescer CodeSubstrateHandler) ---
+
+class LegacyHandler(FileSystemEventHandler):
+    def __init__(self, db, graph, loop):
+        self.db = db
+        self.graph = graph
+        self.loop = loop
+        self.processing = set()
+        self.pending = 0
+        self.done = 0
+        self.lock = threading.Lock()
+
+    def on_modified(self, event):
+        if event.is_directory or Path(event.src_path).suffix not in (".py", ".md"):
+            return
+        if event.src_path in self.processing:
+            return
+        with self.lock:
+            self.pending += 1
+        self.loop.call_soon_threadsafe(lambda: asyncio.ensure_future(self.process_file(event.src_path)))
+
+    on_created = on_modified
+
+    async def process_file(self, path):
+        try:
+            self.processing.add(path)
+            await asyncio.sleep(0.3)
+            label = "Code" if path.endswith(".py") else "Documentation"
+            self.db.execute_command(
+                "GRAPH.QUERY", self.graph,
+                f"MATCH (n:{label} {{file_path: $file_path}}) RETURN id(n) as node_id", f"file_path='{path}'")
+            self.db.execute_command(
+                "GRAPH.QUERY", self.graph,
+                f"CREATE (n:{label} {{file_path: $file_path}}) RETURN id(n)", f"file_path='{path}'")
+        finally:
+            self.processing.discard(path)
+            with self.lock:
+                self.pending -= 1
+                self.done += 1
+
+
+def run_legacy(args, root, files, db):
+    async def scenario():
+        handler = LegacyHandler(db, args.graph, asyncio.get_running_loop())
+        observer = observe(handler, root)
+        trips_before = db.round_trips
+        started = time.perf_counter()
+        await asyncio.to_thread(touch_all, files)
+        quiet_since = time.perf_counter()
+        last_done = handler.done
+        while time.perf_counter() - quiet_since < 1.0:
+            await asyncio.sleep(0.05)
+            if handler.pending or handler.done != last_done:
+                quiet_since, last_done = time.perf_counter(), handler.done
+        observer.stop()
+        observer.join()
+        return db.last_reply - started, db.round_trips - trips_before, handler.done
+
+    return asyncio.run(scenario())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Code substrate watcher settle-time benchmark")
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="Stand-in round trip per GRAPH.QUERY")
+    parser.add_argument("--row-us", type=float, default=10.0, help="Stand-in cost per upserted row")
+    parser.add_argument("--redis-url", default=None, help="Use a real FalkorDB instead of the stand-in")
+    parser.add_argument("--graph", default="bench_code_substrate")
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    logging.getLogger(csw.__name__).setLevel(logging.WARNING)
+    root = Path(tempfile.mkdtemp(prefix="bench_code_substrate_"))
+
+    def make_db():
+        if args.redis_url:
+            import redis
+            return CountingClient(redis.Redis.from_url(args.redis_url))
+        return LatencyGraph(args.rtt_ms / 1000.0, args.row_us / 1e6)
+
+    target = args.redis_url or f"stand-in graph ({args.rtt_ms:g} ms/round trip, {args.row_us:g} us/row)"
+    print("=" * 78)
+    print(f"Code substrate watcher: touch {args.files:,} files, {target}")
+    print("=" * 78)
+    try:
+        files = make_tree(root, args.files)
+        settle_s, touch_s, trips, batches, upserts = run_batched(args, root, files, make_db())
+        print(f"\n  batched: settled in {settle_s:6.2f}s  ({upserts:,} upserts in {batches} batches, "
+              f"{trips} round trips; touching took {touch_s:.2f}s)")
+        if not args.skip_legacy:
+            settle_legacy, trips_legacy, processed = run_legacy(args, root, files, make_db())
+            print(f"  legacy:  settled in {settle_legacy:6.2f}s  ({processed:,} events processed, "
+                  f"{trips_legacy:,} round trips)")
+            print(f"  speedup {settle_legacy / settle_s:,.1f}x, round trips {trips_legacy / max(1, trips):,.0f}x fewer")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
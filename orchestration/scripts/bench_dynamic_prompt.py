@@ -0,0 +1,184 @@
+"""
+Benchmark: dynamic prompt change detection and writes (orchestration/libs/dynamic_prompt_generator.py).
+
+Simulates one minute of 10 Hz ticks over N nodes and K subentities. Each
+tick a diffusion frontier (--moving fraction of nodes) gets energy deltas
+and criticality drifts every --crit-every ticks. Reports per-check latency
+and prompt bytes written per minute for:
+
+- delta feed: apply_energy_deltas(frontier deltas) + check_and_update
+- snapshot feed: update_node_energies(all n.E, as the engine feeds it) + check
+- legacy: per-check full node table (rows as the MATCH (n) scan returns
+  them, query time itself excluded) -> per-subentity dict loop, full file
+  rewrite on every check with a crossing
+
+Usage:
+    python orchestration/scripts/bench_dynamic_prompt.py
+    python orchestration/scripts/bench_dynamic_prompt.py --nodes 10000 100000 --subentities 8 --moving 0.01
+
+Date: 2026-10-18
+Purpose: Measure check latency and prompt bytes/minute of incremental activation detection
+"""
+
+import argparse
+import asyncio
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from orchestration.libs import dynamic_prompt_generator as dpg
+from orchestration.libs.dynamic_prompt_generator import DynamicPromptGenerator, calculate_activation_threshold
+
+TICK_HZ = 10
+TICKS = 60 * TICK_HZ
+
+
+class StaticGraph:
+    """Graph store stand-in for the system-state query (no ConsciousnessState yet)."""
+
+    def query(self, cypher, params=None):
+        return []
+
+
+class SimClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_workload(args, n, seed=11):
+    rng = np.random.default_rng(seed)
+    node_ids = [f"node_{i}" for i in range(n)]
+    entity_ids = [f"entity_{k}" for k in range(args.subentities)]
+    energy = rng.uniform(0.0, 1.0, n)
+    weights = [{entity_ids[k]: float(rng.uniform(0.5, 1.5)) for k in rng.choice(len(entity_ids), 2, replace=False)}
+               if rng.random() < 0.3 else {} for _ in range(n)]
+    moving = max(1, int(n * args.moving))
+    ticks = []
+    for t in range(TICKS):
+        rows = rng.choice(n, moving, replace=False)
+        ticks.append((rows, rng.normal(0.0, 0.08, moving), 0.5 + 0.1 * ((t // args.crit_every) % 3)))
+    return node_ids, entity_ids, energy, weights, ticks
+
+
+async def run_generator(args, n, workload, mode, workdir, clock):
+    node_ids, entity_ids, energy, weights, ticks = workload
+    energy = energy.copy()
+    gen = DynamicPromptGenerator("bench", StaticGraph(), file_path=str(workdir / f"{mode}.md"))
+    gen.update_node_energies(node_ids, energy, sub_entity_weights=weights)
+    clock.now = -gen.min_write_interval
+    await gen.check_and_update(0.5, entity_ids)
+    gen.bytes_written = gen.writes = 0
+
+    latencies = []
+    for t, (rows, deltas, global_crit) in enumerate(ticks):
+        clock.now = t / TICK_HZ
+        new = np.maximum(energy[rows] + deltas, 0.0)
+        applied = new - energy[rows]
+        energy[rows] = new
+        started = time.perf_counter()
+        if mode == "delta":
+            gen.apply_energy_deltas(dict(zip([node_ids[r] for r in rows], applied.tolist())))
+        else:
+            gen.update_node_energies(node_ids, energy)
+        await gen.check_and_update(global_crit, entity_ids)
+        latencies.append(time.perf_counter() - started)
+    clock.now += gen.min_write_interval
+    await gen.flush()
+    return np.array(latencies), gen.bytes_written, gen.writes
+
+
+# --- Legacy path (pre-array generator: per-subentity loop over the full scan) ---
+
+def legacy_detect(states, entity_id, threshold, node_states):
+    changes = 0
+    previous = states.setdefault(entity_id, {})
+    for node_id, (node_name, energy, sub_entity_weights) in node_states.items():
+        activity = energy
+        if entity_id in sub_entity_weights:
+            activity = energy * sub_entity_weights[entity_id]
+        is_active = activity >= threshold
+        if is_active != previous.get(node_id, False):
+            previous[node_id] = is_active
+            changes += 1
+    return changes
+
+
+def run_legacy(args, workload, content_bytes, sample_ticks):
+    node_ids, entity_ids, energy, weights, ticks = workload
+    energy = energy.copy()
+    states = {}
+    latencies, bytes_written, writes = [], 0, 0
+    for t, (rows, deltas, global_crit) in enumerate(ticks):
+        energy[rows] = np.maximum(energy[rows] + deltas, 0.0)
+        if t >= sample_ticks and t > 0:
+            continue
+        table = list(zip(range(len(node_ids)), node_ids, energy.tolist(), weights))  # scan result rows
+        started = time.perf_counter()
+        node_states = {str(i): (name or "unknown", float(e), w or {}) for i, name, e, w in table}
+        changed = 0
+        for entity_id in entity_ids:
+            changed += legacy_detect(states, entity_id, calculate_activation_threshold(global_crit, 0.5), node_states)
+        latencies.append(time.perf_counter() - started)
+        if changed and t > 0:
+            bytes_written += content_bytes
+            writes += 1
+    return np.array(latencies[1:]), bytes_written, writes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dynamic prompt change-detection benchmark")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--subentities", type=int, default=8)
+    parser.add_argument("--moving", type=float, default=0.01, help="Fraction of nodes with energy deltas per tick")
+    parser.add_argument("--crit-every", type=int, default=50, help="Ticks between criticality changes")
+    parser.add_argument("--legacy-sample", type=int, default=20, help="Legacy ticks timed per size")
+    args = parser.parse_args()
+
+    dpg.WEBSOCKET_AVAILABLE = False
+    dpg.logger.setLevel("WARNING")
+    clock = SimClock()
+    dpg.time.monotonic = clock
+    workdir = Path(tempfile.mkdtemp(prefix="bench_prompt_"))
+
+    print("=" * 78)
+    print(f"Dynamic prompt: {TICKS} ticks at {TICK_HZ} Hz (1 simulated minute), {args.subentities} subentities, "
+          f"{args.moving:.1%} of nodes moving per tick")
+    print("=" * 78)
+    try:
+        for n in args.nodes:
+            workload = make_workload(args, n)
+            results = {}
+            for mode in ("delta", "snapshot"):
+                results[mode] = asyncio.run(run_generator(args, n, workload, mode, workdir, clock))
+            content_bytes = (workdir / "delta.md").stat().st_size
+            results["legacy"] = run_legacy(args, workload, content_bytes, args.legacy_sample)
+
+            print(f"\n{n:,} nodes:")
+            print(f"  {'path':<10} {'p50 ms':>9} {'p99 ms':>9} {'writes/min':>11} {'KB/min':>9}")
+            for mode, label in (("delta", "delta"), ("snapshot", "snapshot"), ("legacy", "legacy")):
+                latencies, written, writes = results[mode]
+                if mode == "legacy":
+                    # Writes: every tick with a crossing (measured on the sampled ticks), extrapolated
+                    writes = writes * (TICKS - 1) / max(1, len(latencies))
+                    written = writes * content_bytes
+                print(f"  {label:<10} {np.percentile(latencies, 50) * 1000:9.2f} "
+                      f"{np.percentile(latencies, 99) * 1000:9.2f} {writes:11.0f} {written / 1024:9.1f}")
+            legacy_p50 = np.percentile(results["legacy"][0], 50)
+            print(f"  check speedup (p50): delta {legacy_p50 / np.percentile(results['delta'][0], 50):,.0f}x, "
+                  f"snapshot {legacy_p50 / np.percentile(results['snapshot'][0], 50):,.0f}x "
+                  f"(legacy excludes the FalkorDB scan itself)")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
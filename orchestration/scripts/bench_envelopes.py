@@ -0,0 +1,245 @@
+"""
+Benchmark: membrane envelope validation (orchestration/schemas/membrane_envelopes.py).
+
+Builds one representative frame per ENVELOPE_REGISTRY type and measures
+envelopes/sec for:
+
+- legacy: json.loads -> schema_class(**data) -> .dict() (pre-compiled
+  deserialize_envelope + validate_envelope; in-script copy)
+- compiled: EnvelopeValidator.validate_json on the raw bytes, cache off
+- cached: the same frames replayed through a warm digest cache
+  (duplicated/replayed envelopes)
+
+Also times the protocol hub /inject schema check: legacy json.loads +
+hand-written field checks + json.dumps for fan-out, against BUS_VALIDATOR
+(compiled BusEnvelope, frame forwarded as received). Every compiled result
+is checked against the legacy model. GC is paused while timing.
+
+Usage:
+    python orchestration/scripts/bench_envelopes.py
+    python orchestration/scripts/bench_envelopes.py --n 50000
+
+Date: 2026-10-19
+Purpose: Measure envelopes/sec of compiled, cached envelope validation per type
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+warnings.filterwarnings("ignore")  # .dict() deprecation noise on the legacy path
+
+from orchestration.schemas.membrane_envelopes import ENVELOPE_REGISTRY, BusEnvelope, EnvelopeValidator
+
+STIMULUS = {
+    "type": "membrane.inject",
+    "scope": "personal",
+    "channel": "ui.action.select_nodes",
+    "content": "User selected 3 nodes in the graph view",
+    "features_raw": {"novelty": 0.5, "uncertainty": 0.1, "trust": 0.9,
+                     "urgency": 0.2, "valence": 0.3, "scale": 0.4},
+    "metadata": {"origin": "ui", "dedupe_key": "a" * 64, "timestamp": "2025-10-27T12:00:00"},
+    "target_nodes": ["node_1", "node_2", "node_3"],
+    "provenance": {"path": "dashboard/graph", "session": "s-42"},
+}
+
+SAMPLES = {
+    "membrane.inject": STIMULUS,
+    "percept.frame": {
+        "type": "percept.frame", "entity_id": "e1", "citizen_id": "felix",
+        "affect": {"valence": 0.2, "arousal": 0.5}, "novelty": 0.1, "uncertainty": 0.2,
+        "goal_match": 0.7, "anchors_top": [f"n{i}" for i in range(8)],
+        "anchors_peripheral": [f"p{i}" for i in range(16)], "cursor": 42,
+        "timestamp": "2025-10-27T12:00:00",
+    },
+    "wm.emit": {
+        "type": "wm.emit", "citizen_id": "felix", "selected_nodes": [f"n{i}" for i in range(7)],
+        "activation_scores": {f"n{i}": i / 10 for i in range(7)}, "capacity": 7, "cursor": 42,
+    },
+    "graph.delta.node.upsert": {
+        "type": "graph.delta.node.upsert", "citizen_id": "felix", "cursor": 42, "node_id": "n1",
+        "node_type": "Realization", "properties": {"name": "n1", "energy": 0.4, "tags": ["a", "b"]},
+    },
+    "graph.delta.node.delete": {
+        "type": "graph.delta.node.delete", "citizen_id": "felix", "cursor": 42, "node_id": "n1",
+    },
+    "graph.delta.link.upsert": {
+        "type": "graph.delta.link.upsert", "citizen_id": "felix", "cursor": 42, "link_id": "l1",
+        "link_type": "ENABLES", "source_id": "n1", "target_id": "n2",
+        "properties": {"weight": 0.7, "confidence": 0.9},
+    },
+    "graph.delta.link.delete": {
+        "type": "graph.delta.link.delete", "citizen_id": "felix", "cursor": 42, "link_id": "l1",
+    },
+    "graph.delta.activation": {
+        "type": "graph.delta.activation", "citizen_id": "felix", "cursor": 42,
+        "activations": {f"n{i}": i / 50 for i in range(32)},
+    },
+    "membrane.transfer.up": {
+        "type": "membrane.transfer.up", "source_citizen_id": "felix", "stimulus": STIMULUS,
+        "permeability": 0.4, "flow_ema": 0.2, "effect_ema": 0.1,
+        "record_axes": {"novelty": 0.5, "trust": 0.9},
+    },
+    "membrane.transfer.down": {
+        "type": "membrane.transfer.down", "target_citizen_id": "felix", "stimulus": STIMULUS,
+        "permeability": 0.4,
+    },
+    "membrane.permeability.updated": {
+        "type": "membrane.permeability.updated", "citizen_id": "felix", "direction": "up",
+        "old_kappa": 0.4, "new_kappa": 0.45, "outcome_quality": 0.8, "learning_rate": 0.05,
+    },
+    "membrane.export.rejected": {
+        "type": "membrane.export.rejected", "citizen_id": "felix", "direction": "up",
+        "rejection_reason": "below_threshold", "candidate_scores": {"n1": 0.1, "n2": 0.05},
+    },
+    "intent.event": {
+        "type": "intent.event", "intent_id": "i1", "status": "created",
+        "description": "Fix failing dashboard build", "priority": 0.8,
+        "source_stimulus_ids": ["s1", "s2"],
+    },
+    "mission.event": {
+        "type": "mission.event", "mission_id": "m1", "intent_id": "i1", "citizen_id": "felix",
+        "description": "Fix failing dashboard build",
+    },
+    "tool.offer": {
+        "type": "tool.offer", "tool_id": "git", "capabilities": ["commit", "diff", "log"],
+        "cost_estimate": 0.01,
+    },
+    "tool.request": {
+        "type": "tool.request", "request_id": "r1", "tool_id": "git", "citizen_id": "felix",
+        "capability": "diff",
+    },
+    "tool.result": {
+        "type": "tool.result", "request_id": "r1", "tool_id": "git", "success": True,
+        "execution_time_ms": 12.5,
+    },
+    "outcome.signal": {
+        "type": "outcome.signal", "source_id": "m1", "success": True, "utility_score": 0.8,
+        "harm_score": 0.0,
+    },
+    "stimulus.mass_anomaly": {
+        "type": "stimulus.mass_anomaly", "source_id": "s1", "current_mass": 12.0,
+        "threshold": 8.0, "median": 3.0, "mad": 1.5,
+    },
+    "stimulus.processed": {
+        "type": "stimulus.processed", "citizen_id": "felix", "stimuli_count": 3,
+        "nodes_activated": 40, "total_delta_e": 2.5, "frame_time_ms": 4.2,
+    },
+}
+
+HUB_FRAME = {
+    "type": "membrane.inject",
+    "channel": "graph.update",
+    "payload": {"node_id": "n1", "energy": 0.4, "tags": ["a", "b"]},
+    "origin": "l3.docs",
+    "timestamp": "2025-11-04T14:00:00Z",
+}
+
+
+# ---------------------------------------------------------------------------
+# Legacy paths (pre-compiled membrane_envelopes.py / protocol hub)
+# ---------------------------------------------------------------------------
+
+def legacy_deserialize_and_validate(raw):
+    data = json.loads(raw)
+    envelope_type = data.get("type")
+    schema_class = ENVELOPE_REGISTRY.get(envelope_type)
+    if not schema_class:
+        raise ValueError(f"Unknown envelope type: {envelope_type}")
+    envelope = schema_class(**data)
+    envelope.dict()  # validate_envelope
+    return envelope
+
+
+def legacy_hub_check(raw):
+    envelope = json.loads(raw)
+    for field in ("type", "channel", "payload", "origin"):
+        if field not in envelope:
+            return None
+    if envelope["type"] != "membrane.inject":
+        return None
+    if not isinstance(envelope["channel"], str) or len(envelope["channel"]) == 0:
+        return None
+    return json.dumps(envelope)  # dispatch re-encoded the envelope
+
+
+def compiled_hub_check(validator, raw):
+    envelope = validator.validate_json(raw)
+    return envelope.channel, raw  # forwarded as received
+
+
+def timed(fn, frames, repeat):
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for frame in frames:
+                fn(frame)
+        return len(frames) * repeat / (time.perf_counter() - start)
+    finally:
+        gc.enable()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Envelope validation benchmark")
+    parser.add_argument("--n", type=int, default=20000, help="Frames per type")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    validator = EnvelopeValidator(cache_size=0)
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    print("=" * 78)
+    print(f"Envelope validation: {len(SAMPLES)} types, {args.n} frames/type "
+          f"(compiled {len(ENVELOPE_REGISTRY)} validators in {compile_ms:.1f} ms)")
+    print("=" * 78)
+    print(f"{'type':<32}{'bytes':>7}{'legacy/s':>12}{'compiled/s':>12}{'cached/s':>12}{'speedup':>9}")
+
+    totals = [0.0, 0.0, 0.0]
+    for envelope_type, sample in SAMPLES.items():
+        raw = json.dumps(sample).encode()
+        expected = legacy_deserialize_and_validate(raw)
+        # Generated defaults (utcnow timestamps, uuids) differ between builds
+        unstamped = {n for n, f in type(expected).model_fields.items() if f.default_factory}
+        assert (validator.validate_json(raw).model_dump(exclude=unstamped)
+                == expected.model_dump(exclude=unstamped)), envelope_type
+
+        # Distinct frames (varying a trailing key) so the uncached paths never repeat input
+        frames = [raw[:-1] + b', "_seq": %d}' % i for i in range(args.n)]
+        legacy = timed(legacy_deserialize_and_validate, frames, 1)
+        compiled = timed(validator.validate_json, frames, 1)
+
+        replayed = frames[:256]
+        cache = EnvelopeValidator(registry={envelope_type: ENVELOPE_REGISTRY[envelope_type]}, cache_size=256)
+        for frame in replayed:
+            cache.validate_json(frame)
+        cached = timed(cache.validate_json, replayed, max(1, args.n // len(replayed)))
+
+        for i, rate in enumerate((legacy, compiled, cached)):
+            totals[i] += 1 / rate
+        print(f"{envelope_type:<32}{len(raw):>7}{legacy:>12,.0f}{compiled:>12,.0f}{cached:>12,.0f}"
+              f"{compiled / legacy:>8.1f}x")
+
+    mixed = [len(SAMPLES) / t for t in totals]
+    print(f"{'mixed (equal share per type)':<32}{'':>7}{mixed[0]:>12,.0f}{mixed[1]:>12,.0f}{mixed[2]:>12,.0f}"
+          f"{mixed[1] / mixed[0]:>8.1f}x")
+
+    hub_validator = EnvelopeValidator({"membrane.inject": BusEnvelope}, cache_size=0)
+    raw = json.dumps(HUB_FRAME).encode()
+    frames = [raw[:-1] + b', "_seq": %d}' % i for i in range(args.n)]
+    legacy = timed(legacy_hub_check, frames, 1)
+    compiled = timed(lambda frame: compiled_hub_check(hub_validator, frame), frames, 1)
+    print("-" * 78)
+    print(f"{'hub /inject schema + encode':<32}{len(raw):>7}{legacy:>12,.0f}{compiled:>12,.0f}{'':>12}"
+          f"{compiled / legacy:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: markdown chunker throughput (tools/doc_ingestion/md_chunker.py).
+
+Chunks the repo docs with MarkdownChunker and reports MB/s, chunk counts
+and tokenizer amplification (characters handed to the tokenizer per input
+character; 1.0 means every byte is tokenized once). --scale also chunks
+synthetic files built by concatenating the corpus at growing sizes: flat
+MB/s across sizes means chunking cost is linear in file size.
+
+Usage:
+    python orchestration/scripts/bench_md_chunker.py
+    python orchestration/scripts/bench_md_chunker.py --scale 0.5 1 2 4
+    python orchestration/scripts/bench_md_chunker.py --paths "docs/specs/**/*.md" --encoding o200k_base
+
+Date: 2026-10-18
+Purpose: Measure linear-time chunking in MarkdownChunker
+"""
+
+import argparse
+import glob
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+import tiktoken
+
+from tools.doc_ingestion.md_chunker import MarkdownChunker
+
+
+class MeteredChunker(MarkdownChunker):
+    """MarkdownChunker that counts characters handed to the tokenizer."""
+
+    encoded_chars = 0
+
+    def count_tokens(self, text: str) -> int:
+        self.encoded_chars += len(text)
+        return super().count_tokens(text)
+
+
+def chunk_corpus(chunker: MeteredChunker, documents):
+    """Chunk every document; returns (seconds, chunk count, slowest (seconds, name))."""
+    total = 0.0
+    chunks = 0
+    slowest = (0.0, "")
+    for name, text in documents:
+        started = time.perf_counter()
+        chunks += len(chunker.chunk_file(text))
+        elapsed = time.perf_counter() - started
+        total += elapsed
+        slowest = max(slowest, (elapsed, name))
+    return total, chunks, slowest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MarkdownChunker throughput benchmark")
+    parser.add_argument("--paths", default="docs/**/*.md", help="Glob (relative to repo root)")
+    parser.add_argument("--encoding", default="cl100k_base", help="tiktoken encoding name")
+    parser.add_argument("--target-tokens", type=int, default=250)
+    parser.add_argument("--max-tokens", type=int, default=480)
+    parser.add_argument("--scale", type=float, nargs="*", default=[],
+                        help="Also chunk synthetic files of these sizes (MB)")
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(str(ROOT / args.paths), recursive=True))
+    documents = [(str(Path(f).relative_to(ROOT)), Path(f).read_text(encoding="utf-8", errors="replace"))
+                 for f in files]
+    if not documents:
+        sys.exit(f"No files match {args.paths}")
+    size_mb = sum(len(text.encode("utf-8")) for _, text in documents) / 1e6
+
+    chunker = MeteredChunker(args.target_tokens, args.max_tokens, encoder=tiktoken.get_encoding(args.encoding))
+    input_chars = sum(len(text) for _, text in documents)
+    seconds, chunks, slowest = chunk_corpus(chunker, documents)
+
+    print("=" * 70)
+    print(f"MarkdownChunker ({args.encoding}, target {args.target_tokens}, max {args.max_tokens})")
+    print("=" * 70)
+    print(f"Corpus: {len(documents)} files, {size_mb:.2f} MB -> {chunks} chunks")
+    print(f"Time: {seconds:.2f}s   Throughput: {size_mb / seconds:.2f} MB/s")
+    print(f"Tokenizer amplification: {chunker.encoded_chars / input_chars:.2f}x input characters")
+    print(f"Slowest file: {slowest[1]} ({slowest[0] * 1000:.0f}ms)")
+
+    if args.scale:
+        corpus = "\n\n".join(text for _, text in documents)
+        print("\nScaling (one synthetic file per size):")
+        for mb in args.scale:
+            target_chars = int(mb * 1e6)
+            text = (corpus * (target_chars // len(corpus) + 1))[:target_chars]
+            actual_mb = len(text.encode("utf-8")) / 1e6
+            chunker.encoded_chars = 0
+            seconds, chunks, _ = chunk_corpus(chunker, [("synthetic", text)])
+            print(f"  {actual_mb:6.2f} MB: {seconds:7.2f}s  {actual_mb / seconds:6.2f} MB/s  "
+                  f"{chunks:6d} chunks  amplification {chunker.encoded_chars / len(text):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
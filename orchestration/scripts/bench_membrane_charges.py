@@ -0,0 +1,143 @@
+"""
+Benchmark: MembraneStore.record_charge throughput and lost-update check.
+
+Drives concurrent charges at a local Redis and reports charges/sec for:
+- legacy: the old client-side read / compute / write sequence (4 round trips,
+  not atomic between writers)
+- script: one Lua script call per charge
+- batched: Lua script with the per-(org, lane) micro-batcher
+
+After each run the lane budget, ledger length and wallet balances are checked
+against the expected totals; any shortfall is reported as lost updates.
+
+Usage:
+    python orchestration/scripts/bench_membrane_charges.py
+    python orchestration/scripts/bench_membrane_charges.py --redis-url redis://localhost:6379/15 --charges 20000 --concurrency 128
+    python orchestration/scripts/bench_membrane_charges.py --modes script batched --batch-ms 2
+
+Date: 2026-10-18
+Purpose: Measure the single round-trip charge script (membrane_store.py)
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from orchestration.services.economy.membrane_store import MembraneStore
+
+AMOUNT = 0.25
+START_BUDGET = 1_000_000.0
+
+
+async def legacy_record_charge(store: MembraneStore, org_id: str, lane: str, amount: float, wallet_node: str):
+    """Pre-script record_charge: read EMA, compute client-side, write back."""
+    redis = store._redis
+    budget_key = store._lane_budget_key(org_id, lane)
+    roi_key = store._lane_roi_key(org_id, lane)
+
+    pipe = redis.pipeline()
+    pipe.hget(budget_key, "spent_rolling")
+    pipe.hget(roi_key, "ema")
+    spent_prev, roi_prev = await pipe.execute()
+    spent_new = 0.8 * float(spent_prev or 0.0) + 0.2 * amount
+    roi_new = 0.8 * float(roi_prev or 1.0) + 0.2
+
+    now = time.time()
+    pipe = redis.pipeline()
+    pipe.hincrbyfloat(budget_key, "budget_remaining", -amount)
+    pipe.hset(budget_key, mapping={"spent_rolling": str(spent_new), "updated_at": str(now)})
+    pipe.hset(roi_key, mapping={"ema": str(roi_new), "updated": str(now)})
+    pipe.set(store._lane_spent_key(org_id, lane), str(spent_new), ex=60)
+    await pipe.execute()
+
+    await redis.xadd(store._econ_ledger_key(org_id), {"lane": lane, "amount_mind": f"{amount:.6f}"},
+                     maxlen=1_000_000, approximate=True)
+    await redis.incrbyfloat(store._wallet_balance_key(org_id, wallet_node), -amount)
+    await redis.hget(budget_key, "budget_remaining")
+
+
+async def run_mode(args, mode: str):
+    store = MembraneStore(
+        args.redis_url,
+        spend_alpha=0.2,
+        ledger_maxlen=1_000_000,
+        batch_window_ms=args.batch_ms if mode == "batched" else 0.0,
+    )
+    org_id = f"bench_{uuid.uuid4().hex[:8]}"
+    lanes = [f"lane{i}" for i in range(args.lanes)]
+    wallets = [f"node:citizen:{i}" for i in range(args.wallets)]
+    for lane in lanes:
+        await store.set_lane_budget(org_id, lane, soft_cap=START_BUDGET, budget_remaining=START_BUDGET)
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(args.charges):
+        queue.put_nowait(i)
+
+    async def worker():
+        while True:
+            try:
+                i = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            lane, wallet = lanes[i % len(lanes)], wallets[i % len(wallets)]
+            if mode == "legacy":
+                await legacy_record_charge(store, org_id, lane, AMOUNT, wallet)
+            else:
+                await store.record_charge(org_id, lane, AMOUNT, roi_sample=1.0, wallet_node=wallet)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    # Lost-update check: every charge must be reflected exactly once
+    redis = store._redis
+    charged = 0.0
+    for lane in lanes:
+        remaining = float(await redis.hget(store._lane_budget_key(org_id, lane), "budget_remaining"))
+        charged += START_BUDGET - remaining
+    wallet_total = 0.0
+    for wallet in wallets:
+        wallet_total -= await store.get_wallet_balance(org_id, wallet)
+    ledger_len = await redis.xlen(store._econ_ledger_key(org_id))
+    expected = args.charges * AMOUNT
+
+    keys = [key async for key in redis.scan_iter(match=f"{org_id}:*")]
+    if keys:
+        await redis.delete(*keys)
+    await store.close()
+
+    lost = round((expected - charged) / AMOUNT)
+    print(f"{mode:>8}: {args.charges / elapsed:10.0f} charges/s  ({elapsed:.2f}s)  "
+          f"budget lost {lost}, wallet lost {round((expected - wallet_total) / AMOUNT)}, "
+          f"ledger {ledger_len}/{args.charges}")
+
+
+async def run(args):
+    print("=" * 60)
+    print(f"record_charge benchmark: {args.charges} charges, concurrency {args.concurrency}, "
+          f"{args.lanes} lanes, {args.wallets} wallets")
+    print("=" * 60)
+    for mode in args.modes:
+        await run_mode(args, mode)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MembraneStore.record_charge benchmark")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--charges", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--lanes", type=int, default=4)
+    parser.add_argument("--wallets", type=int, default=16)
+    parser.add_argument("--batch-ms", type=float, default=2.0, help="Micro-batch window for --modes batched")
+    parser.add_argument("--modes", nargs="+", choices=["legacy", "script", "batched"],
+                        default=["legacy", "script", "batched"])
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
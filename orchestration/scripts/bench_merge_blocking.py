@@ -0,0 +1,190 @@
+"""
+Benchmark: duplicate candidate detection with LSH blocking (orchestration/mechanisms/merge.py).
+
+Builds synthetic graphs (names, descriptions, 32-d embeddings, 8 node types,
+~3% planted near-duplicates) and compares DuplicateBlockingIndex against the
+exhaustive all-pairs scan:
+
+- recall: blocked candidates found / exhaustive candidates found, over
+  sampled query nodes (scored against their whole type partition), plus
+  the fraction of planted duplicates recovered
+- full-scan time: index build + candidate_map + scoring candidate pairs,
+  vs the exhaustive scan (extrapolated from timed sample queries; the real
+  thing is hours at 1M nodes)
+- incremental cost: sync() after adding 1% new nodes
+
+Usage:
+    python orchestration/scripts/bench_merge_blocking.py
+    python orchestration/scripts/bench_merge_blocking.py --sizes 10000 100000 1000000 --threshold 0.7
+    python orchestration/scripts/bench_merge_blocking.py --sizes 10000 --queries 500 --name-bands 12
+
+Date: 2026-10-18
+Purpose: Measure recall and scan time of LSH-blocked duplicate detection
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import numpy as np
+
+from orchestration.core.types import NodeType
+from orchestration.mechanisms.merge import DuplicateBlockingIndex, _score_candidates, compute_similarity
+
+DIMS = 32
+TYPES = list(NodeType)[:8]
+SCOPES = ["personal", "organizational", "ecosystem"]
+CONSONANTS = "bcdfghjklmnprstvwz"
+VOWELS = "aeiou"
+
+
+class FixtureNode:
+    """The Node fields compute_similarity and the blocking index read."""
+
+    __slots__ = ("id", "name", "node_type", "description", "scope", "properties", "embedding")
+
+    def __init__(self, node_id, name, node_type, description, scope, created_by, embedding):
+        self.id = node_id
+        self.name = name
+        self.node_type = node_type
+        self.description = description
+        self.scope = scope
+        self.properties = {"created_by": created_by}
+        self.embedding = embedding
+
+
+class FixtureGraph:
+    def __init__(self):
+        self.nodes = {}
+
+
+def word(rng):
+    """Pronounceable vocabulary word: 2-4 consonant-vowel(-consonant) syllables."""
+    return "".join(
+        rng.choice(CONSONANTS) + rng.choice(VOWELS) + (rng.choice(CONSONANTS) if rng.random() < 0.3 else "")
+        for _ in range(rng.randint(2, 4))
+    )
+
+
+def build_graph(n, rng, vocabulary):
+    graph = FixtureGraph()
+    embeddings = rng.standard_normal((n, DIMS)).astype(np.float32)
+    planted = []
+    for i in range(n):
+        if i > 10 and rng.random() < 0.03:
+            original = graph.nodes[f"n{rng.integers(0, i)}"]
+            words = original.description.split()
+            swap = rng.integers(0, len(words))
+            words[swap] = vocabulary[rng.integers(0, len(vocabulary))]
+            name = original.name.replace("_", " ") if rng.random() < 0.5 else original.name.title()
+            node = FixtureNode(f"n{i}", name, original.node_type, " ".join(words), original.scope,
+                               original.properties["created_by"],
+                               original.embedding + rng.normal(0, 0.05, DIMS).astype(np.float32))
+            planted.append((node.id, original.id))
+        else:
+            name = "_".join(vocabulary[k] for k in rng.integers(0, len(vocabulary), 2))
+            description = " ".join(vocabulary[k] for k in rng.integers(0, len(vocabulary), 10))
+            node = FixtureNode(f"n{i}", name, TYPES[rng.integers(0, len(TYPES))], description,
+                               SCOPES[rng.integers(0, len(SCOPES))], f"citizen_{rng.integers(0, 10)}",
+                               embeddings[i])
+        graph.nodes[node.id] = node
+    return graph, planted
+
+
+def run(n, args):
+    rng = np.random.default_rng(args.seed)
+    vocabulary = [word(random.Random(args.seed * 1000 + k)) for k in range(args.vocabulary)]
+    graph, planted = build_graph(n, rng, vocabulary)
+    index = DuplicateBlockingIndex(name_bands=args.name_bands, name_chars_bands=args.name_chars_bands,
+                                   description_bands=args.description_bands, simhash_bands=args.simhash_bands)
+
+    started = time.perf_counter()
+    index.sync(graph)
+    build_s = time.perf_counter() - started
+    started = time.perf_counter()
+    neighbors = index.candidate_map()
+    map_s = time.perf_counter() - started
+    started = time.perf_counter()
+    pairs = 0
+    blocked_found = set()
+    for node_id, ids in neighbors.items():
+        node = graph.nodes[node_id]
+        later = [graph.nodes[i] for i in ids if i > node_id]
+        pairs += len(later)
+        for other, _ in _score_candidates(node, later, args.threshold):
+            blocked_found.add((node_id, other.id))
+    score_s = time.perf_counter() - started
+
+    # Exhaustive reference on sampled queries, within each query's type partition
+    by_type = {}
+    for node in graph.nodes.values():
+        by_type.setdefault(node.node_type, []).append(node)
+    sample = [graph.nodes[f"n{k}"] for k in rng.choice(n, size=min(args.queries, n), replace=False)]
+    exhaustive, recovered = 0, 0
+    for node in sample:
+        for other, _ in _score_candidates(node, by_type[node.node_type], args.threshold):
+            exhaustive += 1
+            recovered += (min(node.id, other.id), max(node.id, other.id)) in blocked_found
+
+    # Legacy full scan = one find_duplicate_candidates over all nodes per node
+    timed = sample[:args.timed_queries]
+    started = time.perf_counter()
+    for node in timed:
+        _score_candidates(node, graph.nodes.values(), args.threshold)
+    exhaustive_s = (time.perf_counter() - started) / len(timed) * n
+
+    planted_hits = sum(
+        (min(a, b), max(a, b)) in blocked_found
+        for a, b in planted
+        if compute_similarity(graph.nodes[a], graph.nodes[b]).overall >= args.threshold
+    )
+    planted_matches = sum(compute_similarity(graph.nodes[a], graph.nodes[b]).overall >= args.threshold for a, b in planted)
+
+    extra = [FixtureNode(f"x{i}", "_".join(vocabulary[k] for k in rng.integers(0, len(vocabulary), 2)),
+                         TYPES[i % len(TYPES)], "fresh node", "personal", "citizen_0",
+                         rng.standard_normal(DIMS).astype(np.float32)) for i in range(max(1, n // 100))]
+    for node in extra:
+        graph.nodes[node.id] = node
+    started = time.perf_counter()
+    index.sync(graph)
+    incremental_s = time.perf_counter() - started
+
+    blocked_s = build_s + map_s + score_s
+    print(f"\n{n:,} nodes ({len(planted):,} planted duplicates, threshold {args.threshold})")
+    print(f"  blocked scan: {blocked_s:8.2f}s  (build {build_s:.2f}s, candidate_map {map_s:.2f}s, "
+          f"score {pairs:,} pairs {score_s:.2f}s)")
+    print(f"  exhaustive:   {exhaustive_s:8.0f}s  (extrapolated from {len(timed)} queries)   "
+          f"speedup {exhaustive_s / blocked_s:,.0f}x")
+    print(f"  recall vs exhaustive: {recovered}/{exhaustive} = {recovered / max(exhaustive, 1):.3f}   "
+          f"planted: {planted_hits}/{planted_matches} = {planted_hits / max(planted_matches, 1):.3f}")
+    print(f"  incremental sync (+{len(extra):,} nodes): {incremental_s * 1000:.0f}ms   "
+          f"oversized buckets skipped: {index.oversized_buckets_skipped}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LSH duplicate blocking benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--threshold", type=float, default=0.7)
+    parser.add_argument("--queries", type=int, default=1000, help="Sampled queries for exhaustive recall")
+    parser.add_argument("--timed-queries", type=int, default=20, help="Full-graph queries timed for the exhaustive scan")
+    parser.add_argument("--vocabulary", type=int, default=5000)
+    parser.add_argument("--name-bands", type=int, default=8)
+    parser.add_argument("--name-chars-bands", type=int, default=4)
+    parser.add_argument("--description-bands", type=int, default=4)
+    parser.add_argument("--simhash-bands", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("Duplicate candidate detection: LSH blocking vs exhaustive scan")
+    print("=" * 78)
+    for n in args.sizes:
+        run(n, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Benchmark: MPSv3 cold start (orchestration/services/mpsv3/registry.py).
+
+Rewrites the bundled services.yaml so every service is a local dummy
+process (same ids, requires/depends_on and readiness checks; ports remapped
+to free local ports). A dummy connects to its dependencies' ports first and
+exits 1 if one is down (like ws_api without FalkorDB), then sleeps its
+init delay and starts listening (TCP, or HTTP for http_get checks).
+
+Reports time-to-all-ready for:
+- planned: ServiceRegistry.start_all (dependency-ordered, parallel launch,
+  concurrent readiness probes)
+- legacy: every service launched at once in file order, then readiness
+  polled serially with 1 s sleeps (pre-planner start_all +
+  wait_for_readiness); dependents that start before their dependencies crash
+- legacy ordered: one service at a time, each waited for before the next
+  (what respecting depends_on cost without a planner)
+
+Usage:
+    python orchestration/scripts/bench_mpsv3_startup.py
+    python orchestration/scripts/bench_mpsv3_startup.py --config orchestration/services/mpsv3/services.yaml --scale 0.5
+
+Date: 2026-10-19
+Purpose: Measure cold-start time-to-all-ready of dependency-ordered parallel startup
+"""
+
+import argparse
+import contextlib
+import io
+import socket
+import sys
+import tempfile
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from orchestration.services.mpsv3.registry import ServiceRegistry
+
+DEFAULT_CONFIG = Path(__file__).resolve().parents[1] / "services" / "mpsv3" / "services.yaml"
+
+# Init delay (seconds) per bundled service id; others use --default-delay
+INIT_DELAYS = {
+    "falkordb": 1.0,
+    "protocol_hub": 1.5,
+    "ws_api": 2.5,
+    "dashboard": 3.0,
+    "falkordb_browser": 3.0,
+}
+
+
+def run_dummy(argv):
+    """Dummy service: check dependency ports, sleep, then listen."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--delay", type=float, default=0.0)
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--http", action="store_true")
+    parser.add_argument("--requires", type=int, nargs="*", default=[])
+    args = parser.parse_args(argv)
+
+    for port in args.requires:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1.0).close()
+        except OSError:
+            sys.exit(1)  # dependency down at startup
+    time.sleep(args.delay)
+    if not args.port:
+        while True:
+            time.sleep(3600)
+    if args.http:
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, *a):
+                pass
+
+        HTTPServer(("127.0.0.1", args.port), Handler).serve_forever()
+    server = socket.socket()
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(("127.0.0.1", args.port))
+    server.listen(64)
+    while True:
+        conn, _ = server.accept()
+        conn.close()
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def dummy_config(config_path, scale, default_delay):
+    """services.yaml with dummy commands and remapped readiness ports."""
+    config = yaml.safe_load(Path(config_path).read_text())
+    services = config.get("services", [])
+    ports = {}
+    for service in services:
+        readiness = service.get("readiness") or {}
+        ports[service["id"]] = (free_port(), "http_get" in readiness) if readiness else (0, False)
+
+    out = []
+    for service in services:
+        sid = service["id"]
+        port, http = ports[sid]
+        deps = service.get("depends_on", []) + service.get("requires", [])
+        dep_ports = [ports[d][0] for d in deps if d in ports and ports[d][0]]
+        cmd = [sys.executable, str(Path(__file__).resolve()), "--dummy",
+               "--delay", str(INIT_DELAYS.get(sid, default_delay) * scale), "--port", str(port)]
+        if http:
+            cmd.append("--http")
+        if dep_ports:
+            cmd += ["--requires"] + [str(p) for p in dep_ports]
+        entry = {"id": sid, "cmd": cmd, "max_retries": 0}
+        if service.get("depends_on"):
+            entry["depends_on"] = service["depends_on"]
+        if service.get("requires"):
+            entry["requires"] = service["requires"]
+        if http:
+            entry["readiness"] = {"http_get": {"url": f"http://127.0.0.1:{port}/", "timeout_s": 1}}
+        elif port:
+            entry["readiness"] = {"tcp": {"host": "127.0.0.1", "port": port, "timeout_s": 1}}
+        out.append(entry)
+    return {"services": out}
+
+
+def alive(registry):
+    return sum(1 for r in registry.runners.values() if r.process and r.process.poll() is None)
+
+
+def run_planned(path):
+    registry = ServiceRegistry(str(path))
+    report = registry.start_all(readiness_timeout_s=60.0)
+    running = alive(registry)
+    registry.shutdown_all()
+    return report, running
+
+
+def run_legacy(path, ordered):
+    registry = ServiceRegistry(str(path))
+    started = time.monotonic()
+    ready_at = {}
+    order = [sid for layer in registry.startup_layers for sid in layer] if ordered else list(registry.runners)
+    if not ordered:
+        for sid in order:  # legacy start_all: launch everything in file order
+            registry.runners[sid].start()
+    for sid in order:  # legacy wait_for_readiness: serial, 1 s sleeps
+        if ordered:
+            registry.runners[sid].start()
+        monitor = registry.health_monitors.get(sid)
+        runner = registry.runners[sid]
+        if monitor and runner.process.poll() is None:
+            if monitor.check_readiness(max_attempts=30, interval_s=1.0):
+                ready_at[sid] = time.monotonic() - started
+        elif not monitor:
+            time.sleep(0.2)
+            if runner.process.poll() is None:
+                ready_at[sid] = time.monotonic() - started
+    total = time.monotonic() - started
+    running = alive(registry)
+    registry.shutdown_all()
+    return ready_at, total, running
+
+
+def main():
+    if "--dummy" in sys.argv:
+        run_dummy([a for a in sys.argv[1:] if a != "--dummy"])
+        return
+
+    parser = argparse.ArgumentParser(description="MPSv3 cold-start benchmark")
+    parser.add_argument("--config", default=str(DEFAULT_CONFIG))
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every init delay")
+    parser.add_argument("--default-delay", type=float, default=0.5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_mpsv3_") as workdir:
+        path = Path(workdir) / "services.yaml"
+        path.write_text(yaml.safe_dump(dummy_config(args.config, args.scale, args.default_delay)))
+        n = len(yaml.safe_load(path.read_text())["services"])
+
+        quiet = io.StringIO()
+        with contextlib.redirect_stdout(quiet):
+            report, planned_running = run_planned(path)
+            legacy = run_legacy(path, ordered=False)
+            ordered = run_legacy(path, ordered=True)
+
+        print("=" * 78)
+        print(f"MPSv3 cold start: {n} dummy services from {args.config}")
+        print("=" * 78)
+        print(report.format())
+        print(f"\n  planned:        all ready in {report.time_to_all_ready or report.total_s:6.2f}s  "
+              f"({planned_running}/{n} running)")
+        for name, (ready_at, total, running) in (("legacy", legacy), ("legacy ordered", ordered)):
+            print(f"  {name + ':':<15} {len(ready_at)}/{n} ready after {total:6.2f}s  ({running}/{n} running)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Benchmark: role graph construction (orchestration/mechanisms/role_graph_builder.py).
+
+Builds the role graph over a synthetic citizen served by an in-memory
+FalkorDB stand-in, with the legacy builder (one COACTIVATES_WITH query per
+pair and one RELATES_TO query per co-activating pair, each after a fresh
+get_falkordb_graph lookup) and the bulk builder (three queries, sparse
+edge matrices, vectorized pair features).
+
+Reports graph lookups, queries, in-memory wall time, and the projected time
+at a per-query round trip (--rtt-ms; lookups also count, since each one
+opens a FalkorDB client).
+
+Usage:
+    python orchestration/scripts/bench_role_graph.py
+    python orchestration/scripts/bench_role_graph.py --sizes 50 200 1000 --degree 12 --rtt-ms 0.3
+
+Date: 2026-10-18
+Purpose: Measure bulk-loaded role graph construction
+"""
+
+import argparse
+import json
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import numpy as np
+
+from orchestration.libs.utils import falkordb_adapter
+from orchestration.mechanisms.role_graph_builder import RoleGraphBuilder
+
+TOOLS = [f"tool_{k}" for k in range(24)]
+OUTCOMES = ["success", "partial", "failure"]
+
+
+class Result:
+    def __init__(self, rows):
+        self.result_set = rows
+
+
+class FixtureGraph:
+    """SubEntity features plus COACTIVATES_WITH / RELATES_TO edges; answers per-pair and bulk queries."""
+
+    def __init__(self, n, degree, rng):
+        self.queries = 0
+        self.lookups = 0
+        ids = [f"se_{k:05d}" for k in range(n)]
+        self.entities = []
+        for entity_id in ids:
+            tools = {t: rng.randint(1, 20) for t in rng.sample(TOOLS, rng.randint(0, 6))}
+            outcomes = {o: round(rng.random(), 3) for o in OUTCOMES}
+            self.entities.append([entity_id, rng.random(), rng.uniform(-1, 1),
+                                  json.dumps(tools) if tools else None, json.dumps(outcomes)])
+        self.u = {}
+        self.ease = {}
+        for a in ids:
+            for b in rng.sample(ids, min(degree, n - 1)):
+                if a == b:
+                    continue
+                lo, hi = min(a, b), max(a, b)
+                self.u.setdefault((lo, hi), round(rng.random(), 4))
+                if rng.random() < 0.5 and (b, a) not in self.ease:
+                    self.ease.setdefault((a, b), round(rng.random(), 4))
+
+    def query(self, cypher, params=None):
+        self.queries += 1
+        if "COACTIVATES_WITH" in cypher and params:
+            u = self.u.get((params["A"], params["B"]))
+            return Result([[u]] if u is not None else [])
+        if "RELATES_TO" in cypher and params:
+            a, b = params["A"], params["B"]
+            ease = self.ease.get((a, b), self.ease.get((b, a)))
+            return Result([[ease]] if ease is not None else [])
+        if "COACTIVATES_WITH" in cypher:
+            return Result([[a, b, u] for (a, b), u in self.u.items()])
+        if "RELATES_TO" in cypher:
+            return Result([[a, b, e] for (a, b), e in self.ease.items()])
+        return Result(self.entities)
+
+
+class LegacyRoleGraphBuilder(RoleGraphBuilder):
+    """Pre-change build_role_graph: pair loops with per-pair queries."""
+
+    def _graph(self):
+        from orchestration.libs.utils.falkordb_adapter import get_falkordb_graph
+        return get_falkordb_graph(self.graph_name)
+
+    def _get_u_metric(self, entity_a, entity_b):
+        A, B = (entity_a, entity_b) if entity_a < entity_b else (entity_b, entity_a)
+        result = self._graph().query("MATCH (a:SubEntity {id: $A})-[r:COACTIVATES_WITH]->(b:SubEntity {id: $B}) "
+                                     "RETURN r.u_jaccard AS u", {"A": A, "B": B})
+        if result and result.result_set:
+            u = result.result_set[0][0]
+            return float(u) if u is not None else 0.0
+        return 0.0
+
+    def _get_highway_ease(self, entity_a, entity_b):
+        result = self._graph().query("MATCH (a:SubEntity {id: $A})-[r:RELATES_TO]-(b:SubEntity {id: $B}) "
+                                     "RETURN r.ease AS ease LIMIT 1", {"A": entity_a, "B": entity_b})
+        if result and result.result_set:
+            ease = result.result_set[0][0]
+            return float(ease) if ease is not None else 0.0
+        return 0.0
+
+    def build_role_graph(self, min_u_threshold=0.01, percentile_normalize=True):
+        entities = self._load_subentity_features(self._graph())
+        n = len(entities)
+        entity_ids = [e.id for e in entities]
+        W = np.zeros((n, n))
+        u_values, ease_values, affect_values, tool_values = [], [], [], []
+        for i in range(n):
+            for j in range(i + 1, n):
+                A, B = entities[i], entities[j]
+                u = self._get_u_metric(A.id, B.id)
+                if u < min_u_threshold:
+                    continue
+                u_values.append(u)
+                ease_values.append(self._get_highway_ease(A.id, B.id))
+                affect_values.append(self._compute_affect_similarity(A, B))
+                tool_values.append(self._compute_tool_overlap(A, B))
+        if not u_values:
+            return W, entity_ids
+        ranks = [self._percentile_normalize(v) for v in (u_values, ease_values, affect_values, tool_values)]
+        pair_idx = 0
+        for i in range(n):
+            for j in range(i + 1, n):
+                if self._get_u_metric(entities[i].id, entities[j].id) < min_u_threshold:
+                    continue
+                weight = ranks[0][pair_idx] * (1 + ranks[1][pair_idx]) * (1 + ranks[2][pair_idx]) * (1 + ranks[3][pair_idx])
+                W[i, j] = W[j, i] = weight
+                pair_idx += 1
+        return W, entity_ids
+
+
+def run(builder_cls, graph):
+    def lookup(name):
+        graph.lookups += 1
+        return graph
+
+    falkordb_adapter.get_falkordb_graph = lookup
+    graph.queries = graph.lookups = 0
+    started = time.perf_counter()
+    W, _ = builder_cls("citizen_bench").build_role_graph()
+    return W, time.perf_counter() - started, graph.queries, graph.lookups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Role graph construction benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--degree", type=int, default=8, help="COACTIVATES_WITH partners sampled per SubEntity")
+    parser.add_argument("--rtt-ms", type=float, default=0.2, help="Round trip per query/lookup for the projection")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    print("=" * 78)
+    print(f"Role graph construction (degree {args.degree}, projected at {args.rtt_ms}ms per round trip)")
+    print("=" * 78)
+    for n in args.sizes:
+        graph = FixtureGraph(n, args.degree, random.Random(args.seed))
+        print(f"\n{n} SubEntities, {len(graph.u):,} COACTIVATES_WITH, {len(graph.ease):,} RELATES_TO")
+        results = {}
+        for label, cls in [("legacy", LegacyRoleGraphBuilder), ("bulk", RoleGraphBuilder)]:
+            W, seconds, queries, lookups = run(cls, graph)
+            results[label] = W
+            projected = seconds + (queries + lookups) * args.rtt_ms / 1000
+            print(f"  {label:>6}: {queries:>9,} queries  {lookups:>9,} graph lookups  "
+                  f"wall {seconds * 1000:9.1f}ms  projected {projected:9.2f}s")
+        print(f"  max |W_bulk - W_legacy| = {np.abs(results['bulk'] - results['legacy']).max():.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""
+Benchmark: FalkorDB node/relation serialization (substrate/schemas/serialization.py).
+
+Builds N nodes carrying the nested consciousness fields (entity_activations,
+entity_clusters, sub_entity_last_sequence_positions) and N/2 relations
+(sub_entity_valences, sub_entity_emotion_vectors, entity_link_strengths,
+...), then measures objects/sec for:
+
+- legacy: per-object serialize/deserialize with json.dumps/json.loads per
+  nested field (in-script copy of the pre-batch implementation)
+- batch: serialize_*s_for_falkordb / deserialize_*s_from_falkordb
+  (column-wise field plan, orjson when installed)
+- batch packed: relations with pack_numeric=True (float dicts packed)
+
+Relations are deserialized into validated models and, with validate=False,
+into plain field dicts. Every batch result is checked against the legacy
+round trip. GC is paused while timing so later runs do not pay for the
+objects earlier runs left alive.
+
+Usage:
+    python orchestration/scripts/bench_serialization.py
+    python orchestration/scripts/bench_serialization.py --nodes 20000 --entities 4
+
+Date: 2026-10-19
+Purpose: Measure bulk serialization throughput of the batch FalkorDB serializers
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from substrate.schemas import serialization
+from substrate.schemas.consciousness_schema import BaseNode, BaseRelation
+from substrate.schemas.serialization import (
+    deserialize_nodes_from_falkordb,
+    deserialize_relations_from_falkordb,
+    serialize_nodes_for_falkordb,
+    serialize_relations_for_falkordb,
+)
+
+
+class BenchNode(BaseNode):
+    entity_activations: Dict[str, Dict[str, Any]] = {}
+    entity_clusters: Dict[str, str] = {}
+
+
+class BenchRelation(BaseRelation):
+    entity_coactivation_counts: Dict[str, int] = {}
+    entity_link_strengths: Dict[str, float] = {}
+
+
+# ---------------------------------------------------------------------------
+# Legacy per-object implementation (pre-batch serialization.py)
+# ---------------------------------------------------------------------------
+
+def legacy_serialize_node(node):
+    properties = {}
+    properties['name'] = node.name
+    properties['description'] = node.description
+    properties['confidence'] = node.confidence
+    properties['formation_trigger'] = node.formation_trigger
+    properties['valid_at'] = int(node.valid_at.timestamp() * 1000)
+    if node.invalid_at:
+        properties['invalid_at'] = int(node.invalid_at.timestamp() * 1000)
+    if node.expired_at:
+        properties['expired_at'] = int(node.expired_at.timestamp() * 1000)
+    if hasattr(node, 'base_weight'):
+        properties['base_weight'] = node.base_weight
+    if hasattr(node, 'reinforcement_weight'):
+        properties['reinforcement_weight'] = node.reinforcement_weight
+    if hasattr(node, 'decay_rate'):
+        properties['decay_rate'] = node.decay_rate
+    if hasattr(node, 'entity_activations') and node.entity_activations:
+        entity_activations_data = {}
+        for entity_id, state in node.entity_activations.items():
+            if isinstance(state, dict):
+                entity_activations_data[entity_id] = state
+            else:
+                entity_activations_data[entity_id] = {
+                    'energy': getattr(state, 'energy', 0.0),
+                    'last_activated': getattr(state, 'last_activated', datetime.now()).isoformat() if hasattr(state, 'last_activated') else None,
+                    'activation_count': getattr(state, 'activation_count', 0),
+                }
+        properties['entity_activations'] = json.dumps(entity_activations_data)
+    else:
+        properties['entity_activations'] = '{}'
+    if hasattr(node, 'entity_clusters') and node.entity_clusters:
+        properties['entity_clusters'] = json.dumps(node.entity_clusters)
+    else:
+        properties['entity_clusters'] = '{}'
+    if hasattr(node, 'sub_entity_last_sequence_positions') and node.sub_entity_last_sequence_positions:
+        properties['sub_entity_last_sequence_positions'] = json.dumps(node.sub_entity_last_sequence_positions)
+    else:
+        properties['sub_entity_last_sequence_positions'] = '{}'
+    if hasattr(node, 'embedding') and node.embedding:
+        properties['embedding'] = node.embedding
+    for key in ('participants', 'members', 'goals', 'steps'):
+        if hasattr(node, key) and getattr(node, key):
+            properties[key] = getattr(node, key)
+    if hasattr(node, 'last_modified'):
+        properties['last_modified'] = int(node.last_modified.timestamp() * 1000) if node.last_modified else None
+    if hasattr(node, 'traversal_count'):
+        properties['traversal_count'] = node.traversal_count
+    if hasattr(node, 'last_traversed_by'):
+        properties['last_traversed_by'] = node.last_traversed_by
+    if hasattr(node, 'last_traversal_time'):
+        properties['last_traversal_time'] = int(node.last_traversal_time.timestamp() * 1000) if node.last_traversal_time else None
+    return properties
+
+
+def legacy_deserialize_node(properties, node_type):
+    result = {}
+    for key, value in properties.items():
+        if value is None:
+            result[key] = None
+        elif isinstance(value, str) and ('{' in value or '[' in value):
+            try:
+                result[key] = json.loads(value)
+            except json.JSONDecodeError:
+                result[key] = value
+        elif key.endswith('_at') or key.endswith('_time') or key.endswith('_modified'):
+            try:
+                result[key] = datetime.fromtimestamp(value / 1000)
+            except (ValueError, TypeError):
+                result[key] = value
+        else:
+            result[key] = value
+    return result
+
+
+def legacy_serialize_relation(relation):
+    properties = {}
+    properties['goal'] = relation.goal
+    properties['mindstate'] = relation.mindstate
+    properties['energy'] = relation.energy
+    properties['confidence'] = relation.confidence
+    properties['formation_trigger'] = relation.formation_trigger
+    if hasattr(relation, 'link_strength'):
+        properties['link_strength'] = relation.link_strength
+    properties['valid_at'] = int(relation.valid_at.timestamp() * 1000)
+    if relation.invalid_at:
+        properties['invalid_at'] = int(relation.invalid_at.timestamp() * 1000)
+    for key in ('sub_entity_valences', 'sub_entity_emotion_vectors',
+                'entity_coactivation_counts', 'entity_link_strengths'):
+        if hasattr(relation, key) and getattr(relation, key):
+            properties[key] = json.dumps(getattr(relation, key))
+        else:
+            properties[key] = '{}'
+    if hasattr(relation, 'embedding') and relation.embedding:
+        properties['embedding'] = relation.embedding
+    if hasattr(relation, 'last_modified'):
+        properties['last_modified'] = int(relation.last_modified.timestamp() * 1000) if relation.last_modified else None
+    for key in ('traversal_count', 'last_traversed_by', 'last_mechanism_id'):
+        if hasattr(relation, key):
+            properties[key] = getattr(relation, key)
+    return properties
+
+
+def legacy_deserialize_relation(properties, relation_type):
+    relation_data = {
+        'goal': properties['goal'],
+        'mindstate': properties['mindstate'],
+        'energy': properties['energy'],
+        'confidence': properties['confidence'],
+        'formation_trigger': properties['formation_trigger'],
+        'valid_at': datetime.fromtimestamp(properties['valid_at'] / 1000),
+        'invalid_at': datetime.fromtimestamp(properties['invalid_at'] / 1000) if properties.get('invalid_at') else None,
+    }
+    for key in ('sub_entity_valences', 'sub_entity_emotion_vectors',
+                'entity_coactivation_counts', 'entity_link_strengths'):
+        relation_data[key] = json.loads(properties.get(key, '{}'))
+    if 'link_strength' in properties:
+        relation_data['link_strength'] = properties['link_strength']
+    if 'embedding' in properties:
+        relation_data['embedding'] = properties['embedding']
+    if 'last_modified' in properties:
+        relation_data['last_modified'] = datetime.fromtimestamp(properties['last_modified'] / 1000) if properties['last_modified'] else None
+    for key in ('traversal_count', 'last_traversed_by', 'last_mechanism_id'):
+        if key in properties:
+            relation_data[key] = properties[key]
+    return BaseRelation(**relation_data)
+
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+def build_nodes(n, entities, rng):
+    base = datetime(2026, 1, 1)
+    ids = [f"entity_{i}" for i in range(entities)]
+    return [
+        BenchNode.model_construct(
+            name=f"node_{i}",
+            description=f"Pattern node {i}",
+            confidence=rng.random(),
+            formation_trigger="inference",
+            valid_at=base + timedelta(seconds=i),
+            invalid_at=None,
+            expired_at=None,
+            last_modified=base + timedelta(seconds=i, milliseconds=250),
+            traversal_count=rng.randrange(100),
+            last_traversed_by=ids[i % entities],
+            last_traversal_time=None,
+            entity_activations={e: {"energy": rng.random(), "activation_count": rng.randrange(50)} for e in ids},
+            entity_clusters={e: f"cluster_{rng.randrange(8)}" for e in ids},
+            sub_entity_last_sequence_positions={e: rng.randrange(10**6) for e in ids},
+        )
+        for i in range(n)
+    ]
+
+
+def build_relations(n, entities, rng):
+    base = datetime(2026, 1, 1)
+    ids = [f"entity_{i}" for i in range(entities)]
+    return [
+        BenchRelation.model_construct(
+            goal="Connects related patterns",
+            mindstate="Builder + Skeptic",
+            energy=rng.random(),
+            confidence=rng.random(),
+            formation_trigger="inference",
+            valid_at=base + timedelta(seconds=i),
+            invalid_at=None,
+            link_strength=rng.random(),
+            last_modified=base + timedelta(seconds=i),
+            traversal_count=rng.randrange(100),
+            last_traversed_by=None,
+            last_mechanism_id="hebbian_learning",
+            sub_entity_valences={e: rng.uniform(-1.0, 1.0) for e in ids},
+            sub_entity_emotion_vectors={ids[0]: {"joy": rng.random(), "fear": rng.random()}},
+            entity_coactivation_counts={e: rng.randrange(1000) for e in ids},
+            entity_link_strengths={e: rng.random() for e in ids},
+        )
+        for i in range(n)
+    ]
+
+
+def timed(fn):
+    gc.collect()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        result = fn()
+        return result, time.perf_counter() - started
+    finally:
+        gc.enable()
+
+
+def stored_bytes(rows):
+    return sum(len(v) for row in rows for v in row.values() if isinstance(v, str))
+
+
+def comparable(relation):
+    if isinstance(relation, dict):
+        relation = BaseRelation(**relation)
+    return relation.model_dump(exclude={"created_at"})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FalkorDB serialization benchmark")
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--entities", type=int, default=8, help="Sub-entities per nested dict")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    n = args.nodes
+    nodes = build_nodes(n, args.entities, rng)
+    relations = build_relations(n // 2, args.entities, rng)
+
+    print("=" * 78)
+    print(f"Serialization: {n:,} nodes / {len(relations):,} relations, "
+          f"{args.entities} sub-entities per nested dict, "
+          f"orjson={'yes' if serialization.orjson is not None else 'no'}")
+    print("=" * 78)
+
+    # Nodes
+    legacy_rows, legacy_ser = timed(lambda: [legacy_serialize_node(x) for x in nodes])
+    legacy_out, legacy_de = timed(lambda: [legacy_deserialize_node(r, "Pattern") for r in legacy_rows])
+    batch_rows, batch_ser = timed(lambda: serialize_nodes_for_falkordb(nodes))
+    batch_out, batch_de = timed(lambda: deserialize_nodes_from_falkordb(batch_rows, "Pattern"))
+    assert batch_out == legacy_out, "node round trip differs from legacy"
+
+    print(f"\nNodes ({n:,})           serialize obj/s   deserialize obj/s   stored string bytes")
+    for label, ser, de, rows in (("legacy", legacy_ser, legacy_de, legacy_rows),
+                                 ("batch", batch_ser, batch_de, batch_rows)):
+        print(f"  {label:<20} {n / ser:>14,.0f}   {n / de:>17,.0f}   {stored_bytes(rows):>19,}")
+    print(f"  batch speedup: serialize {legacy_ser / batch_ser:.1f}x, deserialize {legacy_de / batch_de:.1f}x")
+
+    # Relations
+    m = len(relations)
+    legacy_rrows, legacy_rser = timed(lambda: [legacy_serialize_relation(x) for x in relations])
+    legacy_rout, legacy_rde = timed(lambda: [legacy_deserialize_relation(r, "RELATES_TO") for r in legacy_rrows])
+    batch_rrows, batch_rser = timed(lambda: serialize_relations_for_falkordb(relations))
+    batch_rout, batch_rde = timed(lambda: deserialize_relations_from_falkordb(batch_rrows, "RELATES_TO"))
+    dict_rout, dict_rde = timed(
+        lambda: deserialize_relations_from_falkordb(batch_rrows, "RELATES_TO", validate=False))
+    packed_rrows, packed_rser = timed(lambda: serialize_relations_for_falkordb(relations, pack_numeric=True))
+    packed_rout, packed_rde = timed(
+        lambda: deserialize_relations_from_falkordb(packed_rrows, "RELATES_TO", validate=False))
+    expected = [comparable(r) for r in legacy_rout]
+    for out in (batch_rout, dict_rout, packed_rout):
+        assert [comparable(r) for r in out] == expected, "relation round trip differs from legacy"
+
+    print(f"\nRelations ({m:,})       serialize obj/s   deserialize obj/s   stored string bytes")
+    for label, ser, de, rows in (("legacy (validated)", legacy_rser, legacy_rde, legacy_rrows),
+                                 ("batch (validated)", batch_rser, batch_rde, batch_rrows),
+                                 ("batch (dicts)", batch_rser, dict_rde, batch_rrows),
+                                 ("batch packed (dicts)", packed_rser, packed_rde, packed_rrows)):
+        print(f"  {label:<20} {m / ser:>14,.0f}   {m / de:>17,.0f}   {stored_bytes(rows):>19,}")
+    print(f"  batch speedup: serialize {legacy_rser / batch_rser:.1f}x, "
+          f"deserialize {legacy_rde / batch_rde:.1f}x validated, {legacy_rde / dict_rde:.1f}x dicts")
+    print("\n  Round trips identical to legacy: yes")
+
+
+if __name__ == "__main__":
+    main()
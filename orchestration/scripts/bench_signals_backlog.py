@@ -0,0 +1,191 @@
+"""
+Benchmark: signals collector ingest and backlog drain (orchestration/services/signals_transport.py).
+
+Starts a local WebSocket sink (counts frames) and measures, for N envelopes:
+
+- ingest: dedupe check + envelope encode + backlog append, in signals/sec.
+  Legacy = dedupe dict rescanned per call + one pretty-printed JSON file per
+  envelope (timed on a sample; the rescan also grows with window occupancy,
+  reported as the per-call cost at N live keys)
+- drain: N queued envelopes delivered to the sink by MembraneSender (one
+  connection, batched, cursor committed per batch), in envelopes/sec.
+  Legacy = glob + sort the backlog dir, then parse each file and open a new
+  synchronous connection per envelope (timed on a sample, extrapolated)
+
+Usage:
+    python orchestration/scripts/bench_signals_backlog.py
+    python orchestration/scripts/bench_signals_backlog.py --envelopes 100000 --batch-size 1000
+    python orchestration/scripts/bench_signals_backlog.py --legacy-sample 500 --fsync
+
+Date: 2026-10-18
+Purpose: Measure signals/sec ingest and backlog drain rate of the segment backlog
+"""
+
+import argparse
+import asyncio
+import json
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import websockets
+from websockets.sync.client import connect as ws_connect
+
+from orchestration.services.signals_transport import MembraneSender, SegmentBacklog, TimingWheel, encode_envelope
+
+DEDUP_WINDOW_SEC = 60.0
+
+
+class Sink:
+    """WebSocket server on its own thread that counts received frames."""
+
+    def __init__(self):
+        self.received = 0
+        self.port = None
+        self._ready = threading.Event()
+        threading.Thread(target=lambda: asyncio.run(self._serve()), daemon=True).start()
+        self._ready.wait(5.0)
+
+    async def _serve(self):
+        async def handler(ws):
+            async for _ in ws:
+                self.received += 1
+
+        async with websockets.serve(handler, "127.0.0.1", 0, max_size=None) as server:
+            self.port = server.sockets[0].getsockname()[1]
+            self._ready.set()
+            await asyncio.Future()
+
+
+def make_envelope(i):
+    return {
+        "type": "membrane.inject",
+        "citizen_id": "felix",
+        "channel": "signals.console_error",
+        "content": f"TypeError: cannot read property 'x{i}' of undefined | at render (app.js:{i % 900})",
+        "severity": 0.7,
+        "features_raw": {"urgency": 0.7, "novelty": 0.25, "trust": 0.6},
+        "metadata": {
+            "stimulus_id": f"signal_console_error_{i}",
+            "origin": "dashboard_console",
+            "timestamp_ms": 1_760_000_000_000 + i,
+            "signal_type": "console_error",
+            "dedupe_key": f"{i:016x}",
+            "origin_chain_depth": 0,
+            "origin_chain": ["dashboard_console"],
+        },
+    }
+
+
+# --- Legacy path (pre-segment-backlog signals_collector) ---
+
+def legacy_is_duplicate(cache, signal_hash, now):
+    expired = [h for h, ts in cache.items() if now - ts > DEDUP_WINDOW_SEC]
+    for h in expired:
+        del cache[h]
+    if signal_hash in cache:
+        return True
+    cache[signal_hash] = now
+    return False
+
+
+def legacy_write(directory, envelope):
+    filename = f"stimulus_{int(time.time() * 1000)}_{envelope['metadata']['stimulus_id']}.json"
+    (directory / filename).write_text(json.dumps(envelope, indent=2))
+
+
+def legacy_flush(directory, endpoint, limit):
+    sent = 0
+    for backlog_file in sorted(directory.glob("stimulus_*.json")):
+        envelope = json.loads(backlog_file.read_text())
+        with ws_connect(endpoint, open_timeout=2, close_timeout=1) as ws:
+            ws.send(json.dumps(envelope))
+        backlog_file.unlink()
+        sent += 1
+        if sent >= limit:
+            break
+    return sent
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Signals backlog ingest/drain benchmark")
+    parser.add_argument("--envelopes", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--segment-mb", type=float, default=8.0)
+    parser.add_argument("--legacy-sample", type=int, default=2000)
+    parser.add_argument("--fsync", action="store_true", help="fsync every append and cursor write")
+    args = parser.parse_args()
+
+    n = args.envelopes
+    sink = Sink()
+    endpoint = f"ws://127.0.0.1:{sink.port}"
+    envelopes = [make_envelope(i) for i in range(n)]
+    workdir = Path(tempfile.mkdtemp(prefix="bench_signals_"))
+
+    print("=" * 78)
+    print(f"Signals backlog: {n:,} envelopes, local sink {endpoint}")
+    print("=" * 78)
+
+    try:
+        # Ingest: wheel dedupe + encode + append (sender not running: everything queues)
+        backlog = SegmentBacklog(workdir / "segments", segment_bytes=int(args.segment_mb * 1e6), fsync=args.fsync)
+        wheel = TimingWheel(horizon=DEDUP_WINDOW_SEC)
+        started = time.perf_counter()
+        for envelope in envelopes:
+            if not wheel.check_and_add(envelope["metadata"]["dedupe_key"], DEDUP_WINDOW_SEC):
+                backlog.append(encode_envelope(envelope))
+        ingest_s = time.perf_counter() - started
+
+        legacy_dir = workdir / "legacy"
+        legacy_dir.mkdir()
+        cache = {}
+        sample = envelopes[:args.legacy_sample]
+        started = time.perf_counter()
+        for envelope in sample:
+            if not legacy_is_duplicate(cache, envelope["metadata"]["dedupe_key"], time.time()):
+                legacy_write(legacy_dir, envelope)
+        legacy_ingest_s = (time.perf_counter() - started) / len(sample)
+        full_cache = {f"{i:016x}": time.time() for i in range(n)}
+        started = time.perf_counter()
+        legacy_is_duplicate(full_cache, "probe", time.time())
+        legacy_scan_s = time.perf_counter() - started
+
+        print(f"\nIngest ({backlog.segment_count} segments, {backlog.end_offset / 1e6:.1f} MB"
+              f"{', fsync' if args.fsync else ''}):")
+        print(f"  segment log:  {n / ingest_s:10,.0f} signals/s")
+        print(f"  legacy files: {1 / legacy_ingest_s:10,.0f} signals/s  (first {len(sample):,}; dedupe rescan "
+              f"at {n:,} live keys adds {legacy_scan_s * 1000:.1f} ms per call -> "
+              f"{1 / (legacy_ingest_s + legacy_scan_s):,.0f} signals/s)")
+
+        # Drain: one sender, N queued envelopes
+        sender = MembraneSender(backlog, endpoint, batch_size=args.batch_size)
+        started = time.perf_counter()
+        sender.start()
+        while backlog.pending or sink.received < n:
+            time.sleep(0.01)
+        drain_s = time.perf_counter() - started
+        delivered = sink.received
+        sender.stop()
+        backlog.close()
+
+        started = time.perf_counter()
+        legacy_sent = legacy_flush(legacy_dir, endpoint, args.legacy_sample)
+        legacy_drain_s = (time.perf_counter() - started) / legacy_sent
+
+        print(f"\nDrain {n:,} queued envelopes:")
+        print(f"  MembraneSender: {drain_s:8.2f}s  {n / drain_s:10,.0f} envelopes/s  "
+              f"({sender.stats.connects} connection, {sender.stats.batches} batches)")
+        print(f"  legacy flush:   {legacy_drain_s * n:8.2f}s  {1 / legacy_drain_s:10,.0f} envelopes/s  "
+              f"(extrapolated from {legacy_sent:,}; one connection per envelope)")
+        print(f"  speedup {legacy_drain_s * n / drain_s:,.0f}x   sink received {delivered:,}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
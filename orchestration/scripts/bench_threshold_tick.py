@@ -0,0 +1,150 @@
+"""
+Benchmark: per-tick noise tracking and threshold cost (orchestration/mechanisms/threshold.py).
+
+Simulates ticks over N node-subentity pairs (nodes x --subentities) and
+compares the dict-backed NoiseTracker (one update() call and one f-string
+key per pair) with ArrayNoiseTracker (one update_many() per subentity per
+tick). Also times thresholds plus hard/soft activation for every pair:
+the per-node compute_adaptive_threshold loop vs compute_adaptive_thresholds
+with array activations. Reported cost is per tick, after a warm-up tick
+that registers every pair.
+
+Usage:
+    python orchestration/scripts/bench_threshold_tick.py
+    python orchestration/scripts/bench_threshold_tick.py --pairs 10000 100000 1000000 --ticks 5
+    python orchestration/scripts/bench_threshold_tick.py --subentities 8 --quiet-fraction 0.9
+
+Date: 2026-10-18
+Purpose: Measure per-tick cost of array-backed noise statistics and vectorized thresholds
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import numpy as np
+
+from orchestration.core.settings import settings
+from orchestration.mechanisms.threshold import (
+    ArrayNoiseTracker,
+    NoiseTracker,
+    ThresholdContext,
+    compute_adaptive_threshold,
+    compute_adaptive_thresholds,
+    hard_activation,
+    soft_activation,
+)
+
+EMOTION_DIMS = 8
+
+
+class FixtureNode:
+    """The Node fields compute_adaptive_threshold reads."""
+
+    __slots__ = ("id", "emotion_vector")
+
+    def __init__(self, node_id, emotion_vector):
+        self.id = node_id
+        self.emotion_vector = emotion_vector
+
+
+def legacy_tick(tracker, node_ids, subentities, energies, quiet):
+    for k, subentity in enumerate(subentities):
+        for node_id, energy, is_quiet in zip(node_ids, energies[k].tolist(), quiet[k].tolist()):
+            tracker.update(node_id, subentity, energy, is_quiet)
+
+
+def array_tick(tracker, node_index, subentity_index, energies, quiet):
+    for k, column in enumerate(subentity_index):
+        tracker.update_many(node_index, column, energies[k], quiet[k])
+
+
+def legacy_activations(nodes, subentities, energies, ctx, affect):
+    for k, _ in enumerate(subentities):
+        for node, energy in zip(nodes, energies[k].tolist()):
+            theta = compute_adaptive_threshold(node, "", ctx, affect)
+            hard_activation(energy, theta)
+            soft_activation(energy, theta, ctx.kappa)
+
+
+def array_activations(nodes, subentities, energies, ctx, affect, emotions):
+    thresholds = compute_adaptive_thresholds(ctx, len(nodes), emotions, affect)
+    for k, _ in enumerate(subentities):
+        hard_activation(energies[k], thresholds)
+        soft_activation(energies[k], thresholds, ctx.kappa)
+
+
+def timed(fn, ticks):
+    started = time.perf_counter()
+    for _ in range(ticks):
+        fn()
+    return (time.perf_counter() - started) / ticks
+
+
+def run(pairs, args):
+    rng = np.random.default_rng(args.seed)
+    num_nodes = max(1, pairs // args.subentities)
+    node_ids = [f"node_{i}" for i in range(num_nodes)]
+    subentities = [f"subentity_{k}" for k in range(args.subentities)]
+    energies = rng.random((args.subentities, num_nodes))
+    quiet = rng.random((args.subentities, num_nodes)) < args.quiet_fraction
+    emotions = rng.normal(0, 0.5, (num_nodes, EMOTION_DIMS))
+    emotions[rng.random(num_nodes) < 0.3] = 0.0
+    nodes = [FixtureNode(node_id, row if row.any() else None) for node_id, row in zip(node_ids, emotions)]
+    affect = rng.normal(0, 0.5, EMOTION_DIMS)
+    ctx = ThresholdContext(num_active=num_nodes // 10, num_total=num_nodes)
+
+    legacy = NoiseTracker()
+    legacy_tick(legacy, node_ids, subentities, energies, np.ones_like(quiet))
+    tracker = ArrayNoiseTracker()
+    started = time.perf_counter()
+    node_index = tracker.node_indices(node_ids)
+    subentity_index = [tracker.subentity_index(s) for s in subentities]
+    register_s = time.perf_counter() - started
+    array_tick(tracker, node_index, subentity_index, energies, np.ones_like(quiet))
+
+    legacy_s = timed(lambda: legacy_tick(legacy, node_ids, subentities, energies, quiet), args.ticks)
+    array_s = timed(lambda: array_tick(tracker, node_index, subentity_index, energies, quiet), args.ticks)
+    legacy_act_s = timed(lambda: legacy_activations(nodes, subentities, energies, ctx, affect), 1)
+    array_act_s = timed(lambda: array_activations(nodes, subentities, energies, ctx, affect, emotions), args.ticks)
+
+    check = rng.choice(num_nodes, size=min(100, num_nodes), replace=False)
+    drift = max(
+        abs(legacy.get_stats(node_ids[i], subentities[0]).mu - tracker.mu[subentity_index[0], node_index[i]])
+        for i in check
+    )
+
+    print(f"\n{num_nodes * args.subentities:,} pairs ({num_nodes:,} nodes x {args.subentities} subentities, "
+          f"{args.quiet_fraction:.0%} quiet)")
+    print(f"  noise update  dict: {legacy_s * 1000:9.1f} ms/tick   array: {array_s * 1000:8.2f} ms/tick   "
+          f"speedup {legacy_s / array_s:,.0f}x")
+    print(f"  thresholds+activation  loop: {legacy_act_s * 1000:9.1f} ms/tick   vectorized: "
+          f"{array_act_s * 1000:8.2f} ms/tick   speedup {legacy_act_s / array_act_s:,.0f}x")
+    print(f"  one-time id registration: {register_s * 1000:.1f} ms   max |mu| drift vs dict: {drift:.1e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-tick threshold benchmark")
+    parser.add_argument("--pairs", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--subentities", type=int, default=4)
+    parser.add_argument("--quiet-fraction", type=float, default=0.7)
+    parser.add_argument("--ticks", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    # Affective coupling on, telemetry off: time the math, not the event bus
+    settings.AFFECTIVE_THRESHOLD_ENABLED = True
+    settings.AFFECTIVE_TELEMETRY_ENABLED = False
+
+    print("=" * 78)
+    print("Adaptive threshold tick: dict NoiseTracker vs ArrayNoiseTracker")
+    print("=" * 78)
+    for pairs in args.pairs:
+        run(pairs, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Microbenchmark: inlined vecf32 literals vs vector query parameters.
+
+Compares the old path (embedding formatted into the Cypher text with
+str(list)) against the parameterized path (constant query body +
+vector_param() in the CYPHER header) for:
+1. Query build time and bytes sent per query
+2. Round-trip time against a live FalkorDB (skipped if unreachable)
+
+Usage:
+    python orchestration/scripts/bench_vector_params.py [--dim 768] [--iterations 500]
+    python orchestration/scripts/bench_vector_params.py --host localhost --port 6379
+
+Date: 2026-10-18
+Purpose: Quantify the vecf32 parameterization change (SemanticSearch/TraceCapture)
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from orchestration.adapters.search.semantic_search import NODE_VECTOR_SEARCH_QUERY
+from orchestration.libs.utils.falkordb_adapter import cypher_params_header, vector_param
+
+BENCH_GRAPH = "bench_vector_params"
+BENCH_LABEL = "BenchVec"
+
+
+def build_inline(embedding, k=30, threshold=0.5):
+    """Old SemanticSearch query construction (embedding inlined as text)."""
+    vector_str = str(embedding)
+    return f"""
+        CALL db.idx.vector.queryNodes('{BENCH_LABEL}', 'content_embedding', {k}, vecf32({vector_str}))
+        YIELD node, score
+        WHERE score >= {threshold}
+        RETURN
+          node.name as name,
+          node.description as description,
+          node.embeddable_text as embeddable_text,
+          labels(node) as labels,
+          score as distance
+        ORDER BY score DESC
+        LIMIT {k}
+        """
+
+
+def build_param(embedding, k=30, threshold=0.5):
+    """New SemanticSearch query construction (constant body + parameters)."""
+    return cypher_params_header({
+        'label': BENCH_LABEL,
+        'k': k,
+        'threshold': threshold,
+        'query_vector': vector_param(embedding),
+    }) + NODE_VECTOR_SEARCH_QUERY
+
+
+def _timed(fn, items):
+    samples = []
+    for item in items:
+        t0 = time.perf_counter()
+        fn(item)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return samples
+
+
+def _report(label, samples, unit="µs"):
+    samples = sorted(samples)
+    p50 = samples[len(samples) // 2]
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"  {label:<28} p50={p50:9.1f}{unit}  p95={p95:9.1f}{unit}  mean={statistics.mean(samples):9.1f}{unit}")
+
+
+def bench_build(embeddings):
+    print("\n[1] Query build (client side)")
+    _report("inline vecf32 literal", _timed(build_inline, embeddings))
+    _report("vector parameter", _timed(build_param, embeddings))
+
+    inline_len = statistics.mean(len(build_inline(e).encode()) for e in embeddings[:50])
+    param_len = statistics.mean(len(build_param(e).encode()) for e in embeddings[:50])
+    print(f"  bytes/query: inline={inline_len:,.0f}  param={param_len:,.0f}")
+    print(f"  distinct query bodies: inline={len({build_inline(e) for e in embeddings[:50]})}  param=1")
+
+
+def bench_round_trip(embeddings, host, port, dim):
+    import redis
+
+    r = redis.Redis(host=host, port=port)
+    try:
+        r.ping()
+    except redis.exceptions.ConnectionError:
+        print(f"\n[2] Round trip: FalkorDB not reachable at {host}:{port} - skipped")
+        return
+
+    print(f"\n[2] Round trip against FalkorDB {host}:{port} (graph '{BENCH_GRAPH}')")
+    r.execute_command('GRAPH.QUERY', BENCH_GRAPH, f"CREATE (:{BENCH_LABEL} {{name: 'seed'}})")
+    try:
+        r.execute_command(
+            'GRAPH.QUERY', BENCH_GRAPH,
+            f"CREATE VECTOR INDEX FOR (n:{BENCH_LABEL}) ON (n.content_embedding) "
+            f"OPTIONS {{dimension: {dim}, similarityFunction: 'cosine'}}"
+        )
+    except redis.exceptions.ResponseError:
+        pass  # Index already exists
+
+    for i, emb in enumerate(embeddings[:200]):
+        r.execute_command(
+            'GRAPH.QUERY', BENCH_GRAPH,
+            cypher_params_header({'name': f'n{i}', 'v': vector_param(emb)})
+            + f"CREATE (:{BENCH_LABEL} {{name: $name, content_embedding: vecf32($v)}})"
+        )
+
+    try:
+        for label, builder in (("inline vecf32 literal", build_inline), ("vector parameter", build_param)):
+            samples = _timed(lambda e: r.execute_command('GRAPH.QUERY', BENCH_GRAPH, builder(e)), embeddings)
+            _report(label, samples)
+    finally:
+        r.execute_command('GRAPH.DELETE', BENCH_GRAPH)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=6379)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    embeddings = [[rng.uniform(-1, 1) for _ in range(args.dim)] for _ in range(args.iterations)]
+
+    print("=" * 70)
+    print(f"VECTOR PARAMETER BENCHMARK (dim={args.dim}, iterations={args.iterations})")
+    print("=" * 70)
+    bench_build(embeddings)
+    bench_round_trip(embeddings, args.host, args.port, args.dim)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Benchmark: L2 ViewCache hit rate and invalidation fan-out under graph deltas.
+
+Drives a ViewResolver against an in-memory docs graph (services, endpoints,
+code artifacts under per-service paths) with a Zipf-distributed stream of
+docs.view.request events interleaved with a realistic graph.delta stream:
+mostly property upserts of existing nodes, plus activations, new nodes,
+link upserts and deletes.
+
+--legacy replays the old cache (unbounded, ISO-timestamp TTL, invalidate
+every architecture/api/coverage view on any delta) for comparison.
+
+Usage:
+    python orchestration/scripts/bench_view_cache.py
+    python orchestration/scripts/bench_view_cache.py --legacy
+    python orchestration/scripts/bench_view_cache.py --requests 50000 --delta-every 3 --services 80
+
+Date: 2026-10-18
+Purpose: Measure surgical view-cache invalidation (services/view_resolvers/runner.py)
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from services.view_resolvers.runner import ViewCache, ViewResolver
+from services.view_resolvers.selectors import SELECTORS
+
+GRAPH = "mind_protocol"
+VIEW_TYPES = ["architecture", "api-reference", "index", "coverage"]
+FORMATS = ["json", "mdx", "html"]
+
+
+class LegacyViewCache:
+    """Pre-LRU cache: unbounded, ISO timestamps parsed on every get, substring invalidation."""
+
+    def __init__(self, ttl_seconds: int = 300):
+        self._cache = {}
+        self._ttl = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        if key not in self._cache:
+            self.misses += 1
+            return None
+        entry = self._cache[key]
+        cached_at = datetime.fromisoformat(entry.get("cached_at", "2020-01-01T00:00:00+00:00"))
+        if (datetime.now(timezone.utc) - cached_at).total_seconds() > self._ttl:
+            del self._cache[key]
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def set(self, key, value, refs=()):
+        value["cached_at"] = datetime.now(timezone.utc).isoformat()
+        self._cache[key] = value
+
+    def invalidate(self, pattern):
+        to_delete = [k for k in self._cache.keys() if pattern in str(k)]
+        for k in to_delete:
+            del self._cache[k]
+        self.invalidations += len(to_delete)
+
+    def on_delta(self, delta):
+        self.invalidate("architecture")
+        self.invalidate("api")
+        self.invalidate("coverage")
+
+
+class DocsGraph:
+    """In-memory docs graph answering the four standard selectors."""
+
+    def __init__(self, services: int, endpoints_per_service: int, rng: random.Random):
+        self.rng = rng
+        self.services = {}
+        self.endpoints = {}
+        self.next_id = 0
+        for s in range(services):
+            sid = f"svc{s}"
+            self.services[sid] = {"id": sid, "name": f"service {s}", "path": f"/svc{s}/main.py",
+                                  "deps": rng.sample(range(services), 3)}
+            for e in range(endpoints_per_service):
+                self.add_endpoint(s)
+        self.selector_types = {text: view_type for view_type, text in SELECTORS.items()}
+        self.queries = 0
+
+    def add_endpoint(self, service: int) -> dict:
+        eid = f"ep{self.next_id}"
+        self.next_id += 1
+        ep = {"id": eid, "name": f"GET /{eid}", "path": f"/svc{service}/routes/{eid}.py",
+              "service": f"svc{service}"}
+        self.endpoints[eid] = ep
+        return ep
+
+    def query(self, selector, params=None, graph_name=None):
+        self.queries += 1
+        view_type = self.selector_types[selector]
+        prefix = params["scope_path"]
+        if view_type == "architecture":
+            return [
+                {"s": {"id": sid, "name": s["name"]},
+                 "deps": [{"id": f"svc{d}"} for d in s["deps"]], "ly": None}
+                for sid, s in self.services.items() if s["path"].startswith(prefix)
+            ]
+        if view_type == "api-reference":
+            return [
+                {"ep": {"id": eid, "name": ep["name"], "path": ep["path"]},
+                 "ca": {"path": ep["path"], "service": ep["service"]}, "schemas": []}
+                for eid, ep in self.endpoints.items() if ep["path"].startswith(prefix)
+            ]
+        if view_type == "index":
+            return [
+                {"name": ep["name"], "kind": "Endpoint", "path": ep["path"]}
+                for ep in self.endpoints.values() if ep["path"].startswith(prefix)
+            ]
+        return [{"type": "U4_Knowledge_Object", "count": len(self.services) + len(self.endpoints), "tests": 0}]
+
+    def random_delta(self) -> dict:
+        roll = self.rng.random()
+        base = {"citizen_id": GRAPH, "cursor": 0}
+        if roll < 0.70:
+            ep = self.rng.choice(list(self.endpoints.values()))
+            return {**base, "type": "graph.delta.node.upsert", "node_id": ep["id"], "node_type": "Endpoint",
+                    "properties": {"path": ep["path"], "description": str(self.rng.random())}}
+        if roll < 0.85:
+            return {**base, "type": "graph.delta.activation",
+                    "activations": {ep: self.rng.random() for ep in self.rng.sample(list(self.endpoints), 5)}}
+        if roll < 0.93:
+            ep = self.add_endpoint(self.rng.randrange(len(self.services)))
+            return {**base, "type": "graph.delta.node.upsert", "node_id": ep["id"], "node_type": "Endpoint",
+                    "properties": {"path": ep["path"]}}
+        if roll < 0.97:
+            source = self.rng.choice(list(self.services))
+            return {**base, "type": "graph.delta.link.upsert", "link_id": f"l{self.rng.random()}",
+                    "link_type": "DEPENDS_ON", "source_id": source, "target_id": self.rng.choice(list(self.services)),
+                    "properties": {}}
+        eid = self.rng.choice(list(self.endpoints))
+        self.endpoints.pop(eid)
+        return {**base, "type": "graph.delta.node.delete", "node_id": eid}
+
+
+class NullBus:
+    def __init__(self):
+        self.invalidated = 0
+
+    async def broadcast(self, channel, content):
+        if channel == "docs.view.invalidated":
+            self.invalidated += 1
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    graph = DocsGraph(args.services, args.endpoints, rng)
+    cache = LegacyViewCache() if args.legacy else ViewCache(max_entries=args.max_entries)
+    resolver = ViewResolver(bus=NullBus(), graph=graph, cache=cache)
+
+    scopes = ["/"] + [f"/svc{s}" for s in range(args.services)]
+    views = [(vt, fmt, scope) for scope in scopes for vt in VIEW_TYPES for fmt in FORMATS
+             if not (vt == "coverage" and scope != "/")]
+    rng.shuffle(views)
+    weights = [1 / (i + 1) ** 1.1 for i in range(len(views))]
+    request_stream = rng.choices(views, weights=weights, k=args.requests)
+
+    request_s = delta_s = 0.0
+    deltas = 0
+    for i, (view_type, fmt, scope) in enumerate(request_stream):
+        started = time.perf_counter()
+        resolver.on_docs_view_request({"content": {
+            "request_id": f"r{i}", "quote_id": "q-bench", "view_type": view_type, "format": fmt,
+            "scope": {"org": GRAPH, "path": scope}, "params": {},
+        }})
+        request_s += time.perf_counter() - started
+
+        if i % args.delta_every == 0:
+            delta = graph.random_delta()
+            started = time.perf_counter()
+            if args.legacy:
+                cache.on_delta(delta)
+            else:
+                resolver.on_graph_delta({"content": delta})
+            delta_s += time.perf_counter() - started
+            deltas += 1
+
+        if i % 256 == 0:
+            await asyncio.sleep(0)  # Let emitted broadcasts run
+
+    lookups = cache.hits + cache.misses
+    print("=" * 60)
+    print(f"View cache benchmark ({'legacy' if args.legacy else 'LRU + surgical invalidation'})")
+    print("=" * 60)
+    print(f"{args.requests} requests over {len(views)} distinct views, {deltas} graph deltas")
+    print(f"Hit rate: {cache.hits / lookups:.1%}  ({graph.queries} selector queries)")
+    print(f"Invalidation fan-out: {cache.invalidations / deltas:.2f} views/delta")
+    print(f"Request: {request_s / args.requests * 1e6:.1f}us avg   Delta: {delta_s / deltas * 1e6:.1f}us avg")
+    if not args.legacy:
+        print(f"Stats: {cache.stats()}")
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("services.view_resolvers.runner").setLevel(logging.WARNING)
+    parser = argparse.ArgumentParser(description="ViewCache benchmark")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--delta-every", type=int, default=4, help="One graph delta per N requests")
+    parser.add_argument("--services", type=int, default=40)
+    parser.add_argument("--endpoints", type=int, default=10, help="Endpoints per service")
+    parser.add_argument("--max-entries", type=int, default=1024)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--legacy", action="store_true", help="Use the old invalidate-everything cache")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
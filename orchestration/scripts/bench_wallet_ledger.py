@@ -0,0 +1,159 @@
+"""
+Benchmark: durable wallet custody ledger appends and lookups (orchestration/services/wallet_custody/ledger.py).
+
+Runs T concurrent writer threads against GroupCommitLedger at several
+batch windows and reports durable appends/sec (each append returns after
+its batch is fsynced) and entries per fsync. Baselines: the legacy Ledger
+(open/write/close per entry, no fsync - not durable) and the same with an
+fsync per entry (what durability costs without group commit). Then
+compares indexed wallet / since / tail lookups with a full file scan.
+
+Usage:
+    python orchestration/scripts/bench_wallet_ledger.py
+    python orchestration/scripts/bench_wallet_ledger.py --threads 1 16 64 --windows 0 0.001 0.005
+    python orchestration/scripts/bench_wallet_ledger.py --lookup-entries 1000000 --dir /var/tmp
+
+Date: 2026-10-18
+Purpose: Measure durable appends/sec with group commit and indexed lookup latency
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from orchestration.services.wallet_custody.ledger import GroupCommitLedger, Ledger, LedgerEntry
+
+BASE_TIME = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+def make_entry(i, wallets):
+    return LedgerEntry(
+        entry_type="wallet.transfer",
+        wallet_id=f"wallet:citizen:c{i % wallets}",
+        payload={"amount": i % 1000, "signature": f"{i:064x}", "org": "mind-protocol"},
+        created_at=(BASE_TIME + timedelta(milliseconds=i)).isoformat(),
+    )
+
+
+class FsyncLedger(Ledger):
+    """Legacy Ledger plus an fsync per append (durable, no group commit)."""
+
+    def append(self, entry):
+        with self._path.open("a", encoding="utf-8") as fh:
+            fh.write(entry.to_json() + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+
+
+def run_writers(ledger, threads, per_thread, wallets):
+    def worker(t):
+        for k in range(per_thread):
+            ledger.append(make_entry(t * per_thread + k, wallets))
+
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    started = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - started
+
+
+def bench_appends(args, root):
+    print(f"\nDurable appends ({args.appends:,} per run):")
+    print(f"  {'writer':<28} {'threads':>7} {'appends/s':>11} {'per fsync':>10}")
+    for threads in args.threads:
+        per_thread = max(1, args.appends // threads)
+        total = per_thread * threads
+        for name, factory in (("legacy (no fsync)", Ledger), ("legacy + fsync each", FsyncLedger)):
+            workdir = Path(tempfile.mkdtemp(dir=root))
+            ledger = factory(workdir / "ledger.jsonl")
+            elapsed = run_writers(ledger, threads, per_thread, args.wallets)
+            per_fsync = "-" if factory is Ledger else "1.0"
+            print(f"  {name:<28} {threads:>7} {total / elapsed:>11,.0f} {per_fsync:>10}")
+            shutil.rmtree(workdir)
+        for window in args.windows:
+            workdir = Path(tempfile.mkdtemp(dir=root))
+            ledger = GroupCommitLedger(workdir / "ledger.jsonl", batch_window=window)
+            elapsed = run_writers(ledger, threads, per_thread, args.wallets)
+            ledger.close()
+            name = f"group commit {window * 1000:g}ms window"
+            print(f"  {name:<28} {threads:>7} {total / elapsed:>11,.0f} {total / ledger.fsync_count:>10.1f}")
+            shutil.rmtree(workdir)
+
+
+def bench_lookups(args, root):
+    workdir = Path(tempfile.mkdtemp(dir=root))
+    path = workdir / "ledger.jsonl"
+    ledger = GroupCommitLedger(path, max_batch=4096)
+    futures = [ledger.submit(make_entry(i, args.wallets)) for i in range(args.lookup_entries)]
+    futures[-1].result()
+    ledger.close()
+
+    started = time.perf_counter()
+    ledger = GroupCommitLedger(path)
+    open_s = time.perf_counter() - started
+    wallet = "wallet:citizen:c7"
+    since = (BASE_TIME + timedelta(milliseconds=args.lookup_entries - 500)).timestamp()
+
+    def full_scan(predicate):
+        found = []
+        for segment in ledger.segment_paths:
+            with segment.open(encoding="utf-8") as fh:
+                for line in fh:
+                    item = LedgerEntry.from_json(line)
+                    if predicate(item):
+                        found.append(item)
+        return found
+
+    rows = [
+        (f"entries_for_wallet ({args.lookup_entries // args.wallets:,} hits)",
+         lambda: ledger.entries_for_wallet(wallet), lambda: full_scan(lambda e: e.wallet_id == wallet)),
+        ("entries_since (last 500)",
+         lambda: ledger.entries_since(since), lambda: full_scan(lambda e: e.timestamp >= since)),
+        ("tail(100)", lambda: ledger.tail(100), lambda: full_scan(lambda e: True)[-100:]),
+    ]
+    print(f"\nLookups over {args.lookup_entries:,} entries in {len(ledger.segment_paths)} segments "
+          f"(open + index load {open_s * 1000:.0f} ms):")
+    for name, indexed, scanned in rows:
+        started = time.perf_counter()
+        result = indexed()
+        indexed_s = time.perf_counter() - started
+        started = time.perf_counter()
+        expected = scanned()
+        scan_s = time.perf_counter() - started
+        assert result == expected
+        print(f"  {name:<34} index {indexed_s * 1000:8.2f} ms   scan {scan_s * 1000:9.1f} ms   "
+              f"{scan_s / indexed_s:,.0f}x")
+    ledger.close()
+    shutil.rmtree(workdir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Wallet custody ledger benchmark")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--windows", type=float, nargs="+", default=[0.0, 0.0005, 0.002, 0.005],
+                        help="Group-commit batch windows (seconds)")
+    parser.add_argument("--appends", type=int, default=4000)
+    parser.add_argument("--wallets", type=int, default=50)
+    parser.add_argument("--lookup-entries", type=int, default=200_000)
+    parser.add_argument("--dir", default=None, help="Directory for ledger files (the filesystem under test)")
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("Wallet custody ledger: group commit + sidecar index")
+    print("=" * 78)
+    bench_appends(args, args.dir)
+    bench_lookups(args, args.dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Load test: membrane hub fan-out with slow subscribers.
+
+Starts the membrane hub on a local port, connects healthy and artificially
+slow /observe clients, publishes timestamped envelopes through /inject and
+reports delivery latency (p50/p99/max) for the healthy subscribers plus
+per-subscriber drop counters.
+
+--legacy replays the old dispatch (json.dumps + await send per subscriber,
+in sequence) for comparison: one slow reader stalls the whole channel.
+
+Usage:
+    python orchestration/scripts/load_test_membrane_hub.py
+    python orchestration/scripts/load_test_membrane_hub.py --legacy
+    python orchestration/scripts/load_test_membrane_hub.py --healthy 8 --slow 2 --messages 3000 --overflow coalesce
+
+Date: 2026-10-18
+Purpose: Verify per-subscriber queued fan-out (membrane_hub.py)
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import socket
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import websockets
+
+from orchestration.adapters.bus import membrane_hub
+
+CHANNEL = "load.test"
+
+
+async def legacy_dispatch(envelope: dict):
+    """Pre-queue fan-out: encode per subscriber, await each send in turn."""
+    for sub in list(membrane_hub.SUBS.get(envelope["channel"], [])):
+        try:
+            await sub.ws.send(json.dumps(envelope))
+        except Exception:
+            membrane_hub.unsubscribe(sub)
+
+
+def small_buffer_listener() -> socket.socket:
+    """Hub listening socket whose accepted connections get a small send buffer."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 32768)
+    sock.bind(("127.0.0.1", 0))
+    sock.setblocking(False)
+    return sock
+
+
+def small_buffer_socket(port: int) -> socket.socket:
+    """Client socket with a small fixed receive buffer (no loopback autotuning)."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 16384)
+    sock.connect(("127.0.0.1", port))
+    sock.setblocking(False)
+    return sock
+
+
+async def observer(url: str, port: int, latencies: list, delay_s: float, done: asyncio.Event, ready: asyncio.Event):
+    # Slow readers: small client-side buffers so they back up into TCP (and the hub)
+    # within a few frames, like a remote observer on a slow link
+    sock = small_buffer_socket(port) if delay_s else None
+    async with websockets.connect(url, sock=sock, max_queue=4, max_size=None) as ws:
+        await ws.send(json.dumps({"type": "subscribe", "channels": [CHANNEL]}))
+        await ws.recv()  # subscribe.ack
+        ready.set()
+        while not done.is_set():
+            try:
+                raw = await asyncio.wait_for(ws.recv(), timeout=0.5)
+            except asyncio.TimeoutError:
+                continue
+            except websockets.exceptions.ConnectionClosed:
+                return
+            received_at = time.perf_counter()
+            latencies.append(received_at - json.loads(raw)["payload"]["sent_at"])
+            if delay_s:
+                await asyncio.sleep(delay_s)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def run(args):
+    membrane_hub.OVERFLOW_POLICY = args.overflow
+    membrane_hub.SEND_QUEUE_MAX = args.queue
+    if args.legacy:
+        membrane_hub.dispatch = legacy_dispatch
+
+    # Small kernel buffers on both ends: a slow reader backs up into the hub within
+    # a few frames (on loopback, autotuned buffers would absorb megabytes first)
+    listener = small_buffer_listener()
+    async with websockets.serve(membrane_hub.router, sock=listener, max_size=None) as server:
+        port = server.sockets[0].getsockname()[1]
+        observe_url = f"ws://127.0.0.1:{port}/observe"
+
+        done = asyncio.Event()
+        healthy = [[] for _ in range(args.healthy)]
+        slow = [[] for _ in range(args.slow)]
+        readies = []
+        tasks = []
+        for latencies, delay in [(l, 0.0) for l in healthy] + [(l, args.slow_ms / 1000) for l in slow]:
+            ready = asyncio.Event()
+            readies.append(ready)
+            tasks.append(asyncio.create_task(observer(observe_url, port, latencies, delay, done, ready)))
+        await asyncio.gather(*(r.wait() for r in readies))
+
+        # Distinct random blobs: permessage-deflate would shrink a repeated blob to nothing
+        blobs = [
+            base64.b64encode(os.urandom(args.payload_bytes * 3 // 4)).decode()
+            for _ in range(64)
+        ]
+        interval = 1.0 / args.rate
+        started = time.perf_counter()
+        async with websockets.connect(f"ws://127.0.0.1:{port}/inject", max_size=None) as pub:
+            for seq in range(args.messages):
+                await pub.send(json.dumps({
+                    "type": "membrane.inject",
+                    "channel": CHANNEL,
+                    "origin": "load_test",
+                    "payload": {"seq": seq, "sent_at": time.perf_counter(), "blob": blobs[seq % len(blobs)]},
+                }))
+                next_at = started + (seq + 1) * interval
+                await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+
+            # Let healthy subscribers drain (bounded wait)
+            deadline = time.perf_counter() + args.drain_s
+            while time.perf_counter() < deadline and min(len(l) for l in healthy) < args.messages:
+                await asyncio.sleep(0.05)
+
+        publish_seconds = time.perf_counter() - started
+        subscriber_stats = [sub.stats() for sub in membrane_hub.SUBS.get(CHANNEL, [])]
+        done.set()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    all_healthy = [lat * 1000 for l in healthy for lat in l]
+    print("=" * 60)
+    print(f"Membrane hub fan-out load test ({'legacy sequential' if args.legacy else 'queued, ' + args.overflow})")
+    print("=" * 60)
+    print(f"{args.healthy} healthy + {args.slow} slow ({args.slow_ms}ms/frame) subscribers, "
+          f"{args.messages} msgs x {args.payload_bytes}B at {args.rate}/s")
+    print(f"Run time: {publish_seconds:.2f}s")
+    delivered = [len(l) for l in healthy]
+    print(f"Healthy delivered: min {min(delivered)}/{args.messages}")
+    if all_healthy:
+        print(f"Healthy latency ms: p50 {statistics.median(all_healthy):.2f}  "
+              f"p99 {percentile(all_healthy, 99):.2f}  max {max(all_healthy):.2f}")
+    print(f"Slow delivered: {[len(l) for l in slow]}")
+    if not args.legacy:
+        print(f"Hub dropped/coalesced per subscriber: "
+              f"{[(s['dropped'], s['coalesced']) for s in subscriber_stats]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Membrane hub fan-out load test")
+    parser.add_argument("--healthy", type=int, default=6)
+    parser.add_argument("--slow", type=int, default=2)
+    parser.add_argument("--slow-ms", type=float, default=50.0, help="Slow reader delay per frame")
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--rate", type=float, default=200.0, help="Published envelopes per second")
+    parser.add_argument("--payload-bytes", type=int, default=4096)
+    parser.add_argument("--queue", type=int, default=membrane_hub.SEND_QUEUE_MAX)
+    parser.add_argument("--overflow", choices=membrane_hub.OVERFLOW_POLICIES, default=membrane_hub.OVERFLOW_POLICY)
+    parser.add_argument("--drain-s", type=float, default=5.0)
+    parser.add_argument("--legacy", action="store_true", help="Use the old sequential dispatch")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,81 @@
 """Redis-backed membrane economy store."""
 
 from __future__ import annotations
+import asyncio
 import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from redis.asyncio import Redis  # type: ignore
 
+# Charges coalesced into one script call before an early flush
+CHARGE_BATCH_MAX = 64
+
+# Applies a batch of charges for one (org, lane) atomically, in order.
+# KEYS: 1 budget hash, 2 ROI hash, 3 lane spend (60s), 4 econ ledger stream,
+#       then balance / spend zset / spend window per distinct wallet
+# ARGV: alpha, ledger maxlen, charge count, then per charge:
+#       amount, roi_sample ('' = none), timestamp, wallet KEYS offset (0 = none),
+#       wallet spend member, ledger field count, field/value pairs...
+# Returns {spent_rolling, budget_remaining, roi_ema} per charge (as strings:
+# Lua numbers would be truncated to integers on the way out).
+_RECORD_CHARGES_LUA = """
+local alpha = tonumber(ARGV[1])
+local maxlen = ARGV[2]
+local count = tonumber(ARGV[3])
+local spent = tonumber(redis.call('HGET', KEYS[1], 'spent_rolling') or '0')
+local roi = tonumber(redis.call('HGET', KEYS[2], 'ema') or '1')
+local results = {}
+local i = 4
+for c = 1, count do
+  local amount = tonumber(ARGV[i])
+  local roi_sample = ARGV[i + 1]
+  local ts = ARGV[i + 2]
+  local wallet = tonumber(ARGV[i + 3])
+  local member = ARGV[i + 4]
+  local n_fields = tonumber(ARGV[i + 5])
+  i = i + 6
+
+  spent = (1 - alpha) * spent + alpha * amount
+  if roi_sample ~= '' then
+    roi = (1 - alpha) * roi + alpha * math.max(tonumber(roi_sample), 0)
+  end
+  local spent_str = string.format('%.17g', spent)
+  local roi_str = string.format('%.17g', roi)
+
+  local budget = redis.call('HINCRBYFLOAT', KEYS[1], 'budget_remaining', -amount)
+  redis.call('HSET', KEYS[1], 'spent_rolling', spent_str, 'updated_at', ts)
+  redis.call('HSET', KEYS[2], 'ema', roi_str, 'updated', ts)
+  redis.call('SET', KEYS[3], spent_str, 'EX', 60)
+
+  local fields = {}
+  for f = 1, 2 * n_fields do
+    fields[f] = ARGV[i + f - 1]
+  end
+  i = i + 2 * n_fields
+  redis.call('XADD', KEYS[4], 'MAXLEN', '~', maxlen, '*', unpack(fields))
+
+  if wallet > 0 then
+    redis.call('INCRBYFLOAT', KEYS[wallet], -amount)
+    redis.call('ZADD', KEYS[wallet + 1], ts, member)
+    redis.call('ZREMRANGEBYSCORE', KEYS[wallet + 1], 0, tonumber(ts) - 60)
+    local total = 0
+    for _, entry in ipairs(redis.call('ZRANGE', KEYS[wallet + 1], 0, -1)) do
+      local sep = string.find(entry, ':', 1, true)
+      local amt = sep and tonumber(string.sub(entry, sep + 1))
+      if amt then
+        total = total + amt
+      end
+    end
+    redis.call('SET', KEYS[wallet + 2], string.format('%.17g', total), 'EX', 120)
+  end
+
+  results[c] = {spent_str, budget, roi_str}
+end
+return results
+"""
+
 
 def _to_float(value: Optional[str], default: float) -> float:
     if value is None:
@@ -17,6 +86,15 @@ def _to_float(value: Optional[str], default: float) -> float:
         return default
 
 
+@dataclass
+class _Charge:
+    amount: float
+    roi_sample: Optional[float]
+    timestamp: float
+    wallet_node: Optional[str]
+    ledger_entry: Dict[str, str]
+
+
 class MembraneStore:
     """Tracks rolling spend, ROI, wallet balances, and lane throttles."""
 
@@ -26,14 +104,26 @@ class MembraneStore:
         *,
         spend_alpha: float = 0.2,
         ledger_maxlen: int = 2048,
+        batch_window_ms: float = 0.0,
+        batch_max: int = CHARGE_BATCH_MAX,
+        client: Optional[Redis] = None,
     ) -> None:
-        self._redis = Redis.from_url(redis_url, decode_responses=True)
+        self._redis = client if client is not None else Redis.from_url(redis_url, decode_responses=True)
         self._spend_alpha = max(0.0, min(1.0, spend_alpha))
         self._ledger_maxlen = max(128, ledger_maxlen)
+        self._record_charges_script = self._redis.register_script(_RECORD_CHARGES_LUA)
+
+        # Optional micro-batching of record_charge per (org, lane)
+        self._batch_window = max(0.0, batch_window_ms) / 1000.0
+        self._batch_max = max(1, batch_max)
+        self._pending: Dict[Tuple[str, str], List[Tuple[_Charge, asyncio.Future]]] = {}
+        self._flush_timers: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._inflight: Set[asyncio.Task] = set()
 
     # ------------------------------------------------------------------ lifecycle
 
     async def close(self) -> None:
+        await self.flush_charges()
         await self._redis.close()
 
     # ------------------------------------------------------------------ key helpers
@@ -142,84 +232,147 @@ class MembraneStore:
         wallet_node: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, float]:
-        """Update spend metrics for a lane and append ledger entry."""
+        """
+        Update spend metrics for a lane and append ledger entry.
+
+        EMA, budget, ledger and wallet updates run atomically in one Lua script
+        (one round trip, no lost updates between concurrent writers). With
+        batch_window_ms > 0, charges for the same (org, lane) arriving within
+        the window share a single script call; each caller still gets the
+        metrics as of its own charge.
+        """
 
         if amount_mind <= 0:
             return await self.get_lane_snapshot(org_id, lane)
 
-        budget_key = self._lane_budget_key(org_id, lane)
-        roi_key = self._lane_roi_key(org_id, lane)
-        spent_key = self._lane_spent_key(org_id, lane)
-
-        # Fetch previous values
-        pipe = self._redis.pipeline()
-        pipe.hget(budget_key, "spent_rolling")
-        pipe.hget(roi_key, "ema")
-        spent_prev_raw, roi_prev_raw = await pipe.execute()
-
-        spent_prev = float(spent_prev_raw) if spent_prev_raw is not None else 0.0
-        roi_prev = float(roi_prev_raw) if roi_prev_raw is not None else 1.0
-
-        alpha = self._spend_alpha
-        spent_new = (1 - alpha) * spent_prev + alpha * abs(amount_mind)
-        roi_new = roi_prev
-        if roi_sample is not None:
-            roi_new = (1 - alpha) * roi_prev + alpha * max(roi_sample, 0.0)
+        charge = self._build_charge(amount_mind, roi_sample, citizen_id, wallet_node, metadata, lane)
+
+        if self._batch_window <= 0:
+            results = await self._apply_charges(org_id, lane, [charge])
+            return results[0]
+
+        key = (org_id, lane)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        pending = self._pending.setdefault(key, [])
+        pending.append((charge, future))
+        if len(pending) >= self._batch_max:
+            timer = self._flush_timers.pop(key, None)
+            if timer is not None:
+                timer.cancel()
+            self._spawn_flush(key)
+        elif key not in self._flush_timers:
+            self._flush_timers[key] = asyncio.create_task(self._flush_after_window(key))
+        return await future
 
+    @staticmethod
+    def _build_charge(
+        amount_mind: float,
+        roi_sample: Optional[float],
+        citizen_id: Optional[str],
+        wallet_node: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+        lane: str,
+    ) -> _Charge:
         timestamp = time.time()
-        iso_ts = datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+        amount = abs(amount_mind)
 
-        # Update Redis state
-        pipe = self._redis.pipeline()
-        pipe.hincrbyfloat(budget_key, "budget_remaining", -abs(amount_mind))
-        pipe.hset(
-            budget_key,
-            mapping={
-                "spent_rolling": str(spent_new),
-                "updated_at": str(timestamp),
-            },
-        )
-        pipe.hset(
-            roi_key,
-            mapping={
-                "ema": str(roi_new),
-                "updated": str(timestamp),
-            },
-        )
-        pipe.set(spent_key, str(spent_new), ex=60)
-        await pipe.execute()
-
-        # Append ledger entry
         ledger_entry = {
             "lane": lane,
             "amount_mind": f"{amount_mind:.6f}",
             "roi_sample": f"{roi_sample:.6f}" if roi_sample is not None else "",
             "citizen_id": citizen_id or "",
-            "timestamp": iso_ts,
+            "timestamp": datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat(),
         }
         if metadata:
             for key, value in metadata.items():
                 ledger_entry[f"meta_{key}"] = str(value)
 
-        await self._redis.xadd(
-            self._econ_ledger_key(org_id),
-            ledger_entry,
-            maxlen=self._ledger_maxlen,
-            approximate=True,
+        return _Charge(
+            amount=amount,
+            roi_sample=roi_sample,
+            timestamp=timestamp,
+            wallet_node=wallet_node,
+            ledger_entry=ledger_entry,
         )
 
-        # Wallet balance + rolling spend for citizen
-        if wallet_node:
-            await self.adjust_wallet_balance(org_id, wallet_node, -abs(amount_mind))
-            await self._record_wallet_spend(org_id, wallet_node, abs(amount_mind), timestamp)
-
-        budget_remaining_str = await self._redis.hget(budget_key, "budget_remaining")
-
-        return {
-            "spent_rolling": spent_new,
-            "budget_remaining": _to_float(budget_remaining_str, 0.0),
-            "roi_ema": roi_new,
-        }
+    async def _apply_charges(self, org_id: str, lane: str, charges: List[_Charge]) -> List[Dict[str, float]]:
+        """Run the charge script for one (org, lane) and return per-charge metrics."""
+        keys = [
+            self._lane_budget_key(org_id, lane),
+            self._lane_roi_key(org_id, lane),
+            self._lane_spent_key(org_id, lane),
+            self._econ_ledger_key(org_id),
+        ]
+        wallet_offsets: Dict[str, int] = {}
+        args: List[Any] = [self._spend_alpha, self._ledger_maxlen, len(charges)]
+
+        for charge in charges:
+            offset = 0
+            if charge.wallet_node:
+                offset = wallet_offsets.get(charge.wallet_node, 0)
+                if not offset:
+                    offset = wallet_offsets[charge.wallet_node] = len(keys) + 1  # Lua KEYS are 1-based
+                    keys.extend((
+                        self._wallet_balance_key(org_id, charge.wallet_node),
+                        self._wallet_spent_stream(org_id, charge.wallet_node),
+                        self._wallet_spent_window_key(org_id, charge.wallet_node),
+                    ))
+            args.extend((
+                charge.amount,
+                "" if charge.roi_sample is None else charge.roi_sample,
+                charge.timestamp,
+                offset,
+                f"{charge.timestamp}:{charge.amount:.6f}",
+                len(charge.ledger_entry),
+            ))
+            for field_name, value in charge.ledger_entry.items():
+                args.extend((field_name, value))
+
+        rows = await self._record_charges_script(keys=keys, args=args)
+        return [
+            {
+                "spent_rolling": float(spent),
+                "budget_remaining": _to_float(budget, 0.0),
+                "roi_ema": float(roi),
+            }
+            for spent, budget, roi in rows
+        ]
+
+    # ------------------------------------------------------------------ charge batching
+
+    async def _flush_after_window(self, key: Tuple[str, str]) -> None:
+        await asyncio.sleep(self._batch_window)
+        self._flush_timers.pop(key, None)
+        await self._flush(key)
+
+    def _spawn_flush(self, key: Tuple[str, str]) -> None:
+        task = asyncio.create_task(self._flush(key))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _flush(self, key: Tuple[str, str]) -> None:
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        try:
+            results = await self._apply_charges(key[0], key[1], [charge for charge, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def flush_charges(self) -> None:
+        """Apply every pending batched charge now (called on close)."""
+        for timer in self._flush_timers.values():
+            timer.cancel()
+        self._flush_timers.clear()
+        await asyncio.gather(*(self._flush(key) for key in list(self._pending)))
+        if self._inflight:
+            await asyncio.gather(*list(self._inflight), return_exceptions=True)
 
     async def set_throttle(
         self,
@@ -277,28 +430,6 @@ class MembraneStore:
             approximate=True,
         )
 
-    async def _record_wallet_spend(self, org_id: str, wallet_node: str, amount: float, timestamp: float) -> None:
-        stream_key = self._wallet_spent_stream(org_id, wallet_node)
-        member = f"{timestamp}:{amount:.6f}"
-        window_key = self._wallet_spent_window_key(org_id, wallet_node)
-
-        pipe = self._redis.pipeline()
-        pipe.zadd(stream_key, {member: timestamp})
-        cutoff = timestamp - 60.0
-        pipe.zremrangebyscore(stream_key, 0, cutoff)
-        await pipe.execute()
-
-        # Sum residual entries for 60-second window
-        remaining = await self._redis.zrange(stream_key, 0, -1)
-        total = 0.0
-        for entry in remaining:
-            try:
-                _, amt = entry.split(":", 1)
-                total += float(amt)
-            except ValueError:
-                continue
-        await self._redis.set(window_key, str(total), ex=120)
-
     # ------------------------------------------------------------------ helpers for orchestrator
 
     @staticmethod
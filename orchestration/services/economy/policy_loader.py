@@ -9,8 +9,9 @@ import ast
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
+import numpy as np
 from falkordb import FalkorDB  # type: ignore
 
 from orchestration.core import settings as core_settings
@@ -25,6 +26,31 @@ _SAFE_NAMES = {
     "pow": pow,
 }
 
+# Operator nodes allowed inside BinOp / UnaryOp / Compare / BoolOp
+_SAFE_OPERATORS = (
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+    ast.Not,
+    ast.And,
+    ast.Or,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+)
+
+# Arithmetic failures that mean "this formula has no value for this context"
+_EVAL_ERRORS = (ArithmeticError, NameError, TypeError, ValueError)
+
 
 class PolicyExpressionError(Exception):
     """Raised when a policy formula cannot be evaluated safely."""
@@ -38,21 +64,24 @@ def _compile_formula(formula: str) -> ast.AST:
 
     for node in ast.walk(expr):
         if isinstance(node, ast.Call):
-            if not isinstance(node.func, ast.Name) or node.func.id not in _SAFE_NAMES:
+            if not isinstance(node.func, ast.Name) or node.func.id not in _SAFE_NAMES or node.keywords:
                 raise PolicyExpressionError(f"Disallowed function in policy formula: {formula!r}")
+        elif isinstance(node, ast.Constant):
+            if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+                raise PolicyExpressionError(f"Disallowed constant in policy formula: {formula!r}")
         elif isinstance(
             node,
             (
                 ast.Expression,
                 ast.BinOp,
                 ast.UnaryOp,
-                ast.Num,
                 ast.Name,
                 ast.Compare,
                 ast.BoolOp,
                 ast.IfExp,
                 ast.Load,
-            ),
+            )
+            + _SAFE_OPERATORS,
         ):
             continue
         else:
@@ -62,13 +91,191 @@ def _compile_formula(formula: str) -> ast.AST:
 
 
 def _safe_eval(expr: ast.AST, context: Dict[str, Any]) -> float:
-    value = eval(compile(expr, "<policy>", "eval"), {"__builtins__": {}}, {**_SAFE_NAMES, **context})  # noqa: P204
+    """Reference interpreter: compiles the validated AST on every call."""
+    return _to_number(eval(compile(expr, "<policy>", "eval"), {"__builtins__": {}}, {**_SAFE_NAMES, **context}))  # noqa: P204
+
+
+def _to_number(value: Any) -> float:
     try:
         return float(value)
     except (TypeError, ValueError) as exc:
         raise PolicyExpressionError(f"Policy formula produced non-numeric value {value!r}") from exc
 
 
+class CompiledFormula:
+    """
+    A validated policy formula, lowered once for repeated evaluation.
+
+    __call__(context) evaluates a scalar context through a cached code object
+    (no per-call parse/compile or namespace merge). evaluate_many(columns)
+    evaluates the same formula over NumPy arrays of context variables (one row
+    per lane / citizen) through a closure tree built from the AST: min/max map
+    to np.minimum/np.maximum, conditionals and and/or to np.where. Rows for
+    which the scalar form would raise (division by zero, complex pow, ...)
+    come back as NaN.
+    """
+
+    __slots__ = ("formula", "names", "_code", "_globals", "_vector")
+
+    def __init__(self, formula: str, expr: Optional[ast.AST] = None) -> None:
+        self.formula = formula
+        expr = expr if expr is not None else _compile_formula(formula)
+        self.names = frozenset(
+            node.id for node in ast.walk(expr) if isinstance(node, ast.Name) and node.id not in _SAFE_NAMES
+        )
+        self._code = compile(expr, "<policy>", "eval")
+        self._globals = {"__builtins__": {}, **_SAFE_NAMES}
+        self._vector = _lower_vector(expr.body)
+
+    def __call__(self, context: Dict[str, Any]) -> float:
+        try:
+            value = eval(self._code, self._globals, context)  # noqa: P204
+        except _EVAL_ERRORS as exc:
+            raise PolicyExpressionError(f"Policy formula {self.formula!r} failed: {exc}") from exc
+        return _to_number(value)
+
+    def evaluate_many(self, columns: Dict[str, Any]) -> np.ndarray:
+        """
+        Evaluate over broadcastable arrays of context variables.
+
+        Args:
+            columns: {name: array or scalar}; every name in the formula must be present
+
+        Returns:
+            float64 array (NaN where the formula has no value)
+        """
+        missing = self.names.difference(columns)
+        if missing:
+            raise PolicyExpressionError(f"Policy formula {self.formula!r} missing variables: {sorted(missing)}")
+        with np.errstate(all="ignore"):
+            result = np.asarray(self._vector(columns), dtype=np.float64)
+        if result.ndim == 0:
+            result = np.broadcast_to(result, np.broadcast_shapes(*(np.shape(v) for v in columns.values()))).copy()
+        result[~np.isfinite(result)] = np.nan
+        return result
+
+
+def _no_value(values):
+    """NaN marks rows with no value (the scalar form would raise); it propagates upward."""
+    values = np.asarray(values, dtype=np.float64)
+    return np.where(np.isfinite(values), values, np.nan)
+
+
+def _vector_pow(base, exponent):
+    # float ** fractional on a negative base is complex in Python: no value
+    return _no_value(np.power(np.asarray(base, dtype=np.float64), exponent))
+
+
+def _vector_reduce(func):
+    # np.minimum / np.maximum propagate NaN, like the scalar min()/max() raising
+    def reduce(*args):
+        result = args[0]
+        for arg in args[1:]:
+            result = func(result, arg)
+        return result
+    return reduce
+
+
+def _where(test, body, orelse):
+    """np.where with Python truthiness; a NaN test has no value."""
+    return np.where(np.isnan(test), np.nan, np.where(test, body, orelse))
+
+
+_VECTOR_BINOPS = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.true_divide,
+    ast.FloorDiv: np.floor_divide,
+    ast.Mod: np.mod,
+    ast.Pow: _vector_pow,
+}
+
+_VECTOR_COMPARE = {
+    ast.Eq: np.equal,
+    ast.NotEq: np.not_equal,
+    ast.Lt: np.less,
+    ast.LtE: np.less_equal,
+    ast.Gt: np.greater,
+    ast.GtE: np.greater_equal,
+}
+
+_VECTOR_CALLS = {
+    "min": _vector_reduce(np.minimum),
+    "max": _vector_reduce(np.maximum),
+    "abs": np.abs,
+    "pow": _vector_pow,
+}
+
+
+def _lower_vector(node: ast.AST) -> Callable[[Dict[str, Any]], Any]:
+    """Lower a validated expression node to a closure over NumPy columns."""
+    if isinstance(node, ast.Constant):
+        value = float(node.value)
+        return lambda cols: value
+
+    if isinstance(node, ast.Name):
+        name = node.id
+        return lambda cols: np.asarray(cols[name], dtype=np.float64)
+
+    if isinstance(node, ast.BinOp):
+        op = _VECTOR_BINOPS[type(node.op)]
+        left, right = _lower_vector(node.left), _lower_vector(node.right)
+        return lambda cols: _no_value(op(left(cols), right(cols)))
+
+    if isinstance(node, ast.UnaryOp):
+        operand = _lower_vector(node.operand)
+        if isinstance(node.op, ast.USub):
+            return lambda cols: np.negative(operand(cols))
+        if isinstance(node.op, ast.Not):
+            return lambda cols: _where(operand(cols), 0.0, 1.0)
+        return operand
+
+    if isinstance(node, ast.Compare):
+        first = _lower_vector(node.left)
+        steps = [(_VECTOR_COMPARE[type(op)], _lower_vector(comp)) for op, comp in zip(node.ops, node.comparators)]
+
+        def compare(cols):
+            left = first(cols)
+            result = 1.0
+            for op, comparator in steps:
+                right = comparator(cols)
+                step = np.where(np.isnan(left) | np.isnan(right), np.nan, op(left, right))
+                # Chains stop at the first false link, like Python's lazy a < b < c
+                result = np.where(result == 1.0, step, result)
+                left = right
+            return result
+        return compare
+
+    if isinstance(node, ast.BoolOp):
+        values = [_lower_vector(value) for value in node.values]
+        is_and = isinstance(node.op, ast.And)
+
+        def boolop(cols):
+            # Python semantics: `a and b` is a if a is falsy else b (or: a if truthy else b)
+            result = values[-1](cols)
+            for value in reversed(values[:-1]):
+                current = value(cols)
+                result = _where(current, result, current) if is_and else _where(current, current, result)
+            return result
+        return boolop
+
+    if isinstance(node, ast.IfExp):
+        test, body, orelse = _lower_vector(node.test), _lower_vector(node.body), _lower_vector(node.orelse)
+        return lambda cols: _where(test(cols), body(cols), orelse(cols))
+
+    if isinstance(node, ast.Call):
+        func = _VECTOR_CALLS[node.func.id]
+        args = [_lower_vector(arg) for arg in node.args]
+        if node.func.id in ("min", "max") and len(args) < 2:
+            def no_value(cols):
+                raise PolicyExpressionError(f"{node.func.id}() needs at least two arguments in a policy formula")
+            return no_value
+        return lambda cols: func(*(arg(cols) for arg in args))
+
+    raise PolicyExpressionError(f"Cannot vectorize policy expression node {type(node).__name__}")
+
+
 @dataclass(order=True)
 class BudgetPolicy:
     """Represents a budget policy node from FalkorDB."""
@@ -79,12 +286,18 @@ class BudgetPolicy:
     min_floor_mind: float = field(compare=False, default=0.0)
     extras: Dict[str, Any] = field(compare=False, default_factory=dict)
     _expr: ast.AST = field(init=False, repr=False, compare=False)
+    _compiled: CompiledFormula = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self._expr = _compile_formula(self.formula_raw)
+        self._compiled = CompiledFormula(self.formula_raw, self._expr)
 
     def evaluate(self, context: Dict[str, Any]) -> float:
-        return _safe_eval(self._expr, context)
+        return self._compiled(context)
+
+    def evaluate_many(self, columns: Dict[str, Any]) -> np.ndarray:
+        """Evaluate over NumPy columns of context variables (one row per lane / citizen)."""
+        return self._compiled.evaluate_many(columns)
 
 
 class BudgetPolicyManager:
@@ -25,7 +25,11 @@ class EconomyRuntime:
     def __init__(self, settings: EconomySettings, broadcaster: ConsciousnessStateBroadcaster) -> None:
         self._settings = settings
         self._broadcaster = broadcaster
-        self._store = MembraneStore(settings.redis_url, spend_alpha=settings.spend_alpha)
+        self._store = MembraneStore(
+            settings.redis_url,
+            spend_alpha=settings.spend_alpha,
+            batch_window_ms=settings.charge_batch_ms,
+        )
         self._oracle = PriceOracle(settings)
         self._policies = BudgetPolicyManager(graph=settings.l2_graph)
         self._manager = EconomyManager(settings, self._store, self._policies, broadcaster)
@@ -36,6 +36,7 @@ class EconomySettings:
     throttle_interval_seconds: int = field(default_factory=lambda: int(os.getenv("ECONOMY_THROTTLE_INTERVAL", "60")))
     policy_refresh_seconds: int = field(default_factory=lambda: int(os.getenv("ECONOMY_POLICY_REFRESH", "300")))
     spend_alpha: float = field(default_factory=lambda: float(os.getenv("ECONOMY_SPEND_ALPHA", "0.2")))
+    charge_batch_ms: float = field(default_factory=lambda: float(os.getenv("ECONOMY_CHARGE_BATCH_MS", "0")))
     roi_alpha: float = field(default_factory=lambda: float(os.getenv("ECONOMY_ROI_ALPHA", "0.5")))
     wallet_floor_multiplier: float = field(default_factory=lambda: float(os.getenv("ECONOMY_WALLET_FLOOR_MULT", "0.4")))
     lane_wallets: Dict[str, str] = field(default_factory=lambda: _parse_json_env("ECONOMY_LANE_WALLETS", {}))
@@ -8,6 +8,8 @@ Components:
 - backoff.py: Exponential backoff with quarantine
 - runner.py: Service lifecycle with process groups
 - watcher.py: Centralized file watching
+- planner.py: Dependency-ordered startup layers + cold-start report
+- restart.py: Per-service restart state machine
 - registry.py: Service coordination
 - services.yaml: Service specifications
 
@@ -19,6 +21,8 @@ from .singleton import SingletonLease
 from .backoff import BackoffState, QuarantineRequired
 from .runner import ServiceRunner, ServiceSpec
 from .watcher import CentralizedFileWatcher
+from .planner import DependencyCycleError, StartupReport, plan_startup_layers
+from .restart import RestartState, RestartStateMachine
 from .registry import ServiceRegistry
 
 __all__ = [
@@ -28,5 +32,10 @@ __all__ = [
     "ServiceRunner",
     "ServiceSpec",
     "CentralizedFileWatcher",
+    "DependencyCycleError",
+    "StartupReport",
+    "plan_startup_layers",
+    "RestartState",
+    "RestartStateMachine",
     "ServiceRegistry",
 ]
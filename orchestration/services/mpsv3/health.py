@@ -198,6 +198,24 @@ class ServiceHealthMonitor:
         print(f"[{self.service_id}] ❌ Failed readiness after {max_attempts} attempts: {result.message}")
         return False
 
+    def probe_readiness(self) -> bool:
+        """
+        Run the readiness check once (non-blocking counterpart of check_readiness).
+
+        Returns True if ready (or no readiness check defined).
+        """
+        if not self.readiness_check:
+            self.is_ready = True
+            return True
+
+        result = self.checker.execute_check(self.readiness_check)
+        self.last_result = result
+        self.last_check_time = time.time()
+        if result.passed and not self.is_ready:
+            print(f"[{self.service_id}] ✅ Ready ({result.latency_ms:.0f}ms)")
+        self.is_ready = result.passed
+        return result.passed
+
     def check_liveness(self) -> bool:
         """
         Check if service is alive (ongoing monitoring).
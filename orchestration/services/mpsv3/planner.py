@@ -0,0 +1,102 @@
+"""
+MPSv3 Startup Planner - Dependency-ordered service startup.
+
+Implements:
+- Topological layering of services by depends_on/requires (Kahn's algorithm)
+- Cycle and unknown-dependency detection
+- Cold-start report (per-service start/ready times, time-to-all-ready)
+
+Services in the same layer have no dependencies on each other and can be
+launched in parallel; ServiceRegistry.start_all launches each service as
+soon as every dependency is ready, which never starts a service earlier
+than its layer allows.
+
+Author: Atlas (Infrastructure Engineer)
+Date: 2026-10-19
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+class DependencyCycleError(ValueError):
+    """Raised when depends_on edges form a cycle."""
+    pass
+
+
+def plan_startup_layers(dependencies: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Group services into startup layers.
+
+    Args:
+        dependencies: service_id -> ids it depends on. Unknown ids are
+            ignored (reported by unknown_dependencies).
+
+    Returns:
+        Layers in start order; layer N depends only on layers < N. Order
+        within a layer follows the input order.
+
+    Raises:
+        DependencyCycleError: if the dependencies contain a cycle
+    """
+    remaining = {
+        sid: {dep for dep in deps if dep in dependencies and dep != sid}
+        for sid, deps in dependencies.items()
+    }
+    layers: List[List[str]] = []
+    while remaining:
+        layer = [sid for sid, deps in remaining.items() if not deps]
+        if not layer:
+            raise DependencyCycleError(f"Dependency cycle among: {', '.join(sorted(remaining))}")
+        layers.append(layer)
+        for sid in layer:
+            del remaining[sid]
+        for deps in remaining.values():
+            deps.difference_update(layer)
+    return layers
+
+
+def unknown_dependencies(dependencies: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """service_id -> dependencies that name no known service."""
+    unknown = {}
+    for sid, deps in dependencies.items():
+        missing = [dep for dep in deps if dep not in dependencies]
+        if missing:
+            unknown[sid] = missing
+    return unknown
+
+
+@dataclass
+class StartupReport:
+    """Cold-start timings, seconds relative to start_all()."""
+    layers: List[List[str]]
+    started_at: Dict[str, float] = field(default_factory=dict)
+    ready_at: Dict[str, float] = field(default_factory=dict)
+    failed: Dict[str, str] = field(default_factory=dict)  # service_id -> reason
+    total_s: float = 0.0
+
+    @property
+    def all_ready(self) -> bool:
+        return not self.failed and len(self.ready_at) == sum(len(layer) for layer in self.layers)
+
+    @property
+    def time_to_all_ready(self) -> Optional[float]:
+        """Seconds until the last service was ready (None if any failed)."""
+        return max(self.ready_at.values(), default=0.0) if self.all_ready else None
+
+    def format(self) -> str:
+        """Human-readable report, one line per service in start order."""
+        lines = ["[Registry] Cold-start report:"]
+        for index, layer in enumerate(self.layers):
+            for sid in layer:
+                started = self.started_at.get(sid)
+                ready = self.ready_at.get(sid)
+                status = (f"ready {ready:6.2f}s" if ready is not None
+                          else f"FAILED ({self.failed.get(sid, 'not ready')})")
+                start_text = f"{started:6.2f}s" if started is not None else "   -   "
+                lines.append(f"  L{index} {sid:<24} start {start_text}  {status}")
+        if self.all_ready:
+            lines.append(f"  Time to all ready: {self.time_to_all_ready:.2f}s")
+        else:
+            lines.append(f"  {len(self.failed)} service(s) not ready after {self.total_s:.2f}s")
+        return "\n".join(lines)
@@ -2,9 +2,9 @@
 MPSv3 Service Registry - Service lifecycle management.
 
 Coordinates:
-- Service startup (start all, with dependency order in future)
+- Service startup (dependency-ordered, independent services in parallel)
 - Service reload (graceful restart on file change)
-- Service monitoring (track running state)
+- Service monitoring (concurrent probes, per-service restart state machines)
 - Service shutdown (clean termination)
 
 Author: Atlas
@@ -16,15 +16,21 @@ import re
 import threading
 import time
 import yaml
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Set
 
 from .runner import ServiceRunner, ServiceSpec
 from .health import ServiceHealthMonitor
+from .planner import StartupReport, plan_startup_layers, unknown_dependencies
+from .restart import RestartState, RestartStateMachine
 
 # Quiescence window: refuse reload until service stable
 DEFAULT_MIN_UPTIME = 25  # seconds - allows engines to initialize
 
+# Readiness window after a (re)start before the restart state machine gives up
+DEFAULT_READINESS_TIMEOUT = 30.0  # seconds
+
 
 class ServiceRegistry:
     """Service lifecycle management."""
@@ -35,6 +41,13 @@ class ServiceRegistry:
         self.runners: Dict[str, ServiceRunner] = {}
         self.health_monitors: Dict[str, ServiceHealthMonitor] = {}  # Health monitoring
         self._timers: Dict[str, threading.Timer] = {}  # Deferred reload timers
+        self.restart_machines: Dict[str, RestartStateMachine] = {}  # Per-service restart state
+        self.startup_layers: list = []
+        self.last_startup_report: Optional[StartupReport] = None
+        self._lock = threading.RLock()  # Guards restart_machines transitions
+        self._shutting_down = False  # Set by shutdown_all; restarts must not start services after it
+        self._restarting: Set[threading.Thread] = set()  # Restart timers past their shutdown check
+        self._executor: Optional[ThreadPoolExecutor] = None  # Probes, restarts, shutdowns
         self._load_config()
 
     def _expand_vars(self, value: Any, env_vars: Dict[str, str]) -> Any:
@@ -128,10 +141,16 @@ class ServiceRegistry:
                 criticality=service.get("criticality", "CORE"),
                 max_retries=service.get("max_retries", 3),
                 watched_files=watched_files,
-                depends_on=service.get("depends_on", [])
+                # services.yaml spells dependencies 'requires', services_membrane.yaml 'depends_on'
+                depends_on=list(dict.fromkeys(service.get("depends_on", []) + service.get("requires", [])))
             )
             self.specs[spec.id] = spec
             self.runners[spec.id] = ServiceRunner(spec)
+            self.restart_machines[spec.id] = RestartStateMachine(
+                spec.id,
+                backoff=self.runners[spec.id].backoff,
+                readiness_timeout_s=DEFAULT_READINESS_TIMEOUT
+            )
 
             # Create health monitor if readiness/liveness checks defined
             readiness_check = self._expand_vars(service.get("readiness"), global_env)
@@ -143,13 +162,134 @@ class ServiceRegistry:
                     liveness_check=liveness_check
                 )
 
-        print(f"[Registry] Loaded {len(self.specs)} service specifications")
+        dependencies = {sid: spec.depends_on for sid, spec in self.specs.items()}
+        for sid, missing in unknown_dependencies(dependencies).items():
+            print(f"[Registry] WARNING: {sid} depends on unknown service(s) {missing} - ignoring")
+        self.startup_layers = plan_startup_layers(dependencies)
 
-    def start_all(self):
-        """Start all services."""
-        for service_id, runner in self.runners.items():
-            print(f"[Registry] Starting {service_id}...")
-            runner.start()
+        print(f"[Registry] Loaded {len(self.specs)} service specifications "
+              f"in {len(self.startup_layers)} startup layer(s)")
+
+
+    def _pool(self) -> ThreadPoolExecutor:
+        """Thread pool for health probes, restarts and shutdowns (checks are blocking I/O)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(32, len(self.specs) + 4),
+                thread_name_prefix="mpsv3-probe"
+            )
+        return self._executor
+
+    def _has_readiness(self, service_id: str) -> bool:
+        monitor = self.health_monitors.get(service_id)
+        return bool(monitor and monitor.readiness_check)
+
+    def _mark_started(self, service_id: str):
+        """Tell the restart state machine a (re)started process is up."""
+        with self._lock:
+            self.restart_machines[service_id].on_started(time.monotonic(), self._has_readiness(service_id))
+
+    def start_all(self, readiness_timeout_s: float = 60.0, probe_interval_s: float = 0.25) -> StartupReport:
+        """
+        Start all services in dependency order.
+
+        A service is launched as soon as every service it depends on is
+        ready (or has failed - it is then started anyway, with a warning),
+        so independent services start together and readiness probes for
+        all starting services run concurrently.
+
+        Args:
+            readiness_timeout_s: Overall time to wait for everything to be ready
+            probe_interval_s: Delay between readiness probes of one service
+
+        Returns:
+            StartupReport with per-service start/ready times
+        """
+        with self._lock:
+            self._shutting_down = False
+        started = time.monotonic()
+        report = StartupReport(layers=self.startup_layers)
+        state = {sid: "waiting" for layer in self.startup_layers for sid in layer}
+        next_probe: Dict[str, float] = {}
+        probes = {}  # future -> service_id
+
+        def resolve(sid: str, ready: bool, now: float, reason: str = ""):
+            state[sid] = "ready" if ready else "failed"
+            if ready:
+                report.ready_at[sid] = now
+                with self._lock:
+                    self.restart_machines[sid].on_ready(time.monotonic())
+            else:
+                report.failed[sid] = reason
+
+        while True:
+            now = time.monotonic() - started
+
+            # Launch every waiting service whose dependencies are resolved
+            for layer in self.startup_layers:
+                for sid in layer:
+                    deps = self.specs[sid].depends_on
+                    if state[sid] != "waiting" or any(state.get(d) in ("waiting", "starting") for d in deps):
+                        continue
+                    failed_deps = [d for d in deps if state.get(d) == "failed"]
+                    if failed_deps:
+                        print(f"[Registry] WARNING: starting {sid} although {failed_deps} failed")
+                    print(f"[Registry] Starting {sid}...")
+                    runner = self.runners[sid]
+                    runner.start()
+                    report.started_at[sid] = now
+                    if not runner.process:
+                        resolve(sid, False, now, "quarantined" if runner.quarantined else "not started")
+                        continue
+                    self._mark_started(sid)
+                    if self._has_readiness(sid):
+                        state[sid] = "starting"
+                        next_probe[sid] = now
+                    else:
+                        resolve(sid, True, now)
+
+            starting = [sid for sid, st in state.items() if st == "starting"]
+            if not starting and "waiting" not in state.values():
+                break
+            if now >= readiness_timeout_s:
+                for sid, st in state.items():
+                    if st in ("starting", "waiting"):
+                        resolve(sid, False, now, f"not ready after {readiness_timeout_s:.0f}s")
+                break
+
+            # Probe every starting service concurrently
+            in_flight = set(probes.values())
+            for sid in starting:
+                runner = self.runners[sid]
+                if runner.process.poll() is not None:
+                    resolve(sid, False, now, f"exited with code {runner.process.returncode}")
+                elif sid not in in_flight and next_probe[sid] <= now:
+                    probes[self._pool().submit(self.health_monitors[sid].probe_readiness)] = sid
+
+            if probes:
+                done, _ = wait(list(probes), timeout=probe_interval_s, return_when=FIRST_COMPLETED)
+            else:
+                done = set()
+                time.sleep(probe_interval_s)
+            now = time.monotonic() - started
+            for future in done:
+                sid = probes.pop(future)
+                if state[sid] != "starting":
+                    continue
+                try:
+                    ready = future.result()
+                except Exception as e:
+                    print(f"[Registry] {sid} readiness probe error: {e}")
+                    ready = False
+                if ready:
+                    resolve(sid, True, now)
+                else:
+                    next_probe[sid] = now + probe_interval_s
+
+        report.total_s = time.monotonic() - started
+        self.last_startup_report = report
+        print(report.format())
+        return report
 
     def reload_service(self, service_id: str):
         """Gracefully reload a service with quiescence window.
@@ -181,9 +321,12 @@ class ServiceRegistry:
             
             # Schedule deferred reload
             def deferred_reload():
+                if self._shutting_down:
+                    return
                 print(f"[Registry] Quiescence complete, reloading {service_id}...")
                 runner.shutdown()
                 runner.start()
+                self._mark_started(service_id)
                 self._timers[timer_key] = None
             
             self._timers[timer_key] = threading.Timer(delay, deferred_reload)
@@ -194,92 +337,178 @@ class ServiceRegistry:
         print(f"[Registry] Reloading {service_id} (uptime {uptime:.1f}s)...")
         runner.shutdown()
         runner.start()
+        self._mark_started(service_id)
 
-    def wait_for_readiness(self, overall_timeout_s: float = 60.0):
+    def wait_for_readiness(self, overall_timeout_s: float = 60.0, interval_s: float = 1.0):
         """
         Wait for all services with readiness checks to become ready.
 
+        Probes every not-yet-ready service concurrently each round, so one
+        slow service does not hold up the others' checks.
+
         Args:
             overall_timeout_s: Maximum time to wait for ALL services (default 60s)
+            interval_s: Delay between probe rounds
         """
-        import time
         print("[Registry] Waiting for services to become ready...")
-        start_time = time.time()
-
-        for service_id, monitor in self.health_monitors.items():
-            # Check overall timeout
-            elapsed = time.time() - start_time
-            if elapsed >= overall_timeout_s:
+        deadline = time.monotonic() + overall_timeout_s
+
+        while True:
+            pending = {}
+            for service_id, monitor in self.health_monitors.items():
+                if not monitor.readiness_check or monitor.is_ready:
+                    continue
+                runner = self.runners.get(service_id)
+                if runner and runner.process and runner.process.poll() is not None:
+                    continue  # Process died - resurrection is check_all_health's job
+                pending[service_id] = self._pool().submit(monitor.probe_readiness)
+            if not pending:
+                return
+
+            wait(list(pending.values()))
+            now = time.monotonic()
+            for service_id, future in pending.items():
+                if future.exception() is None and future.result():
+                    with self._lock:
+                        self.restart_machines[service_id].on_ready(now)
+
+            not_ready = [sid for sid, future in pending.items() if future.exception() or not future.result()]
+            if not not_ready:
+                return
+            if now + interval_s >= deadline:
                 print(f"[Registry] ⚠️ Overall readiness timeout ({overall_timeout_s}s) exceeded - proceeding anyway")
-                break
-
-            if not monitor.readiness_check:
-                continue  # No readiness check defined
-
-            # Check if process is still alive before waiting
-            runner = self.runners.get(service_id)
-            if runner and runner.process and runner.process.poll() is not None:
-                print(f"[Registry] ⚠️ {service_id} process died - skipping readiness check")
-                continue
-
-            remaining = overall_timeout_s - elapsed
-            max_attempts = min(30, int(remaining))  # Don't exceed remaining time
-
-            ready = monitor.check_readiness(max_attempts=max_attempts, interval_s=1.0)
-            if not ready:
-                print(f"[Registry] WARNING: {service_id} failed readiness check")
+                for service_id in not_ready:
+                    print(f"[Registry] WARNING: {service_id} failed readiness check")
+                return
+            time.sleep(interval_s)
 
     def check_all_health(self) -> Dict[str, bool]:
         """
         Check health of all monitored services.
 
+        Never blocks on a restart: probes run concurrently, and each
+        service's RestartStateMachine decides what a result means. Dead or
+        failing services are restarted on a timer after their backoff delay
+        and then probed for readiness on later calls (STARTING) until ready
+        or the readiness window runs out.
+
         Returns dict mapping service_id -> is_healthy.
         """
+        now = time.monotonic()
         health_status = {}
-        for service_id, monitor in self.health_monitors.items():
-            runner = self.runners.get(service_id)
-
-            # Check if process is dead - RESURRECT IMMEDIATELY
-            if not runner or not runner.process or runner.process.poll() is not None:
-                print(f"[Registry] {service_id} process died - resurrecting...")
-                health_status[service_id] = False
-
-                # Restart dead process
-                if runner:
-                    runner.shutdown()  # Clean up any remnants
-                    runner.start()
+        readiness_probes = {}
+        liveness_probes = {}
+
+        with self._lock:
+            for service_id, monitor in self.health_monitors.items():
+                runner = self.runners.get(service_id)
+                machine = self.restart_machines[service_id]
+
+                if machine.state in (RestartState.QUARANTINED, RestartState.BACKOFF, RestartState.RESTARTING):
+                    health_status[service_id] = False
+                    continue
+
+                # Check if process is dead - schedule resurrection
+                if not runner or not runner.process or runner.process.poll() is not None:
+                    print(f"[Registry] {service_id} process died - resurrecting...")
+                    health_status[service_id] = False
+                    machine.on_exit(now)
+                    self._schedule_restart(service_id)
+                    continue
+
+                if machine.state == RestartState.STARTING:
+                    readiness_probes[service_id] = self._pool().submit(monitor.probe_readiness)
+                else:
+                    liveness_probes[service_id] = self._pool().submit(monitor.check_liveness)
+
+        wait(list(readiness_probes.values()) + list(liveness_probes.values()))
+        now = time.monotonic()
+
+        with self._lock:
+            for service_id, future in readiness_probes.items():
+                machine = self.restart_machines[service_id]
+                ready = future.exception() is None and future.result()
+                health_status[service_id] = ready
+                if ready:
+                    machine.on_ready(now)
+                elif machine.on_readiness_failed(now):
+                    print(f"[Registry] WARNING: {service_id} failed readiness after restart")
+                    self._schedule_restart(service_id)
+
+            for service_id, future in liveness_probes.items():
+                machine = self.restart_machines[service_id]
+                monitor = self.health_monitors[service_id]
+                is_healthy = future.exception() is None and future.result()
+                health_status[service_id] = is_healthy
+
+                # Restart if exceeded failure threshold (3 consecutive liveness failures)
+                machine.on_liveness(is_healthy, monitor.consecutive_failures, now)
+                if machine.state in (RestartState.BACKOFF, RestartState.QUARANTINED):
+                    print(f"[Registry] {service_id} exceeded health failure threshold, restarting...")
+                    self._schedule_restart(service_id)
 
-                    # Wait for readiness after resurrection
-                    if monitor.readiness_check:
-                        monitor.is_ready = False
-                        monitor.consecutive_failures = 0
-                        ready = monitor.check_readiness(max_attempts=30, interval_s=1.0)
-                        health_status[service_id] = ready
-                    else:
-                        health_status[service_id] = True  # Assume healthy if no readiness check
-                continue
+        return health_status
 
-            # Check liveness for running processes
-            is_healthy = monitor.check_liveness()
-            health_status[service_id] = is_healthy
+    def _schedule_restart(self, service_id: str):
+        """Act on a BACKOFF/QUARANTINED transition: restart on a timer, or disable."""
+        machine = self.restart_machines[service_id]
+        runner = self.runners[service_id]
+        if machine.state == RestartState.QUARANTINED:
+            print(f"[Registry] {service_id} QUARANTINE - exceeded max retries ({machine.last_reason})")
+            runner.quarantined = True
+            return
+        if machine.state != RestartState.BACKOFF:
+            return
 
-            # Restart if exceeded failure threshold (3 consecutive liveness failures)
-            if monitor.should_restart(failure_threshold=3):
-                print(f"[Registry] {service_id} exceeded health failure threshold, restarting...")
-                runner.shutdown()
-                runner.start()
+        timer_key = f"{service_id}::restart_timer"
+        if self._timers.get(timer_key) is not None:
+            return  # Restart already scheduled
 
-                # Wait for readiness after restart
-                if monitor.readiness_check:
+        def restart():
+            with self._lock:
+                self._timers[timer_key] = None
+                if self._shutting_down or machine.state != RestartState.BACKOFF:
+                    return
+                machine.on_restarting(time.monotonic())
+                self._restarting.add(threading.current_thread())
+            try:
+                monitor = self.health_monitors.get(service_id)
+                if monitor:
                     monitor.is_ready = False
                     monitor.consecutive_failures = 0
-                    ready = monitor.check_readiness(max_attempts=30, interval_s=1.0)
-                    health_status[service_id] = ready
+                print(f"[Registry] Restarting {service_id} ({machine.last_reason}, restart #{machine.restarts})...")
+                runner.shutdown()  # Clean up any remnants
+                with self._lock:
+                    if self._shutting_down:
+                        return  # shutdown_all began while the old process was stopping
+                runner.start()
+                self._mark_started(service_id)
+            finally:
+                with self._lock:
+                    self._restarting.discard(threading.current_thread())
 
-        return health_status
+        delay = max(0.0, machine.restart_at - time.monotonic())
+        self._timers[timer_key] = threading.Timer(delay, restart)
+        self._timers[timer_key].daemon = True
+        self._timers[timer_key].start()
 
     def shutdown_all(self):
-        """Shutdown all services cleanly."""
+        """Shutdown all services cleanly (in parallel; each waits out its SIGTERM grace)."""
+        with self._lock:
+            self._shutting_down = True
+            in_flight = list(self._restarting)
+        for timer in self._timers.values():
+            if timer is not None:
+                timer.cancel()
+        # A restart past its check may still be starting its service: let it
+        # finish so the shutdown below terminates what it started
+        for thread in in_flight:
+            thread.join()
+        futures = []
         for service_id, runner in self.runners.items():
             print(f"[Registry] Shutting down {service_id}...")
-            runner.shutdown()
+            futures.append(self._pool().submit(runner.shutdown))
+        wait(futures)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
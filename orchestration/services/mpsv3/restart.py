@@ -0,0 +1,126 @@
+"""
+MPSv3 Restart State Machine - Per-service supervision state.
+
+Replaces blocking restart-and-wait in health checks. Each service moves
+through:
+
+    STARTING -> RUNNING <-> UNHEALTHY
+        |          |            |
+        +----------+------------+--> BACKOFF -> RESTARTING -> STARTING
+                                        |
+                                        +--> QUARANTINED (max retries)
+
+Transitions are driven by probe results and process exits; the registry
+performs the actual restart (off the probe path) and reports back with
+on_started(). Backoff delays and quarantine come from the runner's
+BackoffState; reaching RUNNING resets it.
+
+Author: Atlas (Infrastructure Engineer)
+Date: 2026-10-19
+"""
+
+from enum import Enum
+from typing import Optional
+
+from .backoff import BackoffState, QuarantineRequired
+
+
+class RestartState(str, Enum):
+    STARTING = "starting"        # Launched, waiting for readiness
+    RUNNING = "running"          # Ready, liveness passing
+    UNHEALTHY = "unhealthy"      # Liveness failing, below restart threshold
+    BACKOFF = "backoff"          # Restart scheduled at restart_at
+    RESTARTING = "restarting"    # Shutdown + start in flight
+    QUARANTINED = "quarantined"  # Exceeded max retries, not restarted
+
+
+class RestartStateMachine:
+    """Restart supervision state for one service."""
+
+    def __init__(
+        self,
+        service_id: str,
+        backoff: BackoffState,
+        failure_threshold: int = 3,
+        readiness_timeout_s: float = 30.0
+    ):
+        self.service_id = service_id
+        self.backoff = backoff
+        self.failure_threshold = failure_threshold
+        self.readiness_timeout_s = readiness_timeout_s
+
+        self.state = RestartState.STARTING
+        self.since = 0.0
+        self.ready_deadline = float("inf")
+        self.restart_at: Optional[float] = None
+        self.restarts = 0
+        self.last_reason = ""
+
+    def _enter(self, state: RestartState, now: float):
+        self.state = state
+        self.since = now
+
+    @property
+    def healthy(self) -> bool:
+        return self.state == RestartState.RUNNING
+
+    def on_started(self, now: float, has_readiness: bool = True):
+        """Process launched (initially or by a restart)."""
+        if has_readiness:
+            self._enter(RestartState.STARTING, now)
+            self.ready_deadline = now + self.readiness_timeout_s
+        else:
+            self.on_ready(now)
+
+    def on_ready(self, now: float):
+        """Readiness probe passed."""
+        self._enter(RestartState.RUNNING, now)
+        self.ready_deadline = float("inf")
+        self.backoff.reset()
+
+    def on_readiness_failed(self, now: float) -> bool:
+        """Readiness probe failed; True if the readiness window ran out (restart scheduled)."""
+        if self.state == RestartState.STARTING and now >= self.ready_deadline:
+            self.request_restart(now, "not ready within readiness timeout")
+            return True
+        return False
+
+    def on_liveness(self, passed: bool, consecutive_failures: int, now: float):
+        """Liveness probe result for a running service."""
+        if self.state not in (RestartState.RUNNING, RestartState.UNHEALTHY):
+            return
+        if passed:
+            if self.state != RestartState.RUNNING:
+                self._enter(RestartState.RUNNING, now)
+        elif consecutive_failures >= self.failure_threshold:
+            self.request_restart(now, f"{consecutive_failures} consecutive liveness failures")
+        elif self.state != RestartState.UNHEALTHY:
+            self._enter(RestartState.UNHEALTHY, now)
+
+    def on_exit(self, now: float):
+        """Process found dead."""
+        if self.state in (RestartState.BACKOFF, RestartState.RESTARTING, RestartState.QUARANTINED):
+            return
+        self.request_restart(now, "process died")
+
+    def request_restart(self, now: float, reason: str):
+        """Schedule a restart after the backoff delay, or quarantine."""
+        self.last_reason = reason
+        try:
+            delay = self.backoff.next_delay()
+        except QuarantineRequired:
+            self._enter(RestartState.QUARANTINED, now)
+            self.restart_at = None
+            return
+        self._enter(RestartState.BACKOFF, now)
+        self.restart_at = now + delay
+
+    def restart_due(self, now: float) -> bool:
+        """True once a scheduled restart should run."""
+        return self.state == RestartState.BACKOFF and now >= self.restart_at
+
+    def on_restarting(self, now: float):
+        """Registry began shutdown + start."""
+        self._enter(RestartState.RESTARTING, now)
+        self.restart_at = None
+        self.restarts += 1
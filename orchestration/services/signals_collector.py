@@ -10,14 +10,17 @@ envelopes for the consciousness bus:
 Features:
 - Deduplication (hash-based, 60s window)
 - Rate limiting (per-type cooldowns)
-- Disk backlog (replayed automatically when the membrane is reachable again)
-- Direct publish to the membrane WebSocket (no intermediate HTTP service)
+- Disk backlog: every accepted envelope is appended to a segment log
+  (signals_transport.SegmentBacklog) and acknowledged as "queued"
+- One long-lived WebSocket sender drains the log in batches and commits a
+  cursor, so an outage only grows the log (no per-envelope reconnects)
 
 Created: 2025-10-25 by Atlas (Infrastructure Engineer)
 Spec: Phase-A Autonomy - P3 Signals Collector MVP
 """
 
-from fastapi import FastAPI, Body, HTTPException
+from fastapi import FastAPI, Body, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 import uvicorn
 import os
@@ -25,8 +28,21 @@ import time
 import json
 import logging
 import hashlib
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Optional
+
+from orchestration.schemas.membrane_envelopes import (
+    EnvelopeValidator,
+    SignalEnvelope,
+    UnknownEnvelopeTypeError,
+)
+from orchestration.services.signals_transport import (
+    MembraneSender,
+    SegmentBacklog,
+    TimingWheel,
+    encode_envelope,
+)
 
 try:
     from websockets.sync.client import connect as ws_connect  # type: ignore
@@ -41,29 +57,36 @@ logger = logging.getLogger(__name__)
 APP_NAME = "signals_collector"
 PORT = 8010
 HEARTBEAT = Path(f".heartbeats/{APP_NAME}.heartbeat")
-HEARTBEAT.parent.mkdir(exist_ok=True)
 
-# Disk backlog for resilience
+# Disk backlog for resilience (segment log + committed cursor)
+# Opened on first use (service startup), never at import: opening recovers the
+# newest segment's tail, which must not happen under a running collector when
+# another process (queue_poller) only imports helpers from this module.
 BACKLOG_DIR = Path(".signals/backlog")
-BACKLOG_DIR.mkdir(parents=True, exist_ok=True)
+_backlog: Optional[SegmentBacklog] = None
+_sender: Optional[MembraneSender] = None
+_transport_lock = threading.Lock()
 
-# Deduplication cache (signal_hash -> timestamp)
-dedup_cache: Dict[str, float] = {}
+# Deduplication (signal_hash -> expiry, reclaimed by time bucket)
 DEDUP_WINDOW_SEC = 60.0  # 60 second dedup window
+dedup_cache = TimingWheel(horizon=DEDUP_WINDOW_SEC)
 
-# Rate limiting (signal_type -> last_sent_timestamp)
-rate_limit_cache: Dict[str, float] = {}
+# Rate limiting (signal_type -> cooldown expiry)
 RATE_LIMITS = {
     "console_error": 5.0,
     "screenshot": 10.0,
     "log_anomaly": 15.0,
     "script_error": 15.0,
 }
+rate_limit_cache = TimingWheel(horizon=max(RATE_LIMITS.values()))
 
-# Per-fingerprint rate limiting (fingerprint -> last_sent_timestamp)
-fingerprint_rate_limit_cache: Dict[str, float] = {}
+# Per-fingerprint rate limiting (fingerprint -> cooldown expiry)
 FINGERPRINT_RATE_LIMIT_SEC = 10.0  # Max 1 inject per 10s per unique fingerprint
 FINGERPRINT_JITTER_PERCENT = 0.1  # ±10% jitter to prevent thundering herd
+fingerprint_rate_limit_cache = TimingWheel(horizon=FINGERPRINT_RATE_LIMIT_SEC * (1 + FINGERPRINT_JITTER_PERCENT))
+
+# /ingest envelope schema (compiled once; raw bodies validated without a dict round-trip)
+INGEST_VALIDATOR = EnvelopeValidator({"membrane.inject": SignalEnvelope})
 
 # Membrane WebSocket endpoint
 from orchestration.config.graph_names import resolver
@@ -71,6 +94,25 @@ from orchestration.config.graph_names import resolver
 WS_ENDPOINT = "ws://127.0.0.1:8000/api/ws"
 DEFAULT_CITIZEN_ID = os.getenv("SIGNALS_DEFAULT_CITIZEN", resolver.citizen("felix"))
 
+
+def get_backlog() -> SegmentBacklog:
+    """The collector's segment backlog (opened on first call)."""
+    global _backlog
+    with _transport_lock:
+        if _backlog is None:
+            _backlog = SegmentBacklog(BACKLOG_DIR)
+        return _backlog
+
+
+def get_sender() -> MembraneSender:
+    """Single long-lived publisher draining the backlog (created on first call)."""
+    global _sender
+    backlog = get_backlog()
+    with _transport_lock:
+        if _sender is None:
+            _sender = MembraneSender(backlog, WS_ENDPOINT)
+        return _sender
+
 app = FastAPI(title="Signals Collector", version="1.0")
 
 
@@ -86,30 +128,14 @@ class ScreenshotSignal(BaseModel):
 
 
 def heartbeat_loop():
-    import threading
     def _loop():
-        consecutive_failures = 0
+        # Backlog draining and reconnect backoff live in MembraneSender
         while True:
             try:
                 HEARTBEAT.write_text(str(int(time.time())))
             except Exception:
                 pass
-            try:
-                # flush_backlog() returns None, check if backlog exists
-                flush_backlog()
-                consecutive_failures = 0  # Reset on success
-            except Exception as exc:
-                logger.debug(f"[SignalsCollector] Backlog flush skipped: {exc}")
-                consecutive_failures += 1
-
-            # Exponential backoff on failures (max 60s)
-            backlog_exists = len(list(BACKLOG_DIR.glob("stimulus_*.json"))) > 0
-            if backlog_exists and consecutive_failures > 0:
-                backoff = min(60, 5 * (2 ** consecutive_failures))
-                logger.warning(f"[SignalsCollector] Backlog retry backoff: {backoff}s (failures: {consecutive_failures})")
-                time.sleep(backoff)
-            else:
-                time.sleep(5)
+            time.sleep(5)
     thread = threading.Thread(target=_loop, daemon=True)
     thread.start()
 
@@ -120,26 +146,13 @@ def compute_signal_hash(signal_type: str, content: str) -> str:
 
 
 def is_duplicate(signal_hash: str) -> bool:
-    now = time.time()
-    expired = [h for h, ts in dedup_cache.items() if now - ts > DEDUP_WINDOW_SEC]
-    for h in expired:
-        del dedup_cache[h]
-    if signal_hash in dedup_cache:
-        return True
-    dedup_cache[signal_hash] = now
-    return False
+    return dedup_cache.check_and_add(signal_hash, DEDUP_WINDOW_SEC)
 
 
 def is_rate_limited(signal_type: str) -> bool:
     if signal_type not in RATE_LIMITS:
         return False
-    cooldown = RATE_LIMITS[signal_type]
-    now = time.time()
-    last_sent = rate_limit_cache.get(signal_type, 0)
-    if now - last_sent < cooldown:
-        return True
-    rate_limit_cache[signal_type] = now
-    return False
+    return rate_limit_cache.check_and_add(signal_type, RATE_LIMITS[signal_type])
 
 
 def is_fingerprint_rate_limited(fingerprint: str) -> bool:
@@ -155,25 +168,37 @@ def is_fingerprint_rate_limited(fingerprint: str) -> bool:
     jitter = random.uniform(-FINGERPRINT_JITTER_PERCENT, FINGERPRINT_JITTER_PERCENT)
     cooldown = FINGERPRINT_RATE_LIMIT_SEC * (1 + jitter)
 
-    now = time.time()
-    last_sent = fingerprint_rate_limit_cache.get(fingerprint, 0)
-
-    if now - last_sent < cooldown:
-        return True
-
-    fingerprint_rate_limit_cache[fingerprint] = now
-    return False
+    return fingerprint_rate_limit_cache.check_and_add(fingerprint, cooldown)
 
 
-def write_to_backlog(envelope: dict):
+def write_to_backlog(envelope) -> bool:
+    """Append envelope (dict, or already-encoded JSON bytes) to the segment backlog and wake the sender."""
     try:
-        metadata = envelope.get("metadata", {})
-        filename = f"stimulus_{int(time.time()*1000)}_{metadata.get('stimulus_id', 'unknown')}.json"
-        filepath = BACKLOG_DIR / filename
-        filepath.write_text(json.dumps(envelope, indent=2))
-        logger.info(f"[Backlog] Wrote: {filename}")
+        get_backlog().append(envelope if isinstance(envelope, bytes) else encode_envelope(envelope))
     except Exception as e:
         logger.error(f"[Backlog] Failed: {e}")
+        return False
+    get_sender().notify()
+    return True
+
+
+def migrate_legacy_backlog() -> int:
+    """
+    Move pre-segment backlog files (stimulus_*.json) into the segment log, oldest first.
+    """
+    files = sorted(BACKLOG_DIR.glob("stimulus_*.json"))
+    records = []
+    for backlog_file in files:
+        try:
+            records.append(encode_envelope(ensure_membrane_envelope(json.loads(backlog_file.read_text()))))
+        except Exception as exc:
+            logger.error(f"[Backlog] Corrupt entry {backlog_file.name}: {exc}")
+    get_backlog().append_many(records)
+    for backlog_file in files:
+        backlog_file.unlink(missing_ok=True)
+    if records:
+        logger.info(f"[Backlog] Migrated {len(records)} legacy backlog files")
+    return len(records)
 
 
 def build_membrane_envelope(
@@ -272,8 +297,10 @@ def ensure_membrane_envelope(payload: dict) -> dict:
 
 def send_envelope_over_ws(envelope: dict) -> bool:
     """
-    Publish envelope over the membrane WebSocket.
-    Opens a short-lived connection per send for resilience.
+    Publish one envelope over a short-lived membrane WebSocket connection.
+
+    For one-shot callers (queue_poller migration); the service itself
+    publishes through the long-lived MembraneSender.
     """
     if ws_connect is None:
         logger.error("[SignalsCollector] websockets package unavailable; cannot publish membrane.inject")
@@ -288,31 +315,9 @@ def send_envelope_over_ws(envelope: dict) -> bool:
         return True
     except Exception as exc:
         logger.warning(f"[SignalsCollector] WebSocket publish failed: {exc}")
-        time.sleep(1.0)  # Backoff to prevent tight loop on connection failures
         return False
 
 
-def flush_backlog():
-    """
-    Retry any envelopes that were previously backlogged.
-    Processes files oldest-first to preserve ordering semantics.
-    """
-    for backlog_file in sorted(BACKLOG_DIR.glob("stimulus_*.json")):
-        try:
-            raw_payload = json.loads(backlog_file.read_text())
-            envelope = ensure_membrane_envelope(raw_payload)
-        except Exception as exc:
-            logger.error(f"[Backlog] Corrupt entry {backlog_file.name}: {exc}")
-            backlog_file.unlink(missing_ok=True)
-            continue
-
-        if send_envelope_over_ws(envelope):
-            backlog_file.unlink(missing_ok=True)
-        else:
-            # Preserve ordering: stop once a publish fails
-            break
-
-
 def process_signal(
     signal_type: str,
     content: str,
@@ -351,19 +356,30 @@ def process_signal(
     )
     stimulus_id = envelope["metadata"]["stimulus_id"]
 
-    flush_backlog()
-
-    if send_envelope_over_ws(envelope):
-        return {"status": "published", "stimulus_id": stimulus_id}
-
-    write_to_backlog(envelope)
-    return {"status": "backlogged", "stimulus_id": stimulus_id}
+    if not write_to_backlog(envelope):
+        raise HTTPException(status_code=503, detail="Signal backlog unavailable")
+    return {"status": "queued", "stimulus_id": stimulus_id}
 
 
 @app.on_event("startup")
 def startup():
+    HEARTBEAT.parent.mkdir(exist_ok=True)
+    migrate_legacy_backlog()
+    get_sender().start()
     heartbeat_loop()
-    logger.info(f"[SignalsCollector] Started on port {PORT}")
+    logger.info(f"[SignalsCollector] Started on port {PORT} ({get_backlog().pending} backlogged)")
+
+
+@app.on_event("shutdown")
+def shutdown():
+    global _backlog, _sender
+    with _transport_lock:
+        sender, backlog = _sender, _backlog
+        _sender = _backlog = None
+    if sender is not None:
+        sender.stop()
+    if backlog is not None:
+        backlog.close()
 
 
 @app.get("/health")
@@ -425,18 +441,26 @@ def collect_screenshot(signal: ScreenshotSignal = Body(...)):
 
 
 @app.post("/ingest")
-def ingest_membrane_envelope(envelope: dict = Body(...)):
+async def ingest_membrane_envelope(request: Request):
     """
     Generic ingestion endpoint for full membrane.inject envelopes.
     Used by L2 logger and other graph-aware signal sources.
 
+    The body is validated straight from raw bytes (digest-cached, so retried
+    posts skip re-validation) and queued as received.
     Performs deduplication and per-fingerprint rate limiting before injection.
     """
+    raw = await request.body()
+
     # Validate envelope structure
-    if envelope.get("type") != "membrane.inject":
+    try:
+        envelope = INGEST_VALIDATOR.validate_json(raw)
+    except UnknownEnvelopeTypeError:
         raise HTTPException(status_code=400, detail="Envelope must be type 'membrane.inject'")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid membrane.inject envelope: {e}")
 
-    metadata = envelope.get("metadata", {})
+    metadata = envelope.metadata
     dedupe_key = metadata.get("dedupe_key")
     fingerprint = metadata.get("stack_fingerprint")
 
@@ -450,46 +474,29 @@ def ingest_membrane_envelope(envelope: dict = Body(...)):
         logger.debug(f"[FingerprintRateLimit] {fingerprint} cooling down")
         return {"status": "fingerprint_rate_limited", "fingerprint": fingerprint}
 
-    # Mark as seen for dedup
-    if dedupe_key:
-        dedup_cache[dedupe_key] = time.time()
-
-    # Attempt to flush backlog first
-    flush_backlog()
-
-    # Publish to membrane
-    if send_envelope_over_ws(envelope):
-        return {"status": "published", "stimulus_id": metadata.get("stimulus_id")}
-
-    # Backlog on failure
-    write_to_backlog(envelope)
-    return {"status": "backlogged", "stimulus_id": metadata.get("stimulus_id")}
+    # Queue for the sender (is_duplicate already marked the key as seen)
+    if not await run_in_threadpool(write_to_backlog, raw):
+        raise HTTPException(status_code=503, detail="Signal backlog unavailable")
+    return {"status": "queued", "stimulus_id": metadata.get("stimulus_id")}
 
 
 @app.get("/backlog/count")
 def get_backlog_count():
-    backlog_files = list(BACKLOG_DIR.glob("stimulus_*.json"))
-    return {"count": len(backlog_files), "backlog_dir": str(BACKLOG_DIR)}
+    backlog, sender = get_backlog(), get_sender()
+    return {
+        "count": backlog.pending,
+        "segments": backlog.segment_count,
+        "backlog_dir": str(BACKLOG_DIR),
+        "connected": sender.connected,
+    }
 
 
 @app.post("/backlog/flush")
 def flush_backlog():
-    backlog_files = list(BACKLOG_DIR.glob("stimulus_*.json"))
-    forwarded = 0
-    failed = 0
-    for filepath in backlog_files:
-        try:
-            payload = json.loads(filepath.read_text())
-            envelope = ensure_membrane_envelope(payload)
-            if send_envelope_over_ws(envelope):
-                filepath.unlink()
-                forwarded += 1
-            else:
-                failed += 1
-        except Exception as e:
-            logger.error(f"[BacklogFlush] Error: {e}")
-            failed += 1
-    return {"forwarded": forwarded, "failed": failed, "remaining": failed}
+    """Wake the sender; it drains the backlog in order over its open connection."""
+    backlog, sender = get_backlog(), get_sender()
+    sender.notify()
+    return {"forwarded": sender.stats.sent, "remaining": backlog.pending, "connected": sender.connected}
 
 
 if __name__ == "__main__":
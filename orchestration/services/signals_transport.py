@@ -0,0 +1,522 @@
+"""
+Signals Transport - backlog, sender and expiry state for the signals collector
+
+Every accepted envelope is appended to a SegmentBacklog; one long-lived
+MembraneSender drains it over a single WebSocket and advances a committed
+cursor after each batch. Delivery is at-least-once: after a disconnect the
+sender resumes from the last committed offset.
+
+Backlog layout (BACKLOG_DIR):
+- {base_offset:020d}.seg - append-only segments; base_offset is the logical
+  byte offset of the segment's first record
+- cursor.json - committed offset (everything before it was delivered)
+
+Record format: 4-byte big-endian payload length, 4-byte CRC32, payload
+(compact JSON). A torn record at the tail of the newest segment (crash
+mid-append) is truncated on open; segments wholly below the cursor are
+deleted as it advances.
+
+Dedupe and rate-limit state expire through a TimingWheel: entries sit in
+time buckets, so expiry touches only the buckets whose time has passed
+instead of rescanning every key.
+
+Author: Atlas (Infrastructure Engineer)
+Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import json
+import logging
+import math
+import os
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import websockets  # type: ignore
+except ImportError:  # pragma: no cover - dependency not installed
+    websockets = None
+
+logger = logging.getLogger(__name__)
+
+RECORD_HEADER = struct.Struct(">II")  # payload length, crc32
+SEGMENT_SUFFIX = ".seg"
+CURSOR_FILE = "cursor.json"
+DEFAULT_SEGMENT_BYTES = 8 * 1024 * 1024
+
+
+def encode_envelope(envelope: dict) -> bytes:
+    """Compact JSON bytes for one envelope (the backlog record payload)."""
+    return json.dumps(envelope, separators=(",", ":")).encode("utf-8")
+
+
+@dataclass
+class BacklogBatch:
+    """Records read from the backlog, with the offsets they span."""
+
+    records: List[bytes]
+    start_offset: int
+    end_offset: int
+
+
+class SegmentBacklog:
+    """
+    Append-only, length-prefixed segment log with a committed-offset cursor.
+
+    Thread-safe: appends come from request handlers, reads and commits from
+    the sender. Offsets are logical byte positions across all segments.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        fsync: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._committed = self._load_cursor()
+        self._bases = sorted(
+            int(path.stem) for path in self.directory.glob(f"*{SEGMENT_SUFFIX}") if path.stem.isdigit()
+        )
+        if not self._bases:
+            self._bases = [self._committed]
+        self._end = self._bases[-1] + self._recover_tail(self._bases[-1])
+        self._committed = min(max(self._committed, self._bases[0]), self._end)
+        self._active = self._segment_path(self._bases[-1]).open("ab")
+        self._read_offset = self._committed
+        self._reader = None  # (base, file handle) of the segment being read
+        self._pending = self._count_records(self._committed)
+
+    # --- Layout helpers ---
+
+    def _segment_path(self, base: int) -> Path:
+        return self.directory / f"{base:020d}{SEGMENT_SUFFIX}"
+
+    def _load_cursor(self) -> int:
+        try:
+            return int(json.loads((self.directory / CURSOR_FILE).read_text())["offset"])
+        except FileNotFoundError:
+            return 0
+        except Exception as exc:
+            logger.error(f"[Backlog] Unreadable cursor, replaying from the oldest segment: {exc}")
+            return 0
+
+    def _recover_tail(self, base: int) -> int:
+        """Validate the newest segment, truncating a torn tail. Returns its valid length."""
+        path = self._segment_path(base)
+        if not path.exists():
+            path.touch()
+            return 0
+        data = path.read_bytes()
+        position = 0
+        while position + RECORD_HEADER.size <= len(data):
+            length, crc = RECORD_HEADER.unpack_from(data, position)
+            payload = data[position + RECORD_HEADER.size:position + RECORD_HEADER.size + length]
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                break
+            position += RECORD_HEADER.size + length
+        if position < len(data):
+            logger.warning(f"[Backlog] Truncating torn tail of {path.name} at byte {position}")
+            with path.open("r+b") as fh:
+                fh.truncate(position)
+        return position
+
+    def _count_records(self, offset: int) -> int:
+        """Count records from offset to the end (headers only)."""
+        count = 0
+        index = max(bisect.bisect_right(self._bases, offset) - 1, 0)
+        for i, base in enumerate(self._bases[index:], start=index):
+            limit = (self._bases[i + 1] if i + 1 < len(self._bases) else self._end) - base
+            position = max(offset - base, 0)
+            with self._segment_path(base).open("rb") as fh:
+                while position + RECORD_HEADER.size <= limit:
+                    fh.seek(position)
+                    length, _ = RECORD_HEADER.unpack(fh.read(RECORD_HEADER.size))
+                    position += RECORD_HEADER.size + length
+                    count += 1
+        return count
+
+    # --- Writing ---
+
+    def append(self, payload: bytes) -> int:
+        """Append one record. Returns its offset."""
+        return self.append_many([payload])[0]
+
+    def append_many(self, payloads: Iterable[bytes]) -> List[int]:
+        """Append records with one write. Returns their offsets."""
+        chunks, offsets = [], []
+        with self._lock:
+            position = self._end
+            for payload in payloads:
+                offsets.append(position)
+                chunks.append(RECORD_HEADER.pack(len(payload), zlib.crc32(payload)))
+                chunks.append(payload)
+                position += RECORD_HEADER.size + len(payload)
+            if not offsets:
+                return offsets
+            self._active.write(b"".join(chunks))
+            self._active.flush()
+            if self.fsync:
+                os.fsync(self._active.fileno())
+            self._end = position
+            self._pending += len(offsets)
+            if self._end - self._bases[-1] >= self.segment_bytes:
+                self._rotate()
+        return offsets
+
+    def _rotate(self) -> None:
+        self._active.close()
+        self._bases.append(self._end)
+        self._active = self._segment_path(self._end).open("ab")
+
+    # --- Reading ---
+
+    def read(self, max_records: int) -> BacklogBatch:
+        """Read up to max_records after the read position (advances it, not the cursor)."""
+        records: List[bytes] = []
+        with self._lock:
+            start = offset = self._read_offset
+            while len(records) < max_records and offset < self._end:
+                index = bisect.bisect_right(self._bases, offset) - 1
+                base = self._bases[index]
+                limit = self._bases[index + 1] if index + 1 < len(self._bases) else self._end
+                if offset >= limit:  # past the end of a sealed segment
+                    offset = self._bases[index + 1]
+                    continue
+                fh = self._reader_for(base)
+                fh.seek(offset - base)
+                header = fh.read(RECORD_HEADER.size)
+                length, crc = RECORD_HEADER.unpack(header)
+                payload = fh.read(length)
+                next_offset = offset + RECORD_HEADER.size + length
+                if len(payload) < length or zlib.crc32(payload) != crc or next_offset > limit:
+                    logger.error(f"[Backlog] Corrupt record at offset {offset}; skipping rest of segment {base}")
+                    offset = limit
+                    continue
+                records.append(payload)
+                offset = next_offset
+            self._read_offset = offset
+        return BacklogBatch(records, start, offset)
+
+    def _reader_for(self, base: int):
+        if self._reader is None or self._reader[0] != base:
+            if self._reader is not None:
+                self._reader[1].close()
+            self._reader = (base, self._segment_path(base).open("rb"))
+        return self._reader[1]
+
+    def has_unread(self) -> bool:
+        with self._lock:
+            return self._read_offset < self._end
+
+    def rewind(self) -> None:
+        """Move the read position back to the committed cursor (after a failed send)."""
+        with self._lock:
+            self._read_offset = self._committed
+
+    def commit(self, batch: BacklogBatch) -> None:
+        """Mark a batch delivered: persist the cursor and drop fully delivered segments."""
+        with self._lock:
+            if batch.start_offset != self._committed or batch.end_offset <= self._committed:
+                return  # stale batch (read before a rewind)
+            self._committed = batch.end_offset
+            self._pending -= len(batch.records)
+            self._write_cursor()
+            while len(self._bases) > 1 and self._bases[1] <= self._committed:
+                base = self._bases.pop(0)
+                if self._reader is not None and self._reader[0] == base:
+                    self._reader[1].close()
+                    self._reader = None
+                self._segment_path(base).unlink(missing_ok=True)
+
+    def _write_cursor(self) -> None:
+        tmp = self.directory / f"{CURSOR_FILE}.tmp"
+        with tmp.open("w") as fh:
+            fh.write(json.dumps({"offset": self._committed}))
+            if self.fsync:
+                fh.flush()
+                os.fsync(fh.fileno())
+        os.replace(tmp, self.directory / CURSOR_FILE)
+
+    # --- Status ---
+
+    @property
+    def pending(self) -> int:
+        """Records appended but not yet committed."""
+        return self._pending
+
+    @property
+    def committed_offset(self) -> int:
+        return self._committed
+
+    @property
+    def end_offset(self) -> int:
+        return self._end
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._bases)
+
+    def close(self) -> None:
+        with self._lock:
+            self._active.close()
+            if self._reader is not None:
+                self._reader[1].close()
+                self._reader = None
+
+
+class TimingWheel:
+    """
+    Keys that expire after a TTL, reclaimed through time buckets.
+
+    Each key lands in the bucket of its deadline; advancing the clock
+    expires only the buckets that have passed. Lookups compare the exact
+    deadline, so bucket resolution affects memory reclamation, not answers.
+    Thread-safe (request handlers share one wheel).
+    """
+
+    def __init__(self, horizon: float, resolution: float = 1.0) -> None:
+        """
+        Args:
+            horizon: Longest TTL the wheel accepts (seconds)
+            resolution: Bucket width (seconds)
+        """
+        self.horizon = horizon
+        self.resolution = resolution
+        self._buckets: List[List[str]] = [[] for _ in range(int(math.ceil(horizon / resolution)) + 2)]
+        self._deadlines: Dict[str, float] = {}
+        self._tick: Optional[int] = None  # buckets up to here have been expired
+        self._lock = threading.Lock()
+
+    def _advance(self, now: float) -> None:
+        tick = int(now // self.resolution) - 1  # last tick that is fully in the past
+        if self._tick is None or tick >= self._tick + len(self._buckets):
+            if self._tick is not None:
+                # Clock jumped past the whole wheel: keep only keys still alive
+                self._deadlines = {k: d for k, d in self._deadlines.items() if d >= now}
+                for bucket in self._buckets:
+                    bucket.clear()
+                for key, deadline in self._deadlines.items():
+                    self._bucket_for(deadline).append(key)
+            self._tick = tick
+            return
+        while self._tick < tick:
+            self._tick += 1
+            bucket = self._buckets[self._tick % len(self._buckets)]
+            for key in bucket:
+                deadline = self._deadlines.get(key)
+                if deadline is not None and int(deadline // self.resolution) <= self._tick:
+                    del self._deadlines[key]
+            bucket.clear()
+
+    def _bucket_for(self, deadline: float) -> List[str]:
+        return self._buckets[int(deadline // self.resolution) % len(self._buckets)]
+
+    def add(self, key: str, ttl: float, now: Optional[float] = None) -> None:
+        """Set key to expire ttl seconds from now (replacing any earlier deadline)."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._advance(now)
+            self._add(key, ttl, now)
+
+    def _add(self, key: str, ttl: float, now: float) -> None:
+        if ttl > self.horizon:
+            raise ValueError(f"ttl {ttl}s exceeds wheel horizon {self.horizon}s")
+        deadline = now + ttl
+        self._deadlines[key] = deadline
+        self._bucket_for(deadline).append(key)
+
+    def _alive(self, key: str, now: float) -> bool:
+        deadline = self._deadlines.get(key)
+        return deadline is not None and now < deadline
+
+    def alive(self, key: str, now: Optional[float] = None) -> bool:
+        """True if key was added and its deadline has not passed."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._advance(now)
+            return self._alive(key, now)
+
+    def check_and_add(self, key: str, ttl: float, now: Optional[float] = None) -> bool:
+        """True if key is alive; otherwise add it with ttl and return False."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._advance(now)
+            if self._alive(key, now):
+                return True
+            self._add(key, ttl, now)
+            return False
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+
+@dataclass
+class SenderStats:
+    sent: int = 0
+    batches: int = 0
+    connects: int = 0
+    failures: int = 0
+    last_error: Optional[str] = field(default=None)
+
+
+class MembraneSender:
+    """
+    Long-lived WebSocket publisher that drains a SegmentBacklog.
+
+    Runs its own event loop on a daemon thread. Records are sent in batches
+    over one connection and the backlog cursor is committed once per batch;
+    on disconnect the backlog is rewound to the cursor and the sender
+    reconnects with exponential backoff. Frames the server pushes back
+    (acks, snapshots, events) are read and discarded so the connection's
+    receive queue never fills and keepalive pongs keep being processed.
+    """
+
+    def __init__(
+        self,
+        backlog: SegmentBacklog,
+        endpoint: str,
+        *,
+        batch_size: int = 500,
+        open_timeout: float = 2.0,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        idle_wait: float = 5.0,
+        ping_interval: Optional[float] = 20.0,
+    ) -> None:
+        self.backlog = backlog
+        self.endpoint = endpoint
+        self.batch_size = batch_size
+        self.open_timeout = open_timeout
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.idle_wait = idle_wait
+        self.ping_interval = ping_interval
+        self.stats = SenderStats()
+        self.connected = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._stopping = False
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the sender thread (idempotent)."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=lambda: asyncio.run(self.run()), name="membrane-sender", daemon=True)
+        self._thread.start()
+        self._ready.wait(5.0)
+
+    def notify(self) -> None:
+        """Wake the sender after an append (thread-safe; no-op once stopped)."""
+        if not self._stopping and self._wake is not None:
+            self._call_soon(self._wake.set)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stopping = True
+        if self._stop is not None:
+            self._call_soon(self._wake_for_stop)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _call_soon(self, callback) -> None:
+        """Schedule callback on the sender loop; dropped if the loop has exited."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(callback)
+        except RuntimeError:
+            pass  # loop closed between the check and the call
+
+    def _wake_for_stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    async def run(self) -> None:
+        """Connect, drain, reconnect - until stop()."""
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._stop = asyncio.Event()
+        self._ready.set()
+        if websockets is None:
+            logger.error("[SignalsCollector] websockets package unavailable; backlog will not drain")
+            return
+
+        backoff = self.initial_backoff
+        while not self._stopping:
+            try:
+                async with websockets.connect(
+                    self.endpoint,
+                    open_timeout=self.open_timeout,
+                    max_size=None,
+                    ping_interval=self.ping_interval,
+                    ping_timeout=self.ping_interval,
+                ) as ws:
+                    self.connected = True
+                    self.stats.connects += 1
+                    backoff = self.initial_backoff
+                    reader = asyncio.create_task(self._discard_inbound(ws))
+                    try:
+                        await self._drain(ws)
+                    finally:
+                        reader.cancel()
+            except Exception as exc:
+                self.stats.failures += 1
+                self.stats.last_error = str(exc)
+                logger.warning(f"[SignalsCollector] WebSocket publish failed ({self.backlog.pending} pending): {exc}")
+            finally:
+                self.connected = False
+                self.backlog.rewind()
+            if self._stopping:
+                break
+            # Appends do not cut the backoff short; only stop() does
+            await self._sleep(backoff, self._stop)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    async def _drain(self, ws) -> None:
+        while not self._stopping:
+            batch = self.backlog.read(self.batch_size)
+            if not batch.records:
+                self._wake.clear()
+                if not self.backlog.has_unread():
+                    await self._sleep(self.idle_wait, self._wake)
+                continue
+            for record in batch.records:
+                await ws.send(record.decode("utf-8"))
+            self.backlog.commit(batch)
+            self.stats.sent += len(batch.records)
+            self.stats.batches += 1
+
+    @staticmethod
+    async def _discard_inbound(ws) -> None:
+        """Read and drop server frames until the connection closes."""
+        try:
+            async for _ in ws:
+                pass
+        except websockets.ConnectionClosed:
+            pass
+
+    @staticmethod
+    async def _sleep(seconds: float, event: asyncio.Event) -> None:
+        """Sleep until event is set or the timeout."""
+        try:
+            await asyncio.wait_for(event.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
@@ -10,6 +10,9 @@ Usage:
     heartbeat = HeartbeatWriter("consciousness_engine")
     heartbeat.start()
 
+    # Optional: extra fields refreshed on every heartbeat
+    heartbeat = HeartbeatWriter("conversation_watcher", metadata_fn=lambda: {"queue": 3})
+
     # Your main loop here
 
     heartbeat.stop()
@@ -24,7 +27,7 @@ import logging
 import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -32,14 +35,16 @@ logger = logging.getLogger(__name__)
 class HeartbeatWriter:
     """Writes heartbeat file to signal this process is alive."""
 
-    def __init__(self, component_name: str):
+    def __init__(self, component_name: str, metadata_fn: Optional[Callable[[], Dict[str, Any]]] = None):
         """
         Initialize heartbeat writer.
 
         Args:
             component_name: Component identifier (e.g., "consciousness_engine", "conversation_watcher")
+            metadata_fn: Optional callable returning extra fields for each heartbeat
         """
         self.component_name = component_name
+        self.metadata_fn = metadata_fn
         self.heartbeat_dir = Path(__file__).parent.parent / ".heartbeats"
         self.heartbeat_path = self.heartbeat_dir / f"{component_name}.heartbeat"
         self.running = False
@@ -73,12 +78,21 @@ class HeartbeatWriter:
         except Exception as e:
             logger.error(f"[Heartbeat] Failed to write {self.component_name}: {e}")
 
+    def _metadata(self) -> Dict[str, Any]:
+        if self.metadata_fn is None:
+            return {}
+        try:
+            return self.metadata_fn()
+        except Exception as e:
+            logger.error(f"[Heartbeat] Metadata for {self.component_name} failed: {e}")
+            return {}
+
     async def heartbeat_loop(self):
         """Background loop that writes heartbeats every 10 seconds."""
         logger.info(f"[Heartbeat] Starting heartbeat writer for {self.component_name}")
 
         while self.running:
-            await self.write_heartbeat()
+            await self.write_heartbeat(**self._metadata())
 
             # Sleep in 1s chunks for responsive shutdown
             for _ in range(10):
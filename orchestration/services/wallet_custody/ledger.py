@@ -4,19 +4,41 @@ Append-only ledger for wallet custody operations.
 The ledger captures attestations and transfer signatures without exposing
 private key material. Each entry is written as a JSON line to the configured
 ledger path.
+
+GroupCommitLedger is the durable variant: one writer thread keeps the
+active segment open and batches concurrent appends into a single
+write + fsync (an append returns only once its batch is on disk). Segments
+rotate by size next to the configured path (ledger.000001.jsonl, ...; an
+existing ledger.jsonl is read as the oldest segment). Each segment has a
+sidecar index (<segment>.idx) of fixed-width records - offset, length,
+timestamp, wallet hash - so per-wallet lookups, time-range queries and tail
+reads seek straight to the entries. Indexes are written after the data
+fsync and rebuilt from the data on open if they fall behind; a torn record
+at the end of the newest segment (crash mid-write) is truncated on open.
 """
 
 from __future__ import annotations
 
+import bisect
+import hashlib
 import json
 import logging
-from dataclasses import asdict, dataclass
+import os
+import queue
+import struct
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+INDEX_RECORD = struct.Struct(">QIdQ")  # offset, length, created_at epoch, wallet hash
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+
 
 @dataclass
 class LedgerEntry:
@@ -38,9 +60,17 @@ class LedgerEntry:
             created_at=datetime.now(timezone.utc).isoformat(),
         )
 
+    @classmethod
+    def from_json(cls, line: str) -> "LedgerEntry":
+        return cls(**json.loads(line))
+
     def to_json(self) -> str:
         return json.dumps(asdict(self))
 
+    @property
+    def timestamp(self) -> float:
+        return _epoch(self.created_at)
+
 
 class Ledger:
     """Simple append-only ledger backed by a JSONL file."""
@@ -54,3 +84,352 @@ class Ledger:
         with self._path.open("a", encoding="utf-8") as fh:
             fh.write(line + "\n")
         logger.debug("Ledger appended: %s %s", entry.entry_type, entry.wallet_id)
+
+
+def _epoch(created_at: str) -> float:
+    return datetime.fromisoformat(created_at).timestamp()
+
+
+def _wallet_hash(wallet_id: str) -> int:
+    return int.from_bytes(hashlib.blake2b(wallet_id.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+@dataclass
+class _Segment:
+    """One ledger file plus its in-memory index."""
+
+    path: Path
+    size: int = 0
+    offsets: List[int] = field(default_factory=list)
+    lengths: List[int] = field(default_factory=list)
+    timestamps: List[float] = field(default_factory=list)
+    max_timestamps: List[float] = field(default_factory=list)  # running max, for bisecting "since"
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_name(self.path.name + ".idx")
+
+    def add(self, offset: int, length: int, timestamp: float) -> None:
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.timestamps.append(timestamp)
+        self.max_timestamps.append(max(timestamp, self.max_timestamps[-1]) if self.max_timestamps else timestamp)
+
+
+@dataclass
+class _PendingAppend:
+    line: bytes
+    wallet_id: str
+    timestamp: float
+    future: Future
+
+
+class GroupCommitLedger:
+    """
+    Durable, indexed ledger with group commit and segment rotation.
+
+    Drop-in for Ledger (same constructor path and append()). append() blocks
+    until the entry is fsynced; submit() returns a Future for callers that
+    should not block (await it with asyncio.wrap_future).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        batch_window: float = 0.0,
+        max_batch: int = 1024,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+    ) -> None:
+        """
+        Args:
+            path: Ledger path (e.g. data/wallet_custody/ledger.jsonl)
+            batch_window: Extra seconds the writer waits to grow a batch; 0
+                batches whatever queued up during the previous fsync
+            max_batch: Most entries per write + fsync
+            segment_bytes: Rotate the active segment past this size
+        """
+        self._path = path
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.segment_bytes = segment_bytes
+        self.fsync_count = 0
+        self._lock = threading.Lock()  # guards segments and the wallet map
+        self._segments: List[_Segment] = []
+        self._wallets: Dict[int, List[Tuple[int, int]]] = {}  # wallet hash -> (segment, position)
+        self._read_fds: Dict[int, int] = {}
+        self._load_segments()
+        active = self._segments[-1]
+        self._fd = os.open(active.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        self._index_fh = active.index_path.open("ab")
+        self._queue: "queue.Queue[Optional[_PendingAppend]]" = queue.Queue()
+        self._closed = False
+        self._stopped = False  # writer thread exited
+        self._submit_lock = threading.Lock()  # orders submit() against the writer stopping
+        self._writer = threading.Thread(target=self._write_loop, name="ledger-group-commit", daemon=True)
+        self._writer.start()
+
+    # ------------------------------------------------------------------ open / recovery
+
+    def _numbered_path(self, number: int) -> Path:
+        return self._path.with_name(f"{self._path.stem}.{number:06d}{self._path.suffix}")
+
+    def _segment_number(self, path: Path) -> int:
+        return int(path.name[len(self._path.stem) + 1:-len(self._path.suffix) or None])
+
+    def _load_segments(self) -> None:
+        numbered = sorted(
+            (p for p in self._path.parent.glob(f"{self._path.stem}.[0-9]*{self._path.suffix}")
+             if p.name[len(self._path.stem) + 1:-len(self._path.suffix) or None].isdigit()),
+            key=self._segment_number,
+        )
+        paths = ([self._path] if self._path.exists() else []) + numbered
+        if not numbered:
+            paths.append(self._numbered_path(1))
+            paths[-1].touch()
+
+        for number, path in enumerate(paths):
+            segment = _Segment(path)
+            size = path.stat().st_size
+            if number == len(paths) - 1:
+                size = self._truncate_torn_tail(path, size)
+            segment.size = size
+            self._load_index(number, segment)
+            self._segments.append(segment)
+
+    @staticmethod
+    def _truncate_torn_tail(path: Path, size: int) -> int:
+        """Cut the newest segment back to its last complete (newline-terminated) line."""
+        valid = 0
+        with path.open("rb") as fh:
+            position = size
+            while position > 0:
+                start = max(0, position - 64 * 1024)
+                fh.seek(start)
+                newline = fh.read(position - start).rfind(b"\n")
+                if newline != -1:
+                    valid = start + newline + 1
+                    break
+                position = start
+        if valid < size:
+            logger.warning("Ledger %s: truncating torn tail (%d -> %d bytes)", path.name, size, valid)
+            with path.open("r+b") as fh:
+                fh.truncate(valid)
+                os.fsync(fh.fileno())
+        return valid
+
+    def _load_index(self, number: int, segment: _Segment) -> None:
+        """Load the sidecar index, then index any data past it (crash or legacy file)."""
+        index_bytes = segment.index_path.read_bytes() if segment.index_path.exists() else b""
+        usable = len(index_bytes) - len(index_bytes) % INDEX_RECORD.size
+        next_offset = 0
+        for offset, length, timestamp, wallet in INDEX_RECORD.iter_unpack(index_bytes[:usable]):
+            if offset != next_offset or offset + length > segment.size:
+                break
+            self._index(number, segment, offset, length, timestamp, wallet)
+            next_offset = offset + length
+        kept = len(segment.offsets) * INDEX_RECORD.size
+        if kept != len(index_bytes):
+            with segment.index_path.open("r+b" if segment.index_path.exists() else "wb") as fh:
+                fh.truncate(kept)
+
+        if next_offset < segment.size:
+            rebuilt = []
+            with segment.path.open("rb") as fh:
+                fh.seek(next_offset)
+                for line in fh:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        entry = LedgerEntry.from_json(line.decode("utf-8"))
+                    except (ValueError, TypeError) as exc:
+                        logger.error("Ledger %s: skipping unparseable entry at %d: %s", segment.path.name, next_offset, exc)
+                        next_offset += len(line)
+                        continue
+                    record = (next_offset, len(line), entry.timestamp, _wallet_hash(entry.wallet_id))
+                    self._index(number, segment, *record)
+                    rebuilt.append(INDEX_RECORD.pack(*record))
+                    next_offset += len(line)
+            with segment.index_path.open("ab") as fh:
+                fh.write(b"".join(rebuilt))
+            logger.info("Ledger %s: indexed %d entries from data", segment.path.name, len(rebuilt))
+
+    def _index(self, number: int, segment: _Segment, offset: int, length: int, timestamp: float, wallet: int) -> None:
+        self._wallets.setdefault(wallet, []).append((number, len(segment.offsets)))
+        segment.add(offset, length, timestamp)
+
+    # ------------------------------------------------------------------ writing
+
+    def submit(self, entry: LedgerEntry) -> Future:
+        """Queue entry for the next group commit; the Future resolves once it is fsynced."""
+        future: Future = Future()
+        line = (entry.to_json() + "\n").encode("utf-8")
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("Ledger is closed")
+            if self._stopped:
+                raise RuntimeError("Ledger writer has stopped")
+            self._queue.put(_PendingAppend(line, entry.wallet_id, entry.timestamp, future))
+        return future
+
+    def append(self, entry: LedgerEntry) -> None:
+        self.submit(entry).result()
+        logger.debug("Ledger appended: %s %s", entry.entry_type, entry.wallet_id)
+
+    def _write_loop(self) -> None:
+        try:
+            while True:
+                first = self._queue.get()
+                if first is None:
+                    return
+                batch = [first]
+                deadline = time.monotonic() + self.batch_window
+                while len(batch) < self.max_batch:
+                    try:
+                        remaining = deadline - time.monotonic()
+                        item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        self._queue.put(None)  # finish this batch, then stop
+                        break
+                    batch.append(item)
+                try:
+                    self._commit(batch)
+                except Exception as exc:
+                    # Index write or rotation failed; fail the batch, keep the writer alive
+                    logger.error("Ledger commit failed: %s", exc)
+                    self._fail(batch, exc)
+        finally:
+            # Never leave a caller blocked on a Future nobody will resolve
+            with self._submit_lock:
+                self._stopped = True
+                pending = []
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        pending.append(item)
+            self._fail(pending, RuntimeError("Ledger writer has stopped"))
+
+    @staticmethod
+    def _fail(batch: List[_PendingAppend], exc: BaseException) -> None:
+        for item in batch:
+            if not item.future.done():
+                item.future.set_exception(exc)
+
+    def _commit(self, batch: List[_PendingAppend]) -> None:
+        number = len(self._segments) - 1
+        segment = self._segments[number]
+        data = b"".join(item.line for item in batch)
+        try:
+            written = os.write(self._fd, data)
+            while written < len(data):
+                written += os.write(self._fd, data[written:])
+            os.fsync(self._fd)
+            self.fsync_count += 1
+        except OSError as exc:
+            # Leave no partial batch behind; callers see the error
+            try:
+                os.ftruncate(self._fd, segment.size)
+            except OSError:
+                pass
+            self._fail(batch, exc)
+            return
+
+        records = []
+        offset = segment.size
+        with self._lock:
+            for item in batch:
+                record = (offset, len(item.line), item.timestamp, _wallet_hash(item.wallet_id))
+                self._index(number, segment, *record)
+                records.append(INDEX_RECORD.pack(*record))
+                offset += len(item.line)
+            segment.size = offset
+        self._index_fh.write(b"".join(records))
+        self._index_fh.flush()
+        for item in batch:
+            item.future.set_result(None)
+
+        if segment.size >= self.segment_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        os.close(self._fd)
+        self._index_fh.close()
+        segment = _Segment(self._numbered_path(self._segment_number(self._segments[-1].path) + 1))
+        self._fd = os.open(segment.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        self._index_fh = segment.index_path.open("ab")
+        with self._lock:
+            self._segments.append(segment)
+
+    def close(self) -> None:
+        """Commit everything queued, then stop the writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+        os.close(self._fd)
+        self._index_fh.close()
+        for fd in self._read_fds.values():
+            os.close(fd)
+        self._read_fds.clear()
+
+    # ------------------------------------------------------------------ reading
+
+    def _read(self, number: int, position: int) -> LedgerEntry:
+        segment = self._segments[number]
+        fd = self._read_fds.get(number)
+        if fd is None:
+            with self._lock:
+                fd = self._read_fds.get(number)
+                if fd is None:
+                    fd = self._read_fds[number] = os.open(segment.path, os.O_RDONLY)
+        line = os.pread(fd, segment.lengths[position], segment.offsets[position])
+        return LedgerEntry.from_json(line.decode("utf-8"))
+
+    def entries_for_wallet(self, wallet_id: str, since: Optional[float] = None) -> List[LedgerEntry]:
+        """Entries for wallet_id in append order (optionally created at/after epoch `since`)."""
+        with self._lock:
+            locations = list(self._wallets.get(_wallet_hash(wallet_id), ()))
+            if since is not None:
+                locations = [(n, i) for n, i in locations if self._segments[n].timestamps[i] >= since]
+        entries = (self._read(n, i) for n, i in locations)
+        return [entry for entry in entries if entry.wallet_id == wallet_id]
+
+    def entries_since(self, since: float) -> List[LedgerEntry]:
+        """Entries created at/after epoch `since`, in append order."""
+        locations = []
+        with self._lock:
+            for number, segment in enumerate(self._segments):
+                if not segment.max_timestamps or segment.max_timestamps[-1] < since:
+                    continue
+                start = bisect.bisect_left(segment.max_timestamps, since)
+                locations += [(number, i) for i in range(start, len(segment.offsets))
+                              if segment.timestamps[i] >= since]
+        return [self._read(n, i) for n, i in locations]
+
+    def tail(self, count: int) -> List[LedgerEntry]:
+        """The last `count` entries, oldest first."""
+        locations: List[Tuple[int, int]] = []
+        with self._lock:
+            for number in range(len(self._segments) - 1, -1, -1):
+                needed = count - len(locations)
+                if needed <= 0:
+                    break
+                size = len(self._segments[number].offsets)
+                locations = [(number, i) for i in range(max(0, size - needed), size)] + locations
+        return [self._read(n, i) for n, i in locations]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(segment.offsets) for segment in self._segments)
+
+    @property
+    def segment_paths(self) -> List[Path]:
+        with self._lock:
+            return [segment.path for segment in self._segments]
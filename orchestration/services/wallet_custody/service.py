@@ -23,7 +23,7 @@ from orchestration.adapters.api.control_api import websocket_manager
 from .capability_tokens import CapabilityTokenValidator
 from .config import WalletCustodySettings
 from .keyring_manager import MasterKeyMaterial, VaultKeyring
-from .ledger import Ledger, LedgerEntry
+from .ledger import GroupCommitLedger, LedgerEntry
 from .solana_client import (
     SolanaRpcError,
     create_client,
@@ -61,7 +61,7 @@ class WalletCustodyService:
         self._keyring = VaultKeyring(settings)
         self._master: MasterKeyMaterial = self._keyring.ensure_master_keypair()
         self._vault = WalletVault(settings.vault_dir, self._master.public_key)
-        self._ledger = Ledger(settings.ledger_path)
+        self._ledger = GroupCommitLedger(settings.ledger_path)
         self._cap_validator = CapabilityTokenValidator(settings)
         self._client: Client = create_client(settings.helius_rpc_url)
         self._mind_mint_pubkey: Optional[Pubkey] = (
@@ -96,10 +96,12 @@ class WalletCustodyService:
         except Exception as exc:  # pragma: no cover - defensive
             logger.error("[WCS] Failed to broadcast event %s: %s", event.get("type"), exc)
 
-    def _append_ledger(self, entry_type: str, wallet_id: str, payload: Dict[str, Any]) -> None:
+    async def _append_ledger(self, entry_type: str, wallet_id: str, payload: Dict[str, Any]) -> None:
+        # Await the group commit instead of blocking the loop on fsync, so
+        # concurrent handlers share one write + fsync
         try:
             entry = LedgerEntry.create(entry_type, wallet_id, payload)
-            self._ledger.append(entry)
+            await asyncio.wrap_future(self._ledger.submit(entry))
         except Exception as exc:  # pragma: no cover - ledger must not crash service
             logger.error("[WCS] Failed to append ledger entry: %s", exc)
 
@@ -127,7 +129,7 @@ class WalletCustodyService:
                 origin_chain=payload.get("origin_chain"),
             )
             created = True
-            self._append_ledger(
+            await self._append_ledger(
                 "wallet.created",
                 wallet_id,
                 {"org": org, "subject": request.subject, "id": request.identifier},
@@ -239,7 +241,7 @@ class WalletCustodyService:
             },
         }
 
-        self._append_ledger(
+        await self._append_ledger(
             "wallet.transfer",
             payload["from"],
             {
@@ -356,7 +358,7 @@ class WalletCustodyService:
             "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         }
 
-        self._append_ledger(
+        await self._append_ledger(
             "wallet.signature",
             wallet_id,
             {
@@ -11,10 +11,11 @@ Monitors:
 - consciousness/**/*.md
 
 On file create/modify:
-1. Check if Code/Documentation node exists in N2
-2. If not → create node with auto_created flag
-3. If exists → update last_modified timestamp
-4. Nodes get enriched manually or via periodic enrichment tool
+1. Event is coalesced per path (bursts from checkouts/refactors collapse)
+2. Batch is upserted with one UNWIND ... MERGE per node type
+3. Missing nodes are created with auto_created flag
+4. Existing nodes get last_modified timestamp
+5. Nodes get enriched manually or via periodic enrichment tool
 
 Author: Ada "Bridgekeeper" (extending Felix's file watcher pattern)
 Date: 2025-10-19
@@ -22,17 +23,23 @@ Date: 2025-10-19
 
 import asyncio
 import logging
+import os
 import sys
+import threading
+import time
 from pathlib import Path
-from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
 # Add parent for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 import redis
 
+from orchestration.libs.utils.falkordb_adapter import cypher_params_header
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -54,51 +61,217 @@ WATCH_DIRS = [
 ]
 
 
-class CodeSubstrateHandler(FileSystemEventHandler):
-    """Handles code/doc file changes by auto-creating nodes in N2."""
+# Node type per watched suffix (language for Code nodes)
+CODE_LANGUAGES = {'.py': 'python', '.ts': 'typescript', '.tsx': 'typescript'}
+DOC_SUFFIXES = {'.md'}
+
+# Batched upserts: one round trip per node type per batch. MERGE on file_path
+# creates missing nodes with the auto_created fields and stamps existing ones.
+CODE_UPSERT_QUERY = """
+UNWIND $rows AS row
+MERGE (n:Code {file_path: row.file_path})
+ON CREATE SET
+    n.name = row.name,
+    n.language = row.language,
+    n.purpose = '[Auto-created - needs enrichment]',
+    n.description = row.description,
+    n.node_type = 'Code',
+    n.base_weight = 0.5,
+    n.decay_rate = 0.95,
+    n.reinforcement_weight = 0.0,
+    n.created_at = timestamp(),
+    n.valid_at = timestamp(),
+    n.confidence = 0.7,
+    n.formation_trigger = 'automated_recognition',
+    n.created_by = 'code_substrate_watcher',
+    n.substrate = 'organizational',
+    n.auto_created = true,
+    n.needs_enrichment = true
+ON MATCH SET n.last_modified = timestamp()
+RETURN count(n)
+"""
 
-    def __init__(self):
-        self.processing = set()  # Track files being processed
-        self.db = redis.Redis(host='localhost', port=6379, decode_responses=True)
-        self.n2_graph = "ecosystem"  # L3 ecosystem graph (was collective_n2)
+DOC_UPSERT_QUERY = """
+UNWIND $rows AS row
+MERGE (n:Documentation {file_path: row.file_path})
+ON CREATE SET
+    n.name = row.name,
+    n.description = row.description,
+    n.node_type = 'Documentation',
+    n.base_weight = 0.5,
+    n.decay_rate = 0.95,
+    n.reinforcement_weight = 0.0,
+    n.created_at = timestamp(),
+    n.valid_at = timestamp(),
+    n.confidence = 0.7,
+    n.formation_trigger = 'automated_recognition',
+    n.created_by = 'code_substrate_watcher',
+    n.substrate = 'organizational',
+    n.auto_created = true,
+    n.needs_enrichment = true
+ON MATCH SET n.last_modified = timestamp()
+RETURN count(n)
+"""
 
-    def on_created(self, event):
-        """Called when a file is created."""
-        if event.is_directory:
-            return
+UPSERT_QUERIES = {'Code': CODE_UPSERT_QUERY, 'Documentation': DOC_UPSERT_QUERY}
 
-        file_path = Path(event.src_path)
 
-        # Only process relevant file types
-        if not self._should_process(file_path):
-            return
+class EventCoalescer:
+    """
+    Debounces file events per path and releases bursts as one batch.
 
-        # Avoid duplicate processing
-        if str(file_path) in self.processing:
-            return
+    Thread-safe: watchdog calls add() from its observer thread, the ingest
+    worker calls take_batch(). A path is ready once it has been quiet for
+    quiet_period; ready paths are released together once the whole event
+    stream has been quiet for quiet_period, or once the oldest pending path
+    has waited max_delay (so a continuous stream still makes progress).
+    """
 
-        logger.info(f"📄 NEW FILE: {self._relative_path(file_path)}")
+    def __init__(
+        self,
+        quiet_period: float = 0.3,
+        max_delay: float = 2.0,
+        max_batch: int = 2000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.quiet_period = quiet_period
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self._clock = clock
+        # path -> [first_seen, last_seen, change_type]; insertion order = first_seen order
+        self._pending: Dict[str, list] = {}
+        self._last_event = float("-inf")
+        self._events = 0  # bumped by add(); wait_for_work() watches it
+        self._cond = threading.Condition()
+
+    def add(self, path: str, change_type: str, now: Optional[float] = None):
+        """Record an event; 'created' sticks until the path is released."""
+        now = self._clock() if now is None else now
+        with self._cond:
+            entry = self._pending.get(path)
+            if entry is None:
+                self._pending[path] = [now, now, change_type]
+            else:
+                entry[1] = now
+                if change_type == "created":
+                    entry[2] = change_type
+            self._last_event = now
+            self._events += 1
+            self._cond.notify()
+
+    def take_batch(self, now: Optional[float] = None) -> Dict[str, str]:
+        """Release ready paths as {path: change_type} ({} if none are due)."""
+        now = self._clock() if now is None else now
+        with self._cond:
+            if not self._pending:
+                return {}
+            oldest_first_seen = next(iter(self._pending.values()))[0]
+            if now - self._last_event < self.quiet_period and now - oldest_first_seen < self.max_delay:
+                return {}
+            cutoff = now - self.quiet_period
+            batch = {}
+            for path, (first_seen, last_seen, change_type) in self._pending.items():
+                if last_seen <= cutoff:
+                    batch[path] = change_type
+                    if len(batch) >= self.max_batch:
+                        break
+            for path in batch:
+                del self._pending[path]
+            return batch
+
+    def next_delay(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until take_batch may release something (None: nothing pending)."""
+        now = self._clock() if now is None else now
+        with self._cond:
+            return self._next_delay(now)
+
+    def _next_delay(self, now: float) -> Optional[float]:
+        if not self._pending:
+            return None
+        oldest_first_seen = next(iter(self._pending.values()))[0]
+        delay = min(self._last_event + self.quiet_period, oldest_first_seen + self.max_delay) - now
+        # Overdue but every path still hot: re-check after one quiet period
+        return delay if delay > 0 else self.quiet_period
+
+    def wait_for_work(self, stopped: Callable[[], bool], idle_timeout: float = 1.0) -> None:
+        """
+        Block until a batch may be due, a new event arrives or stopped().
 
-        # Process asynchronously
-        asyncio.create_task(self.process_file(file_path, change_type="created"))
+        The delay is computed and waited on under one lock, so an add() or
+        wake() between the two cannot be missed. With nothing pending the
+        wait is still bounded by idle_timeout.
+        """
+        with self._cond:
+            delay = self._next_delay(self._clock())
+            events = self._events
+            self._cond.wait_for(
+                lambda: self._events != events or stopped(),
+                idle_timeout if delay is None else delay,
+            )
+
+    def wake(self):
+        """Wake a waiting worker (shutdown)."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+
+class CodeSubstrateHandler(FileSystemEventHandler):
+    """
+    Handles code/doc file changes by upserting nodes in N2.
+
+    Watchdog events only feed the EventCoalescer; a worker thread (off the
+    asyncio loop, since the redis client is synchronous) takes coalesced
+    batches and applies them with one parameterized UNWIND ... MERGE per
+    node type.
+    """
+
+    def __init__(
+        self,
+        db=None,
+        graph_name: str = "ecosystem",
+        quiet_period: float = 0.3,
+        max_delay: float = 2.0,
+        max_batch: int = 2000,
+        retry_backoff: float = 1.0
+    ):
+        self.db = db or redis.Redis(host='localhost', port=6379, decode_responses=True)
+        self.n2_graph = graph_name  # L3 ecosystem graph (was collective_n2)
+        self.coalescer = EventCoalescer(quiet_period=quiet_period, max_delay=max_delay, max_batch=max_batch)
+        self.retry_backoff = retry_backoff
+
+        self.batches = 0
+        self.upserts = 0
+        self.round_trips = 0
+        self._in_flight = 0
+        self._idle = threading.Condition()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def on_created(self, event):
+        """Called when a file is created."""
+        if not event.is_directory:
+            self._record(event.src_path, "created")
 
     def on_modified(self, event):
         """Called when a file is modified."""
-        if event.is_directory:
-            return
+        if not event.is_directory:
+            self._record(event.src_path, "modified")
 
-        file_path = Path(event.src_path)
+    def on_moved(self, event):
+        """Called when a file is renamed (editors' atomic saves, checkouts)."""
+        if not event.is_directory:
+            self._record(event.dest_path, "created")
 
-        # Only process relevant file types
-        if not self._should_process(file_path):
-            return
-
-        # Avoid duplicate processing
-        if str(file_path) in self.processing:
-            return
+    def _record(self, src_path, change_type: str):
+        file_path = Path(os.fsdecode(src_path))
 
-        # Process asynchronously
-        asyncio.create_task(self.process_file(file_path, change_type="modified"))
+        # Only process relevant file types
+        if self._should_process(file_path):
+            self.coalescer.add(str(file_path), change_type)
 
     def _should_process(self, file_path: Path) -> bool:
         """Check if file should be processed."""
@@ -109,7 +282,7 @@ class CodeSubstrateHandler(FileSystemEventHandler):
             return False
 
         # Process Python, TypeScript, and Markdown files
-        return file_path.suffix in ['.py', '.ts', '.tsx', '.md']
+        return file_path.suffix in CODE_LANGUAGES or file_path.suffix in DOC_SUFFIXES
 
     def _relative_path(self, file_path: Path) -> str:
         """Get path relative to Mind Protocol root."""
@@ -118,195 +291,102 @@ class CodeSubstrateHandler(FileSystemEventHandler):
         except ValueError:
             return str(file_path)
 
-    async def process_file(self, file_path: Path, change_type: str):
-        """Process a code or documentation file."""
-        try:
-            self.processing.add(str(file_path))
-
-            # Small delay to ensure file is fully written
-            await asyncio.sleep(0.3)
-
-            # Determine node type
-            if file_path.suffix in ['.py', '.ts', '.tsx']:
-                node_type = 'Code'
-                language = self._detect_language(file_path.suffix)
-            elif file_path.suffix == '.md':
-                node_type = 'Documentation'
-                language = None
-            else:
-                return
-
-            # Find or create node
-            relative_path = self._relative_path(file_path)
-            node_result = await self._find_or_create_node(
-                relative_path,
-                node_type,
-                language,
-                change_type
-            )
-
-            if node_result['created']:
-                logger.info(f"  ✅ Created {node_type} node: {relative_path}")
-            elif node_result['updated']:
-                logger.info(f"  🔄 Updated {node_type} node: {relative_path}")
-
-        except Exception as e:
-            logger.error(f"❌ Error processing {file_path.name}: {e}")
-
-        finally:
-            self.processing.discard(str(file_path))
-
     def _detect_language(self, suffix: str) -> str:
         """Detect programming language from file extension."""
-        language_map = {
-            '.py': 'python',
-            '.ts': 'typescript',
-            '.tsx': 'typescript',
-        }
-        return language_map.get(suffix, 'unknown')
-
-    async def _find_or_create_node(
-        self,
-        file_path: str,
-        node_type: str,
-        language: str,
-        change_type: str
-    ) -> dict:
-        """Find existing node or create new one. Returns result dict."""
-
-        # Query for existing node
-        query = f"""
-        MATCH (n:{node_type} {{file_path: $file_path}})
-        RETURN id(n) as node_id, n.auto_created as auto_created
-        """
-
-        result = self.db.execute_command(
-            "GRAPH.QUERY",
-            self.n2_graph,
-            query,
-            f"file_path='{file_path}'"
-        )
-
-        if result:
-            # Node exists → update timestamp
-            node_id = result[0]['node_id']
-            await self._update_node_timestamp(node_id, node_type)
-            return {'created': False, 'updated': True, 'node_id': node_id}
-        else:
-            # Node doesn't exist → create it
-            node_id = await self._create_node(file_path, node_type, language)
-            return {'created': True, 'updated': False, 'node_id': node_id}
-
-    async def _create_node(self, file_path: str, node_type: str, language: str) -> int:
-        """Create new Code or Documentation node in N2."""
-
-        if node_type == 'Code':
-            # Create Code node with universal + type-specific fields
-            query = """
-            CREATE (n:Code {
-                name: $name,
-                file_path: $file_path,
-                language: $language,
-                purpose: $purpose,
-                description: $description,
-                node_type: 'Code',
-
-                base_weight: 0.5,
-                decay_rate: 0.95,
-                reinforcement_weight: 0.0,
-
-                created_at: datetime(),
-                valid_at: datetime(),
-                expired_at: null,
-                invalid_at: null,
-
-                confidence: 0.7,
-                formation_trigger: 'automated_recognition',
-
-                created_by: 'code_substrate_watcher',
-                substrate: 'organizational',
-
-                auto_created: true,
-                needs_enrichment: true
-            })
-            RETURN id(n) as node_id
-            """
-
-            # Generate name from file path
-            name = file_path.replace('/', '_').replace('\\', '_').replace('.', '_')
-
-            params = {
-                "name": name,
-                "file_path": file_path,
-                "language": language,
-                "purpose": "[Auto-created - needs enrichment]",
-                "description": f"Code file: {file_path}"
-            }
-
-        else:  # Documentation
-            query = """
-            CREATE (n:Documentation {
-                name: $name,
-                file_path: $file_path,
-                description: $description,
-                node_type: 'Documentation',
-
-                base_weight: 0.5,
-                decay_rate: 0.95,
-                reinforcement_weight: 0.0,
-
-                created_at: datetime(),
-                valid_at: datetime(),
-                expired_at: null,
-                invalid_at: null,
-
-                confidence: 0.7,
-                formation_trigger: 'automated_recognition',
-
-                created_by: 'code_substrate_watcher',
-                substrate: 'organizational',
-
-                auto_created: true,
-                needs_enrichment: true
-            })
-            RETURN id(n) as node_id
-            """
-
+        return CODE_LANGUAGES.get(suffix, 'unknown')
+
+    # --- Worker ---
+
+    def start(self):
+        """Ensure file_path indexes and start the ingest worker thread."""
+        for label in UPSERT_QUERIES:
+            try:
+                self.db.execute_command(
+                    "GRAPH.QUERY", self.n2_graph, f"CREATE INDEX FOR (n:{label}) ON (n.file_path)"
+                )
+            except Exception as e:
+                logger.debug(f"Index on {label}.file_path not created: {e}")  # usually: already indexed
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, name="code-substrate-ingest", daemon=True)
+        self._worker.start()
+
+    def stop(self, timeout: float = 10.0):
+        """Flush pending events, then stop the worker."""
+        self.wait_settled(timeout)
+        self._stop.set()
+        self.coalescer.wake()
+        if self._worker:
+            self._worker.join(timeout)
+
+    def wait_settled(self, timeout: Optional[float] = None) -> bool:
+        """Block until no events are pending or in flight; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while len(self.coalescer) or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(0.05 if remaining is None else min(0.05, remaining))
+        return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            with self._idle:
+                batch = self.coalescer.take_batch()
+                self._in_flight = len(batch)
+            if not batch:
+                self.coalescer.wait_for_work(self._stop.is_set)
+                continue
+            try:
+                self.apply_batch(batch)
+            except Exception as e:
+                logger.error(f"❌ Batch of {len(batch)} files failed, retrying: {e}")
+                for path, change_type in batch.items():
+                    self.coalescer.add(path, change_type)
+                self._stop.wait(self.retry_backoff)
+            finally:
+                with self._idle:
+                    self._in_flight = 0
+                    self._idle.notify_all()
+
+    def apply_batch(self, batch: Dict[str, str]) -> int:
+        """Upsert one coalesced batch; returns the number of nodes touched."""
+        rows_by_type: Dict[str, List[dict]] = {'Code': [], 'Documentation': []}
+        for path in batch:
+            file_path = Path(path)
+            relative_path = self._relative_path(file_path)
             # Generate name from file path
-            name = file_path.replace('/', '_').replace('\\', '_').replace('.', '_')
-
-            params = {
-                "name": name,
-                "file_path": file_path,
-                "description": f"Documentation: {file_path}"
-            }
-
-        # Convert params to Cypher parameters
-        param_str = ", ".join([f"{k}='{v}'" for k, v in params.items()])
-
-        result = self.db.execute_command(
-            "GRAPH.QUERY",
-            self.n2_graph,
-            query,
-            param_str if param_str else ""
-        )
-        return result[0]['node_id']
-
-    async def _update_node_timestamp(self, node_id: int, node_type: str):
-        """Update last_modified timestamp on existing node."""
-        query = f"""
-        MATCH (n:{node_type})
-        WHERE id(n) = $node_id
-        SET n.last_modified = datetime()
-        RETURN n
-        """
+            name = relative_path.replace('/', '_').replace('\\', '_').replace('.', '_')
+            if file_path.suffix in CODE_LANGUAGES:
+                rows_by_type['Code'].append({
+                    "name": name,
+                    "file_path": relative_path,
+                    "language": self._detect_language(file_path.suffix),
+                    "description": f"Code file: {relative_path}"
+                })
+            else:
+                rows_by_type['Documentation'].append({
+                    "name": name,
+                    "file_path": relative_path,
+                    "description": f"Documentation: {relative_path}"
+                })
+
+        touched = 0
+        for node_type, rows in rows_by_type.items():
+            if not rows:
+                continue
+            self.db.execute_command(
+                "GRAPH.QUERY",
+                self.n2_graph,
+                cypher_params_header({"rows": rows}) + UPSERT_QUERIES[node_type]
+            )
+            self.round_trips += 1
+            touched += len(rows)
+            logger.info(f"  ✅ Upserted {len(rows)} {node_type} node(s)")
 
-        self.db.execute_command(
-            "GRAPH.QUERY",
-            self.n2_graph,
-            query,
-            f"node_id={node_id}"
-        )
+        self.batches += 1
+        self.upserts += touched
+        return touched
 
 
 async def main():
@@ -347,7 +427,8 @@ async def main():
                 recursive=True  # Watch subdirectories
             )
 
-    # Start watching
+    # Start ingest worker, then watching
+    event_handler.start()
     observer.start()
 
     try:
@@ -358,6 +439,7 @@ async def main():
         observer.stop()
 
     observer.join()
+    event_handler.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,411 @@
+"""
+Incremental conversation tailing for ConversationWatcher.
+
+The watcher used to re-read and json.loads the whole conversation file on every
+on_modified event and tracked progress only as an assistant-message count.
+Cost grew with session length. This module keeps a byte offset plus a small
+amount of parser state per file so each event only parses the appended region.
+
+Supports TWO layouts:
+1. JSONL transcripts - one message object per line; a trailing partial line is
+   left for the next read.
+2. Contexts JSON ({messages: [...]}) - the offset points just past the last
+   complete element of the top-level `messages` array. New elements inserted
+   before the closing bracket are decoded with raw_decode, nothing else is.
+
+Also provides:
+- TailPositionStore: positions checkpointed in batches (count or age), atomic
+- DebouncedFileDispatcher: collapses modify-event bursts per path and fans
+  distinct files out across a worker pool (never the same file twice at once)
+
+Date: 2026-10-18
+Purpose: Make per-event cost proportional to appended bytes, not file size
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bytes before the committed offset hashed to detect rewrites/truncation
+FINGERPRINT_WINDOW = 64
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+@dataclass
+class TailState:
+    """Per-file progress: byte offset plus parser state."""
+
+    offset: int = 0                  # Byte offset of the next unparsed byte
+    mode: Optional[str] = None       # "jsonl" | "messages"
+    assistant_seen: int = 0          # Assistant messages already consumed
+    skip_assistant: int = 0          # Legacy count-based progress still to skip
+    fingerprint: str = ""            # Hash of FINGERPRINT_WINDOW bytes before offset
+    bytes_ingested: int = 0
+    messages_ingested: int = 0
+    seconds_spent: float = 0.0
+
+    @property
+    def throughput_bps(self) -> float:
+        """Cumulative ingest throughput in bytes/second."""
+        if self.seconds_spent <= 0:
+            return 0.0
+        return self.bytes_ingested / self.seconds_spent
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_value(cls, value) -> "TailState":
+        """
+        Build state from a positions-file value.
+
+        Legacy positions files stored a bare assistant-message count. Those are
+        honoured by re-parsing once from offset 0 and skipping that many
+        assistant messages, so nothing is replayed after the upgrade.
+        """
+        if isinstance(value, int):
+            return cls(skip_assistant=value, assistant_seen=value)
+        if isinstance(value, dict):
+            known = {k: v for k, v in value.items() if k in cls.__dataclass_fields__}
+            return cls(**known)
+        return cls()
+
+
+@dataclass
+class TailResult:
+    """Outcome of one incremental read."""
+
+    messages: List[dict] = field(default_factory=list)   # New assistant messages
+    bytes_read: int = 0
+    elapsed: float = 0.0
+    reset: bool = False                                   # File was rewritten/truncated
+
+
+def _fingerprint(handle, offset: int) -> str:
+    start = max(0, offset - FINGERPRINT_WINDOW)
+    handle.seek(start)
+    return hashlib.blake2b(handle.read(offset - start), digest_size=8).hexdigest()
+
+
+def _skip_ws(text: str, idx: int) -> int:
+    n = len(text)
+    while idx < n and text[idx] in _WHITESPACE:
+        idx += 1
+    return idx
+
+
+def _message_role(msg: dict) -> Optional[str]:
+    """Role for both contexts messages and Claude Code JSONL records."""
+    role = msg.get("role")
+    if role is None and isinstance(msg.get("message"), dict):
+        role = msg["message"].get("role")
+    if role is None:
+        role = msg.get("type")
+    return role
+
+
+def message_text(msg: dict) -> str:
+    """Flatten message content (string or content-block list) to text."""
+    content = msg.get("content")
+    if content is None and isinstance(msg.get("message"), dict):
+        content = msg["message"].get("content")
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = [
+            block.get("text", "")
+            for block in content
+            if isinstance(block, dict) and block.get("type") == "text"
+        ]
+        return "\n".join(p for p in parts if p)
+    return ""
+
+
+class IncrementalConversationReader:
+    """
+    Reads only the appended region of conversation files.
+
+    Not thread-safe per path; DebouncedFileDispatcher guarantees a single
+    worker per file at a time.
+    """
+
+    def __init__(self, states: Optional[Dict[str, TailState]] = None):
+        self.states: Dict[str, TailState] = states if states is not None else {}
+
+    def state_for(self, file_path: Path) -> TailState:
+        key = str(file_path)
+        state = self.states.get(key)
+        if state is None:
+            state = TailState()
+            self.states[key] = state
+        return state
+
+    def read_new(self, file_path: Path) -> TailResult:
+        """Parse bytes appended since the last call and return new assistant messages."""
+        started = time.perf_counter()
+        state = self.state_for(file_path)
+        result = TailResult()
+
+        with open(file_path, "rb") as handle:
+            handle.seek(0, 2)
+            size = handle.tell()
+
+            if state.offset and (size < state.offset or _fingerprint(handle, state.offset) != state.fingerprint):
+                logger.info(f"[ConversationTail] {file_path.name} rewritten - rescanning from start")
+                # Keep the consumed count so already-ingested messages are not replayed
+                state.skip_assistant = state.assistant_seen
+                state.offset = 0
+                state.mode = None
+                result.reset = True
+
+            if size == state.offset:
+                return result
+
+            handle.seek(state.offset)
+            chunk = handle.read(size - state.offset)
+
+            if state.mode is None:
+                state.mode = "jsonl" if file_path.suffix == ".jsonl" else "messages"
+
+            if state.mode == "jsonl":
+                records, consumed = self._parse_jsonl(chunk)
+            else:
+                records, consumed = self._parse_messages(chunk, state)
+
+            state.offset += consumed
+            state.fingerprint = _fingerprint(handle, state.offset) if state.offset else ""
+
+        for record in records:
+            if not isinstance(record, dict) or _message_role(record) != "assistant":
+                continue
+            if state.skip_assistant > 0:
+                state.skip_assistant -= 1
+                continue
+            state.assistant_seen += 1
+            result.messages.append(record)
+
+        result.bytes_read = consumed
+        result.elapsed = time.perf_counter() - started
+        state.bytes_ingested += consumed
+        state.messages_ingested += len(result.messages)
+        state.seconds_spent += result.elapsed
+        return result
+
+    @staticmethod
+    def _parse_jsonl(chunk: bytes) -> Tuple[list, int]:
+        """Parse complete lines; a trailing line without newline waits for the next read."""
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return [], 0
+        records = []
+        for line in chunk[:end].splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                logger.warning(f"[ConversationTail] Skipping malformed JSONL line: {e}")
+        return records, end + 1
+
+    @staticmethod
+    def _parse_messages(chunk: bytes, state: TailState) -> Tuple[list, int]:
+        """
+        Decode new elements of the top-level messages array.
+
+        On first read (offset 0) walks the top-level object key by key to find
+        the array; afterwards the chunk starts right after the last element.
+        Returns (records, bytes consumed up to the last complete element).
+        """
+        text = chunk.decode("utf-8", errors="replace")
+        idx = 0
+        byte_pos = 0
+        records: list = []
+
+        def advance(to: int) -> None:
+            nonlocal idx, byte_pos
+            byte_pos += len(text[idx:to].encode("utf-8"))
+            idx = to
+
+        if state.offset == 0:
+            start = IncrementalConversationReader._find_messages_array(text)
+            if start is None:
+                return [], 0
+            advance(start)
+
+        while True:
+            pos = _skip_ws(text, idx)
+            if pos < len(text) and text[pos] == ",":
+                pos = _skip_ws(text, pos + 1)
+            if pos >= len(text) or text[pos] == "]":
+                break
+            try:
+                record, end = _decoder.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                break  # Element still being written
+            records.append(record)
+            advance(end)
+
+        return records, byte_pos
+
+    @staticmethod
+    def _find_messages_array(text: str) -> Optional[int]:
+        """Index just past the '[' of the top-level "messages" array, or None."""
+        idx = _skip_ws(text, 0)
+        if idx >= len(text) or text[idx] != "{":
+            return None
+        idx += 1
+        try:
+            while True:
+                idx = _skip_ws(text, idx)
+                if idx < len(text) and text[idx] == ",":
+                    idx = _skip_ws(text, idx + 1)
+                if idx >= len(text) or text[idx] == "}":
+                    return None
+                key, idx = _decoder.raw_decode(text, idx)
+                idx = _skip_ws(text, idx)
+                if idx >= len(text) or text[idx] != ":":
+                    return None
+                idx = _skip_ws(text, idx + 1)
+                if key == "messages":
+                    if idx < len(text) and text[idx] == "[":
+                        return idx + 1
+                    return None
+                _, idx = _decoder.raw_decode(text, idx)
+        except json.JSONDecodeError:
+            return None
+
+
+class TailPositionStore:
+    """
+    Positions file with batched checkpoints.
+
+    mark_dirty() is cheap; the file is rewritten only every `batch_size`
+    updates or `max_age` seconds, and on flush()/close().
+    """
+
+    def __init__(self, path: Path, batch_size: int = 20, max_age: float = 5.0):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.max_age = max_age
+        self.states: Dict[str, TailState] = {}
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            self.states = {k: TailState.from_value(v) for k, v in raw.items()}
+        except Exception as e:
+            logger.warning(f"[ConversationTail] Failed to load file positions: {e}")
+
+    def mark_dirty(self) -> None:
+        with self._lock:
+            self._pending += 1
+            due = (
+                self._pending >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.max_age
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all states atomically (tmp file + replace)."""
+        with self._lock:
+            if not self._pending:
+                return
+            snapshot = {k: v.to_dict() for k, v in list(self.states.items())}
+            self._pending = 0
+            self._last_flush = time.monotonic()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = Path(str(self.path) + ".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, indent=2)
+            tmp_file.replace(self.path)
+        except Exception as e:
+            logger.warning(f"[ConversationTail] Failed to save file positions atomically: {e}")
+
+
+class DebouncedFileDispatcher:
+    """
+    Debounces modify events per path and processes distinct files in parallel.
+
+    schedule() may be called from any thread (watchdog observers). A path is
+    handed to its handler once no event arrived for `debounce` seconds. Events
+    that land while the path is being processed re-arm it afterwards. One
+    dispatcher can be shared by several watchers; each passes its own handler.
+    """
+
+    def __init__(self, handler: Optional[Callable[[Path], None]] = None, debounce: float = 0.25, max_workers: int = 4):
+        self.handler = handler
+        self.debounce = debounce
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="conv-tail")
+        self._handlers: Dict[Path, Callable[[Path], None]] = {}
+        self._deadlines: Dict[Path, float] = {}
+        self._in_flight: set = set()
+        self._dirty: set = set()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="conv-tail-debounce", daemon=True)
+        self._thread.start()
+
+    def schedule(self, file_path: Path, handler: Optional[Callable[[Path], None]] = None) -> None:
+        with self._cond:
+            self._handlers[file_path] = handler or self.handler
+            if file_path in self._in_flight:
+                self._dirty.add(file_path)
+                return
+            self._deadlines[file_path] = time.monotonic() + self.debounce
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                now = time.monotonic()
+                ready = [p for p, t in self._deadlines.items() if t <= now]
+                for p in ready:
+                    del self._deadlines[p]
+                    self._in_flight.add(p)
+                if not ready:
+                    timeout = min(self._deadlines.values()) - now if self._deadlines else None
+                    self._cond.wait(timeout)
+                    continue
+            for p in ready:
+                self._executor.submit(self._process, p)
+
+    def _process(self, file_path: Path) -> None:
+        try:
+            self._handlers[file_path](file_path)
+        except Exception as e:
+            logger.error(f"[ConversationTail] Handler failed for {file_path}: {e}", exc_info=True)
+        finally:
+            with self._cond:
+                self._in_flight.discard(file_path)
+                if file_path in self._dirty:
+                    self._dirty.discard(file_path)
+                    self._deadlines[file_path] = time.monotonic() + self.debounce
+                    self._cond.notify()
+
+    def stop(self, wait: bool = True) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._executor.shutdown(wait=wait)
@@ -33,10 +33,12 @@ import re
 import subprocess
 import sys
 import tempfile
+import threading
 import os
 import atexit
 from pathlib import Path
 from datetime import datetime
+from typing import Dict
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
@@ -96,11 +98,21 @@ from orchestration.adapters.ws.weight_learning_emitter import WeightLearningEmit
 
 # Stimulus injection support
 from orchestration.mechanisms.stimulus_injection import StimulusInjector, create_match
-from orchestration.adapters.search.embedding_service import get_embedding_service
+from orchestration.adapters.search.embedding_service import SENTENCE_TRANSFORMERS_MODEL, get_embedding_service
+from orchestration.adapters.search.model_registry import get_model_registry
+from orchestration.adapters.storage.retrieval import warmup_retrieval
 from orchestration.adapters.search.semantic_search import SemanticSearch
 from orchestration.libs.utils.falkordb_adapter import FalkorDBAdapter
 from orchestration.adapters.storage.engine_registry import get_engine
 
+# Incremental tailing: byte offsets, batched checkpoints, debounced parallel dispatch
+from orchestration.services.watchers.conversation_tail import (
+    DebouncedFileDispatcher,
+    IncrementalConversationReader,
+    TailPositionStore,
+    message_text,
+)
+
 # Heartbeat writer for health monitoring
 from orchestration.services.telemetry.heartbeat_writer import HeartbeatWriter
 
@@ -132,55 +144,36 @@ INJECTION_TOOL = MIND_PROTOCOL_ROOT / "tools" / "inject_consciousness_from_json.
 
 # Contexts-only architecture - no more legacy Claude Code projects watching
 
-# Persistent file position tracking
+# Persistent file position tracking (byte offset + parser state per file)
 POSITIONS_FILE = MIND_PROTOCOL_ROOT / ".heartbeats" / "file_positions.json"
 
-def load_file_positions() -> dict:
-    """Load file positions from disk."""
-    if POSITIONS_FILE.exists():
-        try:
-            with open(POSITIONS_FILE, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"[ConversationWatcher] Failed to load file positions: {e}")
-    return {}
-
-def save_file_positions(positions: dict):
-    """Save file positions to disk atomically (Fix #5)."""
-    try:
-        POSITIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
-
-        # Create snapshot to protect against dict size changes during save
-        snapshot = dict(positions)
-
-        # Write to temporary file first
-        tmp_file = Path(str(POSITIONS_FILE) + ".tmp")
-        with open(tmp_file, 'w', encoding='utf-8') as f:
-            json.dump(snapshot, f, indent=2)
-
-        # Atomic replace (works across platforms)
-        tmp_file.replace(POSITIONS_FILE)
-    except Exception as e:
-        logger.warning(f"[ConversationWatcher] Failed to save file positions atomically: {e}")
-
-# Track last processed position in each file (loaded from disk)
-file_positions = load_file_positions()
+# Positions are checkpointed in batches instead of on every change
+position_store = TailPositionStore(POSITIONS_FILE, batch_size=20, max_age=5.0)
+tail_reader = IncrementalConversationReader(position_store.states)
 
 
 class ConversationWatcher(FileSystemEventHandler):
     """Watches Claude Code conversation files for consciousness JSON blocks."""
 
-    def __init__(self, project_pattern: str = "*luca*", citizen_id: str = None):
+    def __init__(self, project_pattern: str = "*luca*", citizen_id: str = None,
+                 dispatcher: DebouncedFileDispatcher = None):
         """
         Initialize watcher.
 
         Args:
             project_pattern: Glob pattern to match project directories (e.g., "*luca*", "*felix*")
             citizen_id: Citizen identifier for this watcher
+            dispatcher: Shared debounced worker pool; when None, files are processed
+                synchronously on the watchdog thread (legacy behavior)
         """
         self.project_pattern = project_pattern
         self.processing = set()
         self.citizen_id = citizen_id
+        self.dispatcher = dispatcher
+
+        # Parsing runs in parallel across files; graph ingestion for this citizen
+        # stays serialized (shared TraceCapture + event loop are not thread-safe)
+        self._ingest_lock = threading.Lock()
 
         # Initialize broadcaster for event emission (P0: dual-channel debug events)
         self.broadcaster = ConsciousnessStateBroadcaster()
@@ -230,20 +223,25 @@ class ConversationWatcher(FileSystemEventHandler):
 
         file_path = Path(event.src_path)
 
-        # Only process .json files (contexts format)
-        if file_path.suffix != '.json':
+        # Only process contexts .json files and .jsonl transcripts
+        if file_path.suffix not in ('.json', '.jsonl'):
             return
 
         # Only process files in matching project directories
         if not self.matches_project(file_path):
             return
 
+        logger.debug(f"[ConversationWatcher] File modified: {file_path.name}")
+
+        # Debounce bursts and hand off to the worker pool (one worker per file at a time)
+        if self.dispatcher:
+            self.dispatcher.schedule(file_path, self.process_conversation_file)
+            return
+
         # Avoid duplicate processing
         if str(file_path) in self.processing:
             return
 
-        logger.debug(f"[ConversationWatcher] File modified: {file_path.name}")
-
         # Process synchronously (watchdog runs in its own thread)
         self.process_conversation_file(file_path)
 
@@ -304,94 +302,81 @@ class ConversationWatcher(FileSystemEventHandler):
 
             graph_name = f"citizen_{citizen_id}"
 
-            # Get last processed MESSAGE COUNT for this file (not byte position!)
-            last_message_count = file_positions.get(str(file_path), 0)
+            # Parse only the bytes appended since the last read (offset + parser state)
+            tail = tail_reader.read_new(file_path)
+            if tail.bytes_read:
+                # Checkpointed in batches, not on every change
+                position_store.mark_dirty()
 
-            # Read ENTIRE file and parse JSON
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                full_content = f.read()
-
-            # Extract text from JSON
-            text_content = self.extract_text_from_contexts_json(full_content, file_path)
-
-            # Count current messages
-            try:
-                data = json.loads(full_content)
-                messages = data.get('messages', [])
-                assistant_messages = [m for m in messages if m.get('role') == 'assistant']
-                current_message_count = len(assistant_messages)
-
-                # Only process NEW messages
-                if current_message_count > last_message_count:
-                    # Get only the new messages
-                    new_messages = assistant_messages[last_message_count:]
-                    new_content = '\n\n'.join([m.get('content', '') for m in new_messages])
-                    logger.info(f"[ConversationWatcher] Processing {len(new_messages)} new messages")
-                else:
-                    # No new messages
-                    return
-            except json.JSONDecodeError as e:
-                logger.error(f"[ConversationWatcher] Failed to parse JSON: {e}")
+            if not tail.messages:
+                # No new messages
                 return
 
-            # Update message count and persist to disk
-            file_positions[str(file_path)] = current_message_count
-            save_file_positions(file_positions)
+            state = tail_reader.state_for(file_path)
+            logger.info(
+                f"[ConversationWatcher] Processing {len(tail.messages)} new messages from {file_path.name} "
+                f"({tail.bytes_read / 1024:.1f} KB in {tail.elapsed * 1000:.1f} ms, "
+                f"cumulative {state.throughput_bps / 1_000_000:.1f} MB/s)"
+            )
 
-            # new_content is already extracted text from messages
-            text_content = new_content
+            text_content = '\n\n'.join(message_text(m) for m in tail.messages)
 
             if not text_content:
                 # No text content to process
                 return
 
-            # Detect format type and process accordingly
-            has_trace_format = self.has_trace_format(text_content)
-            has_json_blocks = bool(self.extract_json_blocks(text_content))
+            with self._ingest_lock:
+                self.ingest_text(text_content, graph_name, citizen_id)
 
-            if has_trace_format:
-                # Process as TRACE format (dual learning mode)
-                logger.info(f"[ConversationWatcher] Detected TRACE format consciousness stream")
-                success = self.process_trace_format(text_content, graph_name, citizen_id)
-
-                if success:
-                    logger.info(f"[ConversationWatcher] ✅ TRACE format processed successfully")
-                else:
-                    logger.error(f"[ConversationWatcher] ❌ TRACE format processing failed")
+        except Exception as e:
+            import traceback
+            logger.error(f"[ConversationWatcher] Error processing conversation: {e}")
+            logger.error(f"[ConversationWatcher] Traceback:\n{traceback.format_exc()}")
 
-            elif has_json_blocks:
-                # Process as legacy JSON blocks (backward compatibility)
-                json_blocks = self.extract_json_blocks(text_content)
-                logger.info(f"[ConversationWatcher] Found {len(json_blocks)} consciousness JSON blocks (legacy format)")
+        finally:
+            self.processing.discard(str(file_path))
 
-                # Process each block
-                for idx, json_data in enumerate(json_blocks, 1):
-                    logger.info(f"[ConversationWatcher] Processing block {idx}/{len(json_blocks)}")
-                    success = self.inject_json_block(json_data, graph_name, citizen_id)
+    def ingest_text(self, text_content: str, graph_name: str, citizen_id: str):
+        """Route new assistant text to TRACE / legacy JSON processing and stimulus injection."""
+        # Detect format type and process accordingly
+        has_trace_format = self.has_trace_format(text_content)
+        has_json_blocks = bool(self.extract_json_blocks(text_content))
 
-                    if success:
-                        logger.info(f"[ConversationWatcher] ✅ Block {idx} injected successfully")
-                    else:
-                        logger.error(f"[ConversationWatcher] ❌ Block {idx} injection failed")
+        if has_trace_format:
+            # Process as TRACE format (dual learning mode)
+            logger.info(f"[ConversationWatcher] Detected TRACE format consciousness stream")
+            success = self.process_trace_format(text_content, graph_name, citizen_id)
 
+            if success:
+                logger.info(f"[ConversationWatcher] ✅ TRACE format processed successfully")
             else:
-                # No consciousness data detected - but still inject energy via stimulus
-                logger.debug(f"[ConversationWatcher] No TRACE/JSON format detected - processing as plain message")
+                logger.error(f"[ConversationWatcher] ❌ TRACE format processing failed")
 
-            # Always inject energy via stimulus (even for plain messages)
-            self.process_stimulus_injection(text_content, graph_name, citizen_id)
+        elif has_json_blocks:
+            # Process as legacy JSON blocks (backward compatibility)
+            json_blocks = self.extract_json_blocks(text_content)
+            logger.info(f"[ConversationWatcher] Found {len(json_blocks)} consciousness JSON blocks (legacy format)")
 
-            # DISABLED: Cleanup old consciousness blocks (older than 3 messages)
-            # Commenting out due to potential JSONL corruption from concurrent file modification
-            # self.cleanup_old_consciousness_blocks(file_path)
+            # Process each block
+            for idx, json_data in enumerate(json_blocks, 1):
+                logger.info(f"[ConversationWatcher] Processing block {idx}/{len(json_blocks)}")
+                success = self.inject_json_block(json_data, graph_name, citizen_id)
 
-        except Exception as e:
-            import traceback
-            logger.error(f"[ConversationWatcher] Error processing conversation: {e}")
-            logger.error(f"[ConversationWatcher] Traceback:\n{traceback.format_exc()}")
+                if success:
+                    logger.info(f"[ConversationWatcher] ✅ Block {idx} injected successfully")
+                else:
+                    logger.error(f"[ConversationWatcher] ❌ Block {idx} injection failed")
 
-        finally:
-            self.processing.discard(str(file_path))
+        else:
+            # No consciousness data detected - but still inject energy via stimulus
+            logger.debug(f"[ConversationWatcher] No TRACE/JSON format detected - processing as plain message")
+
+        # Always inject energy via stimulus (even for plain messages)
+        self.process_stimulus_injection(text_content, graph_name, citizen_id)
+
+        # DISABLED: Cleanup old consciousness blocks (older than 3 messages)
+        # Commenting out due to potential JSONL corruption from concurrent file modification
+        # self.cleanup_old_consciousness_blocks(file_path)
 
     def infer_citizen_from_path(self, file_path: Path) -> str:
         """
@@ -1261,6 +1246,18 @@ class ConversationWatcher(FileSystemEventHandler):
             logger.error(f"[ConversationWatcher] Failed to report error: {e}")
 
 
+def warmup_embedding_models() -> Dict[str, float]:
+    """
+    Preload the embedding models (trace capture / stimulus matching, retrieval).
+
+    Returns:
+        {model_name: load_seconds}
+    """
+    load_times = get_model_registry().warmup([SENTENCE_TRANSFORMERS_MODEL])
+    load_times.update(warmup_retrieval())
+    return load_times
+
+
 async def main():
     """Run the conversation watcher."""
     logger.info("=" * 70)
@@ -1287,8 +1284,22 @@ async def main():
     # Capture event loop for thread-safe stimulus injection telemetry
     StimulusInjector.set_event_loop()
 
-    # Initialize and start heartbeat writer
-    heartbeat = HeartbeatWriter("conversation_watcher")
+    # Load embedding models before watching, off the loop, so the first
+    # captured response doesn't pay the model load
+    try:
+        load_times = await asyncio.to_thread(warmup_embedding_models)
+        logger.info(
+            "[ConversationWatcher] Embedding models warm: "
+            + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in load_times.items())
+        )
+    except Exception as e:
+        logger.warning(f"[ConversationWatcher] Embedding warmup failed (models load on first use): {e}")
+
+    # Initialize and start heartbeat writer (reports embedding model load times / cache hits / latency)
+    heartbeat = HeartbeatWriter(
+        "conversation_watcher",
+        metadata_fn=lambda: {"embedding_models": get_model_registry().metrics()},
+    )
     heartbeat.start()
 
     # Create observer for each citizen project
@@ -1310,10 +1321,14 @@ async def main():
     # Track handlers for cleanup
     handlers = []
 
+    # Shared debounced worker pool: bursts of modify events collapse per file,
+    # distinct conversation files are tailed in parallel
+    dispatcher = DebouncedFileDispatcher(debounce=0.25, max_workers=4)
+
     for citizen in discovered_citizens:
         pattern = f"*{citizen}*"
         # MEMORY LEAK FIX: Pass citizen_id to enable reusable TraceCapture instance
-        handler = ConversationWatcher(project_pattern=pattern, citizen_id=citizen)
+        handler = ConversationWatcher(project_pattern=pattern, citizen_id=citizen, dispatcher=dispatcher)
         handlers.append(handler)  # Track for cleanup
 
         # Watch citizen's contexts directory
@@ -1336,6 +1351,9 @@ async def main():
         logger.info("\n[ConversationWatcher] Shutting down...")
         for observer in observers:
             observer.stop()
+        dispatcher.stop()
+        # Final checkpoint for positions still pending in the current batch
+        position_store.flush()
         # MEMORY LEAK FIX: Cleanup handlers to release resources
         for handler in handlers:
             handler.cleanup()
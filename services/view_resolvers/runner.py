@@ -13,8 +13,10 @@ Date: 2025-11-04
 """
 
 import logging
-from typing import Dict, Any, Optional, Callable
-from datetime import datetime, timedelta, timezone
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, List, Optional, Callable, Set
+from datetime import datetime, timezone
 import traceback
 
 from .selectors import get_selector
@@ -26,43 +28,231 @@ logger = logging.getLogger(__name__)
 
 
 # ============================================================================
-# Simple Cache (digest-keyed)
+# View Cache (bounded LRU, digest/id-indexed)
 # ============================================================================
 
+# View types whose selection is an aggregate over the whole graph (no row ids)
+_AGGREGATE_VIEWS = ("coverage",)
+
+# View types whose selection does not traverse links
+_LINKLESS_VIEWS = ("index",)
+
+
+def _row_refs(rows: list) -> Set[str]:
+    """
+    Collect knowledge-object references from selected rows.
+
+    Walks nested dicts/lists (and node objects exposing .properties) and
+    returns "id:<id>" / "path:<path>" tokens for every id/path value found.
+    """
+    refs: Set[str] = set()
+    stack: List[Any] = list(rows)
+    while stack:
+        item = stack.pop()
+        props = getattr(item, "properties", None)
+        if isinstance(props, dict):
+            item = props
+        if isinstance(item, dict):
+            for field_name, value in item.items():
+                if field_name in ("id", "path") and isinstance(value, (str, int)):
+                    refs.add(f"{field_name}:{value}")
+                elif isinstance(value, (dict, list, tuple)) or hasattr(value, "properties"):
+                    stack.append(value)
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return refs
+
+
+class _CacheEntry:
+    __slots__ = ("value", "expires_at", "refs", "graph", "view_type", "path")
+
+    def __init__(self, value, expires_at, refs, graph, view_type, path):
+        self.value = value
+        self.expires_at = expires_at
+        self.refs = refs
+        self.graph = graph
+        self.view_type = view_type
+        self.path = path
+
+
 class ViewCache:
-    """Simple in-memory cache keyed by (view_type, format, params, path) + ko_digest"""
+    """
+    Bounded LRU cache of rendered views with monotonic-clock TTLs.
 
-    def __init__(self, ttl_seconds: int = 300):
-        self._cache: Dict[tuple, Dict[str, Any]] = {}
+    Keys are (view_type, format, params, path, graph). Each entry records the
+    knowledge objects its selected rows reference (ids, paths, ko_digest);
+    a reverse index maps each reference to the keys that depend on it, so a
+    graph.delta evicts only the views whose rows it touched (see invalidate_delta).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._cache: "OrderedDict[tuple, _CacheEntry]" = OrderedDict()
+        self._refs: Dict[str, Set[tuple]] = {}
         self._ttl = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.deltas = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
 
     def get(self, key: tuple) -> Optional[Dict[str, Any]]:
-        """Get cached view if not expired"""
-        if key not in self._cache:
+        """Get cached view if not expired (refreshes LRU position)"""
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
             return None
 
-        entry = self._cache[key]
-        cached_at = datetime.fromisoformat(entry.get("cached_at", "2020-01-01T00:00:00+00:00"))
-        age = (datetime.now(timezone.utc) - cached_at).total_seconds()
-
-        if age > self._ttl:
-            del self._cache[key]
+        if self._clock() >= entry.expires_at:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
             return None
 
-        return entry
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(self, key: tuple, value: Dict[str, Any], refs: Iterable[str] = ()):
+        """
+        Cache view with timestamp and the knowledge-object references it depends on.
 
-    def set(self, key: tuple, value: Dict[str, Any]):
-        """Cache view with timestamp"""
+        Args:
+            key: (view_type, format, params, path, graph)
+            value: docs.view.result payload
+            refs: Reference tokens ("id:<id>", "path:<path>", ko_digest)
+        """
         value["cached_at"] = datetime.now(timezone.utc).isoformat()
-        self._cache[key] = value
+        if key in self._cache:
+            self._remove(key)
+
+        view_type, path, graph = key[0], key[3], key[4] if len(key) > 4 else None
+        entry = _CacheEntry(value, self._clock() + self._ttl, frozenset(refs), graph, view_type, path)
+        self._cache[key] = entry
+        for ref in entry.refs:
+            self._refs.setdefault(ref, set()).add(key)
+
+        while len(self._cache) > self._max_entries:
+            oldest = next(iter(self._cache))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: tuple):
+        entry = self._cache.pop(key)
+        for ref in entry.refs:
+            keys = self._refs.get(ref)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._refs[ref]
+
+    def _drop(self, keys: Iterable[tuple]) -> List[tuple]:
+        dropped = [key for key in keys if key in self._cache]
+        for key in dropped:
+            self._remove(key)
+        self.invalidations += len(dropped)
+        return dropped
+
+    def invalidate(self, pattern: str) -> int:
+        """
+        Invalidate cache keys matching a "view_type:path" pattern.
 
-    def invalidate(self, pattern: str):
-        """Invalidate cache keys matching pattern (e.g., 'architecture:/')"""
-        # Simple prefix matching for now
-        to_delete = [k for k in self._cache.keys() if pattern in str(k)]
-        for k in to_delete:
-            del self._cache[k]
-        logger.info(f"[ViewCache] Invalidated {len(to_delete)} keys matching '{pattern}'")
+        'architecture:/' drops architecture views scoped under '/', 'architecture'
+        or 'architecture:*' every architecture view, '*' everything.
+        """
+        view_type, _, path = pattern.partition(":")
+        matches = [
+            key for key, entry in self._cache.items()
+            if view_type in ("*", entry.view_type)
+            and (path in ("", "*") or str(entry.path or "").startswith(path))
+        ]
+        dropped = self._drop(matches)
+        logger.info(f"[ViewCache] Invalidated {len(dropped)} keys matching '{pattern}'")
+        return len(dropped)
+
+    def invalidate_refs(self, refs: Iterable[str]) -> List[tuple]:
+        """Invalidate every view depending on any of the references (ids, paths, digests)"""
+        keys: Set[tuple] = set()
+        for ref in refs:
+            keys.update(self._refs.get(ref, ()))
+        return self._drop(keys)
+
+    def invalidate_delta(self, delta: Dict[str, Any]) -> List[tuple]:
+        """
+        Evict the views a graph delta can affect; returns the evicted keys.
+
+        - Views whose selected rows reference a touched node/link endpoint (by id
+          or path) are evicted.
+        - A node the cache has never seen may join selections: views whose scope
+          path is a prefix of its path are evicted (every view of the graph when
+          the node has no path); an unseen link evicts the graph's link-traversing views.
+        - New nodes, deletes and links change graph-wide aggregates (coverage views).
+        - Activation deltas never change a view.
+        """
+        self.deltas += 1
+        delta_type = delta.get("type") or "graph.delta.node.upsert"
+        if delta_type == "graph.delta.activation":
+            return []
+
+        graph = delta.get("graph") or delta.get("graph_name") or delta.get("citizen_id")
+        props = delta.get("properties") or {}
+        ids = [delta.get(k) for k in ("node_id", "source_id", "target_id", "link_id") if delta.get(k)]
+        refs = {f"id:{i}" for i in ids}
+        if props.get("id"):
+            refs.add(f"id:{props['id']}")
+        if props.get("path"):
+            refs.add(f"path:{props['path']}")
+
+        keys: Set[tuple] = set()
+        for ref in refs:
+            keys.update(self._refs.get(ref, ()))
+
+        # A node/link the cache has never seen may bring rows into (or take rows out
+        # of) a selection without touching any cached row
+        known = any(ref in self._refs for ref in refs)
+        is_link = ".link." in delta_type
+        node_path = props.get("path")
+        for key, entry in self._cache.items():
+            if graph and entry.graph and entry.graph != graph:
+                continue
+            if entry.view_type in _AGGREGATE_VIEWS:
+                if is_link or delta_type.endswith("delete") or not known:
+                    keys.add(key)
+            elif known:
+                continue
+            elif is_link:
+                if entry.view_type not in _LINKLESS_VIEWS:
+                    keys.add(key)
+            elif node_path is None or str(node_path).startswith(str(entry.path or "/")):
+                keys.add(key)
+
+        return self._drop(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate and invalidation fan-out counters"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._cache),
+            "refs": len(self._refs),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "deltas": self.deltas,
+            "invalidations_per_delta": round(self.invalidations / self.deltas, 3) if self.deltas else 0.0,
+        }
 
 
 # ============================================================================
@@ -124,7 +314,7 @@ class ViewResolver:
         self.bus = bus
         self.graph = graph
         self.economy = economy or EconomyStub()
-        self.cache = cache or ViewCache(ttl_seconds=300)
+        self.cache = cache if cache is not None else ViewCache(ttl_seconds=300)
 
         logger.info("[ViewResolver] Initialized (L2 org boundary) - graph_name extracted per-request")
 
@@ -143,12 +333,14 @@ class ViewResolver:
         c = envelope.get("content", {})
         request_id = c.get("request_id", "unknown")
 
-        # Build cache key
+        # Build cache key (graph included: views never leak across orgs)
+        scope = c.get("scope", {})
         key = (
             c.get("view_type"),
             c.get("format"),
             tuple(sorted(c.get("params", {}).items())),
-            c.get("scope", {}).get("path", "/")
+            scope.get("path", "/"),
+            scope.get("org") or scope.get("graph")
         )
 
         try:
@@ -193,8 +385,8 @@ class ViewResolver:
                 "cache": {"ttl_sec": 300}
             }
 
-            # Step 4: Cache + debit
-            self.cache.set(key, payload)
+            # Step 4: Cache (indexed by the KOs the rows reference) + debit
+            self.cache.set(key, payload, refs=_row_refs(rows) | {vm["provenance"]["ko_digest"]})
             self.economy.debit(quote_id)
 
             # Step 5: Emit result
@@ -222,23 +414,25 @@ class ViewResolver:
         """
         Handle graph.delta.* events for cache invalidation
 
-        Future: implement surgical invalidation via ko_digest matching
-        For now: invalidate by view_type
+        Surgical: evicts only the views whose selected rows the delta touched
+        (or could enter), then broadcasts docs.view.invalidated for them.
         """
-        # Extract affected view types from graph delta
-        # Simple heuristic: invalidate all for now
-        logger.info("[ViewResolver] graph.delta.* received, invalidating cache")
-        self.cache.invalidate("architecture")
-        self.cache.invalidate("api")
-        self.cache.invalidate("coverage")
-
-        # Emit invalidation broadcast
-        self.bus.broadcast("docs.view.invalidated", {
+        delta = envelope.get("content") or envelope.get("payload") or envelope
+        if "type" not in delta and envelope.get("type"):
+            delta = {**delta, "type": envelope["type"]}
+
+        evicted = self.cache.invalidate_delta(delta)
+        logger.debug(f"[ViewResolver] {delta.get('type', 'graph.delta')} evicted {len(evicted)} views")
+        if not evicted:
+            return
+
+        import asyncio
+        asyncio.create_task(self.bus.broadcast("docs.view.invalidated", {
             "content": {
-                "reasons": ["graph.delta.node.upsert"],
-                "affects": ["architecture:*", "api:*", "coverage:*", "index:*"]
+                "reasons": [delta.get("type") or "graph.delta.node.upsert"],
+                "affects": sorted({f"{key[0]}:{key[3]}" for key in evicted})
             }
-        })
+        }))
 
     # ========================================================================
     # Pipeline Phases
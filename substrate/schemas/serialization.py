@@ -10,16 +10,33 @@ Field Categories:
 3. Vectors: Native FalkorDB Vec type (embeddings)
 4. Arrays: Primitive arrays (participants, members, goals)
 
+Bulk paths (serialize_nodes_for_falkordb, deserialize_nodes_from_falkordb and
+the relation equivalents) work column-wise from a field plan compiled once
+per object type, encode nested fields with orjson when installed, and can
+pack float dict fields of relations into a compact binary string
+(pack_numeric=True).
+The single-object functions are thin wrappers over them.
+
 Author: Felix "Ironhand"
 Date: 2025-10-17
 Status: Implementing validated organizational pattern
 """
 
+import base64
 import json
+import re
+import sys
+from array import array
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Union
+from operator import attrgetter
+from typing import Dict, Any, Iterable, Optional, List, Tuple, Union
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # json fallback: same values, slower
+    orjson = None
+
 # Import what exists in consciousness_schema
 try:
     from substrate.schemas.consciousness_schema import BaseNode, BaseRelation
@@ -41,6 +58,272 @@ except ImportError:
         valid_at: datetime
 
 
+# =============================================================================
+# Fast-path encoding helpers
+# =============================================================================
+
+_JSON_SEPARATORS = (',', ':')
+
+# orjson parses integers beyond 64 bits as floats (silently, in 3.8), and
+# serializes datetimes/dataclasses that json.dumps rejects: keep json's results
+_ORJSON_DUMPS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                 | orjson.OPT_PASSTHROUGH_DATACLASS) if orjson is not None else 0
+_LONG_DIGITS = re.compile(r'[0-9]{20}')
+_LONG_DIGITS_BYTES = re.compile(rb'[0-9]{20}')
+
+
+def _dumps(value: Any) -> str:
+    """Compact JSON for a nested field (orjson when installed)."""
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(value, option=_ORJSON_DUMPS)
+        except TypeError:
+            pass  # Types orjson rejects (ints beyond 64 bits, datetimes): json decides
+        else:
+            # orjson writes NaN/Infinity as null; json keeps them
+            if b'null' not in encoded:
+                return encoded.decode()
+    return json.dumps(value, separators=_JSON_SEPARATORS)
+
+
+def _loads(value: Union[str, bytes]) -> Any:
+    """Parse JSON (orjson when installed). Raises json.JSONDecodeError."""
+    long_digits = _LONG_DIGITS_BYTES if isinstance(value, bytes) else _LONG_DIGITS
+    # 20+ digit runs may be integers beyond 64 bits: only json keeps them exact
+    if orjson is not None and not long_digits.search(value):
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity literals: json accepts these
+    return json.loads(value)
+
+
+# Packed float dicts: 'pk1:d:<base64 little-endian float64 values>:<JSON key list>'
+PACKED_PREFIX = 'pk1:'
+
+
+def pack_numeric_dict(values: Dict[str, float]) -> Optional[str]:
+    """
+    Encode a Dict[str, float] as a compact packed string.
+
+    Values are stored as float64 (~11 chars each instead of up to ~20 in
+    JSON) and round-trip exactly, NaN/Infinity included. Int dicts are not
+    packed - small ints are already compact in JSON.
+
+    Returns:
+        Packed string, or None if the dict does not qualify (empty, non-str
+        keys, values not all floats) - callers then fall back to JSON
+    """
+    if set(map(type, values.values())) != {float} or set(map(type, values)) != {str}:
+        return None
+    packed = array('d', values.values())
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    payload = base64.b64encode(packed.tobytes()).decode('ascii')
+    return f"{PACKED_PREFIX}d:{payload}:{_dumps(list(values))}"
+
+
+def unpack_numeric_dict(encoded: str) -> Dict[str, float]:
+    """
+    Decode a string produced by pack_numeric_dict().
+
+    Raises:
+        ValueError: if encoded is not a valid packed dict
+    """
+    prefix, typecode, payload, keys = encoded.split(':', 3)
+    if prefix + ':' != PACKED_PREFIX or typecode != 'd':
+        raise ValueError(f"Not a packed numeric dict: {encoded[:32]!r}")
+    values = array(typecode)
+    values.frombytes(base64.b64decode(payload, validate=True))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    keys = _loads(keys)
+    if len(keys) != len(values):
+        raise ValueError(f"Packed numeric dict has {len(keys)} keys but {len(values)} values")
+    return dict(zip(keys, values))
+
+
+# =============================================================================
+# Field plans
+# =============================================================================
+
+# Field kinds - each mirrors one branch of the per-object serializers
+_ATTR = 'attr'                              # Required primitive
+_TIMESTAMP = 'timestamp'                    # Required datetime -> int ms
+_TIMESTAMP_IF_SET = 'timestamp_if_set'      # Required attribute, written only when set
+_OPTIONAL = 'optional'                      # Written as-is when the attribute exists
+_OPTIONAL_TIMESTAMP = 'optional_timestamp'  # Exists -> int ms (None when unset)
+_IF_SET = 'if_set'                          # Exists and non-empty -> as-is (Vec, arrays)
+_JSON = 'json'                              # Nested dict -> JSON ('{}' when empty/absent)
+_NUMERIC_JSON = 'numeric_json'              # Float dict: _JSON, packable with pack_numeric=True
+_ACTIVATIONS = 'activations'                # entity_activations states -> dicts -> JSON
+_EMPTY_JSON = 'empty_json'                  # Compiled: nested dict attribute absent
+
+_HASATTR_KINDS = {_OPTIONAL, _OPTIONAL_TIMESTAMP, _IF_SET, _JSON, _NUMERIC_JSON, _ACTIVATIONS}
+_NESTED_KINDS = {_JSON, _NUMERIC_JSON, _ACTIVATIONS}
+
+NODE_FIELD_PLAN: Tuple[Tuple[str, str], ...] = (
+    ('name', _ATTR),
+    ('description', _ATTR),
+    ('confidence', _ATTR),
+    ('formation_trigger', _ATTR),
+    ('valid_at', _TIMESTAMP),
+    ('invalid_at', _TIMESTAMP_IF_SET),
+    ('expired_at', _TIMESTAMP_IF_SET),
+    ('base_weight', _OPTIONAL),
+    ('reinforcement_weight', _OPTIONAL),
+    ('decay_rate', _OPTIONAL),
+    ('entity_activations', _ACTIVATIONS),
+    ('entity_clusters', _JSON),
+    ('sub_entity_last_sequence_positions', _JSON),
+    ('embedding', _IF_SET),
+    ('participants', _IF_SET),
+    ('members', _IF_SET),
+    ('goals', _IF_SET),
+    ('steps', _IF_SET),
+    ('last_modified', _OPTIONAL_TIMESTAMP),
+    ('traversal_count', _OPTIONAL),
+    ('last_traversed_by', _OPTIONAL),
+    ('last_traversal_time', _OPTIONAL_TIMESTAMP),
+)
+
+RELATION_FIELD_PLAN: Tuple[Tuple[str, str], ...] = (
+    ('goal', _ATTR),
+    ('mindstate', _ATTR),
+    ('energy', _ATTR),
+    ('confidence', _ATTR),
+    ('formation_trigger', _ATTR),
+    ('link_strength', _OPTIONAL),
+    ('valid_at', _TIMESTAMP),
+    ('invalid_at', _TIMESTAMP_IF_SET),
+    ('sub_entity_valences', _NUMERIC_JSON),
+    ('sub_entity_emotion_vectors', _JSON),
+    ('entity_coactivation_counts', _JSON),
+    ('entity_link_strengths', _NUMERIC_JSON),
+    ('embedding', _IF_SET),
+    ('last_modified', _OPTIONAL_TIMESTAMP),
+    ('traversal_count', _OPTIONAL),
+    ('last_traversed_by', _OPTIONAL),
+    ('last_mechanism_id', _OPTIONAL),
+)
+
+_RELATION_JSON_FIELDS = tuple(
+    key for key, kind in RELATION_FIELD_PLAN if kind in _NESTED_KINDS
+)
+
+# Compiled plans: type (or (type, present optional attributes)) -> plan
+_node_plans: Dict[Any, tuple] = {}
+_relation_plans: Dict[Any, tuple] = {}
+
+
+def _compile_plan(field_plan, sample: Any) -> tuple:
+    """Resolve the plan's hasattr() checks against one object."""
+    compiled = []
+    for key, kind in field_plan:
+        if kind in _HASATTR_KINDS and not hasattr(sample, key):
+            if kind in _NESTED_KINDS:
+                compiled.append((key, _EMPTY_JSON, None))
+            continue
+        compiled.append((key, kind, attrgetter(key)))
+    return tuple(compiled)
+
+
+def _group_by_plan(objects: List[Any], rows: List[Dict[str, Any]], field_plan, plan_cache: Dict[Any, tuple]):
+    """
+    Yield (compiled plan, objects, rows) per group of objects sharing a plan.
+
+    Pydantic models have a fixed attribute set, so their plan is compiled
+    once per class. Other objects are grouped by which optional attributes
+    they actually carry.
+    """
+    optional_keys = [key for key, kind in field_plan if kind in _HASATTR_KINDS]
+    fixed_types: Dict[type, bool] = {}
+    groups: Dict[Any, Tuple[Any, List[Any], List[Dict[str, Any]]]] = {}
+    for obj, row in zip(objects, rows):
+        cls = type(obj)
+        fixed = fixed_types.get(cls)
+        if fixed is None:
+            fixed = fixed_types[cls] = (
+                issubclass(cls, BaseModel) and cls.model_config.get('extra') != 'allow'
+            )
+        group_key = cls if fixed else (cls, tuple(hasattr(obj, key) for key in optional_keys))
+        group = groups.get(group_key)
+        if group is None:
+            group = groups[group_key] = (obj, [], [])
+        group[1].append(obj)
+        group[2].append(row)
+
+    for group_key, (sample, members, member_rows) in groups.items():
+        plan = plan_cache.get(group_key)
+        if plan is None:
+            plan = plan_cache[group_key] = _compile_plan(field_plan, sample)
+        yield plan, members, member_rows
+
+
+def _activation_states_as_dicts(entity_activations: Dict[str, Any]) -> Dict[str, Any]:
+    """entity_activations with state objects converted to plain dicts."""
+    if all(isinstance(state, dict) for state in entity_activations.values()):
+        return entity_activations
+    data = {}
+    for entity_id, state in entity_activations.items():
+        if isinstance(state, dict):
+            data[entity_id] = state
+        else:
+            data[entity_id] = {
+                'energy': getattr(state, 'energy', 0.0),
+                'last_activated': getattr(state, 'last_activated', datetime.now()).isoformat() if hasattr(state, 'last_activated') else None,
+                'activation_count': getattr(state, 'activation_count', 0),
+            }
+    return data
+
+
+def _serialize_batch(objects: Iterable[Any], field_plan, plan_cache: Dict[Any, tuple], pack_numeric: bool) -> List[Dict[str, Any]]:
+    """Column-wise serialization: one pass over the objects per field."""
+    objects = list(objects)
+    rows: List[Dict[str, Any]] = [{} for _ in objects]
+
+    for plan, members, member_rows in _group_by_plan(objects, rows, field_plan, plan_cache):
+        for key, kind, getter in plan:
+            if kind == _EMPTY_JSON:
+                for row in member_rows:
+                    row[key] = '{}'
+                continue
+
+            column = zip(member_rows, map(getter, members))
+            if kind == _ATTR or kind == _OPTIONAL:
+                for row, value in column:
+                    row[key] = value
+            elif kind == _TIMESTAMP:
+                for row, value in column:
+                    row[key] = int(value.timestamp() * 1000)
+            elif kind == _TIMESTAMP_IF_SET:
+                for row, value in column:
+                    if value:
+                        row[key] = int(value.timestamp() * 1000)
+            elif kind == _OPTIONAL_TIMESTAMP:
+                for row, value in column:
+                    row[key] = int(value.timestamp() * 1000) if value else None
+            elif kind == _IF_SET:
+                for row, value in column:
+                    if value:
+                        row[key] = value
+            elif kind == _ACTIVATIONS:
+                for row, value in column:
+                    row[key] = _dumps(_activation_states_as_dicts(value)) if value else '{}'
+            elif kind == _NUMERIC_JSON and pack_numeric:
+                for row, value in column:
+                    row[key] = (pack_numeric_dict(value) or _dumps(value)) if value else '{}'
+            else:
+                for row, value in column:
+                    row[key] = _dumps(value) if value else '{}'
+
+    return rows
+
+
+def _from_millis(value: Any) -> datetime:
+    return datetime.fromtimestamp(value / 1000)
+
+
 def serialize_node_for_falkordb(node: BaseNode) -> Dict[str, Any]:
     """
     Convert Pydantic BaseNode to FalkorDB-compatible property dict.
@@ -54,88 +337,27 @@ def serialize_node_for_falkordb(node: BaseNode) -> Dict[str, Any]:
     Returns:
         Dict with only primitive-type values (no nested dicts/objects)
     """
-    properties = {}
-
-    # Category 1: Core Idsubentity Primitives (directly queryable)
-    properties['name'] = node.name
-    properties['description'] = node.description
-    properties['confidence'] = node.confidence
-    properties['formation_trigger'] = node.formation_trigger
-
-    # Timestamps: datetime → int milliseconds since epoch
-    properties['valid_at'] = int(node.valid_at.timestamp() * 1000)
-    if node.invalid_at:
-        properties['invalid_at'] = int(node.invalid_at.timestamp() * 1000)
-    if node.expired_at:
-        properties['expired_at'] = int(node.expired_at.timestamp() * 1000)
-
-    # Weight properties (for traversal queries)
-    if hasattr(node, 'base_weight'):
-        properties['base_weight'] = node.base_weight
-    if hasattr(node, 'reinforcement_weight'):
-        properties['reinforcement_weight'] = node.reinforcement_weight
-    if hasattr(node, 'decay_rate'):
-        properties['decay_rate'] = node.decay_rate
-
-    # Category 2: Complex Consciousness Metadata → JSON strings
-
-    # entity_activations: Dict → JSON (handles both dict and object types)
-    if hasattr(node, 'entity_activations') and node.entity_activations:
-        entity_activations_data = {}
-        for entity_id, state in node.entity_activations.items():
-            if isinstance(state, dict):
-                # Already a dict
-                entity_activations_data[entity_id] = state
-            else:
-                # Object with attributes
-                entity_activations_data[entity_id] = {
-                    'energy': getattr(state, 'energy', 0.0),
-                    'last_activated': getattr(state, 'last_activated', datetime.now()).isoformat() if hasattr(state, 'last_activated') else None,
-                    'activation_count': getattr(state, 'activation_count', 0),
-                }
-        properties['entity_activations'] = json.dumps(entity_activations_data)
-    else:
-        properties['entity_activations'] = '{}'
+    return serialize_nodes_for_falkordb([node])[0]
 
-    # entity_clusters: Dict[str, str] → JSON
-    if hasattr(node, 'entity_clusters') and node.entity_clusters:
-        properties['entity_clusters'] = json.dumps(node.entity_clusters)
-    else:
-        properties['entity_clusters'] = '{}'
 
-    # sub_entity_last_sequence_positions: Dict[str, int] → JSON
-    if hasattr(node, 'sub_entity_last_sequence_positions') and node.sub_entity_last_sequence_positions:
-        properties['sub_entity_last_sequence_positions'] = json.dumps(node.sub_entity_last_sequence_positions)
-    else:
-        properties['sub_entity_last_sequence_positions'] = '{}'
-
-    # Category 3: Vector Embeddings (native FalkorDB support)
-    if hasattr(node, 'embedding') and node.embedding:
-        properties['embedding'] = node.embedding  # Native Vec type
-
-    # Category 4: Simple Arrays (primitive arrays)
-    # Type-specific fields that may be arrays
-    if hasattr(node, 'participants') and node.participants:
-        properties['participants'] = node.participants  # List[str]
-    if hasattr(node, 'members') and node.members:
-        properties['members'] = node.members  # List[str]
-    if hasattr(node, 'goals') and node.goals:
-        properties['goals'] = node.goals  # List[str]
-    if hasattr(node, 'steps') and node.steps:
-        properties['steps'] = node.steps  # List[str]
-
-    # Observability fields (primitives)
-    if hasattr(node, 'last_modified'):
-        properties['last_modified'] = int(node.last_modified.timestamp() * 1000) if node.last_modified else None
-    if hasattr(node, 'traversal_count'):
-        properties['traversal_count'] = node.traversal_count
-    if hasattr(node, 'last_traversed_by'):
-        properties['last_traversed_by'] = node.last_traversed_by
-    if hasattr(node, 'last_traversal_time'):
-        properties['last_traversal_time'] = int(node.last_traversal_time.timestamp() * 1000) if node.last_traversal_time else None
-
-    return properties
+def serialize_nodes_for_falkordb(nodes: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Batch form of serialize_node_for_falkordb().
 
+    Works column-wise: the field plan (which optional attributes exist) is
+    compiled once per node type, then each field is encoded for the whole
+    batch in one pass. Nodes are only read by attribute, never validated,
+    so trusted internal objects (engine nodes, model_construct() instances)
+    can be passed without building validated models first.
+
+    Args:
+        nodes: BaseNode instances or any objects with the same attributes
+
+    Returns:
+        One property dict per node, in input order. Nested dicts are compact
+        JSON; deserializing gives the same values as the per-object path.
+    """
+    return _serialize_batch(nodes, NODE_FIELD_PLAN, _node_plans, pack_numeric=False)
 
 def serialize_dict_fields(obj: Any) -> Dict[str, Any]:
     """
@@ -207,30 +429,56 @@ def deserialize_node_from_falkordb(properties: Dict[str, Any], node_type: str) -
     Returns:
         Dict suitable for BaseNode(**result)
     """
-    result = {}
+    return deserialize_nodes_from_falkordb([properties], node_type)[0]
 
-    for key, value in properties.items():
-        if value is None:
-            result[key] = None
-        elif isinstance(value, str) and ('{' in value or '[' in value):
-            # Likely JSON - try to parse
-            try:
-                result[key] = json.loads(value)
-            except json.JSONDecodeError:
-                # Not JSON - keep as string
-                result[key] = value
-        elif key.endswith('_at') or key.endswith('_time') or key.endswith('_modified'):
-            # Timestamp field - convert to datetime
-            try:
-                result[key] = datetime.fromtimestamp(value / 1000)
-            except (ValueError, TypeError):
-                result[key] = value
-        else:
-            # Pass through
-            result[key] = value
 
-    return result
+def deserialize_nodes_from_falkordb(rows: Iterable[Dict[str, Any]], node_type: str) -> List[Dict[str, Any]]:
+    """
+    Batch form of deserialize_node_from_falkordb().
 
+    Timestamp-key classification is computed once per distinct key for the
+    batch instead of once per value; JSON is parsed with orjson when installed.
+
+    Args:
+        rows: Raw FalkorDB node properties, one dict per node
+        node_type: Node type of the batch
+
+    Returns:
+        One dict per row, in input order
+    """
+    timestamp_keys: Dict[str, bool] = {}
+    results = []
+
+    for properties in rows:
+        result = {}
+        for key, value in properties.items():
+            if value is None:
+                result[key] = None
+                continue
+
+            is_timestamp = timestamp_keys.get(key)
+            if is_timestamp is None:
+                is_timestamp = timestamp_keys[key] = key.endswith(('_at', '_time', '_modified'))
+
+            if isinstance(value, str) and ('{' in value or '[' in value):
+                # Likely JSON - try to parse
+                try:
+                    result[key] = _loads(value)
+                except json.JSONDecodeError:
+                    # Not JSON - keep as string
+                    result[key] = value
+            elif is_timestamp:
+                # Timestamp field - convert to datetime
+                try:
+                    result[key] = _from_millis(value)
+                except (ValueError, TypeError):
+                    result[key] = value
+            else:
+                # Pass through
+                result[key] = value
+        results.append(result)
+
+    return results
 
 def deserialize_node_from_falkordb_legacy(properties: Dict[str, Any], node_type: str) -> BaseNode:
     """
@@ -326,66 +574,27 @@ def serialize_relation_for_falkordb(relation: BaseRelation) -> Dict[str, Any]:
     Returns:
         Dict with only primitive-type values
     """
-    properties = {}
-
-    # Category 1: Core Primitives (directly queryable)
-    properties['goal'] = relation.goal
-    properties['mindstate'] = relation.mindstate
-    properties['energy'] = relation.energy
-    properties['confidence'] = relation.confidence
-    properties['formation_trigger'] = relation.formation_trigger
-
-    # Link strength (critical for traversal queries)
-    if hasattr(relation, 'link_strength'):
-        properties['link_strength'] = relation.link_strength
-
-    # Timestamps
-    properties['valid_at'] = int(relation.valid_at.timestamp() * 1000)
-    if relation.invalid_at:
-        properties['invalid_at'] = int(relation.invalid_at.timestamp() * 1000)
+    return serialize_relations_for_falkordb([relation])[0]
 
-    # Category 2: Complex Consciousness Metadata → JSON strings
 
-    # sub_entity_valences: Dict[str, float] → JSON
-    if hasattr(relation, 'sub_entity_valences') and relation.sub_entity_valences:
-        properties['sub_entity_valences'] = json.dumps(relation.sub_entity_valences)
-    else:
-        properties['sub_entity_valences'] = '{}'
-
-    # sub_entity_emotion_vectors: Dict[str, Dict[str, float]] → JSON
-    if hasattr(relation, 'sub_entity_emotion_vectors') and relation.sub_entity_emotion_vectors:
-        properties['sub_entity_emotion_vectors'] = json.dumps(relation.sub_entity_emotion_vectors)
-    else:
-        properties['sub_entity_emotion_vectors'] = '{}'
-
-    # entity_coactivation_counts: Dict[str, int] → JSON
-    if hasattr(relation, 'entity_coactivation_counts') and relation.entity_coactivation_counts:
-        properties['entity_coactivation_counts'] = json.dumps(relation.entity_coactivation_counts)
-    else:
-        properties['entity_coactivation_counts'] = '{}'
-
-    # entity_link_strengths: Dict[str, float] → JSON
-    if hasattr(relation, 'entity_link_strengths') and relation.entity_link_strengths:
-        properties['entity_link_strengths'] = json.dumps(relation.entity_link_strengths)
-    else:
-        properties['entity_link_strengths'] = '{}'
-
-    # Category 3: Vector Embeddings
-    if hasattr(relation, 'embedding') and relation.embedding:
-        properties['embedding'] = relation.embedding
+def serialize_relations_for_falkordb(relations: Iterable[Any], pack_numeric: bool = False) -> List[Dict[str, Any]]:
+    """
+    Batch form of serialize_relation_for_falkordb().
 
-    # Observability fields
-    if hasattr(relation, 'last_modified'):
-        properties['last_modified'] = int(relation.last_modified.timestamp() * 1000) if relation.last_modified else None
-    if hasattr(relation, 'traversal_count'):
-        properties['traversal_count'] = relation.traversal_count
-    if hasattr(relation, 'last_traversed_by'):
-        properties['last_traversed_by'] = relation.last_traversed_by
-    if hasattr(relation, 'last_mechanism_id'):
-        properties['last_mechanism_id'] = relation.last_mechanism_id
+    Column-wise with a field plan compiled once per relation type, like
+    serialize_nodes_for_falkordb(). Relations are read by attribute only,
+    never validated.
 
-    return properties
+    Args:
+        relations: BaseRelation instances or any objects with the same attributes
+        pack_numeric: Store float dict fields (sub_entity_valences,
+            entity_link_strengths) with pack_numeric_dict() instead of JSON.
+            Only this module's relation deserializers decode them.
 
+    Returns:
+        One property dict per relation, in input order
+    """
+    return _serialize_batch(relations, RELATION_FIELD_PLAN, _relation_plans, pack_numeric)
 
 def deserialize_relation_from_falkordb(properties: Dict[str, Any], relation_type: str) -> BaseRelation:
     """
@@ -398,53 +607,74 @@ def deserialize_relation_from_falkordb(properties: Dict[str, Any], relation_type
     Returns:
         Validated BaseRelation instance
     """
-    # Parse JSON fields
-    sub_entity_valences = json.loads(properties.get('sub_entity_valences', '{}'))
-    sub_entity_emotion_vectors = json.loads(properties.get('sub_entity_emotion_vectors', '{}'))
-    entity_coactivation_counts = json.loads(properties.get('entity_coactivation_counts', '{}'))
-    entity_link_strengths = json.loads(properties.get('entity_link_strengths', '{}'))
+    return deserialize_relations_from_falkordb([properties], relation_type)[0]
 
-    # Parse timestamps
-    valid_at = datetime.fromtimestamp(properties['valid_at'] / 1000)
-    invalid_at = None
-    if properties.get('invalid_at'):
-        invalid_at = datetime.fromtimestamp(properties['invalid_at'] / 1000)
 
-    last_modified = None
-    if properties.get('last_modified'):
-        last_modified = datetime.fromtimestamp(properties['last_modified'] / 1000)
+def _decode_nested(value: str) -> Any:
+    """Nested relation field: packed numeric dict or JSON."""
+    if value.startswith(PACKED_PREFIX):
+        return unpack_numeric_dict(value)
+    return _loads(value)
 
-    # Construct BaseRelation
-    relation_data = {
-        'goal': properties['goal'],
-        'mindstate': properties['mindstate'],
-        'energy': properties['energy'],
-        'confidence': properties['confidence'],
-        'formation_trigger': properties['formation_trigger'],
-        'valid_at': valid_at,
-        'invalid_at': invalid_at,
-        'sub_entity_valences': sub_entity_valences,
-        'sub_entity_emotion_vectors': sub_entity_emotion_vectors,
-        'entity_coactivation_counts': entity_coactivation_counts,
-        'entity_link_strengths': entity_link_strengths,
-    }
 
-    # Optional fields
-    if 'link_strength' in properties:
-        relation_data['link_strength'] = properties['link_strength']
-    if 'embedding' in properties:
-        relation_data['embedding'] = properties['embedding']
-    if 'last_modified' in properties:
-        relation_data['last_modified'] = last_modified
-    if 'traversal_count' in properties:
-        relation_data['traversal_count'] = properties['traversal_count']
-    if 'last_traversed_by' in properties:
-        relation_data['last_traversed_by'] = properties['last_traversed_by']
-    if 'last_mechanism_id' in properties:
-        relation_data['last_mechanism_id'] = properties['last_mechanism_id']
+def deserialize_relations_from_falkordb(
+    rows: Iterable[Dict[str, Any]],
+    relation_type: str,
+    validate: bool = True
+) -> List[Union[BaseRelation, Dict[str, Any]]]:
+    """
+    Batch form of deserialize_relation_from_falkordb().
 
-    return BaseRelation(**relation_data)
+    Nested fields are decoded column-wise (orjson when installed, packed
+    float dicts unpacked).
+
+    Args:
+        rows: Raw FalkorDB relation properties, one dict per relation
+        relation_type: Relation type of the batch
+        validate: False skips the model entirely and returns the field dicts
+            (suitable for BaseRelation(**result)) - for rows this system wrote
+            itself. BaseRelation.model_construct() is no shortcut: it fills
+            defaults in Python and is slower than pydantic-core validation.
+
+    Returns:
+        One BaseRelation (or field dict) per row, in input order
+    """
+    rows = list(rows)
+    nested = {
+        key: [_decode_nested(properties.get(key, '{}')) for properties in rows]
+        for key in _RELATION_JSON_FIELDS
+    }
 
+    relations = []
+    for index, properties in enumerate(rows):
+        invalid_at = properties.get('invalid_at')
+        relation_data = {
+            'goal': properties['goal'],
+            'mindstate': properties['mindstate'],
+            'energy': properties['energy'],
+            'confidence': properties['confidence'],
+            'formation_trigger': properties['formation_trigger'],
+            'valid_at': _from_millis(properties['valid_at']),
+            'invalid_at': _from_millis(invalid_at) if invalid_at else None,
+        }
+        for key in _RELATION_JSON_FIELDS:
+            relation_data[key] = nested[key][index]
+
+        # Optional fields
+        if 'link_strength' in properties:
+            relation_data['link_strength'] = properties['link_strength']
+        if 'embedding' in properties:
+            relation_data['embedding'] = properties['embedding']
+        if 'last_modified' in properties:
+            last_modified = properties['last_modified']
+            relation_data['last_modified'] = _from_millis(last_modified) if last_modified else None
+        for key in ('traversal_count', 'last_traversed_by', 'last_mechanism_id'):
+            if key in properties:
+                relation_data[key] = properties[key]
+
+        relations.append(BaseRelation(**relation_data) if validate else relation_data)
+
+    return relations
 
 def verify_no_nested_dicts(properties: Dict[str, Any]) -> bool:
     """
@@ -0,0 +1,104 @@
+"""
+Tests for batched beam search expansion in tools/doc_ingestion/ask.py.
+
+Uses a small in-memory graph answering the batched query shapes: one
+frontier query per node step (neighbor properties reused for the node
+step), a shared adjacency LRU that serves a repeated question without any
+graph query, and vectorized scores equal to node_score / edge_score.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+
+from tools.doc_ingestion import ask as ask_module
+from tools.doc_ingestion.ask import (
+    AdjacencyLRU,
+    NeighborhoodCache,
+    beam_search,
+    edge_score,
+    edge_scores,
+    node_score,
+    node_scores,
+)
+
+
+class Result:
+    def __init__(self, rows):
+        self.result_set = rows
+
+
+class TinyGraph:
+    """a → b → c, a → d; only the batched UNWIND shapes are supported."""
+
+    def __init__(self):
+        self.queries = []
+        self.nodes = {
+            "a": {"id": "a", "confidence": 0.9, "base_weight": 0.9, "embedding": [1.0, 0.0]},
+            "b": {"id": "b", "confidence": 0.8, "base_weight": 0.9, "embedding": [0.8, 0.6]},
+            "c": {"id": "c", "confidence": "0.7", "base_weight": 1.0, "embedding": [0.6, 0.8]},
+            "d": {"id": "d", "confidence": 0.2, "base_weight": 0.2},
+        }
+        self.edges = [
+            ("RELATES_TO", "a", "b", {"confidence": 0.9, "energy": 0.9}),
+            ("RELATES_TO", "b", "c", {"confidence": 0.9, "energy": 0.8}),
+            ("DOCUMENTS", "a", "d", {"confidence": 0.3, "energy": "bad"}),
+        ]
+
+    def query(self, cypher, params=None):
+        self.queries.append(cypher)
+        if "-[r]-" in cypher:
+            rows = []
+            for nid in params["ids"]:
+                edges = [
+                    [rel, s, t, props, self.nodes[t if s == nid else s], t if s == nid else s]
+                    for rel, s, t, props in self.edges if nid in (s, t)
+                ]
+                rows.append([nid, edges[:params["limit"]]])
+            return Result(rows)
+        return Result([[nid, self.nodes[nid]] for nid in params["ids"] if nid in self.nodes])
+
+
+def test_one_frontier_query_per_node_step(monkeypatch):
+    # Path scores only shrink: disable the marginal-gain stop to walk the full depth
+    monkeypatch.setattr(ask_module, "MARGINAL_GAIN_THRESHOLD", float("-inf"))
+    graph = TinyGraph()
+    start = [{"id": "a", "props": graph.nodes["a"], "score_cos": 1.0}]
+    cache = NeighborhoodCache(graph)
+
+    path = beam_search(graph, start, np.array([1.0, 0.0]), beam_width=2, max_steps=4, cache=cache)
+
+    assert path.nodes == ["a", "b", "c"]
+    assert path.edges == [("a", "RELATES_TO", "b"), ("b", "RELATES_TO", "c")]
+    # Each edge step expands the frontier in one query; node steps reuse neighbor props
+    assert cache.queries == 2
+    assert all("UNWIND $ids" in q for q in graph.queries)
+
+
+def test_shared_adjacency_serves_repeat_question():
+    graph = TinyGraph()
+    shared = AdjacencyLRU(max_entries=16)
+    start = [{"id": "a", "props": graph.nodes["a"], "score_cos": 1.0}]
+
+    first = NeighborhoodCache(graph, shared=shared)
+    beam_search(graph, start, np.array([1.0, 0.0]), beam_width=2, max_steps=4, cache=first)
+    second = NeighborhoodCache(graph, shared=shared)
+    beam_search(graph, start, np.array([1.0, 0.0]), beam_width=2, max_steps=4, cache=second)
+
+    assert first.queries >= 1
+    assert second.queries == 0
+    assert shared.hits >= 1
+
+
+def test_vectorized_scores_match_scalar():
+    graph = TinyGraph()
+    props = [e[3] for e in graph.edges]
+    assert np.allclose(edge_scores(props), [edge_score(p) for p in props])
+
+    query = np.array([0.6, 0.8])
+    nodes = list(graph.nodes.values())
+    expected = [node_score(n, float(np.dot(query, n["embedding"])) if n.get("embedding") else 0.5) for n in nodes]
+    assert np.allclose(node_scores(nodes, query), expected)
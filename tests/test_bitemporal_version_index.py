@@ -0,0 +1,149 @@
+"""
+Tests for the bitemporal VersionIndex (orchestration/mechanisms/bitemporal.py).
+
+Property tests: for random version sets and random sequences of
+create_new_version / supersede / invalidate / expire, every index query
+must match the list-based functions (get_version_history,
+get_current_version, count_versions, was_known_during, was_valid_during)
+over the same objects. Timestamps come from a small grid so ties on both
+timelines are common.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+hypothesis = pytest.importorskip("hypothesis")
+from hypothesis import given, settings, strategies as st  # noqa: E402
+
+from orchestration.mechanisms.bitemporal import (  # noqa: E402
+    VersionIndex,
+    count_versions,
+    create_new_version,
+    expire,
+    get_current_version,
+    get_version_history,
+    invalidate,
+    is_currently_valid,
+    supersede,
+    was_known_during,
+    was_valid_during,
+)
+
+BASE = datetime(2025, 1, 1)
+IDS = ["a", "b", "c"]
+
+
+class Version:
+    def __init__(self, logical_id, vid, created_at, valid_at, expired_at=None, invalidated_at=None):
+        self.id = logical_id
+        self.vid = vid
+        self.created_at = created_at
+        self.valid_at = valid_at
+        self.expired_at = expired_at
+        self.invalidated_at = invalidated_at
+        self.supersedes = None
+        self.superseded_by = None
+
+
+day = st.integers(min_value=0, max_value=12).map(lambda d: BASE + timedelta(days=d))
+maybe_day = st.none() | day
+query_time = st.none() | day
+
+
+@st.composite
+def versions(draw):
+    out = []
+    for k in range(draw(st.integers(min_value=0, max_value=15))):
+        created, valid = draw(day), draw(day)
+        expired, invalidated = draw(maybe_day), draw(maybe_day)
+        out.append(Version(draw(st.sampled_from(IDS)), f"v{k}", created, valid,
+                           expired if expired is None or expired >= created else None,
+                           invalidated if invalidated is None or invalidated >= valid else None))
+    return out
+
+
+def assert_index_matches(index, objects, times):
+    for logical_id in IDS + ["missing"]:
+        history = get_version_history(objects, logical_id)
+        assert index.history(logical_id) == history
+        assert index.count(logical_id) == count_versions(objects, logical_id)
+        for knowledge, reality in times:
+            assert index.current(logical_id, knowledge, reality) is \
+                get_current_version(objects, logical_id, knowledge, reality)
+        for start, end in times:
+            if start is None or end is None:
+                continue
+            assert index.known_during(logical_id, start, end) == \
+                [v for v in history if was_known_during(v, start, end)]
+            by_valid = sorted((v for v in objects if v.id == logical_id), key=lambda v: v.valid_at)
+            assert index.valid_during(logical_id, start, end) == \
+                [v for v in by_valid if was_valid_during(v, start, end)]
+            assert index.valid_at(logical_id, start) == [v for v in by_valid if is_currently_valid(v, start)]
+
+
+@settings(max_examples=200, deadline=None)
+@given(versions(), st.lists(st.tuples(query_time, query_time), min_size=1, max_size=8))
+def test_index_queries_match_linear_functions(objects, times):
+    index = VersionIndex(objects)
+
+    assert len(index) == len(objects)
+    assert_index_matches(index, objects, times)
+
+
+operation = st.tuples(
+    st.sampled_from(["new_version", "supersede", "invalidate", "expire"]),
+    st.integers(min_value=0, max_value=1000),
+    day,
+)
+
+
+@settings(max_examples=100, deadline=None)
+@given(versions(), st.lists(operation, max_size=12), st.lists(st.tuples(query_time, query_time), min_size=1, max_size=6))
+def test_incremental_maintenance_matches_linear_functions(objects, operations, times):
+    objects = list(objects)
+    index = VersionIndex(objects)
+
+    for name, pick, when in operations:
+        if not objects:
+            break
+        target = objects[pick % len(objects)]
+        if name == "new_version":
+            objects.append(create_new_version(target, index=index, valid_at=when))
+        elif name == "supersede":
+            successor = create_new_version(target, index=index)
+            objects.append(successor)
+            supersede(target, successor, index=index)
+        elif name == "invalidate":
+            invalidate(target, max(when, target.valid_at), index=index)
+        else:
+            expire(target, max(when, target.created_at), index=index)
+
+    assert len(index) == len(objects)
+    assert_index_matches(index, objects, times)
+
+
+def test_list_functions_accept_index_and_update_resorts():
+    first = Version("a", "v1", BASE, BASE)
+    index = VersionIndex([first])
+    second = create_new_version(first, index=index, valid_at=BASE + timedelta(days=2))
+    supersede(first, second, index=index)
+
+    assert get_version_history(index, "a") == [first, second]
+    assert count_versions(index, "a") == 2
+    assert get_current_version(index, "a") is second
+    assert get_current_version(index, "a", as_of_knowledge=BASE) is first
+    assert get_current_version(index, "a", as_of_reality=BASE + timedelta(days=1)) is first
+
+    # Moving created_at behind the index's back needs update()
+    second.created_at = BASE - timedelta(days=1)
+    index.update(second)
+    assert index.history("a") == [second, first]
+
+    index.remove(first)
+    index.remove(second)
+    assert len(index) == 0 and index.logical_ids() == []
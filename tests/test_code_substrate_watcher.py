@@ -0,0 +1,116 @@
+"""
+Tests for batched code substrate ingestion (orchestration/services/watchers/code_substrate_watcher.py).
+
+EventCoalescer must debounce per path, release a burst as one batch once
+the stream goes quiet, still make progress under a continuous stream, and
+never sleep through an add() or stop request.
+The handler must turn a burst of watchdog events into one parameterized
+UNWIND ... MERGE per node type, on its worker thread, retrying failed
+batches.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from watchdog.events import FileCreatedEvent, FileModifiedEvent
+
+from orchestration.services.watchers.code_substrate_watcher import CodeSubstrateHandler, EventCoalescer
+
+
+class RecordingDB:
+    """Redis client double: records GRAPH.QUERY calls, optionally failing the first N."""
+
+    def __init__(self, fail=0):
+        self.calls = []
+        self.fail = fail
+        self.threads = set()
+
+    def execute_command(self, *args):
+        if "UNWIND" in args[2]:
+            self.threads.add(threading.current_thread().name)
+        if "UNWIND" in args[2] and self.fail:
+            self.fail -= 1
+            raise ConnectionError("falkordb unavailable")
+        self.calls.append(args)
+        return [[1]]
+
+
+def upserts(db):
+    return [call for call in db.calls if "UNWIND" in call[2]]
+
+
+def test_coalescer_debounces_per_path_and_collapses_bursts():
+    c = EventCoalescer(quiet_period=0.3, max_delay=2.0)
+    c.add("a.py", "created", now=0.0)
+    c.add("b.md", "modified", now=0.1)
+    c.add("a.py", "modified", now=0.2)
+    assert c.take_batch(now=0.4) == {}  # stream still hot
+    assert abs(c.next_delay(now=0.4) - 0.1) < 1e-9
+    assert c.take_batch(now=0.5) == {"a.py": "created", "b.md": "modified"}
+    assert len(c) == 0 and c.next_delay(now=0.5) is None
+
+    # Continuous stream: the max_delay cap releases paths that went quiet
+    hot = EventCoalescer(quiet_period=0.3, max_delay=2.0)
+    for i in range(30):
+        hot.add(f"f{i}.py", "modified", now=i * 0.1)
+        hot.add("hot.py", "modified", now=i * 0.1)
+    batch = hot.take_batch(now=2.95)
+    assert set(batch) == {f"f{i}.py" for i in range(27)}
+    assert "hot.py" not in batch and len(hot) == 4
+
+
+def test_coalescer_wait_for_work_cannot_miss_a_wakeup():
+    c = EventCoalescer(quiet_period=0.3, max_delay=2.0)
+    started = time.monotonic()
+    c.wait_for_work(lambda: True)  # stop requested before the wait: no block
+    c.wait_for_work(lambda: False, idle_timeout=0.05)  # nothing pending: still bounded
+    assert time.monotonic() - started < 1.0
+
+    woke = threading.Event()
+    waiter = threading.Thread(target=lambda: (c.wait_for_work(lambda: False, idle_timeout=30.0), woke.set()))
+    waiter.start()
+    time.sleep(0.05)
+    c.add("a.py", "modified")
+    assert woke.wait(5.0)
+    waiter.join()
+
+
+def test_apply_batch_sends_one_parameterized_upsert_per_node_type():
+    db = RecordingDB()
+    handler = CodeSubstrateHandler(db=db)
+    batch = {f"/repo/pkg/mod_{i}.py": "created" for i in range(40)}
+    batch["/repo/docs/it's \"quoted\".md"] = "modified"
+    batch["/repo/app/page.tsx"] = "modified"
+
+    assert handler.apply_batch(batch) == 42
+    assert handler.round_trips == 2 and len(db.calls) == 2
+    code, docs = sorted(db.calls, key=lambda call: "Documentation" in call[2])
+    assert code[0] == "GRAPH.QUERY" and code[1] == "ecosystem"
+    assert code[2].startswith("CYPHER rows=[{`name`:") and "MERGE (n:Code {file_path: row.file_path})" in code[2]
+    assert code[2].count("`file_path`:") == 41 and '`language`:"typescript"' in code[2]
+    assert 'it\'s \\"quoted\\".md' in docs[2] and "MERGE (n:Documentation" in docs[2]
+
+
+def test_worker_settles_bursts_off_thread_and_retries():
+    db = RecordingDB(fail=1)
+    handler = CodeSubstrateHandler(db=db, quiet_period=0.05, retry_backoff=0.05)
+    handler.start()
+    try:
+        for _ in range(3):  # editor saves: every file touched three times
+            for i in range(300):
+                handler.on_modified(FileModifiedEvent(f"/repo/src/m{i}.py"))
+        handler.on_created(FileCreatedEvent("/repo/src/new.py"))
+        handler.on_modified(FileModifiedEvent("/repo/node_modules/x/index.ts"))  # skipped dir
+        handler.on_modified(FileModifiedEvent("/repo/src/data.json"))  # unwatched suffix
+        assert handler.wait_settled(timeout=10.0)
+    finally:
+        handler.stop()
+
+    paths = [p for call in upserts(db) for p in call[2].split("`file_path`:")[1:]]
+    assert len(paths) == 301  # each file once, after the failed batch was retried
+    assert handler.upserts == 301 and len(upserts(db)) <= 3
+    assert db.threads == {"code-substrate-ingest"}
@@ -0,0 +1,145 @@
+"""
+Tests for incremental conversation tailing (ConversationWatcher).
+
+Covers byte-offset reads for contexts JSON and JSONL transcripts, partial
+writes, rewrite detection, legacy count-based positions, batched
+checkpoints and debounced dispatch.
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from orchestration.services.watchers.conversation_tail import (
+    DebouncedFileDispatcher,
+    IncrementalConversationReader,
+    TailPositionStore,
+    TailState,
+    message_text,
+)
+
+
+def _write_contexts(path: Path, messages, indent=2):
+    path.write_text(json.dumps({"session": "s1", "messages": messages}, indent=indent), encoding="utf-8")
+
+
+def _msgs(n, start=0):
+    out = []
+    for i in range(start, start + n):
+        out.append({"role": "user", "content": f"q{i}"})
+        out.append({"role": "assistant", "content": f"answer {i} — ünïcode"})
+    return out
+
+
+def test_contexts_json_only_new_messages(tmp_path):
+    path = tmp_path / "ctx.json"
+    reader = IncrementalConversationReader()
+
+    _write_contexts(path, _msgs(3))
+    first = reader.read_new(path)
+    assert [message_text(m) for m in first.messages] == [f"answer {i} — ünïcode" for i in range(3)]
+
+    offset_after_first = reader.state_for(path).offset
+    _write_contexts(path, _msgs(5))
+    second = reader.read_new(path)
+
+    assert not second.reset
+    assert [message_text(m) for m in second.messages] == [f"answer {i} — ünïcode" for i in range(3, 5)]
+    # Only the appended region was parsed
+    assert second.bytes_read < path.stat().st_size - offset_after_first + 1
+    assert reader.read_new(path).messages == []
+
+
+def test_contexts_json_partial_element_waits(tmp_path):
+    path = tmp_path / "ctx.json"
+    reader = IncrementalConversationReader()
+    full = json.dumps({"messages": _msgs(2)})
+    cut = full.index('"answer 1')
+    path.write_text(full[:cut], encoding="utf-8")
+
+    partial = reader.read_new(path)
+    assert [message_text(m) for m in partial.messages] == ["answer 0 — ünïcode"]
+
+    path.write_text(full, encoding="utf-8")
+    rest = reader.read_new(path)
+    assert [message_text(m) for m in rest.messages] == ["answer 1 — ünïcode"]
+
+
+def test_jsonl_trailing_partial_line(tmp_path):
+    path = tmp_path / "t.jsonl"
+    reader = IncrementalConversationReader()
+    line_a = json.dumps({"type": "assistant", "message": {"role": "assistant", "content": [{"type": "text", "text": "A"}]}})
+    line_b = json.dumps({"role": "assistant", "content": "B"})
+
+    path.write_text(line_a + "\n" + line_b[:10], encoding="utf-8")
+    assert [message_text(m) for m in reader.read_new(path).messages] == ["A"]
+
+    path.write_text(line_a + "\n" + line_b + "\n", encoding="utf-8")
+    assert [message_text(m) for m in reader.read_new(path).messages] == ["B"]
+
+
+def test_rewrite_detected_and_not_replayed(tmp_path):
+    path = tmp_path / "ctx.json"
+    reader = IncrementalConversationReader()
+    _write_contexts(path, _msgs(3), indent=2)
+    reader.read_new(path)
+
+    # Same conversation re-serialized differently (prefix bytes change)
+    _write_contexts(path, _msgs(4), indent=None)
+    result = reader.read_new(path)
+
+    assert result.reset
+    assert [message_text(m) for m in result.messages] == ["answer 3 — ünïcode"]
+
+
+def test_legacy_count_positions(tmp_path):
+    path = tmp_path / "ctx.json"
+    _write_contexts(path, _msgs(4))
+    states = {str(path): TailState.from_value(3)}
+    reader = IncrementalConversationReader(states)
+
+    result = reader.read_new(path)
+
+    assert [message_text(m) for m in result.messages] == ["answer 3 — ünïcode"]
+    assert states[str(path)].assistant_seen == 4
+
+
+def test_position_store_batches_checkpoints(tmp_path):
+    positions = tmp_path / "positions.json"
+    store = TailPositionStore(positions, batch_size=3, max_age=3600)
+    store.states["a"] = TailState(offset=10)
+
+    store.mark_dirty()
+    store.mark_dirty()
+    assert not positions.exists()
+
+    store.mark_dirty()
+    assert json.loads(positions.read_text())["a"]["offset"] == 10
+
+    reloaded = TailPositionStore(positions)
+    assert reloaded.states["a"].offset == 10
+
+
+def test_dispatcher_debounces_bursts(tmp_path):
+    calls = []
+    done = threading.Event()
+
+    def handler(path):
+        calls.append(path)
+        done.set()
+
+    dispatcher = DebouncedFileDispatcher(handler, debounce=0.05, max_workers=2)
+    try:
+        target = tmp_path / "x.json"
+        for _ in range(50):
+            dispatcher.schedule(target)
+        assert done.wait(2.0)
+        time.sleep(0.15)
+    finally:
+        dispatcher.stop()
+
+    assert calls == [target]
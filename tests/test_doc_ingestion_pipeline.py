@@ -0,0 +1,101 @@
+"""
+Tests for the pipelined corpus processing building blocks.
+
+Covers the bounded StagePipeline (ordering-independent completion, batching,
+concurrency limits, error isolation, entering at a later stage) and the
+per-stage checkpoints in IngestionStateManager used for resume.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tools.doc_ingestion.ingest_docs import IngestionStateManager
+from tools.doc_ingestion.pipeline import PipelineStage, StagePipeline
+
+
+def test_items_flow_through_all_stages_with_batches():
+    written = []
+    batch_sizes = []
+
+    def double(x):
+        return x * 2
+
+    def collect(batch):
+        batch_sizes.append(len(batch))
+        written.extend(batch)
+        return []
+
+    pipeline = StagePipeline([
+        PipelineStage('double', double, workers=3, queue_size=2),
+        PipelineStage('write', collect, batch_size=4, batch_wait=0.05, queue_size=2),
+    ])
+    stats = pipeline.run([('double', i) for i in range(20)])
+
+    assert sorted(written) == [i * 2 for i in range(20)]
+    assert max(batch_sizes) <= 4
+    assert stats['double']['items_out'] == 20
+    assert stats['write']['items_in'] == 20
+    assert stats['double']['max_queue_depth'] <= 2
+
+
+def test_concurrency_limit_respected():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow(x):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return x
+
+    StagePipeline([PipelineStage('llm', slow, workers=2)]).run([('llm', i) for i in range(10)])
+
+    assert peak == 2
+
+
+def test_errors_dropped_and_resume_entry_stage():
+    seen = []
+    errors = []
+
+    def chunk(x):
+        if x == 3:
+            raise ValueError("bad file")
+        return f"chunked-{x}"
+
+    def write(item):
+        seen.append(item)
+
+    pipeline = StagePipeline(
+        [PipelineStage('chunk', chunk), PipelineStage('write', write)],
+        on_error=lambda stage, item, exc: errors.append((stage, item, str(exc)))
+    )
+    stats = pipeline.run([('chunk', 1), ('chunk', 3), ('write', 'resumed-7')])
+
+    assert sorted(seen) == ['chunked-1', 'resumed-7']
+    assert errors == [('chunk', 3, 'bad file')]
+    assert stats['chunk']['errors'] == 1
+
+
+def test_stage_checkpoints_scoped_to_content_hash(tmp_path):
+    manager = IngestionStateManager(str(tmp_path / "state.db"))
+    manager.save_stage_checkpoint("a.md", "chunk", "h1", [{"chunk_id": "a.md_0"}])
+    manager.save_stage_checkpoint("a.md", "llm", "h1", {"chunk_count": 1, "result": {"edges": []}})
+
+    assert manager.get_stage_checkpoints("a.md", "h1") == {
+        "chunk": [{"chunk_id": "a.md_0"}],
+        "llm": {"chunk_count": 1, "result": {"edges": []}},
+    }
+    # File changed since: old checkpoints must not be reused
+    assert manager.get_stage_checkpoints("a.md", "h2") == {}
+
+    manager.mark_completed("a.md", chunk_count=1, node_count=0, link_count=0)
+    assert manager.get_stage_checkpoints("a.md", "h1") == {}
@@ -0,0 +1,122 @@
+"""
+Tests for LSH candidate blocking in orchestration/mechanisms/merge.py.
+
+Planted near-duplicates among random nodes: the blocked candidate search
+finds the same duplicates (and the same merges) as the exhaustive scan.
+Also covers incremental sync/remove/update and that nodes without a
+description or embedding do not all collide in one bucket.
+"""
+
+import random
+import string
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from orchestration.core.graph import Graph
+from orchestration.core.node import Node
+from orchestration.core.types import NodeType
+from orchestration.mechanisms.merge import (
+    DuplicateBlockingIndex,
+    find_and_merge_duplicates,
+    find_duplicate_candidates,
+)
+
+WORDS = ["energy", "graph", "membrane", "signal", "trace", "pattern", "memory", "stride",
+         "weight", "decay", "frame", "budget", "entity", "link", "wallet", "ledger"]
+TYPES = [NodeType.MEMORY, NodeType.CONCEPT, NodeType.PRINCIPLE]
+
+
+def random_name(rng):
+    # compute_name_similarity compares character sets, so word-based names
+    # ("a_b" vs "b_a") would be genuine matches the n-gram bands can miss
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(12))
+
+
+def make_graph(n=300, planted=20, seed=4):
+    rng = random.Random(seed)
+    graph = Graph("g", "blocking test")
+    nodes = []
+    for i in range(n):
+        description = " ".join(rng.choice(WORDS) for _ in range(12))
+        embedding = [rng.gauss(0, 1) for _ in range(16)]
+        node = Node(id=f"n{i}", name=random_name(rng), node_type=rng.choice(TYPES), description=description,
+                    properties={"embedding": embedding, "created_by": "tester"})
+        nodes.append(node)
+    for j in range(planted):
+        original = nodes[j * 7]
+        nodes.append(Node(
+            id=f"dup{j}", name=original.name.upper(), node_type=original.node_type,
+            description=original.description,
+            properties={"embedding": [x + rng.gauss(0, 0.05) for x in original.properties["embedding"]],
+                        "created_by": "tester"},
+        ))
+    for node in nodes:
+        graph.add_node(node)
+    return graph
+
+
+def test_blocked_candidates_match_exhaustive_scan():
+    graph = make_graph()
+    index = DuplicateBlockingIndex()
+    index.sync(graph)
+
+    for node in graph.nodes.values():
+        exhaustive = find_duplicate_candidates(graph, node, threshold=0.8)
+        blocked = find_duplicate_candidates(graph, node, threshold=0.8, index=index)
+        assert [c.id for c, _ in blocked] == [c.id for c, _ in exhaustive]
+    assert len(index.candidates(graph.nodes["n0"])) < len(graph.nodes) // 10
+
+    legacy = find_and_merge_duplicates(make_graph(), threshold=0.8, max_merges_per_run=100, use_blocking=False)
+    blocked = find_and_merge_duplicates(make_graph(), threshold=0.8, max_merges_per_run=100, use_blocking=True)
+    assert len(legacy) == 20
+    assert [(m.kept_node_id, m.absorbed_node_ids) for m in blocked] == \
+        [(m.kept_node_id, m.absorbed_node_ids) for m in legacy]
+
+
+def test_incremental_sync_remove_and_update():
+    graph = make_graph(n=50, planted=0)
+    index = DuplicateBlockingIndex()
+    assert index.sync(graph) == (50, 0)
+    assert index.sync(graph) == (0, 0)
+
+    twin = Node(id="twin", name=graph.nodes["n3"].name, node_type=graph.nodes["n3"].node_type,
+                description=graph.nodes["n3"].description)
+    graph.add_node(twin)
+    graph.remove_node("n5")
+    assert index.sync(graph) == (1, 1)
+    assert "n5" not in index
+    assert "twin" in index.candidates(graph.nodes["n3"])
+
+    twin.name, twin.description = "completely different", "nothing alike here at all"
+    index.update(twin)
+    assert "twin" not in index.candidates(graph.nodes["n3"])
+
+    # Edited in place without update(): sync re-hashes it from its fingerprint
+    twin.name, twin.description = graph.nodes["n3"].name, graph.nodes["n3"].description
+    assert index.sync(graph) == (1, 0)
+    assert "twin" in index.candidates(graph.nodes["n3"])
+    assert index.sync(graph) == (0, 0)
+
+    index.remove("twin")
+    assert len(index) == 49
+    assert "twin" not in {i for ids in index.candidate_map().values() for i in ids}
+
+
+def test_empty_fields_do_not_collide_and_map_is_symmetric():
+    graph = Graph("g", "sparse nodes")
+    rng = random.Random(9)
+    for i in range(40):
+        graph.add_node(Node(id=f"s{i}", name=random_name(rng), node_type=NodeType.MEMORY, description=""))
+    index = DuplicateBlockingIndex()
+    index.sync(graph)
+    neighbors = index.candidate_map()
+
+    # Empty descriptions and missing embeddings must not put everyone in one bucket
+    assert sum(len(ids) for ids in neighbors.values()) < 10
+    for node_id, ids in neighbors.items():
+        assert node_id not in ids
+        for other in ids:
+            assert node_id in neighbors[other]
+        assert ids == index.candidates(graph.nodes[node_id])
@@ -0,0 +1,132 @@
+"""
+Tests for incremental change detection in the dynamic prompt generator (orchestration/libs/dynamic_prompt_generator.py).
+
+The vectorized all-subentity pass must flag the same threshold crossings
+as the per-subentity scan it replaces; once a change feed is attached,
+checks must not scan the graph; and prompt writes must be debounced and
+skipped when only the timestamp would change.
+"""
+
+import asyncio
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from orchestration.libs import dynamic_prompt_generator as dpg
+from orchestration.libs.dynamic_prompt_generator import DynamicPromptGenerator, calculate_activation_threshold
+
+
+class FakeGraph:
+    """Graph store double: serves a fixed node table and counts queries."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.queries = 0
+
+    def query(self, cypher, params=None):
+        self.queries += 1
+        return self.rows if "n.E IS NOT NULL" in cypher else []
+
+
+def reference_states(energies, weights, entity_ids, thresholds):
+    """Per-subentity scan as the pre-array generator did it."""
+    states = {}
+    for entity_id in entity_ids:
+        states[entity_id] = {
+            node_id: True for node_id, energy in energies.items()
+            if energy * weights.get(node_id, {}).get(entity_id, 1.0) >= thresholds[entity_id]
+        }
+    return states
+
+
+def test_vectorized_pass_matches_per_subentity_scan(tmp_path, monkeypatch):
+    monkeypatch.setattr(dpg, "WEBSOCKET_AVAILABLE", False)
+    rng = random.Random(7)
+    entity_ids = ["translator", "validator", "architect"]
+    node_ids = [f"n{i}" for i in range(400)]
+    weights = {n: {e: rng.uniform(0.2, 2.0) for e in entity_ids if rng.random() < 0.5} for n in node_ids}
+    energies = {n: rng.uniform(0.0, 1.5) for n in node_ids}
+    gen = DynamicPromptGenerator("felix", FakeGraph(), file_path=str(tmp_path / "CLAUDE.md"), node_capacity=16)
+    gen.update_node_energies(node_ids, [energies[n] for n in node_ids],
+                             sub_entity_weights=[weights[n] for n in node_ids])
+
+    async def scenario():
+        flips = 0
+        for step in range(12):
+            if step == 5:
+                gen.update_entity_criticality("validator", 0.9)
+            if step == 8:
+                entity_ids.append("observer")  # new subentity mid-run
+            moved = rng.sample(node_ids, 40)
+            deltas = {n: rng.uniform(-0.4, 0.4) for n in moved}
+            for n, delta in deltas.items():
+                energies[n] = max(0.0, energies[n] + delta)
+            gen.apply_energy_deltas(deltas)
+            before = gen.activation_states
+            global_crit = 0.5 if step < 10 else 0.2
+            await gen.check_and_update(global_criticality=global_crit, entity_ids=entity_ids)
+            thresholds = {e: calculate_activation_threshold(global_crit, gen.entity_criticalities.get(e, 0.5))
+                          for e in entity_ids}
+            expected = reference_states(energies, weights, entity_ids, thresholds)
+            assert gen.activation_states == expected
+            flips += sum(len(set(before.get(e, {})) ^ set(expected[e])) for e in entity_ids)
+        return flips
+
+    flips = asyncio.run(scenario())
+    assert flips > 0
+
+
+def test_change_feed_replaces_graph_scan(tmp_path, monkeypatch):
+    monkeypatch.setattr(dpg, "WEBSOCKET_AVAILABLE", False)
+    graph = FakeGraph([(1, "alpha", 0.9, {}), (2, "beta", 0.1, {"translator": 10.0}), (3, "gamma", 0.3, None)])
+    gen = DynamicPromptGenerator("felix", graph, file_path=str(tmp_path / "CLAUDE.md"))
+
+    async def scenario():
+        await gen.check_and_update(0.5, ["translator"])  # no feed yet: one scan
+        assert graph.queries >= 1
+        assert set(gen.activation_states["translator"]) == {"1", "2"}
+
+        gen.apply_energy_deltas({"3": 0.6})  # feed attached: no more scans
+        queries = graph.queries
+        gen.min_write_interval = 3600.0
+        await gen.check_and_update(0.5, ["translator"])
+        assert graph.queries == queries
+        assert set(gen.activation_states["translator"]) == {"1", "2", "3"}
+        change = gen.recent_changes["translator"][-1]
+        assert (change.node_name, change.became_active) == ("gamma", True)
+
+        await gen.check_and_update(0.5, ["translator"])  # nothing moved: nothing to evaluate
+        assert len(gen.recent_changes["translator"]) == 3
+
+    asyncio.run(scenario())
+
+
+def test_prompt_writes_are_debounced_and_diffed(tmp_path, monkeypatch):
+    monkeypatch.setattr(dpg, "WEBSOCKET_AVAILABLE", False)
+    path = tmp_path / "CLAUDE.md"
+    gen = DynamicPromptGenerator("felix", FakeGraph(), file_path=str(path), min_write_interval=3600.0)
+    clock = [1000.0]
+    monkeypatch.setattr(dpg.time, "monotonic", lambda: clock[0])
+
+    async def scenario():
+        gen.update_node_energies(["a", "b"], [0.9, 0.1], names=["alpha", "beta"])
+        await gen.check_and_update(0.5, ["translator"])
+        assert gen.writes == 1 and "alpha (activity=0.90)" in path.read_text()
+
+        gen.update_node_energies(["a", "b"], [0.9, 0.95])
+        await gen.check_and_update(0.5, ["translator"])  # inside the window: deferred
+        assert gen.writes == 1 and "beta" not in path.read_text()
+
+        clock[0] += 3600.0
+        await gen.check_and_update(0.5, ["translator"])  # window elapsed: pending write lands
+        assert gen.writes == 2 and "beta: ACTIVATED" in path.read_text()
+
+        written = gen.bytes_written
+        gen._write_pending = True
+        await gen.flush()  # same content, new timestamp only: not rewritten
+        assert gen.writes == 2 and gen.bytes_written == written
+        assert not list(tmp_path.glob("*.tmp"))
+
+    asyncio.run(scenario())
@@ -0,0 +1,101 @@
+"""
+Tests for the process-wide EmbeddingModelRegistry.
+
+Uses a stand-in loader (no sentence-transformers download) to check that
+each model loads exactly once under concurrent first use, that warmup runs
+an encode, that encode latency metrics and off-loop encoding work, and that
+the metrics reach a service heartbeat.
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+
+from orchestration.adapters.search.model_registry import EmbeddingModelRegistry
+from orchestration.services.telemetry.heartbeat_writer import HeartbeatWriter
+
+
+class FakeModel:
+    def __init__(self, name):
+        self.name = name
+        self.encode_threads = []
+
+    def encode(self, texts, **kwargs):
+        self.encode_threads.append(threading.current_thread().name)
+        if isinstance(texts, str):
+            return np.full(4, len(texts), dtype=np.float32)
+        return np.stack([np.full(4, len(t), dtype=np.float32) for t in texts])
+
+
+def make_registry():
+    loads = []
+
+    def loader(name):
+        loads.append(name)
+        time.sleep(0.05)  # Slow load: concurrent callers must wait, not reload
+        return FakeModel(name)
+
+    return EmbeddingModelRegistry(loader=loader), loads
+
+
+def test_model_loaded_once_under_concurrency_and_warmed_up():
+    registry, loads = make_registry()
+    models = []
+
+    threads = [threading.Thread(target=lambda: models.append(registry.get_model("mini"))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert loads == ["mini"]
+    assert all(m is models[0] for m in models)
+    assert len(models[0].encode_threads) == 1  # Warmup encode
+
+    metrics = registry.metrics()["mini"]
+    assert metrics["load_seconds"] >= 0.05
+    assert metrics["warmup_seconds"] is not None
+    assert metrics["encodes"] == 0  # Warmup is not counted as traffic
+    assert metrics["cache_hits"] == 7  # Every caller but the loader
+
+
+def test_encode_metrics_and_async_encode_off_loop():
+    registry, loads = make_registry()
+    registry.warmup(["mini"])
+
+    vector = registry.encode("mini", "hello")
+    batch = registry.encode("mini", ["a", "bcd"])
+    async_vector = asyncio.run(registry.encode_async("mini", "hey"))
+
+    assert vector.tolist() == [5.0] * 4
+    assert batch.shape == (2, 4)
+    assert async_vector.tolist() == [3.0] * 4
+    assert registry.get_model("mini").encode_threads[-1].startswith("embed")
+    assert loads == ["mini"]
+
+    metrics = registry.metrics()["mini"]
+    assert metrics["encodes"] == 3
+    assert metrics["texts"] == 4
+    assert metrics["encode_p50_ms"] is not None
+    assert metrics["encode_p95_ms"] >= metrics["encode_p50_ms"]
+
+
+def test_metrics_are_reported_in_heartbeat(tmp_path):
+    registry, _ = make_registry()
+    registry.warmup(["mini"])
+    registry.encode("mini", "hello")
+
+    heartbeat = HeartbeatWriter("watcher_test", metadata_fn=lambda: {"embedding_models": registry.metrics()})
+    heartbeat.heartbeat_path = tmp_path / "watcher_test.heartbeat"
+    asyncio.run(heartbeat.write_heartbeat(**heartbeat._metadata()))
+
+    reported = json.loads(heartbeat.heartbeat_path.read_text())["embedding_models"]["mini"]
+    assert reported["load_seconds"] >= 0.05
+    assert reported["encodes"] == 1 and reported["cache_hits"] >= 1
@@ -0,0 +1,102 @@
+"""
+Tests for the linear-time MarkdownChunker (tools/doc_ingestion/md_chunker.py).
+
+Golden test: chunking every markdown file under docs/ must reproduce the
+digests in tests/fixtures/md_chunker_golden.json, recorded with the
+pre-rewrite chunker. A small BPE encoding defined here (cl100k
+pre-tokenizer, a few dozen merges) keeps the test offline and stresses
+forced splits. Docs the old chunker did not finish within two minutes are
+left out of the fixture. Also checks that forced splits tokenize a bounded
+multiple of the input and that fence lookups agree with a linear scan.
+"""
+
+import hashlib
+import json
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import pytest
+
+tiktoken = pytest.importorskip("tiktoken")
+
+from tools.doc_ingestion.md_chunker import MarkdownChunker
+
+GOLDEN = Path(__file__).parent / "fixtures" / "md_chunker_golden.json"
+
+CL100K_PATTERN = (
+    r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}+|\p{N}{1,3}| ?[^\s\p{L}\p{N}]++[\r\n]*"""
+    r"""|\s*[\r\n]|\s+(?!\S)|\s+"""
+)
+MERGES = [
+    b"th", b"the", b"he", b"in", b"ing", b"an", b"and", b"er", b"on", b"re", b"es", b"en", b"at", b"or",
+    b" t", b" the", b" a", b" an", b" and", b" i", b" in", b" o", b" of", b"of", b" s", b" c", b" w",
+    b"  ", b"    ", b"\n\n", b"##", b"###", b"``", b"```", b"--", b"---", b"**", b"ti", b"tion", b"on", b"st",
+]
+
+
+def small_bpe():
+    ranks = {bytes([i]): i for i in range(256)}
+    for token in MERGES:
+        ranks.setdefault(token, len(ranks))
+    return tiktoken.Encoding("md_chunker_test", pat_str=CL100K_PATTERN, mergeable_ranks=ranks, special_tokens={})
+
+
+def digest(chunks):
+    payload = json.dumps([[c.content, c.token_count, c.char_offset, c.chunk_index, c.chunk_type] for c in chunks])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class MeteredChunker(MarkdownChunker):
+    encoded_chars = 0
+
+    def count_tokens(self, text):
+        self.encoded_chars += len(text)
+        return super().count_tokens(text)
+
+
+def test_golden_chunks_over_repo_docs():
+    golden = json.loads(GOLDEN.read_text())
+    chunker = MarkdownChunker(encoder=small_bpe())
+
+    mismatched = [
+        rel_path for rel_path, expected in golden.items()
+        if (ROOT / rel_path).exists()
+        and digest(chunker.chunk_file((ROOT / rel_path).read_text(encoding="utf-8"))) != expected
+    ]
+
+    assert len(golden) > 100
+    assert mismatched == []
+
+
+def test_forced_splits_tokenize_linearly():
+    rng = random.Random(5)
+    words = ["alpha", "beta", "gamma", "delta", "the", "chunker", "token", "split", "of", "and"]
+    paragraph = " ".join(rng.choice(words) for _ in range(15_000))  # ~80KB, no paragraph breaks
+    chunker = MeteredChunker(encoder=small_bpe())
+
+    chunks = chunker.chunk_file("## Big\n\n" + paragraph)
+
+    assert chunks[0].content == "## Big"
+    assert all(c.token_count <= chunker.max_tokens for c in chunks)
+    assert "".join(c.content for c in chunks[1:]).replace(" ", "") == paragraph.replace(" ", "")
+    # Each split probes at most ~2 * over_limit characters however long the paragraph
+    # is (re-tokenizing the whole remainder per split costs over 100x here)
+    assert chunker.encoded_chars < 20 * len(paragraph)
+
+
+def test_fence_lookup_matches_linear_scan():
+    text = "intro\n" + "".join(f"## H{i}\n\n```py\n## not a header {i}\n```\n\ntext {i}\n\n" for i in range(50))
+    chunker = MarkdownChunker(encoder=small_bpe())
+    fences = chunker._find_code_fences(text)
+
+    assert len(fences) == 50
+    for pos in range(len(text)):
+        assert chunker._is_inside_code_fence(pos, fences) == any(s <= pos < e for s, e in fences)
+
+    sections = chunker._split_on_headers(text, fences)
+    assert len(sections) == 51
+    assert not any(s.startswith("## not a header") for s in sections)
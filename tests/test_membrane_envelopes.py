@@ -0,0 +1,177 @@
+"""
+Tests for compiled envelope validation (orchestration/schemas/membrane_envelopes.py).
+
+EnvelopeValidator must build the same models as the per-type Pydantic path,
+dispatch on the top-level type only, report unknown types and bad fields as
+ValueErrors, and answer replayed frames (rejections included) from its
+bounded digest cache. The protocol hub validates /inject frames with it,
+hands every client field (signature included) to the L4 checks, and
+forwards accepted frames unchanged.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+from pydantic import ValidationError
+
+from orchestration.protocol.hub import membrane_hub
+from orchestration.schemas.membrane_envelopes import (
+    ENVELOPE_REGISTRY,
+    EnvelopeValidator,
+    UnknownEnvelopeTypeError,
+    deserialize_envelope,
+)
+
+STIMULUS = {
+    "type": "membrane.inject",
+    "scope": "personal",
+    "channel": "ui.action.select_nodes",
+    "content": "User selected 3 nodes",
+    "features_raw": {"novelty": 0.5, "uncertainty": 0.1, "trust": 0.9,
+                     "urgency": 0.2, "valence": 0.3, "scale": 0.4},
+    "metadata": {"origin": "ui", "timestamp": "2025-10-27T12:00:00"},
+    "provenance": {"type": "nested keys are not the envelope type"},
+}
+
+PERCEPT = {
+    "type": "percept.frame",
+    "entity_id": "e1",
+    "citizen_id": "felix",
+    "affect": {"valence": 0.2, "arousal": 0.5},
+    "novelty": 0.1,
+    "uncertainty": 0.2,
+    "goal_match": 0.7,
+    "anchors_top": ["n1", "n2"],
+    "cursor": 42,
+    "timestamp": "2025-10-27T12:00:00",
+}
+
+
+class FakeWS:
+    def __init__(self, frames=()):
+        self.sent = []
+        self._frames = list(frames)
+
+    async def send(self, frame):
+        self.sent.append(frame)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._frames:
+            raise StopAsyncIteration
+        return self._frames.pop(0)
+
+
+def test_compiled_validation_matches_model_construction():
+    validator = EnvelopeValidator(cache_size=0)
+    for data in (STIMULUS, PERCEPT):
+        expected = ENVELOPE_REGISTRY[data["type"]](**data)
+        for source in (json.dumps(data), json.dumps(data).encode(), data):
+            envelope = validator.validate(source)
+            assert type(envelope) is type(expected)
+            assert envelope.model_dump() == expected.model_dump()
+        assert deserialize_envelope(json.dumps(data)).model_dump() == expected.model_dump()
+
+    # type not leading, and a duplicate type key (the last one wins when parsing)
+    reordered = json.dumps({k: v for k, v in PERCEPT.items() if k != "type"} | {"type": "percept.frame"})
+    assert validator.validate_json(reordered).entity_id == "e1"
+    duplicated = '{"type": "membrane.inject", ' + json.dumps(PERCEPT)[1:]
+    assert type(validator.validate_json(duplicated)).__name__ == "PerceptFrame"
+
+
+def test_unknown_types_and_invalid_fields_raise_value_errors():
+    validator = EnvelopeValidator(cache_size=0)
+    with pytest.raises(UnknownEnvelopeTypeError) as exc:
+        validator.validate_json(b'{"type": "no.such.type"}')
+    assert exc.value.envelope_type == "no.such.type"
+    with pytest.raises(UnknownEnvelopeTypeError):
+        validator.validate_json(b'{"channel": "x"}')
+    with pytest.raises(ValidationError):
+        validator.validate_json(b'{"type": "percept.frame", "broken')
+    with pytest.raises(ValidationError):
+        validator.validate_json(json.dumps(dict(PERCEPT, novelty=3.0)))
+    with pytest.raises(ValueError):
+        deserialize_envelope({"type": "percept.frame"})
+
+
+def test_replayed_frames_are_served_from_bounded_cache():
+    validator = EnvelopeValidator(cache_size=2)
+    frame = json.dumps(PERCEPT).encode()
+    first = validator.validate_json(frame)
+    assert validator.validate_json(frame) is first
+    assert validator.stats()["hits"] == 1 and validator.stats()["misses"] == 1
+
+    bad = b'{"type": "percept.frame"}'
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            validator.validate_json(bad)
+    assert validator.stats()["hits"] == 2  # the rejection was cached too
+
+    validator.validate_json(json.dumps(STIMULUS))
+    assert validator.stats()["cached"] == 2
+    assert validator.validate_json(frame) is not first  # evicted (least recently used)
+
+
+def test_protocol_hub_rejects_bad_frames_and_forwards_accepted_ones():
+    membrane_hub.SUBS.clear()
+    subscriber = FakeWS()
+    membrane_hub.SUBS["graph.update"].add(subscriber)
+    accepted = '{"type":"membrane.inject","channel":"graph.update","payload":{"q":1},"origin":"l3.docs"}'
+    publisher = FakeWS([
+        accepted,
+        b'{"type":"membrane.inject","channel":"","payload":{},"origin":"l3.docs"}',
+        '{"type":"membrane.inject","channel":"graph.update","payload":{}}',
+        "not json",
+    ])
+
+    asyncio.run(membrane_hub.handle_inject(publisher))
+
+    assert subscriber.sent == [accepted]
+    reasons = [json.loads(f)["payload"]["exception"] for f in publisher.sent]
+    assert reasons[:2] == [
+        "Schema validation failed: Invalid channel format",
+        "Schema validation failed: Missing required field: 'origin'",
+    ]
+    assert reasons[2].startswith("Schema validation failed: Invalid JSON")
+    assert json.loads(publisher.sent[2])["payload"]["original_envelope"] == {"raw": "not json"}
+    assert membrane_hub.validate_envelope({"type": "x"}) == (False, "Invalid envelope type: x")
+
+
+def test_protocol_hub_schema_is_presence_only_and_reports_full_frame():
+    # Same contract as the hand-written checks it replaced: payload/origin
+    # only need to be present, timestamp is untyped
+    for extra in ({"timestamp": 1730000000}, {"origin": 7}, {"payload": [1, 2]}, {"payload": None}):
+        frame = dict({"type": "membrane.inject", "channel": "graph.update", "payload": {}, "origin": "l3"}, **extra)
+        assert membrane_hub.validate_envelope(frame) == (True, None)
+        assert membrane_hub.validate_envelope(json.dumps(frame)) == (True, None)
+
+    # A policy rejection (CPS-1 quote) reports every field the client sent
+    unpaid = {"type": "membrane.inject", "channel": "docs.view.request", "payload": {"q": 1},
+              "origin": "l3.docs", "timestamp": 1730000000, "signature": "sig", "trace_id": "t-1"}
+    publisher = FakeWS([json.dumps(unpaid)])
+    asyncio.run(membrane_hub.handle_inject(publisher))
+
+    report = json.loads(publisher.sent[0])["payload"]
+    assert report["exception"].startswith("CPS-1 violation")
+    assert report["original_envelope"] == unpaid
+
+
+def test_protocol_hub_passes_extra_fields_to_l4_checks(monkeypatch):
+    seen = []
+    monkeypatch.setattr(membrane_hub, "verify_sea_signature", lambda env: (seen.append(env), (True, None))[1])
+    membrane_hub.SUBS.clear()
+    signed = {"type": "membrane.inject", "channel": "graph.update", "payload": {"q": 1},
+              "origin": "l3.docs", "signature": "sig", "quote_id": "q-1"}
+    publisher = FakeWS([json.dumps(signed)])
+
+    asyncio.run(membrane_hub.handle_inject(publisher))
+
+    assert publisher.sent == []
+    assert seen == [signed]  # no timestamp key invented, extras kept
@@ -0,0 +1,97 @@
+"""
+Tests for membrane hub fan-out (per-subscriber send queues).
+
+Uses in-memory stand-ins for websocket connections: a stalled subscriber
+must not delay the others, each envelope is encoded once, and the three
+overflow policies behave as documented.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from orchestration.adapters.bus import membrane_hub
+from orchestration.adapters.bus.membrane_hub import SUBS, Subscriber, dispatch
+
+
+class FakeWS:
+    def __init__(self, stalled=False):
+        self.frames = []
+        self.stalled = stalled
+        self.close_code = None
+        self._release = asyncio.Event()
+
+    async def send(self, frame):
+        if self.stalled:
+            await self._release.wait()
+        self.frames.append(frame)
+
+    async def close(self, code=1000, reason=""):
+        self.close_code = code
+
+
+def subscribe(ws, channel, **kwargs):
+    sub = Subscriber(ws, **kwargs)
+    sub.channels.add(channel)
+    SUBS[channel].add(sub)
+    sub.start()
+    return sub
+
+
+def test_stalled_subscriber_does_not_block_fan_out():
+    async def scenario():
+        SUBS.clear()
+        fast, stalled = FakeWS(), FakeWS(stalled=True)
+        subscribe(fast, "docs")
+        slow_sub = subscribe(stalled, "docs", max_queue=4)
+
+        for i in range(10):
+            await dispatch({"type": "membrane.inject", "channel": "docs", "payload": {"i": i}})
+        await asyncio.sleep(0.01)
+
+        assert [json.loads(f)["payload"]["i"] for f in fast.frames] == list(range(10))
+        # Frames are encoded once and shared by every subscriber queue
+        assert list(slow_sub._queue)[-1][1] is fast.frames[-1]
+        # drop_oldest: the stalled subscriber keeps only the newest frames
+        # (6 is in flight in its writer, blocked on the socket)
+        assert [json.loads(f)["payload"]["i"] for _, f in slow_sub._queue] == [7, 8, 9]
+        assert slow_sub.dropped == 6
+
+        for sub in list(SUBS["docs"]):
+            await sub.wait_closed()
+
+    asyncio.run(scenario())
+
+
+def test_coalesce_and_disconnect_policies():
+    async def scenario():
+        SUBS.clear()
+        coalescing = Subscriber(FakeWS(), max_queue=3, overflow="coalesce")
+        for frame, channel in [("a1", "a"), ("b1", "b"), ("a2", "a"), ("a3", "a")]:
+            coalescing.offer(frame, channel)
+        assert [f for _, f in coalescing._queue] == ["b1", "a3"]
+        assert coalescing.coalesced == 2
+
+        ws = FakeWS()
+        disconnecting = subscribe(ws, "docs", max_queue=2, overflow="disconnect")
+        disconnecting._writer.cancel()  # Nothing drains: the queue fills
+        assert disconnecting.offer("1", "docs") and disconnecting.offer("2", "docs")
+        assert not disconnecting.offer("3", "docs")
+        await asyncio.sleep(0)
+        assert ws.close_code == 1008
+        assert disconnecting not in SUBS["docs"]
+
+    asyncio.run(scenario())
+
+
+def test_unknown_overflow_policy_rejected():
+    try:
+        Subscriber(FakeWS(), overflow="block")
+    except ValueError as e:
+        assert "block" in str(e)
+    else:
+        raise AssertionError("expected ValueError")
+    assert membrane_hub.OVERFLOW_POLICY in membrane_hub.OVERFLOW_POLICIES
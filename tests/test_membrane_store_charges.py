@@ -0,0 +1,110 @@
+"""
+Tests for MembraneStore.record_charge (server-side Lua charge script).
+
+Runs against fakeredis with Lua support (skipped when unavailable): the
+script must reproduce the EMA / budget / ledger / wallet updates of the
+client-side sequence, concurrent charges must not lose updates, and the
+micro-batcher must coalesce charges per (org, lane).
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+from orchestration.services.economy.membrane_store import MembraneStore
+
+ORG = "org_test"
+
+
+def make_store(**kwargs):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True, max_connections=256)
+    return MembraneStore("redis://unused", client=client, **kwargs), client
+
+
+def test_charge_script_matches_sequential_ema_and_side_effects():
+    async def scenario():
+        store, client = make_store(spend_alpha=0.25)
+        await store.set_lane_budget(ORG, "exec", soft_cap=100.0, budget_remaining=100.0)
+
+        charges = [(2.0, 1.5), (4.0, None), (1.0, -3.0)]
+        spent, roi, budget = 0.0, 1.0, 100.0
+        for amount, roi_sample in charges:
+            result = await store.record_charge(
+                ORG, "exec", amount,
+                roi_sample=roi_sample, citizen_id="ada", wallet_node="node:citizen:ada",
+                metadata={"request_id": "r1"},
+            )
+            spent = 0.75 * spent + 0.25 * amount
+            if roi_sample is not None:
+                roi = 0.75 * roi + 0.25 * max(roi_sample, 0.0)
+            budget -= amount
+            assert result["spent_rolling"] == pytest.approx(spent, abs=1e-12)
+            assert result["roi_ema"] == pytest.approx(roi, abs=1e-12)
+            assert result["budget_remaining"] == pytest.approx(budget)
+
+        snapshot = await store.get_lane_snapshot(ORG, "exec")
+        assert snapshot["spent_60s"] == pytest.approx(spent)
+        assert await store.get_wallet_balance(ORG, "node:citizen:ada") == pytest.approx(-7.0)
+        assert float(await client.get(f"{ORG}:spent:node:node:citizen:ada:60s")) == pytest.approx(7.0)
+
+        ledger = await client.xrange(f"{ORG}:ledger:econ")
+        assert [fields["amount_mind"] for _, fields in ledger] == ["2.000000", "4.000000", "1.000000"]
+        assert ledger[1][1]["roi_sample"] == ""
+        assert ledger[0][1]["meta_request_id"] == "r1"
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("batch_window_ms", [0.0, 2.0])
+def test_concurrent_charges_lose_no_updates(batch_window_ms):
+    async def scenario():
+        store, client = make_store(batch_window_ms=batch_window_ms, batch_max=16)
+        await store.set_lane_budget(ORG, "exec", soft_cap=1000.0, budget_remaining=1000.0)
+
+        wallets = [f"node:citizen:{i % 4}" for i in range(200)]
+        results = await asyncio.gather(*(
+            store.record_charge(ORG, "exec", 0.5, roi_sample=1.0, wallet_node=wallet)
+            for wallet in wallets
+        ))
+
+        assert len(results) == 200
+        budgets = sorted(r["budget_remaining"] for r in results)
+        assert budgets == pytest.approx([1000.0 - 0.5 * n for n in range(200, 0, -1)])
+        assert await client.xlen(f"{ORG}:ledger:econ") == 200
+        for i in range(4):
+            assert await store.get_wallet_balance(ORG, f"node:citizen:{i}") == pytest.approx(-25.0)
+        await store.close()
+
+    asyncio.run(scenario())
+
+
+def test_batcher_coalesces_charges_per_lane():
+    async def scenario():
+        store, _ = make_store(batch_window_ms=5.0)
+        calls = []
+        apply_charges = store._apply_charges
+
+        async def counting(org_id, lane, charges):
+            calls.append((lane, len(charges)))
+            return await apply_charges(org_id, lane, charges)
+
+        store._apply_charges = counting
+        await asyncio.gather(*(
+            store.record_charge(ORG, lane, 1.0) for lane in ["a", "b"] * 10
+        ))
+        assert sorted(calls) == [("a", 10), ("b", 10)]
+
+        # Charges still pending at close are applied, not dropped
+        pending = asyncio.create_task(store.record_charge(ORG, "a", 1.0))
+        await asyncio.sleep(0)
+        await store.close()
+        assert (await pending)["budget_remaining"] == pytest.approx(-11.0)
+
+    asyncio.run(scenario())
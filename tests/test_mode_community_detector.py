@@ -0,0 +1,95 @@
+"""
+Tests for sparse edge construction and the resolution sweep in
+orchestration/mechanisms/mode_community_detector.py.
+
+Edges from sparse_edge_list match the legacy double loop over a dense
+matrix (for dense and scipy.sparse input). The sweep skips Leiden above
+the heaviest edge (singletons are optimal there), gives the same
+communities in-process and across a process pool, and with
+plateau_patience stops once the partition stops changing.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+pytest.importorskip("igraph")
+
+from orchestration.mechanisms import mode_community_detector as mcd
+from orchestration.mechanisms.mode_community_detector import ModeCommunityDetector, sparse_edge_list
+
+
+def planted_role_graph(blocks=6, size=40, p_in=0.4, p_out=0.01, seed=3):
+    rng = np.random.default_rng(seed)
+    labels = np.repeat(np.arange(blocks), size)
+    n = labels.size
+    p = np.where(labels[:, None] == labels[None, :], p_in, p_out)
+    upper = np.triu((rng.random((n, n)) < p) * rng.uniform(0.1, 0.9, (n, n)), k=1)
+    return upper + upper.T, labels
+
+
+def offline_detector():
+    detector = ModeCommunityDetector("citizen_test")
+    detector._load_historical_partition = lambda: None
+    detector._save_historical_partition = lambda partition: None
+    return detector
+
+
+def test_edge_list_matches_dense_double_loop():
+    W, _ = planted_role_graph(blocks=3, size=20)
+    W[0, 5] = 0.7  # Asymmetric entry: only the upper triangle counts
+    W[5, 0] = 0.0
+
+    expected = [(i, j, W[i, j]) for i in range(len(W)) for j in range(i + 1, len(W)) if W[i, j] > 0]
+    for matrix in (W, sparse.csr_matrix(W), sparse.coo_array(W)):
+        edges, weights = sparse_edge_list(matrix)
+        assert edges.tolist() == [[i, j] for i, j, _ in expected]
+        assert weights.tolist() == [w for _, _, w in expected]
+
+    detector = offline_detector()
+    community = [3, 1, 7, 12]
+    assert detector._compute_boundary_clarity(community, sparse.csr_matrix(W)) == \
+        pytest.approx(detector._compute_boundary_clarity(community, W))
+
+
+def test_sweep_skips_resolutions_above_heaviest_edge_and_pool_agrees(monkeypatch):
+    W, _ = planted_role_graph()
+    ids = [f"e{i}" for i in range(len(W))]
+    runs = []
+    leiden_at = mcd._leiden_at
+    monkeypatch.setattr(mcd, "_leiden_at", lambda task: runs.append(task[0]) or leiden_at(task))
+
+    serial = offline_detector().detect_communities(W, ids, max_workers=1, seed=11)
+
+    # logspace(-2, 1, 20) has 7 resolutions above the heaviest edge (< 0.9)
+    assert len(runs) == 13
+    assert max(runs) <= W.max()
+
+    monkeypatch.setattr(mcd, "_leiden_at", leiden_at)
+    monkeypatch.setattr(mcd, "PARALLEL_MIN_EDGES", 0)
+    pooled = offline_detector().detect_communities(W, ids, max_workers=2, seed=11)
+    assert pooled == serial
+
+
+def test_plateau_stops_sweep_and_recovers_planted_blocks(monkeypatch):
+    W, labels = planted_role_graph()
+    runs = []
+    leiden_at = mcd._leiden_at
+    monkeypatch.setattr(mcd, "_leiden_at", lambda task: runs.append(task[0]) or leiden_at(task))
+
+    communities = offline_detector().detect_communities(
+        sparse.csr_matrix(W), [f"e{i}" for i in range(len(W))], max_workers=1, plateau_patience=3, seed=11
+    )
+
+    assert len(runs) < 13
+    assert sorted(sorted(labels[c].tolist()) for c in communities) == \
+        sorted([[b] * 40 for b in range(6)])
+
+    relabeled = [[0, 0, 1, 2], [5, 5, 3, 4], [1, 1, 0, 2]]
+    assert ModeCommunityDetector._has_plateaued(relabeled, 3)
+    assert not ModeCommunityDetector._has_plateaued(relabeled + [[0, 1, 1, 2]], 3)
@@ -0,0 +1,76 @@
+"""
+Tests for the mp_lint LintDriver (shared-parse, cached scanner runs).
+
+Checks that one driver pass reports exactly what the individual scanner
+scan_file functions report, and that the content-hash cache is reused for
+unchanged files and invalidated when content changes.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tools.mp_lint.driver import LintDriver
+from tools.mp_lint.scanner_fail_loud import scan_file_for_fail_loud
+from tools.mp_lint.scanner_fallback import scan_file_for_fallback
+from tools.mp_lint.scanner_hardcoded import scan_file_for_hardcoded
+from tools.mp_lint.scanner_quality import scan_file_for_quality
+
+SAMPLE = '''
+import logging
+
+THRESHOLDS = [0.25, 0.5, 0.75]
+
+
+def load(path):
+    try:
+        return open(path).read()
+    except Exception:
+        pass
+
+
+def check(x):
+    # TODO: tighten this
+    print("checking", x)
+    if x > 42:
+        return "https://example.com/api"
+    return None
+'''
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / "orchestration" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_driver_matches_individual_scanners(tmp_path):
+    path = _write(tmp_path, "sample.py", SAMPLE)
+
+    result = LintDriver().lint_paths([path])
+    per_file = result.results[str(path)]
+
+    assert per_file["hardcoded"] == scan_file_for_hardcoded(path)
+    assert per_file["quality"] == scan_file_for_quality(path)
+    assert per_file["fallback"] == scan_file_for_fallback(path)
+    assert per_file["fail_loud"] == scan_file_for_fail_loud(path)
+    assert sum(len(v) for v in per_file.values()) > 0
+
+
+def test_cache_reused_until_content_changes(tmp_path):
+    path = _write(tmp_path, "sample.py", SAMPLE)
+    cache_path = tmp_path / "lint_cache.json"
+
+    first = LintDriver(cache_path=cache_path).lint_paths([path, tmp_path / "notes.md"])
+    assert (first.files_scanned, first.cache_hits) == (1, 0)
+
+    # New driver instance: cache comes from disk, results hydrate identically
+    second = LintDriver(cache_path=cache_path).lint_paths([path])
+    assert (second.files_scanned, second.cache_hits) == (0, 1)
+    assert second.results == first.results
+
+    path.write_text(SAMPLE + "\n\ndef extra():\n    pass\n", encoding="utf-8")
+    third = LintDriver(cache_path=cache_path).lint_paths([path])
+    assert (third.files_scanned, third.cache_hits) == (1, 0)
@@ -0,0 +1,169 @@
+"""
+Tests for MPSv3 startup planning and supervision (orchestration/services/mpsv3/).
+
+The planner must layer services by depends_on/requires and reject cycles;
+start_all must launch dependents only once their dependencies are ready
+and start independent services together; a dead service must not block
+check_all_health, and its restart state machine must back off, restart
+it, see it ready again, and quarantine after max retries; a restart in
+flight when shutdown_all runs must not start the service again.
+"""
+
+import socket
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+import yaml
+
+from orchestration.services.mpsv3.backoff import BackoffState
+from orchestration.services.mpsv3.planner import DependencyCycleError, plan_startup_layers
+from orchestration.services.mpsv3.registry import ServiceRegistry
+from orchestration.services.mpsv3.restart import RestartState, RestartStateMachine
+
+BUNDLED = Path(__file__).resolve().parents[1] / "orchestration" / "services" / "mpsv3" / "services.yaml"
+
+# Exits 1 if a dependency port is down, else sleeps `delay` and listens on `port`
+DUMMY = """
+import socket, sys, time
+delay, port, deps = float(sys.argv[1]), int(sys.argv[2]), [int(p) for p in sys.argv[3:]]
+for p in deps:
+    try:
+        socket.create_connection(("127.0.0.1", p), timeout=1).close()
+    except OSError:
+        sys.exit(1)
+time.sleep(delay)
+s = socket.socket()
+s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+s.bind(("127.0.0.1", port))
+s.listen(8)
+while True:
+    s.accept()[0].close()
+"""
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def write_config(tmp_path, services):
+    """services: (id, delay, [deps]) -> yaml with dummy TCP services."""
+    ports = {sid: free_port() for sid, _, _ in services}
+    entries = []
+    for sid, delay, deps in services:
+        entries.append({
+            "id": sid,
+            "cmd": [sys.executable, "-c", DUMMY, str(delay), str(ports[sid])] + [str(ports[d]) for d in deps],
+            "requires": deps,
+            "max_retries": 2,
+            "readiness": {"tcp": {"host": "127.0.0.1", "port": ports[sid], "timeout_s": 0.5}},
+        })
+    path = tmp_path / "services.yaml"
+    path.write_text(yaml.safe_dump({"services": entries}))
+    return path
+
+
+def test_planner_layers_bundled_services_and_rejects_cycles():
+    assert plan_startup_layers({"a": [], "b": ["a"], "c": ["a", "missing"], "d": ["b", "c"]}) == [
+        ["a"], ["b", "c"], ["d"]
+    ]
+    with pytest.raises(DependencyCycleError):
+        plan_startup_layers({"a": ["c"], "b": ["a"], "c": ["b"], "d": []})
+
+    registry = ServiceRegistry(str(BUNDLED))  # services.yaml spells dependencies 'requires'
+    layer_of = {sid: i for i, layer in enumerate(registry.startup_layers) for sid in layer}
+    assert layer_of["falkordb"] == 0
+    assert layer_of["falkordb"] < layer_of["protocol_hub"] < layer_of["ws_api"] < layer_of["dashboard"]
+    assert layer_of["signals_collector"] == layer_of["dashboard"]
+
+
+def test_start_all_waits_for_dependencies_and_starts_siblings_together(tmp_path):
+    path = write_config(tmp_path, [
+        ("db", 0.6, []),
+        ("api", 0.2, ["db"]),
+        ("worker_a", 0.6, ["api"]),
+        ("worker_b", 0.6, ["api"]),
+    ])
+    registry = ServiceRegistry(str(path))
+    try:
+        report = registry.start_all(readiness_timeout_s=30.0, probe_interval_s=0.05)
+    finally:
+        registry.shutdown_all()
+
+    assert report.all_ready, report.format()
+    assert report.started_at["api"] >= report.ready_at["db"]
+    assert report.started_at["worker_a"] >= report.ready_at["api"]
+    assert abs(report.started_at["worker_a"] - report.started_at["worker_b"]) < 0.1
+    # Siblings initialize concurrently: well under a serial 0.6 + 0.6
+    assert report.ready_at["worker_b"] - report.ready_at["api"] < 1.1
+    assert all(m.state == RestartState.RUNNING for m in registry.restart_machines.values())
+
+
+def test_restart_state_machine_backs_off_and_quarantines():
+    machine = RestartStateMachine("svc", BackoffState(max_retries=2), failure_threshold=3, readiness_timeout_s=5.0)
+    machine.on_started(0.0)
+    machine.on_ready(1.0)
+    for failures, expected in ((1, RestartState.UNHEALTHY), (2, RestartState.UNHEALTHY), (3, RestartState.BACKOFF)):
+        machine.on_liveness(False, failures, 2.0)
+        assert machine.state == expected
+    assert not machine.restart_due(2.0) and machine.restart_due(2.0 + 60.0)
+
+    machine.on_restarting(3.0)
+    machine.on_started(3.0)
+    assert not machine.on_readiness_failed(4.0) and machine.state == RestartState.STARTING
+    assert machine.on_readiness_failed(8.5) and machine.state == RestartState.BACKOFF  # window ran out
+    machine.on_restarting(9.0)
+    machine.on_started(9.0)
+    machine.on_exit(9.5)
+    assert machine.state == RestartState.QUARANTINED and machine.restarts == 2
+
+
+def test_dead_service_does_not_block_health_checks(tmp_path):
+    path = write_config(tmp_path, [("db", 0.0, []), ("api", 0.0, [])])
+    registry = ServiceRegistry(str(path))
+    registry.runners["db"].backoff.base_delay = 0.05
+    try:
+        assert registry.start_all(readiness_timeout_s=30.0, probe_interval_s=0.05).all_ready
+        registry.runners["db"].process.kill()
+        registry.runners["db"].process.wait()
+
+        started = time.monotonic()
+        status = registry.check_all_health()
+        assert time.monotonic() - started < 1.0  # no inline restart-and-wait
+        assert status == {"db": False, "api": True}
+
+        deadline = time.monotonic() + 15.0
+        while registry.restart_machines["db"].state != RestartState.RUNNING:
+            assert time.monotonic() < deadline, registry.restart_machines["db"].state
+            time.sleep(0.2)
+            registry.check_all_health()
+        assert registry.restart_machines["db"].restarts == 1
+        assert registry.check_all_health() == {"db": True, "api": True}
+    finally:
+        registry.shutdown_all()
+
+
+def test_restart_in_flight_does_not_start_service_after_shutdown(tmp_path):
+    registry = ServiceRegistry(str(write_config(tmp_path, [("db", 0.0, [])])))
+    runner = registry.runners["db"]
+    runner.backoff.base_delay = 0.0
+    starts, stops = [], []
+    runner.start = lambda: starts.append(time.monotonic())
+    runner.shutdown = lambda: (stops.append(time.monotonic()), time.sleep(0.3))  # SIGTERM grace
+
+    machine = registry.restart_machines["db"]
+    machine.on_started(time.monotonic())
+    machine.on_exit(time.monotonic())
+    assert machine.state == RestartState.BACKOFF
+    registry._schedule_restart("db")
+    time.sleep(0.25)  # past the 0.1s minimum backoff: the restart is stopping the old process
+    assert machine.state == RestartState.RESTARTING
+
+    registry.shutdown_all()
+    assert starts == [] and len(stops) == 2
+    assert not registry._restarting
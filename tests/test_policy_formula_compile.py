@@ -0,0 +1,100 @@
+"""
+Tests for compiled budget policy formulas.
+
+The compiled scalar form must agree with the reference interpreter
+(_safe_eval), and vectorized evaluation over NumPy columns must agree with
+per-row scalar evaluation, over randomized contexts. Rows the scalar form
+rejects (division by zero, ...) come back as NaN.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from orchestration.services.economy.policy_loader import (
+    BudgetPolicy,
+    CompiledFormula,
+    PolicyExpressionError,
+    _compile_formula,
+    _safe_eval,
+)
+
+FORMULAS = [
+    "1.0 - max(0, (soft_cap - budget_remaining) / soft_cap)",
+    "min(1, max(0, budget_remaining / soft_cap)) * roi_ema",
+    "budget_remaining / soft_cap if soft_cap > 0 else 1",
+    "abs(spent_rolling - roi_ema) ** 0.5 + pow(roi_ema, 2) // 3",
+    "-budget_remaining % 7 + (roi_ema > 1 and spent_rolling or 0.5)",
+    "0 < roi_ema <= 1.5 or not spent_rolling",
+    "soft_cap > 1 > budget_remaining / (spent_rolling - roi_ema)",
+    "min(soft_cap, budget_remaining, spent_rolling, 2)",
+    "spent_rolling / (budget_remaining - soft_cap)",
+]
+
+NAMES = ["budget_remaining", "soft_cap", "roi_ema", "spent_rolling"]
+
+
+def random_context(rng):
+    context = {name: rng.choice([rng.uniform(-50, 200), rng.uniform(0, 3), 0.0]) for name in NAMES}
+    if rng.random() < 0.1:
+        context["budget_remaining"] = context["soft_cap"]  # Exercise division by zero
+    return context
+
+
+def scalar_or_nan(fn, context):
+    try:
+        value = fn(context)
+    except (PolicyExpressionError, ArithmeticError):
+        return float("nan")
+    return value if np.isfinite(value) else float("nan")
+
+
+def test_compiled_matches_interpreter_on_random_contexts():
+    rng = random.Random(1234)
+    for formula in FORMULAS:
+        expr = _compile_formula(formula)
+        compiled = CompiledFormula(formula, expr)
+        for _ in range(300):
+            context = random_context(rng)
+            expected = scalar_or_nan(lambda ctx: _safe_eval(expr, ctx), context)
+            actual = scalar_or_nan(compiled, context)
+            assert np.isnan(expected) == np.isnan(actual), (formula, context)
+            if not np.isnan(expected):
+                assert actual == expected, (formula, context)
+
+
+def test_vectorized_matches_scalar_rows():
+    rng = random.Random(99)
+    for formula in FORMULAS:
+        policy = BudgetPolicy(priority=0, lane="exec", formula_raw=formula)
+        rows = [random_context(rng) for _ in range(500)]
+        columns = {name: np.array([row[name] for row in rows]) for name in NAMES}
+
+        vector = policy.evaluate_many(columns)
+        expected = np.array([scalar_or_nan(policy.evaluate, row) for row in rows])
+
+        assert vector.shape == (500,)
+        np.testing.assert_allclose(vector, expected, rtol=1e-12, atol=1e-12, equal_nan=True, err_msg=formula)
+
+    constant = CompiledFormula("0.5").evaluate_many({"soft_cap": np.ones(3)})
+    assert constant.tolist() == [0.5, 0.5, 0.5]
+
+
+def test_validation_still_rejects_unsafe_formulas():
+    for formula in ["__import__('os')", "roi_ema.real", "[1, 2]", "'text'", "lambda: 1", "min(*roi_ema)"]:
+        try:
+            _compile_formula(formula)
+        except PolicyExpressionError:
+            continue
+        raise AssertionError(f"accepted unsafe formula {formula!r}")
+
+    try:
+        CompiledFormula("soft_cap * 2").evaluate_many({"roi_ema": np.ones(2)})
+    except PolicyExpressionError as exc:
+        assert "soft_cap" in str(exc)
+    else:
+        raise AssertionError("expected missing-variable error")
@@ -0,0 +1,139 @@
+"""
+Tests for bulk-loaded role graph construction in
+orchestration/mechanisms/role_graph_builder.py.
+
+A fake FalkorDB graph serves the three bulk queries. The built matrix must
+equal a pair-by-pair reference that uses the scalar affect and tool helpers
+and the former per-pair edge semantics (U from the smaller id to the
+larger id only, ease from either direction, first edge wins).
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+from scipy.stats import rankdata
+
+from orchestration.libs.utils import falkordb_adapter
+from orchestration.mechanisms.role_graph_builder import RoleGraphBuilder
+
+TOOLS = ["search", "edit", "run", "read", "plan"]
+
+
+class Result:
+    def __init__(self, rows):
+        self.result_set = rows
+
+
+class FakeGraph:
+    def __init__(self, entities, coactivates, relates):
+        self.entities = entities
+        self.coactivates = coactivates  # [(a, b, u)] directed
+        self.relates = relates          # [(a, b, ease)] directed
+        self.queries = 0
+
+    def query(self, cypher, params=None):
+        self.queries += 1
+        if "COACTIVATES_WITH" in cypher:
+            return Result([[a, b, u] for a, b, u in self.coactivates if a < b])
+        if "RELATES_TO" in cypher:
+            return Result([list(edge) for edge in self.relates])
+        return Result(self.entities)
+
+
+def random_fixture(n=30, seed=2):
+    rng = random.Random(seed)
+    ids = [f"se_{rng.randrange(10**6):06d}" for _ in range(n)]
+    entities = []
+    for entity_id in ids:
+        tools = {t: rng.randint(0, 5) for t in rng.sample(TOOLS, rng.randint(0, 3))}
+        entities.append([entity_id, rng.random(), rng.uniform(-1, 1), json.dumps(tools) if tools else None, None])
+    coactivates, relates = [], []
+    for _ in range(n * 4):
+        a, b = rng.sample(ids, 2)
+        coactivates.append((a, b, rng.choice([None, 0.005, round(rng.random(), 3)])))
+        relates.append((a, b, rng.choice([None, round(rng.random(), 3)])))
+    return FakeGraph(entities, coactivates, relates)
+
+
+def reference_role_graph(builder, graph, min_u_threshold=0.01):
+    """Pair-by-pair build with the scalar helpers and per-pair edge semantics."""
+    entities = builder._load_subentity_features(graph)
+    n = len(entities)
+
+    def u_metric(a, b):
+        lo, hi = min(a, b), max(a, b)
+        u = next((u for x, y, u in graph.coactivates if (x, y) == (lo, hi)), None)
+        return float(u) if u is not None else 0.0
+
+    def ease(a, b):
+        e = next((e for x, y, e in graph.relates if {x, y} == {a, b}), None)
+        return float(e) if e is not None else 0.0
+
+    pairs, components = [], []
+    for i in range(n):
+        for j in range(i + 1, n):
+            A, B = entities[i], entities[j]
+            u = u_metric(A.id, B.id)
+            if u < min_u_threshold:
+                continue
+            pairs.append((i, j))
+            components.append((u, ease(A.id, B.id), builder._compute_affect_similarity(A, B),
+                               builder._compute_tool_overlap(A, B)))
+
+    W = np.zeros((n, n))
+    if not pairs:
+        return W
+    ranks = [(rankdata(col, method="average") - 1) / max(len(col) - 1, 1) for col in zip(*components)]
+    for k, (i, j) in enumerate(pairs):
+        W[i, j] = W[j, i] = ranks[0][k] * (1 + ranks[1][k]) * (1 + ranks[2][k]) * (1 + ranks[3][k])
+    return W
+
+
+def test_bulk_build_matches_pairwise_reference(monkeypatch):
+    graph = random_fixture()
+    monkeypatch.setattr(falkordb_adapter, "get_falkordb_graph", lambda name: graph)
+    builder = RoleGraphBuilder("citizen_test")
+
+    W, entity_ids = builder.build_role_graph()
+    assert graph.queries == 3
+    assert entity_ids == [row[0] for row in graph.entities]
+    np.testing.assert_array_equal(W, reference_role_graph(builder, graph))
+    assert np.count_nonzero(W) > 0
+
+    W_sparse, _ = builder.build_role_graph(as_sparse=True)
+    np.testing.assert_array_equal(W_sparse.toarray(), W)
+
+
+def test_vectorized_pair_components_match_scalar():
+    graph = random_fixture(n=40, seed=7)
+    builder = RoleGraphBuilder("citizen_test")
+    entities = builder._load_subentity_features(graph)
+    rows, cols = np.triu_indices(len(entities), k=1)
+
+    affect = builder._affect_similarities(entities, rows, cols)
+    tools = builder._tool_overlaps(entities, rows, cols, chunk_pairs=97)
+    expected_affect = [builder._compute_affect_similarity(entities[i], entities[j]) for i, j in zip(rows, cols)]
+    expected_tools = [builder._compute_tool_overlap(entities[i], entities[j]) for i, j in zip(rows, cols)]
+
+    np.testing.assert_allclose(affect, expected_affect, atol=1e-12)
+    assert tools.tolist() == expected_tools  # Bit-identical: ties drive the percentile ranks
+    assert (tools == 0.5).any()  # Pairs where neither entity has tool data
+
+
+def test_zero_threshold_includes_pairs_without_edges(monkeypatch):
+    graph = random_fixture(n=12, seed=5)
+    monkeypatch.setattr(falkordb_adapter, "get_falkordb_graph", lambda name: graph)
+    builder = RoleGraphBuilder("citizen_test")
+
+    W, _ = builder.build_role_graph(min_u_threshold=0.0)
+    np.testing.assert_allclose(W, reference_role_graph(builder, graph, min_u_threshold=0.0), atol=1e-12)
+    # Pairs without a COACTIVATES_WITH edge are ranked too (tied at U = 0), so nearly all get weight
+    assert np.count_nonzero(W) >= 2 * (12 * 11 // 2 - 12)
+
+    assert builder._percentile_normalize([0.1, 0.5, 0.5, 0.9]).tolist() == [0.0, 0.5, 0.5, 1.0]
+    assert builder._percentile_normalize([3.0]).tolist() == [0.5]
@@ -13,14 +13,25 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import json
+import math
 import time
 from datetime import datetime
+from typing import Dict
+
+from substrate.schemas.consciousness_schema import BaseNode, BaseRelation
 from substrate.schemas.serialization import (
     serialize_dict_fields,
     verify_no_nested_dicts,
     deserialize_node_from_falkordb,
+    deserialize_nodes_from_falkordb,
+    deserialize_relations_from_falkordb,
+    pack_numeric_dict,
     serialize_node_for_falkordb,
+    serialize_nodes_for_falkordb,
     serialize_relation_for_falkordb,
+    serialize_relations_for_falkordb,
+    unpack_numeric_dict,
     deserialize_relation_from_falkordb
 )
 
@@ -251,6 +262,182 @@ class TestPerformance:
         assert avg_ms < 10, f"Deserialization too slow: {avg_ms:.2f}ms"
 
 
+class ActivationState:
+    """Non-dict entity activation state (serialized via attributes)"""
+
+    def __init__(self, energy):
+        self.energy = energy
+        self.last_activated = datetime(2026, 1, 2, 3, 4, 5)
+        self.activation_count = 7
+
+
+class ClusteredNode(BaseNode):
+    entity_activations: Dict[str, object] = {}
+    entity_clusters: Dict[str, str] = {}
+    participants: list = []
+
+
+class WeightedRelation(BaseRelation):
+    entity_coactivation_counts: Dict[str, int] = {}
+    entity_link_strengths: Dict[str, float] = {}
+
+
+class EngineNode:
+    """Trusted internal object: plain attributes, no model"""
+
+    def __init__(self, name, base_weight=None):
+        self.name = name
+        self.description = "engine node"
+        self.confidence = 1.0
+        self.formation_trigger = "inference"
+        self.valid_at = datetime(2026, 3, 1)
+        self.invalid_at = None
+        self.expired_at = None
+        self.entity_clusters = {"translator": "c1"}
+        if base_weight is not None:
+            self.base_weight = base_weight
+
+
+def make_nodes():
+    return [
+        BaseNode(name="plain", description="d", confidence=0.5, formation_trigger="inference",
+                 sub_entity_last_sequence_positions={"translator": 12}),
+        ClusteredNode(name="clustered", description="d", confidence=0.9, formation_trigger="inference",
+                      invalid_at=datetime(2026, 5, 1), participants=["a", "b"],
+                      entity_activations={"translator": {"energy": float("nan")}, "validator": ActivationState(0.25)},
+                      entity_clusters={"translator": "cluster_1"}),
+        ClusteredNode(name="empty", description="d", confidence=0.1, formation_trigger="inference"),
+        EngineNode("engine_a", base_weight=0.4),
+        EngineNode("engine_b"),
+    ]
+
+
+def make_relations():
+    return [
+        WeightedRelation(goal="g", mindstate="Builder", confidence=0.8, formation_trigger="inference",
+                         sub_entity_valences={"translator": 0.1, "validator": -1e-300},
+                         sub_entity_emotion_vectors={"translator": {"joy": 0.7}},
+                         entity_coactivation_counts={"pair": 2 ** 40},
+                         entity_link_strengths={"translator": float("inf")},
+                         last_modified=datetime(2026, 4, 1), traversal_count=3),
+        BaseRelation(goal="g2", mindstate="Skeptic", confidence=0.2, formation_trigger="inference",
+                     invalid_at=datetime(2026, 6, 1), last_modified=datetime(2026, 4, 2)),
+    ]
+
+
+class TestBatchSerialization:
+    """Test column-wise batch serializers against the per-object path"""
+
+    def test_batch_matches_per_object_serialization(self):
+        """Same keys in the same order, same values, nested JSON decodes identically"""
+        for objects, batch_fn, single_fn in (
+            (make_nodes(), serialize_nodes_for_falkordb, serialize_node_for_falkordb),
+            (make_relations(), serialize_relations_for_falkordb, serialize_relation_for_falkordb),
+        ):
+            batch = batch_fn(objects)
+            assert len(batch) == len(objects)
+            for obj, row in zip(objects, batch):
+                assert row == single_fn(obj)
+                assert verify_no_nested_dicts(row)
+
+        rows = serialize_nodes_for_falkordb(make_nodes())
+        assert "invalid_at" in rows[1] and "invalid_at" not in rows[0]
+        assert rows[3]["base_weight"] == 0.4 and "base_weight" not in rows[4]
+        assert rows[4]["entity_activations"] == "{}"
+        activations = json.loads(rows[1]["entity_activations"])
+        assert math.isnan(activations["translator"]["energy"])  # NaN survives (json fallback)
+        assert activations["validator"] == {
+            "energy": 0.25, "last_activated": "2026-01-02T03:04:05", "activation_count": 7
+        }
+        print("[OK] Batch serialization matches per-object path")
+
+    def test_node_round_trip_matches_json_reference(self):
+        """deserialize_nodes_from_falkordb gives what the json-based reference gives"""
+        rows = serialize_nodes_for_falkordb(make_nodes())
+        rows.append({"name": "odd", "note": "[not json", "last_modified": "bad", "traversal_count": None})
+
+        def reference(properties):
+            result = {}
+            for key, value in properties.items():
+                if value is None:
+                    result[key] = None
+                elif isinstance(value, str) and ('{' in value or '[' in value):
+                    try:
+                        result[key] = json.loads(value)
+                    except json.JSONDecodeError:
+                        result[key] = value
+                elif key.endswith(('_at', '_time', '_modified')):
+                    try:
+                        result[key] = datetime.fromtimestamp(value / 1000)
+                    except (ValueError, TypeError):
+                        result[key] = value
+                else:
+                    result[key] = value
+            return result
+
+        batch = deserialize_nodes_from_falkordb(rows, "Pattern")
+        for row, result in zip(rows, batch):
+            assert repr(result) == repr(reference(row))  # repr: NaN != NaN
+        assert batch[-1]["note"] == "[not json"
+        print("[OK] Batch node deserialization matches reference")
+
+    def test_packed_numeric_dicts_round_trip_exactly(self):
+        """Float dicts pack to float64 and decode bit-for-bit; others fall back to JSON"""
+        values = {"a": 0.1, "b": -1e-300, "c": float("inf"), "d\"q": 1 / 3}
+        packed = pack_numeric_dict(values)
+        assert packed.startswith("pk1:d:")
+        assert unpack_numeric_dict(packed) == values
+        for unpackable in ({"a": 1, "b": 2}, {"a": 1.0, "b": 2}, {1: 0.5}, {"a": True}, {}):
+            assert pack_numeric_dict(unpackable) is None
+
+        relations = make_relations()
+        packed_rows = serialize_relations_for_falkordb(relations, pack_numeric=True)
+        assert packed_rows[0]["sub_entity_valences"].startswith("pk1:")
+        assert packed_rows[0]["entity_coactivation_counts"] == '{"pair":1099511627776}'
+        plain = [r.model_dump(exclude={"created_at"}) for r in
+                 deserialize_relations_from_falkordb(serialize_relations_for_falkordb(relations), "R")]
+        packed = [r.model_dump(exclude={"created_at"}) for r in
+                  deserialize_relations_from_falkordb(packed_rows, "R")]
+        assert packed == plain
+        assert plain[0]["sub_entity_valences"] == relations[0].sub_entity_valences
+        print("[OK] Packed numeric dicts round-trip exactly")
+
+    def test_relation_dicts_without_validation(self):
+        """validate=False returns the field dicts the validated path builds models from"""
+        rows = serialize_relations_for_falkordb(make_relations())
+        validated = deserialize_relations_from_falkordb(rows, "R")
+        dicts = deserialize_relations_from_falkordb(rows, "R", validate=False)
+        assert all(isinstance(r, BaseRelation) for r in validated)
+        assert all(isinstance(d, dict) for d in dicts)
+        assert dicts[0]["entity_link_strengths"] == {"translator": float("inf")}
+        assert dicts[1]["invalid_at"] == datetime(2026, 6, 1)
+        for model, data in zip(validated, dicts):
+            assert BaseRelation(**data).model_dump(exclude={"created_at"}) == model.model_dump(exclude={"created_at"})
+        single = deserialize_relation_from_falkordb(rows[0], "R")
+        assert single.model_dump(exclude={"created_at"}) == validated[0].model_dump(exclude={"created_at"})
+        print("[OK] Relation dicts match validated models")
+
+
+    def test_nested_json_keeps_json_semantics(self):
+        """Integers beyond 64 bits decode exactly; nested datetimes are still rejected"""
+        big = 2 ** 70
+        row = serialize_dict_fields({"name": "counts", "coactivation_counts": {"pair": big, "small": 3}})
+        decoded = deserialize_nodes_from_falkordb([row], "Realization")[0]
+        assert decoded["coactivation_counts"] == {"pair": big, "small": 3}
+        assert type(decoded["coactivation_counts"]["pair"]) is int
+
+        node = EngineNode("dated")
+        node.entity_clusters = {"translator": datetime(2026, 1, 1)}
+        for serialize in (serialize_nodes_for_falkordb, lambda nodes: serialize_node_for_falkordb(nodes[0])):
+            try:
+                serialize([node])
+            except TypeError:
+                pass
+            else:
+                raise AssertionError("nested datetime serialized")
+        print("[OK] Nested JSON keeps json semantics")
+
+
 def run_all_tests():
     """Run all serialization tests"""
     print("=" * 60)
@@ -261,6 +448,7 @@ def run_all_tests():
         TestSerializeDictFields,
         TestVerifyNoNestedDicts,
         TestRoundtripSerialization,
+        TestBatchSerialization,
         TestPerformance
     ]
 
@@ -0,0 +1,206 @@
+"""
+Tests for the signals collector transport (orchestration/services/signals_transport.py).
+
+SegmentBacklog must survive rotation, reopen from its committed cursor and
+truncate a torn tail; TimingWheel must answer like an exact deadline dict
+while reclaiming expired keys; MembraneSender must drain the backlog over
+one connection, keep it alive while the server pushes frames back, and
+resume from the cursor after the sink restarts.
+"""
+
+import asyncio
+import json
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from orchestration.services import signals_transport
+from orchestration.services.signals_transport import (
+    MembraneSender,
+    SegmentBacklog,
+    TimingWheel,
+    encode_envelope,
+)
+
+
+def envelopes(start, stop):
+    return [encode_envelope({"type": "membrane.inject", "content": "x" * (i % 50), "metadata": {"seq": i}})
+            for i in range(start, stop)]
+
+
+def test_backlog_rotates_commits_and_resumes_from_cursor(tmp_path):
+    backlog = SegmentBacklog(tmp_path, segment_bytes=2_000)
+    for start in range(0, 150, 10):
+        backlog.append_many(envelopes(start, start + 10))
+    assert backlog.segment_count > 3 and backlog.pending == 150
+
+    first = backlog.read(60)
+    backlog.commit(first)
+    backlog.read(40)  # read but never committed (send failed)
+    backlog.close()
+
+    reopened = SegmentBacklog(tmp_path, segment_bytes=2_000)
+    assert reopened.pending == 90
+    assert len(list(tmp_path.glob("*.seg"))) == reopened.segment_count
+    reopened.append_many(envelopes(150, 160))
+    seqs = []
+    while True:
+        batch = reopened.read(25)
+        if not batch.records:
+            break
+        seqs += [json.loads(r)["metadata"]["seq"] for r in batch.records]
+        reopened.commit(batch)
+
+    assert seqs == list(range(60, 160))
+    assert reopened.pending == 0 and reopened.segment_count == 1
+
+
+def test_backlog_truncates_torn_tail_and_ignores_stale_batches(tmp_path):
+    backlog = SegmentBacklog(tmp_path)
+    backlog.append_many(envelopes(0, 5))
+    stale = backlog.read(3)
+    backlog.rewind()
+    backlog.commit(backlog.read(2))
+    backlog.commit(stale)  # read before the rewind: must not move the cursor
+    backlog.close()
+
+    segment = next(tmp_path.glob("*.seg"))
+    with segment.open("ab") as fh:
+        fh.write(b"\x00\x00\x01\x00garbage")  # crash mid-append
+
+    reopened = SegmentBacklog(tmp_path)
+    assert reopened.pending == 3
+    assert [json.loads(r)["metadata"]["seq"] for r in reopened.read(10).records] == [2, 3, 4]
+    reopened.append(envelopes(5, 6)[0])
+    assert json.loads(reopened.read(10).records[0])["metadata"]["seq"] == 5
+
+
+def test_timing_wheel_matches_exact_deadlines():
+    rng = random.Random(4)
+    wheel = TimingWheel(horizon=15.0, resolution=1.0)
+    model = {}
+    now = 1000.0
+    for _ in range(5000):
+        now += rng.expovariate(20.0) if rng.random() < 0.99 else 40.0
+        key = f"k{rng.randrange(300)}"
+        ttl = rng.uniform(0.5, 15.0)
+        expected = key in model and now < model[key]
+        if not expected:
+            model[key] = now + ttl
+        assert wheel.check_and_add(key, ttl, now) == expected
+
+    live = {k for k, deadline in model.items() if now < deadline}
+    assert {k for k in model if wheel.alive(k, now)} == live
+    wheel.alive("probe", now + 16.0)
+    assert len(wheel) == 0
+    with pytest.raises(ValueError):
+        wheel.add("long", 16.0, now)
+
+
+def test_sender_drains_over_one_connection_and_resumes(tmp_path):
+    websockets = pytest.importorskip("websockets")
+
+    async def scenario():
+        received, connections = [], []
+
+        async def sink(ws):
+            connections.append(ws)
+            async for message in ws:
+                received.append(json.loads(message)["metadata"]["seq"])
+
+        backlog = SegmentBacklog(tmp_path, segment_bytes=4_000)
+        for record in envelopes(0, 300):
+            backlog.append(record)
+        server = await websockets.serve(sink, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        sender = MembraneSender(backlog, f"ws://127.0.0.1:{port}", batch_size=64, initial_backoff=0.05)
+        sender.start()
+
+        async def wait_for(predicate):
+            for _ in range(200):
+                if predicate():
+                    return
+                await asyncio.sleep(0.05)
+            raise AssertionError("timed out")
+
+        await wait_for(lambda: backlog.pending == 0)
+        assert len(connections) == 1
+
+        server.close()
+        await server.wait_closed()
+        for ws in connections:
+            await ws.close()
+        backlog.append_many(envelopes(300, 400))
+        sender.notify()
+        await asyncio.sleep(0.3)
+        assert backlog.pending == 100
+
+        server = await websockets.serve(sink, "127.0.0.1", port)
+        await wait_for(lambda: backlog.pending == 0)
+        await asyncio.to_thread(sender.stop)  # the close handshake needs this loop running
+        server.close()
+        await server.wait_closed()
+        return received
+
+    received = asyncio.run(scenario())
+    # At-least-once and in order: every envelope arrives; a retried batch may repeat
+    assert sorted(set(received)) == list(range(400))
+    assert received[:300] == list(range(300))
+    assert received[-1] == 399
+
+
+def test_sender_keeps_connection_alive_while_server_pushes_frames(tmp_path):
+    websockets = pytest.importorskip("websockets")
+
+    async def scenario():
+        received, connections = [], []
+
+        async def chatty(ws):
+            connections.append(ws)
+            for i in range(200):  # acks/snapshots the sender never asked for
+                await ws.send(json.dumps({"type": "ack", "n": i}))
+            async for message in ws:
+                received.append(json.loads(message)["metadata"]["seq"])
+                await ws.send('{"type": "ack"}')
+
+        backlog = SegmentBacklog(tmp_path)
+        backlog.append_many(envelopes(0, 300))
+        server = await websockets.serve(chatty, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        sender = MembraneSender(backlog, f"ws://127.0.0.1:{port}", batch_size=64, ping_interval=0.1)
+        sender.start()
+        for _ in range(200):
+            if backlog.pending == 0:
+                break
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0.6)  # several keepalive rounds with the server still pushing
+        backlog.append_many(envelopes(300, 310))
+        sender.notify()
+        await asyncio.sleep(0.3)
+        stats = (len(connections), sender.stats.failures, backlog.pending)
+        await asyncio.to_thread(sender.stop)
+        server.close()
+        await server.wait_closed()
+        return received, stats
+
+    received, (connects, failures, pending) = asyncio.run(scenario())
+    assert (connects, failures, pending) == (1, 0, 0)
+    assert received == list(range(310))
+
+
+def test_sender_notify_and_stop_after_loop_exit_are_noops(tmp_path, monkeypatch):
+    # Without websockets run() returns at once and the sender loop closes;
+    # later appends still call notify()
+    monkeypatch.setattr(signals_transport, "websockets", None)
+    sender = MembraneSender(SegmentBacklog(tmp_path), "ws://127.0.0.1:9")
+    sender.notify()  # not started yet
+    sender.start()
+    sender._thread.join(5.0)
+    assert sender._loop.is_closed()
+    sender.notify()
+    sender.stop()
+    sender.notify()
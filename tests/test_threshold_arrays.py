@@ -0,0 +1,127 @@
+"""
+Tests for the array-backed threshold paths (orchestration/mechanisms/threshold.py).
+
+ArrayNoiseTracker must reproduce NoiseTracker's per-sample EMA when a tick's
+samples are applied in one vectorized call, and the vectorized thresholds
+and activation functions must agree with the scalar ones node by node.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+import pytest
+
+from orchestration.core.settings import settings
+from orchestration.mechanisms import threshold
+from orchestration.mechanisms.threshold import (
+    ArrayNoiseTracker,
+    NoiseTracker,
+    ThresholdContext,
+    compute_activation_mask,
+    compute_activation_values,
+    compute_adaptive_threshold,
+    compute_adaptive_thresholds,
+    hard_activation,
+    soft_activation,
+)
+
+
+class EnergyNode:
+    def __init__(self, node_id, energies, emotion_vector=None):
+        self.id = node_id
+        self.energies = energies
+        self.emotion_vector = emotion_vector
+
+    def get_entity_energy(self, subentity):
+        return self.energies.get(subentity, 0.0)
+
+
+class EnergyGraph:
+    def __init__(self, nodes):
+        self.nodes = {node.id: node for node in nodes}
+
+
+def test_vectorized_ticks_match_per_sample_updates():
+    rng = np.random.default_rng(3)
+    node_ids = [f"n{i}" for i in range(40)]
+    subentities = ["translator", "architect", "validator"]
+    legacy = NoiseTracker(ema_alpha=0.2)
+    tracker = ArrayNoiseTracker(ema_alpha=0.2, node_capacity=4, subentity_capacity=1)
+    nodes = tracker.node_indices(node_ids)
+
+    for _ in range(25):
+        for subentity in subentities:
+            energies = rng.random(len(node_ids))
+            quiet = rng.random(len(node_ids)) < 0.6
+            for node_id, energy, is_quiet in zip(node_ids, energies, quiet):
+                legacy.update(node_id, subentity, float(energy), bool(is_quiet))
+            tracker.update_many(nodes, tracker.subentity_index(subentity), energies, quiet)
+
+    for node_id in node_ids:
+        for subentity in subentities:
+            expected = legacy.get_stats(node_id, subentity)
+            got = tracker.get_stats(node_id, subentity)
+            assert got.sample_count == expected.sample_count
+            assert got.mu == pytest.approx(expected.mu, abs=1e-12)
+            assert got.sigma == pytest.approx(expected.sigma, abs=1e-12)
+
+    k = tracker.subentity_index("architect")
+    stats = [legacy.get_stats(node_id, "architect") for node_id in node_ids]
+    np.testing.assert_allclose(tracker.base_thresholds(k, 1.28, nodes), [s.mu + 1.28 * s.sigma for s in stats])
+
+
+def test_dense_ids_do_not_collide_like_string_keys():
+    tracker = ArrayNoiseTracker()
+    tracker.update("a_b", "c", 0.5, True)
+    tracker.update("a", "b_c", 0.9, False)
+
+    assert tracker.get_stats("a_b", "c").mu == 0.5
+    assert tracker.get_stats("a", "b_c").sample_count == 0
+    assert list(tracker.node_indices(["a", "a_b", "z"])) == [tracker.node_ids["a"], tracker.node_ids["a_b"], 2]
+
+    # Mixed subentities in one call update the same cells as per-pair calls
+    nodes = tracker.node_indices(["a_b", "a", "z"])
+    subentities = np.array([tracker.subentity_index("c"), tracker.subentity_index("b_c"), tracker.subentity_index("c")])
+    tracker.update_many(nodes, subentities, np.array([0.7, 0.3, 0.1]), np.array([True, True, False]))
+    assert tracker.get_stats("a_b", "c").mu == pytest.approx(0.1 * 0.7 + 0.9 * 0.5)
+    assert tracker.get_stats("a", "b_c").mu == 0.3
+    assert tracker.get_stats("z", "c").sample_count == 0
+
+
+def test_vectorized_thresholds_and_activations_match_scalar(monkeypatch):
+    monkeypatch.setattr(settings, "AFFECTIVE_THRESHOLD_ENABLED", True)
+    monkeypatch.setattr(settings, "AFFECTIVE_TELEMETRY_ENABLED", True)
+    emitted = []
+    monkeypatch.setattr(threshold, "emit_affective_threshold", lambda **event: emitted.append(event))
+
+    rng = np.random.default_rng(8)
+    affect = np.array([0.6, 0.3, -0.2])
+    nodes = [
+        EnergyNode(f"n{i}", {"translator": float(e)}, None if i % 5 == 0 else rng.normal(0, 0.7, 3))
+        for i, e in enumerate(rng.random(200) * 2.5)
+    ]
+    ctx = ThresholdContext(num_active=30, num_total=200)
+    emotions = np.array([n.emotion_vector if n.emotion_vector is not None else np.zeros(3) for n in nodes])
+
+    thresholds = compute_adaptive_thresholds(ctx, len(nodes), emotions, affect, [n.id for n in nodes])
+    vector_events = len(emitted)
+    expected = [compute_adaptive_threshold(n, "translator", ctx, affect) for n in nodes]
+
+    np.testing.assert_allclose(thresholds, expected, rtol=1e-12)
+    assert vector_events == len(emitted) - vector_events > 0
+
+    graph = EnergyGraph(nodes)
+    mask = compute_activation_mask(graph, "translator", ctx, thresholds)
+    values = compute_activation_values(graph, "translator", ctx, thresholds)
+    for node, theta in zip(nodes, expected):
+        energy = node.get_entity_energy("translator")
+        assert mask[node.id] == hard_activation(energy, theta)
+        assert values[node.id] == pytest.approx(soft_activation(energy, theta, ctx.kappa), abs=1e-12)
+
+    shared = compute_adaptive_threshold(None, "translator", ctx)
+    assert compute_activation_mask(graph, "translator", ctx) == {
+        n.id: hard_activation(n.get_entity_energy("translator"), shared) for n in nodes
+    }
@@ -0,0 +1,43 @@
+"""
+Tests for vecf32 query parameters (FalkorDB adapter).
+
+Embeddings must travel as parameters with float32-exact text so the Cypher
+body stays constant (plan cache) without losing precision.
+"""
+
+import random
+import struct
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from falkordb.helpers import stringify_param_value
+
+from orchestration.libs.utils.falkordb_adapter import cypher_params_header, vector_param
+
+
+def _f32(x):
+    return struct.unpack('f', struct.pack('f', x))[0]
+
+
+def test_vector_param_round_trips_float32():
+    rng = random.Random(7)
+    embedding = [rng.uniform(-1, 1) for _ in range(768)]
+
+    text = str(vector_param(embedding))
+    parsed = [float(v) for v in text[1:-1].split(',')]
+
+    assert [_f32(v) for v in parsed] == [_f32(v) for v in embedding]
+    assert len(text) < len(str(embedding))
+
+
+def test_vector_param_stringifies_through_driver():
+    param = vector_param([0.5, -1.0, 2.0])
+
+    assert stringify_param_value(param) == "[0.5,-1,2]"
+    assert cypher_params_header({'v': param, 'label': 'Concept'}) == 'CYPHER v=[0.5,-1,2] label="Concept" '
+
+
+def test_empty_header_for_no_params():
+    assert cypher_params_header({}) == ""
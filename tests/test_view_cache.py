@@ -0,0 +1,86 @@
+"""
+Tests for the L2 ViewCache (bounded LRU, monotonic TTL, surgical invalidation).
+
+Uses a manual clock and hand-built rows: expiry and LRU eviction keep the
+reverse index consistent, and a graph delta evicts only the views whose
+selected rows it touched (plus aggregates and views a new node may join).
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from services.view_resolvers.runner import ViewCache, _row_refs
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def key(view_type, path="/", graph="org_a"):
+    return (view_type, "json", (), path, graph)
+
+
+def test_lru_bound_and_monotonic_ttl():
+    clock = Clock()
+    cache = ViewCache(ttl_seconds=10, max_entries=2, clock=clock)
+
+    cache.set(key("index", "/a"), {"v": 1}, refs={"id:a"})
+    cache.set(key("index", "/b"), {"v": 2}, refs={"id:b"})
+    assert cache.get(key("index", "/a"))["v"] == 1  # /a becomes most recent
+    cache.set(key("index", "/c"), {"v": 3}, refs={"id:c"})
+
+    assert cache.get(key("index", "/b")) is None  # LRU evicted
+    assert cache.stats()["evictions"] == 1
+    assert "id:b" not in cache._refs
+
+    clock.now = 10.0
+    assert cache.get(key("index", "/a")) is None
+    assert cache.stats()["expirations"] == 1
+    assert set(cache._refs) == {"id:c"}
+
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 2
+    assert stats["hit_rate"] == round(1 / 3, 4)
+
+
+def test_delta_evicts_only_touched_views():
+    cache = ViewCache()
+    arch_rows = [{"s": {"id": "svc1", "name": "api"}, "deps": [{"id": "svc2"}], "ly": None}]
+    cache.set(key("architecture"), {}, refs=_row_refs(arch_rows) | {"sha256:arch"})
+    cache.set(key("api-reference", "/auth"), {}, refs=_row_refs([{"ep": {"id": "ep1"}, "ca": {"path": "/auth/x.py"}}]))
+    cache.set(key("coverage"), {}, refs=set())
+    cache.set(key("index", "/", graph="org_b"), {}, refs={"id:svc1"})
+
+    # Property update on a node the architecture view selected (same graph only)
+    evicted = cache.invalidate_delta({"type": "graph.delta.node.upsert", "citizen_id": "org_a",
+                                      "node_id": "svc2", "properties": {}})
+    assert evicted == [key("architecture")]
+
+    # Activations never change a view
+    assert cache.invalidate_delta({"type": "graph.delta.activation", "activations": {"ep1": 0.5}}) == []
+
+    # A new node under /auth may join the /auth API view and changes coverage counts
+    evicted = cache.invalidate_delta({"type": "graph.delta.node.upsert", "citizen_id": "org_a",
+                                      "node_id": "ep9", "properties": {"path": "/auth/y.py"}})
+    assert sorted(evicted) == sorted([key("api-reference", "/auth"), key("coverage")])
+
+    assert cache.invalidate_refs(["sha256:unknown"]) == []
+    assert len(cache) == 1 and cache.get(key("index", "/", graph="org_b")) is not None
+    assert cache.stats()["invalidations_per_delta"] == 1.0
+
+
+def test_pattern_invalidation_by_view_type_and_path():
+    cache = ViewCache()
+    cache.set(key("architecture", "/"), {})
+    cache.set(key("architecture", "/svc"), {})
+    cache.set(key("index", "/svc"), {})
+
+    assert cache.invalidate("architecture:/svc") == 1
+    assert cache.invalidate("*") == 2
+    assert len(cache) == 0
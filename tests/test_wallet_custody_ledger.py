@@ -0,0 +1,177 @@
+"""
+Tests for the group-commit wallet custody ledger (orchestration/services/wallet_custody/ledger.py).
+
+Concurrent appends must share fsyncs and all land (including overlapping
+custody handlers awaiting the ledger); the sidecar index must answer wallet,
+time and tail queries across rotated segments (and a legacy ledger.jsonl)
+like a full scan; a crash mid-record must reopen to the last complete entry
+with the index rebuilt to match; and a failed commit must fail its callers
+without stopping the writer.
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from orchestration.services.wallet_custody.ledger import GroupCommitLedger, Ledger, LedgerEntry
+
+BASE_TIME = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+def entry(i, wallet=None):
+    return LedgerEntry(
+        entry_type="wallet.transfer",
+        wallet_id=wallet or f"wallet:citizen:c{i % 7}",
+        payload={"seq": i, "amount": i * 3},
+        created_at=(BASE_TIME + timedelta(seconds=i)).isoformat(),
+    )
+
+
+def scan(ledger_dir):
+    """Full-scan reference: every entry in every ledger file, oldest first."""
+    paths = sorted(ledger_dir.glob("ledger*.jsonl"), key=lambda p: (p.name != "ledger.jsonl", p.name))
+    return [LedgerEntry.from_json(line) for p in paths for line in p.read_text().splitlines()]
+
+
+def test_concurrent_appends_share_fsyncs(tmp_path):
+    ledger = GroupCommitLedger(tmp_path / "ledger.jsonl", batch_window=0.002)
+
+    def worker(t):
+        for k in range(50):
+            ledger.append(entry(t * 50 + k))
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ledger.close()
+
+    seqs = sorted(e.payload["seq"] for e in scan(tmp_path))
+    assert seqs == list(range(800))
+    assert ledger.fsync_count < 800 / 4
+    reopened = GroupCommitLedger(tmp_path / "ledger.jsonl")
+    assert len(reopened) == 800
+    reopened.close()
+
+
+def test_index_queries_match_full_scan_across_segments(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    legacy = Ledger(path)
+    for i in range(30):
+        legacy.append(entry(i))
+    ledger = GroupCommitLedger(path, segment_bytes=4_000, max_batch=16)
+    for i in range(30, 300):
+        ledger.submit(entry(i, "wallet:org:treasury" if i % 11 == 0 else None))
+    ledger.append(entry(300))
+
+    everything = scan(tmp_path)
+    assert len(ledger.segment_paths) > 5 and ledger.segment_paths[0] == path
+    assert [e.payload["seq"] for e in everything] == list(range(301))
+    for wallet in ("wallet:citizen:c3", "wallet:org:treasury", "wallet:none"):
+        assert ledger.entries_for_wallet(wallet) == [e for e in everything if e.wallet_id == wallet]
+    since = (BASE_TIME + timedelta(seconds=123.5)).timestamp()
+    assert ledger.entries_since(since) == [e for e in everything if e.timestamp >= since]
+    assert ledger.entries_for_wallet("wallet:citizen:c3", since) == [
+        e for e in everything if e.wallet_id == "wallet:citizen:c3" and e.timestamp >= since
+    ]
+    assert ledger.tail(45) == everything[-45:]
+    ledger.close()
+
+    (path.with_name(path.name + ".idx")).unlink()  # legacy index lost: rebuilt from data
+    reopened = GroupCommitLedger(path, segment_bytes=4_000)
+    assert reopened.tail(400) == everything
+    reopened.close()
+
+
+def test_crash_mid_record_reopens_to_last_complete_entry(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    ledger = GroupCommitLedger(path)
+    for i in range(40):
+        ledger.append(entry(i))
+    ledger.close()
+
+    segment = ledger.segment_paths[-1]
+    data = segment.read_bytes()
+    cut = data.index(b'"seq": 37') + 4  # torn write: record 37 half on disk
+    segment.write_bytes(data[:cut])
+    index = segment.with_name(segment.name + ".idx")
+    index.write_bytes(index.read_bytes()[:-10])  # index torn too, and it covers entries past the cut
+
+    reopened = GroupCommitLedger(path)
+    assert [e.payload["seq"] for e in reopened.tail(100)] == list(range(37))
+    assert segment.read_bytes().endswith(b"}\n")
+    assert [e.payload["seq"] for e in reopened.entries_for_wallet("wallet:citizen:c1")] == [1, 8, 15, 22, 29, 36]
+
+    reopened.append(entry(37))
+    reopened.close()
+    lines = segment.read_text().splitlines()
+    assert [json.loads(line)["payload"]["seq"] for line in lines] == list(range(38))
+    final = GroupCommitLedger(path)
+    assert len(final) == 38
+    final.close()
+
+
+class FailingIndex:
+    def write(self, data):
+        raise ValueError("index disk gone")
+
+    def flush(self):
+        pass
+
+
+def test_failed_commit_fails_callers_and_keeps_writer_alive(tmp_path):
+    ledger = GroupCommitLedger(tmp_path / "ledger.jsonl")
+    index_fh, ledger._index_fh = ledger._index_fh, FailingIndex()
+    with pytest.raises(ValueError, match="index disk gone"):
+        ledger.submit(entry(0)).result(timeout=5)
+
+    ledger._index_fh = index_fh
+    ledger.append(entry(1))  # the writer survived the failed batch
+    ledger.close()
+    assert [e.payload["seq"] for e in scan(tmp_path)] == [0, 1]  # data was fsynced before the index failed
+    with pytest.raises(RuntimeError):
+        ledger.submit(entry(2))
+
+
+class FakeVault:
+    def has_wallet(self, wallet_id):
+        return False
+
+    def save_wallet(self, wallet_id, public_key, **kwargs):
+        return SimpleNamespace(wallet_id=wallet_id, public_key=public_key)
+
+
+def test_overlapping_custody_handlers_share_one_fsync(tmp_path):
+    pytest.importorskip("solana")
+    from orchestration.services.wallet_custody.service import WalletCustodyService
+
+    service = WalletCustodyService.__new__(WalletCustodyService)
+    service._vault = FakeVault()
+    service._ledger = GroupCommitLedger(tmp_path / "ledger.jsonl", batch_window=0.05)
+
+    async def no_broadcast(event):
+        pass
+
+    service._broadcast = no_broadcast
+
+    async def scenario():
+        return await asyncio.gather(
+            service.handle_wallet_ensure("mind-protocol", {"subject": "citizen", "id": "a"}),
+            service.handle_wallet_ensure("mind-protocol", {"subject": "citizen", "id": "b"}),
+        )
+
+    results = asyncio.run(scenario())
+    service._ledger.close()
+
+    assert all(result["payload"]["created"] for result in results)
+    assert sorted(e.wallet_id for e in scan(tmp_path)) == ["wallet:citizen:a", "wallet:citizen:b"]
+    assert service._ledger.fsync_count == 1
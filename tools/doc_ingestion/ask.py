@@ -33,18 +33,20 @@ import sys
 import os
 import json
 import math
+import threading
+import time
 import numpy as np
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Iterable
 from pathlib import Path
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from falkordb import FalkorDB
-from sentence_transformers import SentenceTransformer
 from orchestration.config.graph_names import resolver
+from orchestration.adapters.search.model_registry import get_model_registry
 
 
 # ============================================================================
@@ -59,6 +61,9 @@ N_INITIAL = 6  # initial nodes for beam
 BEAM_WIDTH = int(os.environ.get('ASK_BEAM_WIDTH', '4'))
 MAX_STEPS = int(os.environ.get('ASK_MAX_STEPS', '9'))
 MARGINAL_GAIN_THRESHOLD = 0.01  # 1% minimum improvement
+EDGE_LIMIT = 20  # edges fetched per frontier node
+ADJACENCY_CACHE_SIZE = int(os.environ.get('ASK_ADJACENCY_CACHE_SIZE', '4096'))  # cross-question LRU (0 = off)
+ADJACENCY_CACHE_TTL = float(os.environ.get('ASK_ADJACENCY_CACHE_TTL', '300'))  # seconds
 
 
 # ============================================================================
@@ -80,15 +85,18 @@ class PathState:
 # ============================================================================
 
 class EmbeddingService:
-    """Handle text embedding and similarity"""
+    """Handle text embedding and similarity (model shared via the process-wide registry)"""
+
+    MODEL_NAME = 'all-mpnet-base-v2'
 
     def __init__(self):
-        self.model = SentenceTransformer('all-mpnet-base-v2')
+        self.registry = get_model_registry()
+        self.model = self.registry.get_model(self.MODEL_NAME)
         self.dims = 768
 
     def embed(self, text: str) -> np.ndarray:
         """Embed text to vector"""
-        return self.model.encode(text, normalize_embeddings=True)
+        return self.registry.encode(self.MODEL_NAME, text, normalize_embeddings=True)
 
     def cosine_similarity(self, v1: np.ndarray, v2: np.ndarray) -> float:
         """Compute cosine similarity (vectors already normalized)"""
@@ -186,6 +194,136 @@ def discover_candidates(
     return candidates
 
 
+# ============================================================================
+# NEIGHBORHOOD CACHE
+# ============================================================================
+
+# All frontier nodes expanded in one round trip (per-node edge cap kept by slicing)
+FRONTIER_EDGES_QUERY = """
+UNWIND $ids AS nid
+MATCH (n {id: nid})-[r]-(m)
+WITH nid, collect([type(r), startNode(r).id, endNode(r).id, properties(r), properties(m), m.id])[0..$limit] AS edges
+RETURN nid, edges
+"""
+
+NODES_QUERY = """
+UNWIND $ids AS nid
+MATCH (n {id: nid})
+RETURN nid, properties(n) AS props
+"""
+
+
+class AdjacencyLRU:
+    """Cross-question adjacency cache: node_id → (edges, neighbor props), bounded LRU with TTL"""
+
+    def __init__(self, max_entries: int = ADJACENCY_CACHE_SIZE, ttl_seconds: float = ADJACENCY_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, node_id: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(node_id)
+            if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+                if entry is not None:
+                    del self._entries[node_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(node_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, node_id: str, value: Any):
+        with self._lock:
+            self._entries[node_id] = (time.monotonic(), value)
+            self._entries.move_to_end(node_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_shared_adjacency: Optional[AdjacencyLRU] = None
+
+
+def get_shared_adjacency() -> Optional[AdjacencyLRU]:
+    """Process-wide adjacency LRU (None when ASK_ADJACENCY_CACHE_SIZE=0)"""
+    global _shared_adjacency
+    if ADJACENCY_CACHE_SIZE <= 0:
+        return None
+    if _shared_adjacency is None:
+        _shared_adjacency = AdjacencyLRU()
+    return _shared_adjacency
+
+
+class NeighborhoodCache:
+    """
+    Per-question adjacency + node property cache for beam search
+
+    Frontier nodes are expanded with one UNWIND query per step; a node reached
+    by several paths is fetched once. Neighbor properties returned with the
+    edges are kept, so the links → node step usually needs no query at all.
+    Counts the graph queries it issues.
+    """
+
+    def __init__(self, graph: Any, shared: Optional[AdjacencyLRU] = None, edge_limit: int = EDGE_LIMIT):
+        self.graph = graph
+        self.shared = shared
+        self.edge_limit = edge_limit
+        self.edges: Dict[str, List[Tuple[str, str, str, Dict[str, Any]]]] = {}
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.queries = 0
+
+    def query(self, cypher: str, params: Dict[str, Any]) -> Any:
+        self.queries += 1
+        return self.graph.query(cypher, params=params)
+
+    def neighbors(self, node_ids: Iterable[str]) -> Dict[str, List[Tuple[str, str, str, Dict[str, Any]]]]:
+        """Edges (rel_type, source_id, target_id, props) around each node, fetching misses in one query"""
+        node_ids = list(dict.fromkeys(node_ids))
+        missing = []
+        for node_id in node_ids:
+            if node_id in self.edges:
+                continue
+            cached = self.shared.get(node_id) if self.shared is not None else None
+            if cached is not None:
+                self.edges[node_id], neighbor_props = cached
+                self.nodes.update(neighbor_props)
+            else:
+                missing.append(node_id)
+
+        if missing:
+            result = self.query(FRONTIER_EDGES_QUERY, {'ids': missing, 'limit': self.edge_limit})
+            fetched = {record[0]: record[1] for record in result.result_set}
+            for node_id in missing:
+                edges = []
+                neighbor_props = {}
+                for rel_type, source_id, target_id, edge_props, m_props, m_id in fetched.get(node_id, []):
+                    edges.append((rel_type, source_id, target_id, edge_props))
+                    neighbor_props[m_id] = m_props
+                self.edges[node_id] = edges
+                self.nodes.update(neighbor_props)
+                if self.shared is not None:
+                    self.shared.put(node_id, (edges, neighbor_props))
+
+        return {node_id: self.edges[node_id] for node_id in node_ids}
+
+    def node_props(self, node_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Properties (with embedding) for each node, fetching misses in one query"""
+        node_ids = list(dict.fromkeys(node_ids))
+        missing = [node_id for node_id in node_ids if node_id not in self.nodes]
+        if missing:
+            result = self.query(NODES_QUERY, {'ids': missing})
+            for node_id, props in result.result_set:
+                self.nodes[node_id] = props
+        return {node_id: self.nodes[node_id] for node_id in node_ids if node_id in self.nodes}
+
+
 # ============================================================================
 # SCORING
 # ============================================================================
@@ -238,6 +376,35 @@ def path_score(node_scores: List[float], edge_scores: List[float]) -> float:
     return math.exp(log_sum / len(all_scores))
 
 
+def _clamped_column(props_list: List[Dict[str, Any]], field: str, default: float = 0.5) -> np.ndarray:
+    """Vectorized clamp() of one property across many records"""
+    values = np.empty(len(props_list), dtype=np.float64)
+    for i, props in enumerate(props_list):
+        value = props.get(field, default)
+        try:
+            values[i] = float(value)
+        except (ValueError, TypeError):
+            values[i] = 0.5  # Same fallback as clamp()
+    return np.clip(values, 0.0, 1.0)
+
+
+def edge_scores(edge_props: List[Dict[str, Any]]) -> np.ndarray:
+    """edge_score() over many edges at once"""
+    return _clamped_column(edge_props, 'confidence') * _clamped_column(edge_props, 'energy')
+
+
+def node_scores(node_props: List[Dict[str, Any]], query_vector: np.ndarray) -> np.ndarray:
+    """node_score() over many nodes at once (cosine from stored embeddings; 0.5 when missing)"""
+    cosines = np.full(len(node_props), 0.5)
+    with_embedding = [i for i, props in enumerate(node_props) if props.get('embedding')]
+    if with_embedding:
+        matrix = np.asarray([node_props[i]['embedding'] for i in with_embedding], dtype=np.float64)
+        cosines[with_embedding] = matrix @ np.asarray(query_vector, dtype=np.float64)
+    return (np.clip(cosines, 0.0, 1.0)
+            * _clamped_column(node_props, 'confidence')
+            * _clamped_column(node_props, 'base_weight'))
+
+
 # ============================================================================
 # BEAM SEARCH
 # ============================================================================
@@ -247,7 +414,8 @@ def beam_search(
     initial_nodes: List[Dict[str, Any]],
     query_vector: np.ndarray,
     beam_width: int = BEAM_WIDTH,
-    max_steps: int = MAX_STEPS
+    max_steps: int = MAX_STEPS,
+    cache: Optional[NeighborhoodCache] = None
 ) -> PathState:
     """
     Generic beam search exploration
@@ -259,8 +427,14 @@ def beam_search(
     - De-dup nodes within path (no cycles)
     - Stop when reaching max steps or marginal gain < 1%
 
+    Each step expands the whole frontier in one query through the
+    NeighborhoodCache and scores all candidates with NumPy; PathStates are
+    only built for the beam_width survivors.
+
     Returns: Best path found
     """
+    cache = cache if cache is not None else NeighborhoodCache(graph)
+
     # Initialize beam with top N initial nodes
     beam: List[PathState] = []
 
@@ -285,101 +459,79 @@ def beam_search(
 
     # Beam search loop
     for step in range(max_steps):
-        new_beam = []
+        # Candidates: (parent state, edge or None, target node or None), scored in bulk
+        parents: List[PathState] = []
+        new_edges: List[Optional[Tuple[str, str, str]]] = []
+        new_nodes: List[Optional[str]] = []
+        scored_props: List[Dict[str, Any]] = []
+        exponents: List[float] = []
+
+        node_states = [state for state in beam if state.last_step_type == 'node']
+        adjacency = cache.neighbors(state.nodes[-1] for state in node_states)
+        link_targets = [state.edges[-1][2] for state in beam if state.last_step_type != 'node' and state.edges]
+        target_props = cache.node_props(link_targets) if link_targets else {}
 
         for state in beam:
             if state.last_step_type == 'node':
-                # Expand from node to edges
-                last_node = state.nodes[-1]
-
-                # Query outgoing AND incoming edges
-                edge_query = """
-                MATCH (n {id: $node_id})-[r]-(m)
-                RETURN type(r) AS rel_type, startNode(r).id AS source_id,
-                       endNode(r).id AS target_id, properties(r) AS props,
-                       properties(m) AS target_props, m.id AS target_id_check
-                LIMIT 20
-                """
-
-                result = graph.query(edge_query, params={'node_id': last_node})
-
-                for record in result.result_set:
-                    rel_type = record[0]
-                    source_id = record[1]
-                    target_id = record[2]
-                    edge_props = record[3]
-                    target_props = record[4]
-
+                # Expand from node to edges (outgoing AND incoming)
+                for rel_type, source_id, target_id, edge_props in adjacency[state.nodes[-1]]:
                     # Skip if target already in path (avoid cycles)
                     if target_id in state.nodes:
                         continue
-
-                    # Create new state with edge added
-                    new_edges = state.edges + [(source_id, rel_type, target_id)]
-
-                    # Calculate new score (add edge score to geometric mean)
-                    e_score = edge_score(edge_props)
-                    # Recompute path score with new edge
-                    # Simplified: multiply current by edge score ratio
-                    new_score = state.score * (e_score ** (1.0 / (len(state.nodes) + len(new_edges))))
-
-                    new_beam.append(PathState(
-                        nodes=state.nodes.copy(),
-                        edges=new_edges,
-                        score=new_score,
-                        last_step_type='links',
-                        depth=state.depth + 1
-                    ))
+                    parents.append(state)
+                    new_edges.append((source_id, rel_type, target_id))
+                    new_nodes.append(None)
+                    scored_props.append(edge_props)
+                    exponents.append(1.0 / (len(state.nodes) + len(state.edges) + 1))
 
             else:  # last_step_type == 'links'
                 # Expand from links to target node
                 if not state.edges:
                     continue
-
-                last_edge = state.edges[-1]
-                target_id = last_edge[2]
-
-                # Query target node properties
-                node_query = """
-                MATCH (n {id: $node_id})
-                RETURN properties(n) AS props, n.embedding AS embedding
-                """
-                result = graph.query(node_query, params={'node_id': target_id})
-
-                if not result.result_set:
+                target_id = state.edges[-1][2]
+                if target_id not in target_props:
                     continue
+                parents.append(state)
+                new_edges.append(None)
+                new_nodes.append(target_id)
+                scored_props.append(target_props[target_id])
+                exponents.append(1.0 / (len(state.nodes) + 1))
 
-                node_props = result.result_set[0][0]
-                node_embedding = result.result_set[0][1]
-
-                # Calculate cosine similarity
-                if node_embedding:
-                    cos_sim = np.dot(query_vector, np.array(node_embedding))
-                else:
-                    cos_sim = 0.5  # fallback
-
-                # Add node to path
-                new_nodes = state.nodes + [target_id]
-                n_score = node_score(node_props, cos_sim)
-
-                # Recompute path score
-                new_score = state.score * (n_score ** (1.0 / len(new_nodes)))
+        if not parents:
+            break
 
-                new_beam.append(PathState(
-                    nodes=new_nodes,
+        # Vectorized scoring: edge candidates use edge_score, node candidates node_score
+        is_edge = np.array([edge is not None for edge in new_edges])
+        step_scores = np.empty(len(parents))
+        if is_edge.any():
+            step_scores[is_edge] = edge_scores([p for p, e in zip(scored_props, is_edge) if e])
+        if not is_edge.all():
+            step_scores[~is_edge] = node_scores([p for p, e in zip(scored_props, is_edge) if not e], query_vector)
+        parent_scores = np.array([state.score for state in parents])
+        new_scores = parent_scores * step_scores ** np.array(exponents)
+
+        # Keep top beam_width (stable: ties keep expansion order)
+        top = np.argsort(-new_scores, kind='stable')[:beam_width]
+        beam = []
+        for i in top:
+            state = parents[i]
+            if new_edges[i] is not None:
+                beam.append(PathState(
+                    nodes=state.nodes.copy(),
+                    edges=state.edges + [new_edges[i]],
+                    score=float(new_scores[i]),
+                    last_step_type='links',
+                    depth=state.depth + 1
+                ))
+            else:
+                beam.append(PathState(
+                    nodes=state.nodes + [new_nodes[i]],
                     edges=state.edges.copy(),
-                    score=new_score,
+                    score=float(new_scores[i]),
                     last_step_type='node',
                     depth=state.depth + 1
                 ))
 
-        if not new_beam:
-            break
-
-        # Sort and keep top beam_width
-        new_beam.sort(key=lambda s: s.score, reverse=True)
-        beam = new_beam[:beam_width]
-
         # Check marginal gain
         new_best_score = beam[0].score
         marginal_gain = (new_best_score - best_score) / (best_score + 1e-10)
@@ -435,34 +587,33 @@ def hydrate_and_serialize(graph: Any, path: PathState) -> List[Dict[str, Any]]:
             'props': props
         }
 
-    # Get all edges in path
+    # Get all edges in path (one query; first matching edge per (source, type, target))
     edges_by_source = defaultdict(list)
-    for source_id, rel_type, target_id in path.edges:
-        edge_query = """
-        MATCH (s {id: $source_id})-[r:$rel_type]->(t {id: $target_id})
-        RETURN type(r) AS rel_type, properties(r) AS props
-        LIMIT 1
-        """
-        # Note: Cypher doesn't allow parameterized relationship types in simple form
-        # Need to use dynamic query
-        edge_query_dynamic = f"""
-        MATCH (s {{id: $source_id}})-[r:`{rel_type}`]->(t {{id: $target_id}})
-        RETURN type(r) AS rel_type, properties(r) AS props
-        LIMIT 1
+    if path.edges:
+        edges_query = """
+        UNWIND $edges AS e
+        MATCH (s {id: e[0]})-[r]->(t {id: e[2]})
+        WHERE type(r) = e[1]
+        RETURN e[0] AS source_id, type(r) AS rel_type, e[2] AS target_id, properties(r) AS props
         """
+        edges_result = graph.query(edges_query, params={'edges': [list(edge) for edge in path.edges]})
 
-        result = graph.query(edge_query_dynamic, params={'source_id': source_id, 'target_id': target_id})
+        edge_props = {}
+        for source_id, rel_type, target_id, props in edges_result.result_set:
+            edge_props.setdefault((source_id, rel_type, target_id), props)
 
-        if result.result_set:
-            rel_type_actual = result.result_set[0][0]
-            props = result.result_set[0][1].copy()
+        for source_id, rel_type, target_id in path.edges:
+            props = edge_props.get((source_id, rel_type, target_id))
+            if props is None:
+                continue
+            props = props.copy()
 
             # Remove operational timestamps
             for key in ['created_at', 'updated_at', 'expired_at', 'invalid_at']:
                 props.pop(key, None)
 
             edges_by_source[source_id].append({
-                'rel_type': rel_type_actual,
+                'rel_type': rel_type,
                 'source': source_id,
                 'target': target_id,
                 'props': props
@@ -490,16 +641,29 @@ def hydrate_and_serialize(graph: Any, path: PathState) -> List[Dict[str, Any]]:
 # MAIN
 # ============================================================================
 
-def ask(question: str) -> Dict[str, Any]:
+def ask(
+    question: str,
+    graph: Any = None,
+    embedding_service: Optional[EmbeddingService] = None,
+    adjacency: Optional[AdjacencyLRU] = None
+) -> Dict[str, Any]:
     """
     Execute the ask algorithm
 
+    Args:
+        question: Question text
+        graph: FalkorDB graph (default: org base graph on localhost)
+        embedding_service: Embedding service (default: shared registry model)
+        adjacency: Cross-question adjacency LRU (default: process-wide, see ASK_ADJACENCY_CACHE_SIZE)
+
     Returns: JSON-serializable result dict
     """
     # Initialize services
-    embedding_service = EmbeddingService()
-    db = FalkorDB(host='localhost', port=6379)
-    graph = db.select_graph(resolver.org_base())
+    embedding_service = embedding_service or EmbeddingService()
+    if graph is None:
+        db = FalkorDB(host='localhost', port=6379)
+        graph = db.select_graph(resolver.org_base())
+    cache = NeighborhoodCache(graph, shared=adjacency if adjacency is not None else get_shared_adjacency())
 
     # 0. Build contextual query embedding
     query_vector, context_used = build_contextual_query(question, embedding_service)
@@ -524,7 +688,7 @@ def ask(question: str) -> Dict[str, Any]:
         }
 
     # 2. Generic beam search exploration
-    best_path = beam_search(graph, all_candidates, query_vector)
+    best_path = beam_search(graph, all_candidates, query_vector, cache=cache)
 
     # 3. Select best path and hydrate fully
     cluster = hydrate_and_serialize(graph, best_path)
@@ -534,7 +698,8 @@ def ask(question: str) -> Dict[str, Any]:
         'query': question,
         'context_used': context_used,
         'cluster': cluster,
-        'notes': f'Top path score: {best_path.score:.4f}, depth: {best_path.depth}'
+        'notes': f'Top path score: {best_path.score:.4f}, depth: {best_path.depth}, '
+                 f'beam queries: {cache.queries}'
     }
 
 
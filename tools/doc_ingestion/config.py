@@ -67,6 +67,12 @@ class ProcessingConfig:
     state_db_path: str = ".doc_ingestion_state.db"  # SQLite state file
     checkpoint_interval: int = 10     # Checkpoint every N documents
     qa_check_interval: int = 3        # Run QA quality check every N documents
+    write_batch_size: int = 500       # Rows per UNWIND batch for graph writes
+    chunk_workers: int = 0            # Pipeline: chunking processes (0 = CPU count)
+    llm_concurrency: int = 4          # Pipeline: concurrent map_and_link calls
+    embed_batch_files: int = 8        # Pipeline: files per embedding micro-batch
+    write_batch_files: int = 4        # Pipeline: files per graph write batch
+    stage_queue_size: int = 8         # Pipeline: bound on each stage's input queue
     enable_resume: bool = True        # Enable checkpoint/resume
 
 
@@ -132,6 +138,9 @@ class DocIngestionConfig:
         - DOC_INGEST_FALKORDB_GRAPH
         - DOC_INGEST_MANIFEST_PATH
         - DOC_INGEST_STATE_DB_PATH
+        - DOC_INGEST_WRITE_BATCH
+        - DOC_INGEST_LLM_CONCURRENCY
+        - DOC_INGEST_CHUNK_WORKERS
         - DOC_INGEST_LOG_LEVEL
 
         Returns:
@@ -172,6 +181,12 @@ class DocIngestionConfig:
             config.processing.manifest_path = val
         if val := os.getenv('DOC_INGEST_STATE_DB_PATH'):
             config.processing.state_db_path = val
+        if val := os.getenv('DOC_INGEST_WRITE_BATCH'):
+            config.processing.write_batch_size = int(val)
+        if val := os.getenv('DOC_INGEST_LLM_CONCURRENCY'):
+            config.processing.llm_concurrency = int(val)
+        if val := os.getenv('DOC_INGEST_CHUNK_WORKERS'):
+            config.processing.chunk_workers = int(val)
 
         # Logging config
         if val := os.getenv('DOC_INGEST_LOG_LEVEL'):
@@ -253,6 +268,10 @@ class DocIngestionConfig:
         # Processing validation
         if not self.processing.manifest_path:
             errors.append("processing.manifest_path is required")
+        for field_name in ['write_batch_size', 'llm_concurrency', 'embed_batch_files', 'write_batch_files', 'stage_queue_size']:
+            val = getattr(self.processing, field_name)
+            if val <= 0:
+                errors.append(f"processing.{field_name} must be > 0, got {val}")
 
         return errors
 
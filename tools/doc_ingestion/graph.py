@@ -6,6 +6,8 @@ Provides idempotent graph operations with read-back verification for doc ingesti
 Key features:
 - ensure_node/ensure_edge with MERGE (idempotent)
 - Write→read confirmation (2 retry attempts)
+- BulkWriteSession: parameterized UNWIND ... MERGE batches grouped by
+  label / relationship type, one confirmation query per batch
 - Schema registry queries (node types, link types, metadata contracts)
 - JSONL streaming logs for all operations
 
@@ -17,9 +19,12 @@ Spec: docs/SPEC DOC INPUT.md
 import json
 import logging
 import sys
+import time
+from collections import defaultdict
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import redis
+from falkordb.helpers import stringify_param_value
 
 from tools.logger import setup_logger
 from orchestration.config.graph_names import resolver
@@ -27,6 +32,249 @@ from orchestration.config.graph_names import resolver
 logger = setup_logger(__name__)
 
 
+class BulkWriteSession:
+    """
+    Bulk node/edge writer for one chunk or file.
+
+    ensure_node/ensure_edge cost 2-4 round trips per item (MERGE + read-back,
+    plus endpoint checks for edges). A session collects items and flush()
+    writes them with parameterized UNWIND ... MERGE, grouped by label or
+    relationship type, in batches of `batch_size`. Each batch is confirmed
+    with a single query returning the confirmed row indices; unconfirmed
+    rows are retried up to GraphWrapper.MAX_RETRIES times.
+
+    flush() returns per-item results in the same shape as ensure_node /
+    ensure_edge, so callers keep their existing logging and ARM handling.
+    Nodes are always flushed before edges.
+    """
+
+    DEFAULT_BATCH_SIZE = 500
+
+    def __init__(self, graph: 'GraphWrapper', batch_size: int = DEFAULT_BATCH_SIZE):
+        self.graph = graph
+        self.batch_size = max(1, batch_size)
+        self._nodes: List[Tuple[str, str, Dict[str, Any]]] = []
+        self._edges: List[Tuple[str, str, str, Dict[str, Any]]] = []
+        self.stats = {
+            "nodes_written": 0,
+            "edges_written": 0,
+            "batches": 0,
+            "round_trips": 0,
+            "write_seconds": 0.0,
+            "nodes_per_sec": 0.0,
+        }
+
+    def __enter__(self) -> 'BulkWriteSession':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        return False
+
+    @staticmethod
+    def _param_value(value: Any) -> Any:
+        """Coerce a property to a FalkorDB primitive (matches GraphWrapper._format_value)."""
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return str(value)
+
+    def add_node(self, node_type: str, node_id: str, properties: Optional[Dict[str, Any]] = None):
+        """Queue a node MERGE (same semantics as GraphWrapper.ensure_node)."""
+        props = {k: self._param_value(v) for k, v in (properties or {}).items()}
+        props['id'] = node_id
+        self._nodes.append((node_type, node_id, props))
+
+    def add_edge(
+        self,
+        edge_type: str,
+        source_id: str,
+        target_id: str,
+        meta: Dict[str, Any],
+        confidence: float = 1.0,
+        status: str = "CONFIRMED"
+    ):
+        """Queue an edge MERGE (same semantics as GraphWrapper.ensure_edge)."""
+        props = {
+            "confidence": confidence,
+            "status": status,
+            "meta": json.dumps(meta),
+            "created_at": datetime.utcnow().isoformat()
+        }
+        self._edges.append((edge_type, source_id, target_id, props))
+
+    def _run(self, query: str, params: Dict[str, Any]) -> Any:
+        self.stats["round_trips"] += 1
+        return self.graph._execute_query(query, params)
+
+    @staticmethod
+    def _collected(result: Any) -> List[Any]:
+        """First column of first row (a collect() result), decoded."""
+        if not result or len(result) < 2 or not result[1]:
+            return []
+        values = result[1][0][0] or []
+        return [v.decode('utf-8') if isinstance(v, bytes) else v for v in values]
+
+    def _batches(self, items: List[Tuple[int, Any]]):
+        for start in range(0, len(items), self.batch_size):
+            yield items[start:start + self.batch_size]
+
+    def _write_confirmed(self, rows: List[Dict[str, Any]], write_query: str, confirm_query: str) -> set:
+        """Write rows, confirm with one query, retry unconfirmed rows. Returns confirmed row indices."""
+        confirmed: set = set()
+        pending = rows
+        for attempt in range(self.graph.MAX_RETRIES + 1):
+            self._run(write_query, {"rows": pending})
+            confirmed.update(self._collected(self._run(confirm_query, {"rows": pending})))
+            pending = [row for row in pending if row["i"] not in confirmed]
+            if not pending:
+                break
+            self.graph._log_event("bulk_readback_failed", {
+                "unconfirmed": len(pending),
+                "attempt": attempt + 1,
+                "max_attempts": self.graph.MAX_RETRIES + 1
+            })
+        return confirmed
+
+    def flush(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Write all queued nodes, then edges.
+
+        Returns:
+            {"nodes": [ensure_node-style results], "edges": [ensure_edge-style results]}
+            in the order items were added.
+        """
+        started = time.perf_counter()
+        node_results = self._flush_nodes()
+        edge_results = self._flush_edges()
+        elapsed = time.perf_counter() - started
+
+        self.stats["write_seconds"] += elapsed
+        if self.stats["write_seconds"] > 0:
+            self.stats["nodes_per_sec"] = self.stats["nodes_written"] / self.stats["write_seconds"]
+
+        if node_results or edge_results:
+            self.graph._log_event("bulk_flush", {
+                "nodes": sum(1 for r in node_results if r["confirmed"]),
+                "edges": sum(1 for r in edge_results if r["confirmed"]),
+                "round_trips": self.stats["round_trips"],
+                "seconds": round(elapsed, 4),
+                "nodes_per_sec": round(self.stats["nodes_per_sec"], 1)
+            })
+
+        return {"nodes": node_results, "edges": edge_results}
+
+    def _flush_nodes(self) -> List[Dict[str, Any]]:
+        queued, self._nodes = self._nodes, []
+        results: List[Dict[str, Any]] = [None] * len(queued)
+
+        by_label: Dict[str, List[Tuple[int, Dict[str, Any]]]] = defaultdict(list)
+        for i, (node_type, node_id, props) in enumerate(queued):
+            by_label[node_type].append((i, {"i": i, "id": node_id, "props": props}))
+
+        for node_type, items in by_label.items():
+            write_query = f"""
+            UNWIND $rows AS row
+            MERGE (n:{node_type} {{id: row.id}})
+            SET n += row.props
+            """
+            confirm_query = f"""
+            UNWIND $rows AS row
+            MATCH (n:{node_type} {{id: row.id}})
+            RETURN collect(row.i)
+            """
+            for batch in self._batches(items):
+                self.stats["batches"] += 1
+                rows = [row for _, row in batch]
+                try:
+                    confirmed = self._write_confirmed(rows, write_query, confirm_query)
+                    error = "Read-back confirmation failed after all retries"
+                except Exception as e:
+                    self.graph._log_event("bulk_node_error", {"node_type": node_type, "rows": len(rows), "error": str(e)})
+                    confirmed, error = set(), str(e)
+
+                for i, row in batch:
+                    result = {"confirmed": i in confirmed, "node_id": row["id"], "node_type": node_type, "retries": 0}
+                    if not result["confirmed"]:
+                        result["error"] = error
+                    results[i] = result
+                self.stats["nodes_written"] += sum(1 for i, _ in batch if i in confirmed)
+
+        return results
+
+    def _flush_edges(self) -> List[Dict[str, Any]]:
+        queued, self._edges = self._edges, []
+        results: List[Dict[str, Any]] = [None] * len(queued)
+        if not queued:
+            return results
+
+        # Endpoint validation: one query for every id referenced by queued edges
+        endpoint_ids = sorted({sid for _, sid, _, _ in queued} | {tid for _, _, tid, _ in queued})
+        existing: Optional[set] = None
+        try:
+            found = self._run(
+                "UNWIND $ids AS id MATCH (n {id: id}) RETURN collect(DISTINCT n.id)",
+                {"ids": endpoint_ids}
+            )
+            existing = set(self._collected(found))
+        except Exception as e:
+            # Same as ensure_edge: continue with the write attempt
+            self.graph._log_event("edge_validation_failed", {"edges": len(queued), "error": str(e)})
+
+        by_type: Dict[str, List[Tuple[int, Dict[str, Any]]]] = defaultdict(list)
+        for i, (edge_type, source_id, target_id, props) in enumerate(queued):
+            base = {"edge_type": edge_type, "source_id": source_id, "target_id": target_id, "retries": 0}
+            missing = None
+            if existing is not None and source_id not in existing:
+                missing = f"Source node '{source_id}' does not exist"
+            elif existing is not None and target_id not in existing:
+                missing = f"Target node '{target_id}' does not exist"
+            if missing:
+                self.graph._log_event("edge_creation_failed", {**base, "error": missing, "severity": "ERROR"})
+                results[i] = {**base, "confirmed": False, "error": missing}
+                continue
+            by_type[edge_type].append((i, {"i": i, "source": source_id, "target": target_id, "props": props}))
+
+        for edge_type, items in by_type.items():
+            write_query = f"""
+            UNWIND $rows AS row
+            MATCH (a {{id: row.source}}), (b {{id: row.target}})
+            MERGE (a)-[r:{edge_type}]->(b)
+            SET r += row.props
+            """
+            confirm_query = f"""
+            UNWIND $rows AS row
+            MATCH (a {{id: row.source}})-[r:{edge_type}]->(b {{id: row.target}})
+            RETURN collect(DISTINCT row.i)
+            """
+            for batch in self._batches(items):
+                self.stats["batches"] += 1
+                rows = [row for _, row in batch]
+                try:
+                    confirmed = self._write_confirmed(rows, write_query, confirm_query)
+                    error = "Read-back confirmation failed after all retries"
+                except Exception as e:
+                    self.graph._log_event("bulk_edge_error", {"edge_type": edge_type, "rows": len(rows), "error": str(e)})
+                    confirmed, error = set(), str(e)
+
+                for i, row in batch:
+                    result = {
+                        "confirmed": i in confirmed,
+                        "edge_type": edge_type,
+                        "source_id": row["source"],
+                        "target_id": row["target"],
+                        "retries": 0
+                    }
+                    if not result["confirmed"]:
+                        result["error"] = error
+                    results[i] = result
+                self.stats["edges_written"] += sum(1 for i, _ in batch if i in confirmed)
+
+        return results
+
+
 class GraphWrapper:
     """
     FalkorDB graph client with write→read confirmations.
@@ -107,16 +355,20 @@ class GraphWrapper:
         """
         Execute Cypher query against FalkorDB.
 
-        Note: FalkorDB doesn't support parameterized queries via Redis protocol.
-        Query should already have values interpolated.
+        Over the raw Redis protocol, parameters travel in a 'CYPHER k=v ...'
+        header in front of the query text (same encoding as the falkordb client).
 
         Args:
-            query: Cypher query string (values already interpolated)
-            params: Unused (kept for API compatibility)
+            query: Cypher query string (values interpolated, or $params)
+            params: Optional query parameters referenced as $name
 
         Returns:
             Query result from FalkorDB
         """
+        if params:
+            header = "".join(f"{k}={stringify_param_value(v)} " for k, v in params.items())
+            query = f"CYPHER {header}{query}"
+
         try:
             result = self.r.execute_command('GRAPH.QUERY', self.graph_name, query)
             return result
@@ -534,6 +786,18 @@ class GraphWrapper:
             "error": "Read-back confirmation failed after all retries"
         }
 
+    def bulk_session(self, batch_size: int = BulkWriteSession.DEFAULT_BATCH_SIZE) -> 'BulkWriteSession':
+        """
+        Open a bulk-write session (collect nodes/edges, flush as UNWIND batches).
+
+        Example:
+            >>> with graph.bulk_session() as session:
+            ...     session.add_node("Mechanism", "mechanism:x", {"name": "X"})
+            ...     session.add_edge("IMPLEMENTS", "best_practice:y", "mechanism:x", meta={})
+            >>> session.stats["nodes_per_sec"]
+        """
+        return BulkWriteSession(self, batch_size=batch_size)
+
     def get_node_types(self) -> List[Dict[str, Any]]:
         """
         Query schema registry for node type definitions.
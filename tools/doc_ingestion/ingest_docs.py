@@ -8,7 +8,7 @@ Key features:
 - Read manifest.json (ordered file list)
 - Hash file contents (SHA-256) for change detection
 - SQLite state tracking (pending, processing, completed, failed)
-- Checkpoint/resume support
+- Checkpoint/resume support (per file, and per pipeline stage)
 - Idempotent operations (safe to re-run)
 
 Author: Atlas (Infrastructure Engineer)
@@ -114,6 +114,20 @@ class IngestionStateManager:
         )
         """)
 
+        # Pipeline stage checkpoints (process_corpus.py --pipeline)
+        # Payload is the stage output, so resume re-enters after the last finished stage.
+        # Rows are only valid for the content_hash they were produced from.
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS stage_checkpoints (
+            file_path TEXT NOT NULL,
+            stage TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            payload TEXT,
+            completed_at TEXT NOT NULL,
+            PRIMARY KEY (file_path, stage)
+        )
+        """)
+
         conn.commit()
         conn.close()
 
@@ -333,6 +347,7 @@ class IngestionStateManager:
             link_count,
             file_path
         ))
+        cursor.execute("DELETE FROM stage_checkpoints WHERE file_path = ?", (file_path,))
 
         conn.commit()
         conn.close()
@@ -368,6 +383,60 @@ class IngestionStateManager:
 
         self._log_event(file_path, "processing_failed", error_message)
 
+    def save_stage_checkpoint(self, file_path: str, stage: str, content_hash: str, payload: Any = None):
+        """
+        Record that a pipeline stage finished for a file.
+
+        Args:
+            file_path: File the stage processed
+            stage: Stage name (e.g. 'chunk', 'embed', 'llm')
+            content_hash: Hash of the file content the payload was produced from
+            payload: JSON-serializable stage output (None if not needed for resume)
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute("""
+        INSERT OR REPLACE INTO stage_checkpoints (file_path, stage, content_hash, payload, completed_at)
+        VALUES (?, ?, ?, ?, ?)
+        """, (
+            file_path,
+            stage,
+            content_hash,
+            json.dumps(payload, default=str) if payload is not None else None,
+            datetime.utcnow().isoformat()
+        ))
+
+        conn.commit()
+        conn.close()
+
+    def get_stage_checkpoints(self, file_path: str, content_hash: str) -> Dict[str, Any]:
+        """
+        Get finished stages for a file.
+
+        Checkpoints recorded for a different content hash (file changed since)
+        are ignored.
+
+        Args:
+            file_path: File to look up
+            content_hash: Current content hash of the file
+
+        Returns:
+            {stage: payload} for every stage checkpointed against content_hash
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute("""
+        SELECT stage, payload FROM stage_checkpoints
+        WHERE file_path = ? AND content_hash = ?
+        """, (file_path, content_hash))
+        rows = cursor.fetchall()
+
+        conn.close()
+
+        return {stage: json.loads(payload) if payload is not None else None for stage, payload in rows}
+
     def create_qa_task(self, file_path: str, task_type: str, description: str):
         """
         Create a QA task for manual review.
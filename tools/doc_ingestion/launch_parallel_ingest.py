@@ -115,7 +115,8 @@ def launch_agents(
     db_paths: List[Path],
     manifest_dir: Path,
     repo_root: Path,
-    config_path: str
+    config_path: str,
+    write_batch_size: int = 500
 ) -> List[subprocess.Popen]:
     """
     Launch parallel agent processes.
@@ -125,6 +126,7 @@ def launch_agents(
         manifest_dir: Directory containing temp manifests
         repo_root: Repository root path
         config_path: Path to config.toml
+        write_batch_size: Rows per UNWIND batch for each agent's graph writes
 
     Returns:
         List of subprocess.Popen objects
@@ -148,6 +150,7 @@ def launch_agents(
         import os
         env = os.environ.copy()
         env['DOC_INGEST_STATE_DB_PATH'] = str(db_path)
+        env['DOC_INGEST_WRITE_BATCH'] = str(write_batch_size)
 
         # Launch process
         log_file = manifest_dir / f"agent{agent_id}_output.log"
@@ -202,9 +205,9 @@ def monitor_agents(processes: List[subprocess.Popen], db_paths: List[Path]):
                 try:
                     manager = IngestionStateManager(str(db_path))
                     stats = manager.get_processing_stats()
-                    completed = stats['completed']
-                    failed = stats['failed']
-                    total = stats['total']
+                    completed = stats['by_status'].get('completed', 0)
+                    failed = stats['by_status'].get('failed', 0)
+                    total = sum(stats['by_status'].values())
                 except Exception:
                     completed = "?"
                     failed = "?"
@@ -235,6 +238,7 @@ def main():
     parser.add_argument('--manifest', required=True, help='Path to manifest.json')
     parser.add_argument('--config', default='config.toml', help='Path to config.toml')
     parser.add_argument('--db-dir', default='.parallel_ingest', help='Directory for agent databases')
+    parser.add_argument('--write-batch', type=int, default=500, help='Rows per UNWIND batch for graph writes')
 
     args = parser.parse_args()
 
@@ -273,7 +277,8 @@ def main():
 
     # Step 3: Launch agents
     try:
-        processes = launch_agents(db_paths, db_dir, repo_root, config_path)
+        started_at = time.time()
+        processes = launch_agents(db_paths, db_dir, repo_root, config_path, args.write_batch)
     except Exception as e:
         print(f"  ✗ Error launching agents: {e}")
         import traceback
@@ -282,6 +287,7 @@ def main():
 
     # Step 4: Monitor agents
     monitor_agents(processes, db_paths)
+    elapsed = time.time() - started_at
 
     # Step 5: Aggregate results
     print("\n📊 Final Statistics:")
@@ -290,25 +296,33 @@ def main():
     total_completed = 0
     total_failed = 0
     total_files = 0
+    total_nodes = 0
 
     for agent_id, db_path in enumerate(db_paths):
         manager = IngestionStateManager(str(db_path))
         stats = manager.get_processing_stats()
 
+        completed = stats['by_status'].get('completed', 0)
+        failed = stats['by_status'].get('failed', 0)
+        total = sum(stats['by_status'].values())
+
         print(f"Agent {agent_id}:")
-        print(f"  - Completed: {stats['completed']}")
-        print(f"  - Failed: {stats['failed']}")
-        print(f"  - Total: {stats['total']}")
+        print(f"  - Completed: {completed}")
+        print(f"  - Failed: {failed}")
+        print(f"  - Total: {total}")
+        print(f"  - Nodes: {stats['total_nodes']}")
 
-        total_completed += stats['completed']
-        total_failed += stats['failed']
-        total_files += stats['total']
+        total_completed += completed
+        total_failed += failed
+        total_files += total
+        total_nodes += stats['total_nodes']
 
     print("-" * 60)
     print(f"Overall:")
     print(f"  - Completed: {total_completed}/{total_files}")
     print(f"  - Failed: {total_failed}/{total_files}")
-    print(f"  - Success rate: {(total_completed/total_files*100):.1f}%")
+    print(f"  - Success rate: {(total_completed/max(1, total_files)*100):.1f}%")
+    print(f"  - Nodes written: {total_nodes} ({total_nodes/max(elapsed, 1e-9):.1f} nodes/sec over {elapsed:.0f}s)")
 
     print("\n✅ Parallel ingestion complete")
     print(f"Logs available in: {db_dir}")
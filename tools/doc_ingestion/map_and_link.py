@@ -2164,7 +2164,8 @@ def process_chunks(inputs: Dict[str, Any], config: Dict[str, Any]) -> Dict[str,
         logger.info(f"[process_chunks] ===== CHUNK {i+1}/{len(chunks)}: {chunk['chunk_id']} =====")
 
         # Get candidates for this chunk via vector search
-        embedding = creator.embedding_service.embed(chunk['text'])
+        # (pipeline mode embeds chunks ahead of time in micro-batches)
+        embedding = chunk.pop('embedding', None) or creator.embedding_service.embed(chunk['text'])
         existing_nodes_for_chunk = {}
         for node_type in ['Principle', 'Best_Practice', 'Mechanism', 'Behavior', 'Process', 'Metric']:
             try:
@@ -12,13 +12,20 @@ Key features:
 - Token counting via tiktoken (cl100k_base)
 - Returns chunks with metadata (offset, token count, type)
 
+Cost is linear in file size: each distinct segment is tokenized once per
+chunk_file call, fence lookups bisect the sorted fence list, and forced
+splits never tokenize more than max_tokens * (longest token in bytes)
+characters per probe.
+
 Author: Atlas (Infrastructure Engineer)
 Date: 2025-10-29
 Spec: docs/SPEC DOC INPUT.md
 """
 
+import math
 import re
-from typing import List, Dict, Any, Tuple
+from bisect import bisect_right
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 import tiktoken
 
@@ -47,22 +54,41 @@ class MarkdownChunker:
     - Max: 480 tokens (hard limit)
     """
 
-    def __init__(self, target_tokens: int = 250, max_tokens: int = 480):
+    def __init__(self, target_tokens: int = 250, max_tokens: int = 480,
+                 encoder: Optional[tiktoken.Encoding] = None):
         """
         Initialize chunker.
 
         Args:
             target_tokens: Target chunk size
             max_tokens: Maximum chunk size (hard limit)
+            encoder: tiktoken encoding (default: cl100k_base)
         """
         self.target_tokens = target_tokens
         self.max_tokens = max_tokens
-        self.encoder = tiktoken.get_encoding("cl100k_base")  # GPT-4 tokenizer
+        self.encoder = encoder or tiktoken.get_encoding("cl100k_base")  # GPT-4 tokenizer
+
+        # Every token covers at most this many bytes (>= characters), so longer
+        # text always holds more than max_tokens tokens without encoding it
+        longest_token = max(len(token) for token in self.encoder.token_byte_values())
+        self._over_limit_chars = self.max_tokens * longest_token
+
+        # Token counts of segments seen during the current chunk_file call
+        self._token_counts: Optional[Dict[str, int]] = None
 
     def count_tokens(self, text: str) -> int:
         """Count tokens in text."""
         return len(self.encoder.encode(text))
 
+    def _segment_tokens(self, text: str) -> int:
+        """Count tokens, tokenizing each distinct segment once per chunk_file call."""
+        if self._token_counts is None:
+            return self.count_tokens(text)
+        tokens = self._token_counts.get(text)
+        if tokens is None:
+            tokens = self._token_counts[text] = self.count_tokens(text)
+        return tokens
+
     def _find_code_fences(self, text: str) -> List[Tuple[int, int]]:
         """
         Find all code fence blocks in text.
@@ -78,9 +104,16 @@ class MarkdownChunker:
 
         return fences
 
+    def _containing_fence(self, pos: int, fences: List[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+        """Return the fence containing position (fences are sorted and disjoint), if any."""
+        i = bisect_right(fences, (pos, math.inf)) - 1
+        if i >= 0 and pos < fences[i][1]:
+            return fences[i]
+        return None
+
     def _is_inside_code_fence(self, pos: int, fences: List[Tuple[int, int]]) -> bool:
         """Check if position is inside a code fence."""
-        return any(start <= pos < end for start, end in fences)
+        return self._containing_fence(pos, fences) is not None
 
     def _split_on_headers(self, text: str, fences: List[Tuple[int, int]]) -> List[str]:
         """
@@ -158,7 +191,7 @@ class MarkdownChunker:
         current_tokens = 0
 
         for chunk in chunks:
-            chunk_tokens = self.count_tokens(chunk)
+            chunk_tokens = self._segment_tokens(chunk)
 
             # If adding this would exceed max_tokens, flush current
             if current and current_tokens + chunk_tokens > self.max_tokens:
@@ -202,7 +235,7 @@ class MarkdownChunker:
         # Check if any paragraph is still too large
         result = []
         for para in paragraphs:
-            tokens = self.count_tokens(para)
+            tokens = self._segment_tokens(para)
 
             if tokens <= self.max_tokens:
                 result.append(para)
@@ -228,27 +261,30 @@ class MarkdownChunker:
         """
         chunks = []
         current_start = 0
+        over_limit = self._over_limit_chars
+        visited = set()
 
         while current_start < len(text):
+            visited.add(current_start)
+
             # Try to take max_tokens worth of text
             chunk_text = text[current_start:]
-            tokens = self.count_tokens(chunk_text)
 
-            if tokens <= self.max_tokens:
+            # Text past over_limit characters never fits: skip encoding it
+            if len(chunk_text) <= over_limit and self._segment_tokens(chunk_text) <= self.max_tokens:
                 # Remaining text fits
                 chunks.append(chunk_text)
                 break
             else:
-                # Binary search for split point
+                # Binary search for split point (same probes as a full search;
+                # probes past over_limit are known not to fit)
                 left, right = 0, len(chunk_text)
                 split_point = right
 
                 while left < right:
                     mid = (left + right) // 2
-                    test_chunk = chunk_text[:mid]
-                    test_tokens = self.count_tokens(test_chunk)
 
-                    if test_tokens <= self.max_tokens:
+                    if mid <= over_limit and self.count_tokens(chunk_text[:mid]) <= self.max_tokens:
                         split_point = mid
                         left = mid + 1
                     else:
@@ -256,13 +292,12 @@ class MarkdownChunker:
 
                 # Ensure we're not splitting inside code fence
                 absolute_pos = current_start + split_point
-                if self._is_inside_code_fence(absolute_pos, fences):
-                    # Find fence boundary
-                    for start, end in fences:
-                        if start <= absolute_pos < end:
-                            # Split before fence starts
-                            split_point = start - current_start
-                            break
+                fence = self._containing_fence(absolute_pos, fences)
+                # Fences are document offsets, so the fence start can lie behind
+                # us; resuming from an offset already split from would loop forever
+                if fence is not None and fence[0] not in visited:
+                    # Split before fence starts
+                    split_point = fence[0] - current_start
 
                 # Extract chunk
                 chunk = chunk_text[:split_point].strip()
@@ -290,6 +325,14 @@ class MarkdownChunker:
         Returns:
             List of Chunk objects with metadata
         """
+        self._token_counts = {}
+        try:
+            return self._chunk_content(content)
+        finally:
+            self._token_counts = None
+
+    def _chunk_content(self, content: str) -> List[Chunk]:
+        """Chunk content (see chunk_file) with segment token counts memoized."""
         # Find code fences
         fences = self._find_code_fences(content)
 
@@ -302,7 +345,7 @@ class MarkdownChunker:
         # Handle oversized chunks
         final_chunks = []
         for section in merged:
-            tokens = self.count_tokens(section)
+            tokens = self._segment_tokens(section)
 
             if tokens <= self.max_tokens:
                 final_chunks.append(section)
@@ -326,7 +369,7 @@ class MarkdownChunker:
 
             result.append(Chunk(
                 content=chunk_text,
-                token_count=self.count_tokens(chunk_text),
+                token_count=self._segment_tokens(chunk_text),
                 char_offset=pos,
                 chunk_index=idx,
                 chunk_type=chunk_type
@@ -356,7 +399,7 @@ class MarkdownChunker:
             return 'code'
 
         # Check if exceeds target significantly (overflow from forced split)
-        if self.count_tokens(text) > self.target_tokens * 1.5:
+        if self._segment_tokens(text) > self.target_tokens * 1.5:
             return 'overflow'
 
         return 'paragraph'
@@ -0,0 +1,223 @@
+"""
+Bounded Stage Pipeline
+
+Small in-process pipeline engine used by process_corpus.py --pipeline.
+Stages run on their own worker threads and are connected by bounded
+queues, so a slow stage (LLM calls) applies backpressure to the stages
+feeding it instead of buffering the whole corpus in memory.
+
+Key features:
+- Per-stage worker count (e.g. LLM concurrency limit, single graph writer)
+- Micro-batching stages (collect up to batch_size items, wait batch_wait)
+- Items can enter at any stage (resume from a stage checkpoint)
+- Per-stage throughput, busy time and queue depth (current / max)
+
+Author: Atlas (Infrastructure Engineer)
+Date: 2026-10-18
+Spec: docs/SPEC DOC INPUT.md
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_CLOSE = object()  # Queue sentinel: upstream stage finished
+
+
+@dataclass
+class PipelineStage:
+    """
+    One pipeline stage.
+
+    fn receives one item (batch_size == 1) or a list of items and returns
+    the item(s) to forward to the next stage. Returning None drops the
+    item (e.g. already handled); for batch stages return a list.
+    """
+    name: str
+    fn: Callable[[Any], Any]
+    workers: int = 1
+    batch_size: int = 1
+    batch_wait: float = 0.05    # Seconds to wait for a batch to fill
+    queue_size: int = 8         # Bound on this stage's input queue
+
+
+@dataclass
+class StageStats:
+    """Runtime counters for one stage."""
+    items_in: int = 0
+    items_out: int = 0
+    errors: int = 0
+    batches: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+    first_item_at: Optional[float] = None
+    last_item_at: Optional[float] = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def snapshot(self, queue_depth: int) -> Dict[str, Any]:
+        elapsed = (self.last_item_at or 0.0) - (self.first_item_at or 0.0)
+        return {
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "errors": self.errors,
+            "batches": self.batches,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "items_per_sec": round((self.items_in - self.errors) / elapsed, 2) if elapsed > 0 else 0.0,
+            "queue_depth": queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+class StagePipeline:
+    """
+    Runs items through PipelineStages connected by bounded queues.
+
+    Errors raised by a stage are passed to on_error(stage_name, item, exc)
+    and the item is dropped; the pipeline keeps running. on_progress is
+    called with stats() every progress_interval seconds while running.
+    """
+
+    def __init__(
+        self,
+        stages: List[PipelineStage],
+        on_error: Optional[Callable[[str, Any, Exception], None]] = None,
+        on_progress: Optional[Callable[[Dict[str, Dict[str, Any]]], None]] = None,
+        progress_interval: float = 10.0
+    ):
+        if not stages:
+            raise ValueError("StagePipeline requires at least one stage")
+        self.stages = stages
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+
+        self._index = {stage.name: i for i, stage in enumerate(stages)}
+        self._queues = [queue.Queue(maxsize=max(1, s.queue_size)) for s in stages]
+        self._stats = [StageStats() for _ in stages]
+        self._live_workers = [max(1, s.workers) for s in stages]
+        self._live_lock = threading.Lock()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage throughput and queue depth, in stage order."""
+        return {
+            stage.name: self._stats[i].snapshot(self._queues[i].qsize())
+            for i, stage in enumerate(self.stages)
+        }
+
+    def _put(self, index: int, item: Any):
+        q = self._queues[index]
+        q.put(item)
+        stats = self._stats[index]
+        with stats.lock:
+            stats.max_queue_depth = max(stats.max_queue_depth, q.qsize())
+
+    def _next_batch(self, index: int) -> Tuple[List[Any], bool]:
+        """Block for one item, then gather up to batch_size within batch_wait. Returns (batch, closed)."""
+        stage = self.stages[index]
+        q = self._queues[index]
+        first = q.get()
+        if first is _CLOSE:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + stage.batch_wait
+        while len(batch) < stage.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = q.get(timeout=remaining) if remaining > 0 else q.get_nowait()
+            except queue.Empty:
+                break
+            if item is _CLOSE:
+                q.put(_CLOSE)  # Leave the sentinel for this worker's next loop
+                break
+            batch.append(item)
+        return batch, False
+
+    def _worker(self, index: int):
+        stage = self.stages[index]
+        stats = self._stats[index]
+        forward = index + 1 < len(self.stages)
+
+        while True:
+            batch, closed = self._next_batch(index)
+            if closed:
+                break
+
+            started = time.perf_counter()
+            with stats.lock:
+                stats.items_in += len(batch)
+                stats.batches += 1
+                if stats.first_item_at is None:
+                    stats.first_item_at = started
+
+            try:
+                if stage.batch_size > 1:
+                    outputs = stage.fn(batch) or []
+                else:
+                    output = stage.fn(batch[0])
+                    outputs = [] if output is None else [output]
+            except Exception as e:
+                outputs = []
+                with stats.lock:
+                    stats.errors += len(batch)
+                if self.on_error:
+                    for item in batch:
+                        self.on_error(stage.name, item, e)
+
+            finished = time.perf_counter()
+            with stats.lock:
+                stats.items_out += len(outputs)
+                stats.busy_seconds += finished - started
+                stats.last_item_at = finished
+
+            if forward:
+                for output in outputs:
+                    self._put(index + 1, output)
+
+        # Last worker out closes the next stage
+        with self._live_lock:
+            self._live_workers[index] -= 1
+            last = self._live_workers[index] == 0
+        if last and forward:
+            for _ in range(max(1, self.stages[index + 1].workers)):
+                self._queues[index + 1].put(_CLOSE)
+
+    def run(self, items: List[Tuple[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run items to completion.
+
+        Args:
+            items: (stage_name, item) pairs - the stage each item enters at
+
+        Returns:
+            Final stats() snapshot
+        """
+        threads = []
+        for index, stage in enumerate(self.stages):
+            for n in range(max(1, stage.workers)):
+                t = threading.Thread(target=self._worker, args=(index,), name=f"pipeline-{stage.name}-{n}", daemon=True)
+                t.start()
+                threads.append(t)
+
+        done = threading.Event()
+        monitor = None
+        if self.on_progress:
+            def _monitor():
+                while not done.wait(self.progress_interval):
+                    self.on_progress(self.stats())
+            monitor = threading.Thread(target=_monitor, name="pipeline-monitor", daemon=True)
+            monitor.start()
+
+        for stage_name, item in items:
+            self._put(self._index[stage_name], item)
+        for _ in range(max(1, self.stages[0].workers)):
+            self._queues[0].put(_CLOSE)
+
+        for t in threads:
+            t.join()
+        done.set()
+        if monitor:
+            monitor.join()
+
+        return self.stats()
@@ -10,6 +10,12 @@ Main orchestrator for documentation ingestion pipeline. Coordinates all componen
 
 Supports checkpoint/resume for fault-tolerant processing.
 
+Two execution modes:
+- Sequential (default): one file at a time through every step
+- Pipelined (--pipeline): bounded stage queues (pipeline.py) - chunking on
+  a process pool, embeddings in micro-batches, LLM calls under a
+  concurrency limit, graph writes batched across files
+
 Author: Atlas (Infrastructure Engineer)
 Date: 2025-10-29
 Spec: docs/SPEC DOC INPUT.md
@@ -19,8 +25,11 @@ import argparse
 import json
 import os
 import sys
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 # Add project root to Python path for orchestration imports
@@ -33,6 +42,7 @@ from graph import GraphWrapper
 from md_chunker import MarkdownChunker
 from ingest_docs import IngestionStateManager, ProcessingStatus
 from lint_graph import GraphLinter
+from pipeline import PipelineStage, StagePipeline
 
 logger = setup_logger(__name__)
 
@@ -45,6 +55,29 @@ except ImportError as e:
     logger.warning(f"map_and_link.py import failed: {e}")
 
 
+_worker_chunkers: Dict[Tuple[int, int], MarkdownChunker] = {}
+
+
+def _chunk_content(content: str, target_tokens: int, max_tokens: int) -> list:
+    """Chunk markdown in a pool process (one MarkdownChunker per process)."""
+    key = (target_tokens, max_tokens)
+    if key not in _worker_chunkers:
+        _worker_chunkers[key] = MarkdownChunker(target_tokens=target_tokens, max_tokens=max_tokens)
+    return _worker_chunkers[key].chunk_file(content)
+
+
+@dataclass
+class FileWork:
+    """A file moving through the pipelined stages."""
+    file_path: str
+    content_hash: str
+    entry_stage: str = 'chunk'                      # Stage the file (re-)enters at
+    chunks: Optional[List[Dict[str, Any]]] = None  # map_and_link chunk inputs
+    chunk_count: int = 0
+    result: Optional[Dict[str, Any]] = None         # process_chunks() result
+    started: bool = False
+
+
 class CorpusProcessor:
     """
     Main orchestrator for corpus processing.
@@ -78,8 +111,10 @@ class CorpusProcessor:
             'total_chunks': 0,
             'total_nodes': 0,
             'total_links': 0,
-            'total_qa_tasks': 0
+            'total_qa_tasks': 0,
+            'graph_write_seconds': 0.0
         }
+        self._stats_lock = threading.Lock()
 
     def _log_event(self, event_type: str, payload: Dict[str, Any]):
         """Emit JSONL event log."""
@@ -358,324 +393,589 @@ class CorpusProcessor:
         self._log_event("manifest_sync_complete", stats)
         return stats
 
-    def process_file(self, file_path: str) -> bool:
+    def _chunk_file(self, file_path: str, pool: Optional[Executor] = None) -> List[Dict[str, Any]]:
         """
-        Process a single file through the pipeline.
+        Read and chunk a file into map_and_link chunk inputs.
 
         Args:
             file_path: Path to markdown file
+            pool: Optional process pool to run the chunker on (pipeline mode)
 
         Returns:
-            True if successful, False if failed
+            Chunk dicts {chunk_id, text, index, token_count, document_path, last_updated}
         """
-        self._log_event("file_processing_start", {"file": file_path})
+        # Resolve file path relative to project root
+        resolved_path = Path(file_path)
+        if not resolved_path.is_absolute():
+            resolved_path = PROJECT_ROOT / resolved_path
+
+        # Read file content
+        with open(str(resolved_path), 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        # Chunk file
+        self._log_event("chunking_start", {"file": file_path})
+        if pool is not None:
+            chunks = pool.submit(
+                _chunk_content, content, self.config.chunk.target_tokens, self.config.chunk.max_tokens
+            ).result()
+        else:
+            chunks = self.chunker.chunk_file(content)
+        chunk_stats = self.chunker.chunk_stats(chunks)
 
-        try:
-            # Mark as processing
-            self.state_manager.mark_processing(file_path)
+        self._log_event("chunking_complete", {
+            "file": file_path,
+            "chunk_count": len(chunks),
+            "avg_tokens": chunk_stats['avg_tokens']
+        })
+
+        # Prepare inputs for map_and_link
+        # Generate chunk IDs from file path + index
+        filename = resolved_path.name
+        # Get file modification time
+        last_updated = datetime.fromtimestamp(os.path.getmtime(str(resolved_path))).isoformat()
+
+        return [
+            {
+                "chunk_id": f"{filename}_{c.chunk_index}",
+                "text": c.content,
+                "index": c.chunk_index,
+                "token_count": c.token_count,
+                "document_path": file_path,
+                "last_updated": last_updated
+            }
+            for c in chunks
+        ]
 
-            # Resolve file path relative to project root
-            resolved_path = Path(file_path)
-            if not resolved_path.is_absolute():
-                resolved_path = PROJECT_ROOT / resolved_path
+    def _map_and_link(self, file_path: str, chunk_inputs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run Felix's semantic processing (LLM map-and-link) over a file's chunks.
 
-            # Read file content
-            with open(str(resolved_path), 'r', encoding='utf-8') as f:
-                content = f.read()
+        Args:
+            file_path: Source file path
+            chunk_inputs: Chunk dicts from _chunk_file (optionally with 'embedding')
 
-            # Chunk file
-            self._log_event("chunking_start", {"file": file_path})
-            chunks = self.chunker.chunk_file(content)
-            chunk_stats = self.chunker.chunk_stats(chunks)
+        Returns:
+            process_chunks() result
+        """
+        if not MAP_AND_LINK_AVAILABLE:
+            raise RuntimeError("map_and_link.py not available")
 
-            self._log_event("chunking_complete", {
-                "file": file_path,
-                "chunk_count": len(chunks),
-                "avg_tokens": chunk_stats['avg_tokens']
-            })
+        self._log_event("semantic_processing_start", {
+            "file": file_path,
+            "chunk_count": len(chunk_inputs)
+        })
 
-            # Process chunks via Felix's map_and_link
-            if not MAP_AND_LINK_AVAILABLE:
-                raise RuntimeError("map_and_link.py not available")
+        inputs = {
+            "chunks": chunk_inputs,
+            "graph": self.graph,
+            "seed_ids": []  # Could extract seed IDs from file metadata
+        }
 
-            self._log_event("semantic_processing_start", {
-                "file": file_path,
-                "chunk_count": len(chunks)
-            })
+        # Prepare config thresholds
+        thresholds = {
+            "MIN_CONF_PROPOSE_LINK": self.config.confidence.propose_link,
+            "MIN_CONF_AUTOCONFIRM": self.config.confidence.autoconfirm,
+            "MIN_CONF_CREATE_TASK": self.config.confidence.create_task
+        }
 
-            # Prepare inputs for map_and_link
-            # Generate chunk IDs from file path + index
-            filename = resolved_path.name
-            # Get file modification time
-            last_updated = datetime.fromtimestamp(os.path.getmtime(str(resolved_path))).isoformat()
-
-            inputs = {
-                "chunks": [
-                    {
-                        "chunk_id": f"{filename}_{c.chunk_index}",
-                        "text": c.content,
-                        "index": c.chunk_index,
-                        "token_count": c.token_count,
-                        "document_path": file_path,
-                        "last_updated": last_updated
-                    }
-                    for c in chunks
-                ],
-                "graph": self.graph,
-                "seed_ids": []  # Could extract seed IDs from file metadata
-            }
+        # Call Felix's semantic processing
+        result = process_chunks(inputs, thresholds)
 
-            # Prepare config thresholds
-            thresholds = {
-                "MIN_CONF_PROPOSE_LINK": self.config.confidence.propose_link,
-                "MIN_CONF_AUTOCONFIRM": self.config.confidence.autoconfirm,
-                "MIN_CONF_CREATE_TASK": self.config.confidence.create_task
-            }
+        self._log_event("semantic_processing_complete", {
+            "file": file_path,
+            "theme": result.get('theme'),
+            "node_count": len(result.get('node_proposals', [])),
+            "link_count": len(result.get('edges', [])),
+            "task_count": len(result.get('tasks', []))
+        })
 
-            # Call Felix's semantic processing
-            result = process_chunks(inputs, thresholds)
+        return result
 
-            self._log_event("semantic_processing_complete", {
-                "file": file_path,
-                "theme": result.get('theme'),
-                "node_count": len(result.get('node_proposals', [])),
-                "link_count": len(result.get('edges', [])),
-                "task_count": len(result.get('tasks', []))
-            })
+    def _queue_nodes(self, session, file_path: str, result: Dict[str, Any]) -> int:
+        """
+        Validate node proposals and queue them on a bulk write session.
 
-            # Write node proposals to graph
-            node_count = 0
-            for idx, node_proposal in enumerate(result.get('node_proposals', [])):
-                # node_proposals come back hydrated with {id, type, props} from map_and_link
-                node_id = node_proposal.get('id')
-                node_type = node_proposal.get('type')
-                properties = node_proposal.get('props', {})
-
-                # VALIDATION: Reject incomplete nodes (name=None or description=None)
-                node_name = properties.get('name')
-                node_desc = properties.get('description')
-
-                if not node_name or not node_desc:
-                    self._log_event("node_proposal_rejected_incomplete", {
-                        "node_id": node_id,
-                        "node_type": node_type,
-                        "reason": f"missing {'name' if not node_name else 'description'}",
-                        "file": file_path
-                    })
-                    print(f"\n⚠️  Rejected incomplete node: {node_id}", flush=True)
-                    print(f"    Type: {node_type}, Name: {node_name}, Description: {node_desc}", flush=True)
-                    print(f"    Reason: Nodes must have both name and description\n", flush=True)
-                    continue  # Skip this incomplete node
-
-                # VALIDATION: Reject nodes with None/invalid type
-                if not node_type or node_type == 'None':
-                    self._log_event("node_proposal_rejected_invalid_type", {
-                        "node_id": node_id,
-                        "node_type": node_type,
-                        "name": node_name,
-                        "reason": "invalid or None type",
-                        "file": file_path
-                    })
-                    print(f"\n⚠️  Rejected node with invalid type: {node_id}", flush=True)
-                    print(f"    Type: {node_type}, Name: {node_name}", flush=True)
-                    print(f"    Reason: Node type cannot be None or invalid\n", flush=True)
-                    continue  # Skip this invalid node
-
-                # Add source_file to properties
-                properties['source_file'] = file_path
-
-                node_result = self.graph.ensure_node(
-                    node_type=node_type,
-                    node_id=node_id,
-                    properties=properties
+        Returns:
+            Number of nodes queued
+        """
+        queued = 0
+        for node_proposal in result.get('node_proposals', []):
+            # node_proposals come back hydrated with {id, type, props} from map_and_link
+            node_id = node_proposal.get('id')
+            node_type = node_proposal.get('type')
+            properties = node_proposal.get('props', {})
+
+            # VALIDATION: Reject incomplete nodes (name=None or description=None)
+            node_name = properties.get('name')
+            node_desc = properties.get('description')
+
+            if not node_name or not node_desc:
+                self._log_event("node_proposal_rejected_incomplete", {
+                    "node_id": node_id,
+                    "node_type": node_type,
+                    "reason": f"missing {'name' if not node_name else 'description'}",
+                    "file": file_path
+                })
+                print(f"\n⚠️  Rejected incomplete node: {node_id}", flush=True)
+                print(f"    Type: {node_type}, Name: {node_name}, Description: {node_desc}", flush=True)
+                print(f"    Reason: Nodes must have both name and description\n", flush=True)
+                continue  # Skip this incomplete node
+
+            # VALIDATION: Reject nodes with None/invalid type
+            if not node_type or node_type == 'None':
+                self._log_event("node_proposal_rejected_invalid_type", {
+                    "node_id": node_id,
+                    "node_type": node_type,
+                    "name": node_name,
+                    "reason": "invalid or None type",
+                    "file": file_path
+                })
+                print(f"\n⚠️  Rejected node with invalid type: {node_id}", flush=True)
+                print(f"    Type: {node_type}, Name: {node_name}", flush=True)
+                print(f"    Reason: Node type cannot be None or invalid\n", flush=True)
+                continue  # Skip this invalid node
+
+            # Add source_file to properties
+            properties['source_file'] = file_path
+
+            session.add_node(
+                node_type=node_type,
+                node_id=node_id,
+                properties=properties
+            )
+            queued += 1
+        return queued
+
+    def _record_edges(
+        self,
+        file_path: str,
+        edges: List[Dict[str, Any]],
+        edge_results: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Log edge write results and run ARM for edges with missing endpoints.
+
+        Returns:
+            Number of confirmed edges
+        """
+        link_count = 0
+        for edge, edge_result in zip(edges, edge_results):
+            if edge_result['confirmed']:
+                link_count += 1
+                self._log_event("edge_created", {
+                    "edge_type": edge['type'],
+                    "source": edge['source'],
+                    "target": edge['target'],
+                    "confidence": edge.get('confidence'),
+                    "file": file_path
+                })
+            else:
+                error_msg = edge_result.get('error', '')
+                self._log_event("edge_creation_failed", {
+                    "edge_type": edge['type'],
+                    "source": edge['source'],
+                    "target": edge['target'],
+                    "error": error_msg,
+                    "file": file_path
+                })
+
+                # Auto-Resolve Missing Endpoint (ARM)
+                if "does not exist" in error_msg:
+                    missing_id = None
+                    other_id = None
+
+                    if "Source node" in error_msg:
+                        missing_id = edge['source']
+                        other_id = edge['target']
+                    elif "Target node" in error_msg:
+                        missing_id = edge['target']
+                        other_id = edge['source']
+
+                    if missing_id:
+                        try:
+                            from arm import auto_resolve_missing_endpoint
+
+                            arm_result = auto_resolve_missing_endpoint(
+                                graph=self.graph,
+                                missing_id=missing_id,
+                                other_id=other_id,
+                                edge_type=edge['type'],
+                                embedding_service=None  # Will create its own
+                            )
+
+                            # Log ARM candidates
+                            print(f"\n⚠️  Missing node: {missing_id}", flush=True)
+                            print(f"    Edge: {edge['source']} →[{edge['type']}]→ {edge['target']}", flush=True)
+                            print(f"    ARM found {len(arm_result['candidates'])} candidates:", flush=True)
+                            for i, cand in enumerate(arm_result['candidates'][:3], 1):
+                                print(f"      {i}. {cand['id']} (score={cand['score_combined']:.3f})", flush=True)
+
+                            # Create QA task with ARM candidates
+                            self.state_manager.create_qa_task(
+                                file_path=file_path,
+                                task_type='arm_resolve_missing_node',
+                                description=f"ARM: Missing node '{missing_id}' - {len(arm_result['candidates'])} candidates found"
+                            )
+
+                            self._log_event("arm_candidates_found", {
+                                "missing_id": missing_id,
+                                "edge_type": edge['type'],
+                                "candidates_count": len(arm_result['candidates']),
+                                "top_candidate": arm_result['candidates'][0]['id'] if arm_result['candidates'] else None,
+                                "file": file_path
+                            })
+
+                        except Exception as arm_error:
+                            print(f"⚠️  ARM failed for {missing_id}: {arm_error}", flush=True)
+        return link_count
+
+    def _write_results(self, results: List[Tuple[str, Dict[str, Any]]]) -> List[Tuple[int, int]]:
+        """
+        Write map_and_link results for one or more files in UNWIND batches.
+
+        All files share one bulk session: nodes, then edges, then a second
+        flush for completed edges so their metadata overwrites the first write.
+
+        Args:
+            results: (file_path, process_chunks result) pairs
+
+        Returns:
+            (node_count, link_count) per file, in order
+        """
+        session = self.graph.bulk_session(batch_size=self.config.processing.write_batch_size)
+
+        spans = []
+        for file_path, result in results:
+            node_span = self._queue_nodes(session, file_path, result)
+            edges = result.get('edges', [])
+            for edge in edges:
+                session.add_edge(
+                    edge_type=edge['type'],
+                    source_id=edge['source'],
+                    target_id=edge['target'],
+                    meta=edge.get('meta', {}),
+                    confidence=edge.get('confidence', 1.0),
+                    status=edge.get('status', 'CONFIRMED')
                 )
+            spans.append((node_span, len(edges)))
+
+        # Nodes are flushed before edges so same-file endpoints exist
+        written = session.flush()
 
+        counts = []
+        node_offset = edge_offset = 0
+        for (file_path, result), (node_span, edge_span) in zip(results, spans):
+            node_count = 0
+            for node_result in written['nodes'][node_offset:node_offset + node_span]:
                 if node_result['confirmed']:
                     node_count += 1
                     self._log_event("node_created", {
-                        "node_id": node_id,
-                        "node_type": node_type,
+                        "node_id": node_result['node_id'],
+                        "node_type": node_result['node_type'],
                         "file": file_path
                     })
                 else:
                     self._log_event("node_creation_failed", {
-                        "node_id": node_id,
+                        "node_id": node_result['node_id'],
                         "error": node_result.get('error'),
                         "file": file_path
                     })
 
-            # Write edges to graph
-            link_count = 0
-            for edge in result.get('edges', []):
-                edge_result = self.graph.ensure_edge(
+            link_count = self._record_edges(
+                file_path,
+                result.get('edges', []),
+                written['edges'][edge_offset:edge_offset + edge_span]
+            )
+            node_offset += node_span
+            edge_offset += edge_span
+            counts.append((node_count, link_count))
+
+        # Update completed edges (edges that got metadata completions in later chunks)
+        completed = [
+            (file_path, edge)
+            for file_path, result in results
+            for edge in result.get('completed_edges', [])
+        ]
+        if completed:
+            print(f"Updating {len(completed)} edges with completed metadata...", flush=True)
+            for _, edge in completed:
+                session.add_edge(
                     edge_type=edge['type'],
-                    source_id=edge['source'],
-                    target_id=edge['target'],
+                    source_id=edge.get('source', edge.get('source_id')),
+                    target_id=edge.get('target', edge.get('target_id')),
                     meta=edge.get('meta', {}),
                     confidence=edge.get('confidence', 1.0),
                     status=edge.get('status', 'CONFIRMED')
                 )
 
+            for (file_path, edge), edge_result in zip(completed, session.flush()['edges']):
                 if edge_result['confirmed']:
-                    link_count += 1
-                    self._log_event("edge_created", {
-                        "edge_type": edge['type'],
-                        "source": edge['source'],
-                        "target": edge['target'],
-                        "confidence": edge.get('confidence'),
-                        "file": file_path
-                    })
-                else:
-                    error_msg = edge_result.get('error', '')
-                    self._log_event("edge_creation_failed", {
+                    self._log_event("edge_metadata_completed", {
                         "edge_type": edge['type'],
-                        "source": edge['source'],
-                        "target": edge['target'],
-                        "error": error_msg,
+                        "source": edge.get('source', edge.get('source_id')),
+                        "target": edge.get('target', edge.get('target_id')),
                         "file": file_path
                     })
 
-                    # Auto-Resolve Missing Endpoint (ARM)
-                    if "does not exist" in error_msg:
-                        missing_id = None
-                        other_id = None
-
-                        if "Source node" in error_msg:
-                            missing_id = edge['source']
-                            other_id = edge['target']
-                        elif "Target node" in error_msg:
-                            missing_id = edge['target']
-                            other_id = edge['source']
-
-                        if missing_id:
-                            try:
-                                from arm import auto_resolve_missing_endpoint
-
-                                arm_result = auto_resolve_missing_endpoint(
-                                    graph=self.graph,
-                                    missing_id=missing_id,
-                                    other_id=other_id,
-                                    edge_type=edge['type'],
-                                    embedding_service=None  # Will create its own
-                                )
-
-                                # Log ARM candidates
-                                print(f"\n⚠️  Missing node: {missing_id}", flush=True)
-                                print(f"    Edge: {edge['source']} →[{edge['type']}]→ {edge['target']}", flush=True)
-                                print(f"    ARM found {len(arm_result['candidates'])} candidates:", flush=True)
-                                for i, cand in enumerate(arm_result['candidates'][:3], 1):
-                                    print(f"      {i}. {cand['id']} (score={cand['score_combined']:.3f})", flush=True)
-
-                                # Create QA task with ARM candidates
-                                self.state_manager.create_qa_task(
-                                    file_path=file_path,
-                                    task_type='arm_resolve_missing_node',
-                                    description=f"ARM: Missing node '{missing_id}' - {len(arm_result['candidates'])} candidates found"
-                                )
-
-                                self._log_event("arm_candidates_found", {
-                                    "missing_id": missing_id,
-                                    "edge_type": edge['type'],
-                                    "candidates_count": len(arm_result['candidates']),
-                                    "top_candidate": arm_result['candidates'][0]['id'] if arm_result['candidates'] else None,
-                                    "file": file_path
-                                })
-
-                            except Exception as arm_error:
-                                print(f"⚠️  ARM failed for {missing_id}: {arm_error}", flush=True)
-
-            # Update completed edges (edges that got metadata completions in later chunks)
-            completed_edges = result.get('completed_edges', [])
-            if completed_edges:
-                print(f"Updating {len(completed_edges)} edges with completed metadata...", flush=True)
-                for edge in completed_edges:
-                    edge_result = self.graph.ensure_edge(
-                        edge_type=edge['type'],
-                        source_id=edge.get('source', edge.get('source_id')),
-                        target_id=edge.get('target', edge.get('target_id')),
-                        meta=edge.get('meta', {}),
-                        confidence=edge.get('confidence', 1.0),
-                        status=edge.get('status', 'CONFIRMED')
-                    )
-
-                    if edge_result['confirmed']:
-                        self._log_event("edge_metadata_completed", {
-                            "edge_type": edge['type'],
-                            "source": edge.get('source', edge.get('source_id')),
-                            "target": edge.get('target', edge.get('target_id')),
-                            "file": file_path
-                        })
-
-            # Deduplication pass: Find and merge duplicate nodes from this file
-            print(f"Running deduplication pass for {file_path}...", flush=True)
-            dedup_count = self._deduplicate_nodes(file_path)
-            if dedup_count > 0:
-                print(f"✓ Deduplicated {dedup_count} duplicate node pairs", flush=True)
-
-            # Create QA tasks
-            qa_task_count = 0
-            for task in result.get('tasks', []):
-                self.state_manager.create_qa_task(
-                    file_path=file_path,
-                    task_type=task.get('type', 'manual_review'),
-                    description=task.get('description', '')
-                )
-                qa_task_count += 1
+        self._log_event("graph_write_complete", {
+            "files": [file_path for file_path, _ in results],
+            "nodes": sum(n for n, _ in counts),
+            "links": sum(l for _, l in counts),
+            "round_trips": session.stats['round_trips'],
+            "nodes_per_sec": round(session.stats['nodes_per_sec'], 1)
+        })
+        with self._stats_lock:
+            self.stats['graph_write_seconds'] += session.stats['write_seconds']
 
-                self._log_event("qa_task_created", {
-                    "task_type": task.get('type'),
-                    "description": task.get('description'),
-                    "file": file_path
-                })
+        return counts
 
-            # Mark as completed
-            self.state_manager.mark_completed(
+    def _finish_file(
+        self,
+        file_path: str,
+        result: Dict[str, Any],
+        chunk_count: int,
+        node_count: int,
+        link_count: int
+    ):
+        """Dedupe, create QA tasks and mark a written file completed."""
+        # Deduplication pass: Find and merge duplicate nodes from this file
+        print(f"Running deduplication pass for {file_path}...", flush=True)
+        dedup_count = self._deduplicate_nodes(file_path)
+        if dedup_count > 0:
+            print(f"✓ Deduplicated {dedup_count} duplicate node pairs", flush=True)
+
+        # Create QA tasks
+        qa_task_count = 0
+        for task in result.get('tasks', []):
+            self.state_manager.create_qa_task(
                 file_path=file_path,
-                chunk_count=len(chunks),
-                node_count=node_count,
-                link_count=link_count
+                task_type=task.get('type', 'manual_review'),
+                description=task.get('description', '')
             )
+            qa_task_count += 1
+
+            self._log_event("qa_task_created", {
+                "task_type": task.get('type'),
+                "description": task.get('description'),
+                "file": file_path
+            })
+
+        # Mark as completed
+        self.state_manager.mark_completed(
+            file_path=file_path,
+            chunk_count=chunk_count,
+            node_count=node_count,
+            link_count=link_count
+        )
 
-            # Update statistics
+        # Update statistics
+        with self._stats_lock:
             self.stats['files_processed'] += 1
-            self.stats['total_chunks'] += len(chunks)
+            self.stats['total_chunks'] += chunk_count
             self.stats['total_nodes'] += node_count
             self.stats['total_links'] += link_count
             self.stats['total_qa_tasks'] += qa_task_count
 
-            self._log_event("file_processing_complete", {
-                "file": file_path,
-                "chunks": len(chunks),
-                "nodes": node_count,
-                "links": link_count,
-                "qa_tasks": qa_task_count
-            })
+        self._log_event("file_processing_complete", {
+            "file": file_path,
+            "chunks": chunk_count,
+            "nodes": node_count,
+            "links": link_count,
+            "qa_tasks": qa_task_count
+        })
+
+    def _fail_file(self, file_path: str, error: Exception):
+        """Mark a file failed and log the error."""
+        import traceback
+        error_msg = f"{type(error).__name__}: {str(error)}"
+        traceback_str = ''.join(traceback.format_exception(type(error), error, error.__traceback__))
+        print(f"FULL TRACEBACK:\n{traceback_str}", flush=True)
+
+        self.state_manager.mark_failed(file_path, error_msg)
+
+        with self._stats_lock:
+            self.stats['files_failed'] += 1
+
+        self._log_event("file_processing_failed", {
+            "file": file_path,
+            "error": error_msg
+        })
+
+    def process_file(self, file_path: str) -> bool:
+        """
+        Process a single file through the pipeline.
+
+        Args:
+            file_path: Path to markdown file
+
+        Returns:
+            True if successful, False if failed
+        """
+        self._log_event("file_processing_start", {"file": file_path})
+
+        try:
+            # Mark as processing
+            self.state_manager.mark_processing(file_path)
+
+            chunk_inputs = self._chunk_file(file_path)
+            result = self._map_and_link(file_path, chunk_inputs)
+            (node_count, link_count), = self._write_results([(file_path, result)])
+            self._finish_file(file_path, result, len(chunk_inputs), node_count, link_count)
 
             return True
 
         except Exception as e:
-            # Mark as failed
-            import traceback
-            error_msg = f"{type(e).__name__}: {str(e)}"
-            traceback_str = traceback.format_exc()
-            print(f"FULL TRACEBACK:\n{traceback_str}", flush=True)
+            self._fail_file(file_path, e)
+            return False
 
-            self.state_manager.mark_failed(file_path, error_msg)
+    def _run_pipeline(self, pending_files: list) -> Dict[str, Dict[str, Any]]:
+        """
+        Process files through bounded, concurrent stages.
 
-            self.stats['files_failed'] += 1
+        chunk (process pool) → embed (micro-batches) → llm (concurrency limit)
+        → write (batched graph writes, single writer). Each stage checkpoints its
+        output in the state DB, so resumed files re-enter after the last
+        finished stage instead of repeating chunking, embedding or LLM calls.
 
-            self._log_event("file_processing_failed", {
-                "file": file_path,
-                "error": error_msg
-            })
+        Args:
+            pending_files: FileRecords to process
 
-            return False
+        Returns:
+            Per-stage stats (throughput, busy time, queue depth)
+        """
+        from orchestration.adapters.search.embedding_service import get_embedding_service
+
+        cfg = self.config.processing
+        chunk_pool = ProcessPoolExecutor(max_workers=cfg.chunk_workers or os.cpu_count())
+        qa_state = {'recent': [], 'finished': 0}
+
+        def _start(work: FileWork):
+            if not work.started:
+                work.started = True
+                self._log_event("file_processing_start", {"file": work.file_path, "stage": work.entry_stage})
+                self.state_manager.mark_processing(work.file_path)
+
+        def chunk_stage(work: FileWork) -> FileWork:
+            _start(work)
+            work.chunks = self._chunk_file(work.file_path, pool=chunk_pool)
+            work.chunk_count = len(work.chunks)
+            self.state_manager.save_stage_checkpoint(work.file_path, 'chunk', work.content_hash, work.chunks)
+            return work
+
+        def embed_stage(batch: List[FileWork]) -> List[FileWork]:
+            for work in batch:
+                _start(work)
+            texts = [chunk['text'] for work in batch for chunk in work.chunks]
+            embeddings = iter(get_embedding_service().embed_batch(texts))
+            for work in batch:
+                for chunk in work.chunks:
+                    chunk['embedding'] = next(embeddings)
+                self.state_manager.save_stage_checkpoint(work.file_path, 'embed', work.content_hash, work.chunks)
+            return batch
+
+        def llm_stage(work: FileWork) -> FileWork:
+            _start(work)
+            work.result = self._map_and_link(work.file_path, work.chunks)
+            self.state_manager.save_stage_checkpoint(
+                work.file_path, 'llm', work.content_hash,
+                {'chunk_count': work.chunk_count, 'result': work.result}
+            )
+            return work
+
+        def write_stage(batch: List[FileWork]) -> List[FileWork]:
+            for work in batch:
+                _start(work)
+            counts = self._write_results([(work.file_path, work.result) for work in batch])
+            for work, (node_count, link_count) in zip(batch, counts):
+                try:
+                    self._finish_file(work.file_path, work.result, work.chunk_count, node_count, link_count)
+                except Exception as e:
+                    self._fail_file(work.file_path, e)
+                    continue
+
+                qa_state['recent'].append(work.file_path)
+                qa_state['finished'] += 1
+                if qa_state['finished'] % cfg.qa_check_interval == 0:
+                    qa_results = self._run_qa_check(qa_state['recent'])
+                    if qa_results['quality_score'] < 60:
+                        print(f"\n⚠️  WARNING: Quality score below 60 ({qa_results['quality_score']:.1f}/100)")
+                        print(f"   Consider reviewing extraction parameters or LLM prompts\n")
+                    qa_state['recent'] = []
+                if qa_state['finished'] % cfg.checkpoint_interval == 0:
+                    self._log_event("checkpoint", {
+                        "processed": qa_state['finished'],
+                        "total": len(pending_files),
+                        "stats": self.stats,
+                        "stages": pipeline.stats()
+                    })
+            return []
+
+        def on_error(stage: str, work: FileWork, error: Exception):
+            self._log_event("pipeline_stage_failed", {"file": work.file_path, "stage": stage})
+            self._fail_file(work.file_path, error)
+
+        pipeline = StagePipeline(
+            [
+                PipelineStage('chunk', chunk_stage, workers=cfg.chunk_workers or os.cpu_count(),
+                              queue_size=cfg.stage_queue_size),
+                PipelineStage('embed', embed_stage, batch_size=cfg.embed_batch_files,
+                              queue_size=cfg.stage_queue_size),
+                PipelineStage('llm', llm_stage, workers=cfg.llm_concurrency,
+                              queue_size=cfg.stage_queue_size),
+                PipelineStage('write', write_stage, batch_size=cfg.write_batch_files, batch_wait=0.5,
+                              queue_size=cfg.stage_queue_size),
+            ],
+            on_error=on_error,
+            on_progress=lambda stages: self._log_event("pipeline_progress", {"stages": stages})
+        )
+
+        # Resume: re-enter each file after its last checkpointed stage
+        items = []
+        for record in pending_files:
+            work = FileWork(file_path=record.file_path, content_hash=record.content_hash)
+            checkpoints = self.state_manager.get_stage_checkpoints(record.file_path, record.content_hash)
+            if 'llm' in checkpoints:
+                work.chunk_count = checkpoints['llm']['chunk_count']
+                work.result = checkpoints['llm']['result']
+                work.entry_stage = 'write'
+            elif 'embed' in checkpoints:
+                work.chunks = checkpoints['embed']
+                work.chunk_count = len(work.chunks)
+                work.entry_stage = 'llm'
+            elif 'chunk' in checkpoints:
+                work.chunks = checkpoints['chunk']
+                work.chunk_count = len(work.chunks)
+                work.entry_stage = 'embed'
+            items.append((work.entry_stage, work))
+
+        self._log_event("pipeline_start", {
+            "files": len(items),
+            "resumed": sum(1 for stage, _ in items if stage != 'chunk'),
+            "llm_concurrency": cfg.llm_concurrency,
+            "embed_batch_files": cfg.embed_batch_files,
+            "write_batch_files": cfg.write_batch_files
+        })
+
+        try:
+            stage_stats = pipeline.run(items)
+        finally:
+            chunk_pool.shutdown()
+
+        # Run final QA check if there are remaining files
+        if qa_state['recent']:
+            print(f"\n📊 Running final QA check on remaining {len(qa_state['recent'])} files...")
+            self._run_qa_check(qa_state['recent'])
+
+        self._log_event("pipeline_complete", {"stages": stage_stats})
+        return stage_stats
 
     def process_corpus(
         self,
         manifest_path: str,
         max_files: Optional[int] = None,
-        resume: bool = True
+        resume: bool = True,
+        pipeline: bool = False
     ) -> Dict[str, Any]:
         """
         Process entire corpus from manifest.
@@ -684,6 +984,7 @@ class CorpusProcessor:
             manifest_path: Path to manifest.json
             max_files: Maximum files to process (None for all)
             resume: Resume from last checkpoint
+            pipeline: Use pipelined concurrent stages instead of one file at a time
 
         Returns:
             Processing statistics
@@ -691,7 +992,8 @@ class CorpusProcessor:
         self._log_event("corpus_processing_start", {
             "manifest": manifest_path,
             "max_files": max_files,
-            "resume": resume
+            "resume": resume,
+            "pipeline": pipeline
         })
 
         # Sync manifest
@@ -717,46 +1019,52 @@ class CorpusProcessor:
             })
             return self.stats
 
-        # Process files with checkpointing and QA checks
-        checkpoint_interval = self.config.processing.checkpoint_interval
-        qa_interval = self.config.processing.qa_check_interval
-        recent_files_for_qa = []
-
-        for idx, file_record in enumerate(pending_files):
-            # Process file
-            success = self.process_file(file_record.file_path)
-
-            # Track recent files for QA
-            if success:
-                recent_files_for_qa.append(file_record.file_path)
+        if pipeline:
+            self.stats['pipeline_stages'] = self._run_pipeline(pending_files)
+        else:
+            # Process files with checkpointing and QA checks
+            checkpoint_interval = self.config.processing.checkpoint_interval
+            qa_interval = self.config.processing.qa_check_interval
+            recent_files_for_qa = []
+
+            for idx, file_record in enumerate(pending_files):
+                # Process file
+                success = self.process_file(file_record.file_path)
+
+                # Track recent files for QA
+                if success:
+                    recent_files_for_qa.append(file_record.file_path)
+
+                # Run QA check every N files
+                if (idx + 1) % qa_interval == 0 and recent_files_for_qa:
+                    qa_results = self._run_qa_check(recent_files_for_qa)
+
+                    # Alert if quality is poor
+                    if qa_results['quality_score'] < 60:
+                        print(f"\n⚠️  WARNING: Quality score below 60 ({qa_results['quality_score']:.1f}/100)")
+                        print(f"   Consider reviewing extraction parameters or LLM prompts\n")
+
+                    # Clear recent files list
+                    recent_files_for_qa = []
+
+                # Checkpoint every N files
+                if (idx + 1) % checkpoint_interval == 0:
+                    self._log_event("checkpoint", {
+                        "processed": idx + 1,
+                        "total": len(pending_files),
+                        "stats": self.stats
+                    })
 
-            # Run QA check every N files
-            if (idx + 1) % qa_interval == 0 and recent_files_for_qa:
+            # Run final QA check if there are remaining files
+            if recent_files_for_qa:
+                print(f"\n📊 Running final QA check on remaining {len(recent_files_for_qa)} files...")
                 qa_results = self._run_qa_check(recent_files_for_qa)
 
-                # Alert if quality is poor
-                if qa_results['quality_score'] < 60:
-                    print(f"\n⚠️  WARNING: Quality score below 60 ({qa_results['quality_score']:.1f}/100)")
-                    print(f"   Consider reviewing extraction parameters or LLM prompts\n")
-
-                # Clear recent files list
-                recent_files_for_qa = []
-
-            # Checkpoint every N files
-            if (idx + 1) % checkpoint_interval == 0:
-                self._log_event("checkpoint", {
-                    "processed": idx + 1,
-                    "total": len(pending_files),
-                    "stats": self.stats
-                })
-
-        # Run final QA check if there are remaining files
-        if recent_files_for_qa:
-            print(f"\n📊 Running final QA check on remaining {len(recent_files_for_qa)} files...")
-            qa_results = self._run_qa_check(recent_files_for_qa)
-
         # Final statistics
         final_stats = self.state_manager.get_processing_stats()
+        self.stats['graph_nodes_per_sec'] = round(
+            self.stats['total_nodes'] / self.stats['graph_write_seconds'], 1
+        ) if self.stats['graph_write_seconds'] > 0 else 0.0
 
         self._log_event("corpus_processing_complete", {
             "manifest": manifest_path,
@@ -839,6 +1147,8 @@ def main():
     parser.add_argument('--max-files', type=int, help='Maximum files to process')
     parser.add_argument('--no-resume', action='store_true', help='Do not resume from checkpoint')
     parser.add_argument('--lint', action='store_true', help='Run linter after processing')
+    parser.add_argument('--pipeline', action='store_true', help='Process files through concurrent bounded stages')
+    parser.add_argument('--llm-concurrency', type=int, help='Concurrent LLM calls in --pipeline mode')
 
     args = parser.parse_args()
 
@@ -847,6 +1157,8 @@ def main():
 
     # Override manifest path
     config.processing.manifest_path = args.manifest
+    if args.llm_concurrency:
+        config.processing.llm_concurrency = args.llm_concurrency
 
     # Validate config
     errors = config.validate()
@@ -863,7 +1175,8 @@ def main():
     stats = processor.process_corpus(
         manifest_path=args.manifest,
         max_files=args.max_files,
-        resume=not args.no_resume
+        resume=not args.no_resume,
+        pipeline=args.pipeline
     )
 
     # Run linter if requested
@@ -889,10 +1202,21 @@ def main():
             ["Total chunks", stats.get('total_chunks', 0)],
             ["Total nodes", stats.get('total_nodes', 0)],
             ["Total links", stats.get('total_links', 0)],
+            ["Graph writes (nodes/sec)", stats.get('graph_nodes_per_sec', 0.0)],
             ["QA tasks", stats.get('total_qa_tasks', 0)]
         ]
     )
 
+    if stats.get('pipeline_stages'):
+        log_section(logger, "⏱️  Pipeline Stages")
+        log_table(logger,
+            ["Stage", "Items", "Errors", "Items/sec", "Busy (s)", "Max queue"],
+            [
+                [name, s['items_in'], s['errors'], s['items_per_sec'], s['busy_seconds'], s['max_queue_depth']]
+                for name, s in stats['pipeline_stages'].items()
+            ]
+        )
+
     # Exit code: 0 if no failures, 1 if failures
     sys.exit(1 if stats.get('files_failed', 0) > 0 else 0)
 
@@ -0,0 +1,334 @@
+"""
+Lint Driver - Shared-Parse, Parallel, Cached Scanner Runs
+
+Runs every Python scanner (events, hardcoded, quality, fallback, fail-loud)
+over a set of files with:
+- One read + one ast.parse per file, and a single pre-order traversal that
+  dispatches each node to every scanner visitor
+- A process pool for cache misses (inline for small batches)
+- A per-file result cache keyed by content hash + RULESET_VERSION, so a
+  re-run over an unchanged tree only hashes files
+
+Results per file are identical to calling the scanner_* scan_file functions
+one by one (same violations, same order per scanner).
+
+Usage:
+    driver = LintDriver(cache_path=Path(".mp_lint_cache.json"))
+    result = driver.lint_paths(["orchestration/adapters/watchers/file_watcher.py"])
+    result = driver.lint_tree(Path("orchestration"))
+
+Author: Atlas (Infrastructure Engineer)
+Date: 2026-10-18
+"""
+
+import ast
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from . import scanner_fail_loud, scanner_fallback, scanner_hardcoded, scanner_py, scanner_quality
+from .scanner_fail_loud import FailLoudScanner, FailLoudViolation
+from .scanner_fallback import FallbackScanner, FallbackViolation
+from .scanner_hardcoded import HardcodedScanner, HardcodedViolation
+from .scanner_py import EventEmission, PythonScanner
+from .scanner_quality import QualityScanner, QualityViolation
+
+
+# Bump when driver behaviour changes; scanner source changes are picked up automatically
+DRIVER_VERSION = "1"
+
+# Below this many cache misses, scanning inline beats process pool startup
+POOL_MIN_FILES = 16
+
+DEFAULT_EXCLUDE_PATTERNS = [
+    "**/venv/**",
+    "**/.venv/**",
+    "**/node_modules/**",
+    "**/__pycache__/**",
+    "**/.git/**",
+]
+
+
+def _ruleset_version() -> str:
+    """Hash of driver version + scanner sources: any rule edit invalidates the cache."""
+    hasher = hashlib.sha256(DRIVER_VERSION.encode())
+    for module in (scanner_py, scanner_hardcoded, scanner_quality, scanner_fallback, scanner_fail_loud):
+        hasher.update(Path(module.__file__).read_bytes())
+    return hasher.hexdigest()[:16]
+
+
+RULESET_VERSION = _ruleset_version()
+
+
+@dataclass
+class ScannerSpec:
+    """
+    How the driver runs one scanner.
+
+    skip(file_path, source) mirrors the scanner's allowed-path check;
+    strict scanners only run when the file decodes as UTF-8 (their
+    scan_file functions read with errors="strict").
+    """
+    name: str
+    visitor: Callable[[Path, str], ast.NodeVisitor]
+    result_type: type
+    results_attr: str = "violations"
+    skip: Callable[[Path, str], bool] = lambda file_path, source: False
+    strict: bool = False
+    finish: Optional[Callable[[ast.NodeVisitor], None]] = None
+
+
+SCANNERS: List[ScannerSpec] = [
+    ScannerSpec(
+        name="events",
+        visitor=lambda file_path, source: PythonScanner(str(file_path), source.splitlines()),
+        result_type=EventEmission,
+        results_attr="emissions",
+        strict=True,
+    ),
+    ScannerSpec(
+        name="hardcoded",
+        visitor=HardcodedScanner,
+        result_type=HardcodedViolation,
+        skip=scanner_hardcoded.is_allowed_path,
+    ),
+    ScannerSpec(
+        name="quality",
+        visitor=QualityScanner,
+        result_type=QualityViolation,
+        skip=lambda file_path, source: scanner_quality.is_allowed_path(file_path),
+        finish=lambda visitor: visitor.scan_text_patterns(),
+    ),
+    ScannerSpec(
+        name="fallback",
+        visitor=FallbackScanner,
+        result_type=FallbackViolation,
+        skip=lambda file_path, source: scanner_fallback.is_allowed_path(file_path),
+    ),
+    ScannerSpec(
+        name="fail_loud",
+        visitor=FailLoudScanner,
+        result_type=FailLoudViolation,
+        skip=lambda file_path, source: scanner_fail_loud._is_allowed_path(file_path),
+        strict=True,
+    ),
+]
+
+_SCANNERS_BY_NAME = {spec.name: spec for spec in SCANNERS}
+
+
+def _no_descend(node: ast.AST) -> None:
+    """Replaces a visitor's generic_visit: the driver owns the traversal."""
+
+
+def scan_source(file_path: Path, source: str, strict_ok: bool = True) -> Dict[str, List[Any]]:
+    """
+    Run all applicable scanners over one parsed file in a single traversal.
+
+    Args:
+        file_path: Path used for allowed-path checks and violation records
+        source: Decoded source code
+        strict_ok: Whether the file decoded as strict UTF-8
+
+    Returns:
+        {scanner_name: [violation dataclasses]} (empty lists for skipped scanners)
+    """
+    results: Dict[str, List[Any]] = {spec.name: [] for spec in SCANNERS}
+    active = [
+        spec for spec in SCANNERS
+        if (strict_ok or not spec.strict) and not spec.skip(file_path, source)
+    ]
+    if not active:
+        return results
+
+    try:
+        tree = ast.parse(source, filename=str(file_path))
+    except SyntaxError:
+        return results
+
+    visitors = []
+    for spec in active:
+        visitor = spec.visitor(file_path, source)
+        visitor.generic_visit = _no_descend
+        visitors.append((spec, visitor))
+
+    # Per node type, the bound visit_* methods that handle it
+    dispatch: Dict[type, List[Callable[[ast.AST], None]]] = {}
+
+    # Pre-order, children in field order: same visit order as NodeVisitor recursion.
+    # _parent is attached on the way down (scanner_hardcoded.walk_with_parents).
+    tree._parent = None
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        handlers = dispatch.get(type(node))
+        if handlers is None:
+            method_name = "visit_" + type(node).__name__
+            # Skip ast.NodeVisitor's own visit_* (e.g. the visit_Constant compat shim)
+            handlers = [
+                getattr(visitor, method_name)
+                for _, visitor in visitors
+                if getattr(type(visitor), method_name, None) not in (None, getattr(ast.NodeVisitor, method_name, None))
+            ]
+            dispatch[type(node)] = handlers
+        for handler in handlers:
+            handler(node)
+
+        children = list(ast.iter_child_nodes(node))
+        for child in children:
+            child._parent = node
+        stack.extend(reversed(children))
+
+    for spec, visitor in visitors:
+        if spec.finish:
+            spec.finish(visitor)
+        results[spec.name] = list(getattr(visitor, spec.results_attr))
+
+    return results
+
+
+def _decode(raw: bytes) -> Tuple[str, bool]:
+    try:
+        return raw.decode("utf-8"), True
+    except UnicodeDecodeError:
+        return raw.decode("utf-8", errors="ignore"), False
+
+
+def _scan_for_cache(path_str: str) -> Tuple[str, Optional[str], Dict[str, List[Dict[str, Any]]]]:
+    """Pool worker: read, hash, scan. Returns (path, content_hash, {scanner: [dicts]})."""
+    try:
+        raw = Path(path_str).read_bytes()
+    except OSError:
+        return path_str, None, {}
+    source, strict_ok = _decode(raw)
+    results = scan_source(Path(path_str), source, strict_ok)
+    return path_str, hashlib.sha256(raw).hexdigest(), {
+        name: [asdict(v) for v in violations] for name, violations in results.items()
+    }
+
+
+@dataclass
+class LintRunResult:
+    """Results of one driver run."""
+    results: Dict[str, Dict[str, List[Any]]] = field(default_factory=dict)  # path -> scanner -> violations
+    files_scanned: int = 0
+    cache_hits: int = 0
+    unreadable: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def violations(self, scanner: str) -> List[Any]:
+        """All violations from one scanner, in file order."""
+        return [v for per_file in self.results.values() for v in per_file.get(scanner, [])]
+
+
+class LintDriver:
+    """
+    Shared-parse lint runner with a content-hash result cache.
+
+    The cache is a JSON file {path: {hash, ruleset, results}}; entries are
+    reused only when both the file's content hash and RULESET_VERSION match.
+    """
+
+    def __init__(
+        self,
+        cache_path: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+        pool_min_files: int = POOL_MIN_FILES
+    ):
+        self.cache_path = cache_path
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.pool_min_files = pool_min_files
+        self._cache: Dict[str, Dict[str, Any]] = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}  # Corrupt cache: rebuild
+        if data.get("ruleset") != RULESET_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def save_cache(self) -> None:
+        """Persist the cache (atomic replace)."""
+        if not self.cache_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+        tmp.write_text(json.dumps({"ruleset": RULESET_VERSION, "files": self._cache}), encoding="utf-8")
+        os.replace(tmp, self.cache_path)
+
+    @staticmethod
+    def _hydrate(raw: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Any]]:
+        return {
+            name: [_SCANNERS_BY_NAME[name].result_type(**item) for item in items]
+            for name, items in raw.items()
+            if name in _SCANNERS_BY_NAME
+        }
+
+    def lint_paths(self, paths: Iterable[Any]) -> LintRunResult:
+        """
+        Lint specific files (e.g. only the files a watcher saw change).
+
+        Args:
+            paths: File paths (str or Path); non-.py paths are ignored
+
+        Returns:
+            LintRunResult with per-file results in input order
+        """
+        started = time.perf_counter()
+        run = LintRunResult()
+        ordered = [str(p) for p in paths if str(p).endswith(".py")]
+
+        misses = []
+        for path_str in ordered:
+            try:
+                content_hash = hashlib.sha256(Path(path_str).read_bytes()).hexdigest()
+            except OSError:
+                run.unreadable.append(path_str)
+                continue
+            entry = self._cache.get(path_str)
+            if entry and entry.get("hash") == content_hash and entry.get("ruleset") == RULESET_VERSION:
+                run.cache_hits += 1
+            else:
+                misses.append(path_str)
+
+        if len(misses) >= self.pool_min_files and self.max_workers > 1:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                scanned = list(pool.map(_scan_for_cache, misses, chunksize=8))
+        else:
+            scanned = [_scan_for_cache(path_str) for path_str in misses]
+
+        for path_str, content_hash, raw in scanned:
+            if content_hash is None:
+                run.unreadable.append(path_str)
+                continue
+            self._cache[path_str] = {"hash": content_hash, "ruleset": RULESET_VERSION, "results": raw}
+            run.files_scanned += 1
+
+        unreadable = set(run.unreadable)
+        for path_str in ordered:
+            if path_str not in unreadable:
+                run.results[path_str] = self._hydrate(self._cache[path_str]["results"])
+
+        if scanned:
+            self.save_cache()
+
+        run.seconds = time.perf_counter() - started
+        return run
+
+    def lint_tree(self, directory: Path, exclude_patterns: Optional[List[str]] = None) -> LintRunResult:
+        """Lint every .py file under directory (one walk, shared across scanners)."""
+        exclude_patterns = DEFAULT_EXCLUDE_PATTERNS if exclude_patterns is None else exclude_patterns
+        files = sorted(
+            p for p in directory.rglob("*.py")
+            if p.is_file() and not any(p.match(pattern) for pattern in exclude_patterns)
+        )
+        return self.lint_paths(files)
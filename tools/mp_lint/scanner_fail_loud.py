@@ -274,6 +274,36 @@ def _check_failure_emit_call(
     return None
 
 
+class FailLoudScanner(ast.NodeVisitor):
+    """AST visitor that finds exception handlers and failure.emit calls (R-400/401)."""
+
+    def __init__(self, file_path: Path, source_code: str):
+        self.file_path = file_path
+        self.source_lines = source_code.splitlines()
+        self.violations: List[FailLoudViolation] = []
+
+    def visit_Try(self, node: ast.Try):
+        # Check each exception handler
+        for handler in node.handlers:
+            # Skip if has pragma: no cover (defensive guard)
+            if _has_pragma_no_cover(self.source_lines, handler.lineno):
+                continue
+
+            violation = _check_exception_handler(handler, self.source_lines, str(self.file_path))
+            if violation:
+                self.violations.append(violation)
+
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        # Check failure.emit calls for missing context
+        violation = _check_failure_emit_call(node, self.source_lines, str(self.file_path))
+        if violation:
+            self.violations.append(violation)
+
+        self.generic_visit(node)
+
+
 def scan_file_for_fail_loud(file_path: Path) -> List[FailLoudViolation]:
     """
     Scan a Python file for fail-loud violations (R-400/401).
@@ -291,7 +321,6 @@ def scan_file_for_fail_loud(file_path: Path) -> List[FailLoudViolation]:
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             source = f.read()
-            source_lines = source.splitlines()
     except Exception:
         return violations  # Can't read file
 
@@ -301,33 +330,7 @@ def scan_file_for_fail_loud(file_path: Path) -> List[FailLoudViolation]:
     except SyntaxError:
         return violations  # Syntax error - skip
 
-    # Visitor to find exception handlers and failure.emit calls
-    class FailLoudVisitor(ast.NodeVisitor):
-        def __init__(self):
-            self.violations = []
-
-        def visit_Try(self, node: ast.Try):
-            # Check each exception handler
-            for handler in node.handlers:
-                # Skip if has pragma: no cover (defensive guard)
-                if _has_pragma_no_cover(source_lines, handler.lineno):
-                    continue
-
-                violation = _check_exception_handler(handler, source_lines, str(file_path))
-                if violation:
-                    self.violations.append(violation)
-
-            self.generic_visit(node)
-
-        def visit_Call(self, node: ast.Call):
-            # Check failure.emit calls for missing context
-            violation = _check_failure_emit_call(node, source_lines, str(file_path))
-            if violation:
-                self.violations.append(violation)
-
-            self.generic_visit(node)
-
-    visitor = FailLoudVisitor()
+    visitor = FailLoudScanner(file_path, source)
     visitor.visit(tree)
     violations.extend(visitor.violations)
 
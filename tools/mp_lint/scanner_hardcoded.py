@@ -99,6 +99,9 @@ HARDCODED_PATTERNS = [
     (re.compile(r"\becosystem_mind-protocol_[a-z]+\b"), "Hardcoded FalkorDB graph name"),
 ]
 
+# Source lines split like the tokenizer (\r\n, \r or \n), line endings kept
+RE_SOURCE_LINES = re.compile(r"[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+$")
+
 # Pattern for citizen arrays
 CITIZEN_ARRAY_PATTERN = re.compile(
     r"\[\s*(?:['\"](?:" + "|".join(map(re.escape, CITIZENS)) + r")['\"]\s*,?\s*)+\]",
@@ -139,6 +142,33 @@ class HardcodedScanner(ast.NodeVisitor):
         self.source_code = source_code
         self.source_lines = source_code.splitlines()
         self.violations: List[HardcodedViolation] = []
+        self._segment_lines: Optional[List[str]] = None
+
+    def _source_segment(self, node: ast.AST) -> str:
+        """
+        Source text of a node (same result as ast.get_source_segment).
+
+        ast.get_source_segment re-splits the whole file on every call; the
+        line table is built once per file instead.
+        """
+        if self._segment_lines is None:
+            self._segment_lines = RE_SOURCE_LINES.findall(self.source_code)
+        lines = self._segment_lines
+
+        end_lineno = getattr(node, "end_lineno", None)
+        end_col_offset = getattr(node, "end_col_offset", None)
+        if end_lineno is None or end_col_offset is None:
+            return ""
+
+        lineno = node.lineno - 1
+        end_lineno -= 1
+        # col offsets are UTF-8 byte offsets
+        if lineno == end_lineno:
+            return lines[lineno].encode()[node.col_offset:end_col_offset].decode()
+
+        first = lines[lineno].encode()[node.col_offset:].decode()
+        last = lines[end_lineno].encode()[:end_col_offset].decode()
+        return "".join([first, *lines[lineno + 1:end_lineno], last])
 
     def _get_line_snippet(self, line_number: int) -> str:
         """Get source code line at given line number."""
@@ -217,8 +247,8 @@ class HardcodedScanner(ast.NodeVisitor):
 
         # Get source segment for this list
         try:
-            list_text = ast.get_source_segment(self.source_code, node) or ""
-        except (AttributeError, TypeError):
+            list_text = self._source_segment(node)
+        except (IndexError, UnicodeDecodeError):
             list_text = ""
 
         # Check if it's a citizen array